@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useState, useMemo } from 'react';
+import { memo, useCallback, useEffect, useState } from 'react';
 import Link from 'next/link';
 import { motion, AnimatePresence } from 'framer-motion';
 import {
@@ -24,46 +24,56 @@ import {
     CheckCircle2,
     Download,
     Trash2,
-    AlertTriangle
+    AlertTriangle,
+    Upload
 } from 'lucide-react';
 import { useLanguage } from '@/context/LanguageContext';
+import TableVirtuelle from '@/components/ui/TableVirtuelle';
 
-// ---- Fuzzy Search utility ----
-function fuzzyMatch(text, query) {
-    if (!query) return true;
-    const t = text.toLowerCase().replace(/\s+/g, '');
-    const q = query.toLowerCase().replace(/\s+/g, '');
-    if (t.includes(q)) return true;
+const PAGE_SIZE = 30;
 
-    // Levenshtein distance with threshold
-    const maxDist = Math.max(1, Math.floor(q.length * 0.35));
-    return levenshtein(t, q) <= maxDist || subsequenceMatch(t, q);
-}
-
-function levenshtein(a, b) {
-    const m = a.length, n = b.length;
-    if (Math.abs(m - n) > 3) return 999;
-    const dp = Array.from({ length: m + 1 }, (_, i) => [i]);
-    for (let j = 1; j <= n; j++) dp[0][j] = j;
-    for (let i = 1; i <= m; i++) {
-        for (let j = 1; j <= n; j++) {
-            dp[i][j] = Math.min(
-                dp[i - 1][j] + 1,
-                dp[i][j - 1] + 1,
-                dp[i - 1][j - 1] + (a[i - 1] === b[j - 1] ? 0 : 1)
-            );
-        }
-    }
-    return dp[m][n];
-}
-
-function subsequenceMatch(text, query) {
-    let qi = 0;
-    for (let ti = 0; ti < text.length && qi < query.length; ti++) {
-        if (text[ti] === query[qi]) qi++;
-    }
-    return qi >= query.length * 0.8;
-}
+// Ligne mémoïsée de la vue tableau
+const LigneEmploye = memo(function LigneEmploye({ emp, t, onOpen }) {
+    return (
+        <tr className="hover:bg-slate-50 transition-colors group cursor-pointer" onClick={() => onOpen(emp)}>
+            <td className="px-8 py-5">
+                <div className="flex items-center gap-4">
+                    <div className="w-12 h-12 rounded-2xl bg-slate-900 text-white flex items-center justify-center text-lg font-black uppercase">
+                        {emp.nom[0]}{emp.prenom[0]}
+                    </div>
+                    <div>
+                        <p className="text-base font-black text-slate-900 uppercase">{emp.nom} {emp.prenom}</p>
+                    </div>
+                </div>
+            </td>
+            <td className="px-6 py-5 text-center">
+                <span className="text-xs font-bold text-blue-600 bg-blue-50 px-3 py-1.5 rounded-lg uppercase">{emp.poste}</span>
+            </td>
+            <td className="px-6 py-5 text-center">
+                <span className="text-xs font-black text-slate-500">{emp.employeeId || '---'}</span>
+            </td>
+            <td className="px-6 py-5 text-center">
+                <span className="text-lg font-black text-blue-600">{emp.statsMensuelles?.presence || 0}</span>
+                <span className="text-[10px] text-slate-400 font-bold ml-1">J</span>
+            </td>
+            <td className="px-6 py-5 text-center">
+                <span className="text-lg font-black text-slate-900">+{emp.statsMensuelles?.heuresSupp || 0}</span>
+                <span className="text-[10px] text-slate-400 font-bold ml-1">H</span>
+            </td>
+            <td className="px-6 py-5 text-center">
+                <div className="flex items-center justify-center gap-2">
+                    <div className={`w-2.5 h-2.5 rounded-full ${emp.statut === 'ACTIF' ? 'bg-emerald-500' : 'bg-rose-500'}`} />
+                    <span className="text-[10px] font-black uppercase text-slate-400">{emp.statut === 'ACTIF' ? t('active') : t('inactive')}</span>
+                </div>
+            </td>
+            <td className="px-6 py-5 text-center">
+                <div className="w-8 h-8 rounded-lg bg-slate-100 flex items-center justify-center mx-auto group-hover:bg-blue-600 group-hover:text-white transition-all text-slate-400">
+                    <ChevronRight className="w-4 h-4" />
+                </div>
+            </td>
+        </tr>
+    );
+});
 
 export default function EmployesPage() {
     const { t } = useLanguage();
@@ -74,6 +84,11 @@ export default function EmployesPage() {
     const [deleteConfirmText, setDeleteConfirmText] = useState('');
     const [isDeleting, setIsDeleting] = useState(false);
     const [searchTerm, setSearchTerm] = useState('');
+    const [debouncedSearch, setDebouncedSearch] = useState('');
+    const [page, setPage] = useState(1);
+    const [total, setTotal] = useState(0);
+    const [tri, setTri] = useState('nom');
+    const [ordre, setOrdre] = useState('asc');
     const [viewMode, setViewMode] = useState('grid'); // 'grid' | 'table'
     const [selectedEmployee, setSelectedEmployee] = useState(null);
     const [drawerLoading, setDrawerLoading] = useState(false);
@@ -93,15 +108,34 @@ export default function EmployesPage() {
     });
     const [isEditing, setIsEditing] = useState(false);
 
+    // Recherche côté serveur, déclenchée après une courte pause de frappe
+    useEffect(() => {
+        const timer = setTimeout(() => {
+            setDebouncedSearch(searchTerm.trim());
+            setPage(1);
+        }, 300);
+        return () => clearTimeout(timer);
+    }, [searchTerm]);
+
     useEffect(() => {
         fetchEmployes();
-    }, []);
+    }, [page, tri, ordre, debouncedSearch]);
 
     const fetchEmployes = async () => {
+        setLoading(true);
         try {
-            const res = await fetch('/api/employes?includeStats=true');
+            const params = new URLSearchParams({
+                includeStats: 'true',
+                page: String(page),
+                pageSize: String(PAGE_SIZE),
+                tri,
+                ordre,
+            });
+            if (debouncedSearch) params.set('search', debouncedSearch);
+            const res = await fetch(`/api/employes?${params}`);
             const data = await res.json();
-            setEmployes(data);
+            setEmployes(data.employes || []);
+            setTotal(data.total || 0);
         } catch (error) {
             console.error('Erreur chargement employés:', error);
         } finally {
@@ -109,6 +143,49 @@ export default function EmployesPage() {
         }
     };
 
+    const [importing, setImporting] = useState(false);
+
+    // Import CSV/XLSX : le serveur valide tout le fichier avant d'écrire
+    const handleImport = async (e) => {
+        const fichier = e.target.files?.[0];
+        e.target.value = '';
+        if (!fichier) return;
+
+        setImporting(true);
+        try {
+            const envoyer = async (ignorerErreurs) => {
+                const body = new FormData();
+                body.append('fichier', fichier);
+                if (ignorerErreurs) body.append('ignorerErreurs', 'true');
+                const res = await fetch('/api/employes/import', { method: 'POST', body });
+                return { res, result: await res.json() };
+            };
+
+            let { res, result } = await envoyer(false);
+            if (res.status === 422) {
+                const details = result.erreurs.slice(0, 10)
+                    .map((err) => `Ligne ${err.ligne} : ${err.erreurs.join(', ')}`).join('\n');
+                const suite = result.erreurs.length > 10 ? `\n… et ${result.erreurs.length - 10} autre(s)` : '';
+                if (!confirm(`${result.erreurs.length} ligne(s) en erreur :\n${details}${suite}\n\nImporter les lignes valides ?`)) {
+                    return;
+                }
+                ({ res, result } = await envoyer(true));
+            }
+
+            if (res.ok) {
+                alert(`${result.importes} employé(s) importé(s) en ${(result.dureeMs / 1000).toFixed(1)} s`
+                    + (result.erreurs.length ? `\n${result.erreurs.length} ligne(s) ignorée(s)` : ''));
+                fetchEmployes();
+            } else {
+                alert(result.error || "Erreur lors de l'import");
+            }
+        } catch (error) {
+            alert('Erreur de connexion');
+        } finally {
+            setImporting(false);
+        }
+    };
+
     const [submitting, setSubmitting] = useState(false);
     const [error, setError] = useState(null);
 
@@ -176,7 +253,7 @@ export default function EmployesPage() {
         setShowModal(true);
     };
 
-    const openDrawer = async (emp) => {
+    const openDrawer = useCallback(async (emp) => {
         setSelectedEmployee(emp);
         // If employee has detailed stats, use them, otherwise fetch
         if (!emp.recapMensuel) {
@@ -191,14 +268,21 @@ export default function EmployesPage() {
                 setDrawerLoading(false);
             }
         }
+    }, []);
+
+    const totalPages = Math.max(1, Math.ceil(total / PAGE_SIZE));
+
+    const changerTri = (cle) => {
+        if (tri === cle) {
+            setOrdre(ordre === 'asc' ? 'desc' : 'asc');
+        } else {
+            setTri(cle);
+            setOrdre(cle === 'nom' || cle === 'poste' || cle === 'matricule' ? 'asc' : 'desc');
+        }
+        setPage(1);
     };
 
-    const filteredEmployes = useMemo(() => {
-        return employes.filter(emp => {
-            const searchable = `${emp.nom} ${emp.prenom} ${emp.poste} ${emp.employeeId || ''}`;
-            return fuzzyMatch(searchable, searchTerm);
-        });
-    }, [employes, searchTerm]);
+    const indicateurTri = (cle) => (tri === cle ? (ordre === 'asc' ? ' ↑' : ' ↓') : '');
 
     if (loading && employes.length === 0) {
         return (
@@ -218,7 +302,7 @@ export default function EmployesPage() {
                         {t('employeeManagement')}
                     </h1>
                     <p className="text-slate-400 font-bold mt-2 uppercase tracking-[0.3em] text-xs">
-                        {filteredEmployes.length} {filteredEmployes.length > 1 ? t('employees').toLowerCase() : t('employee').toLowerCase()} {t('found') || 'trouvé'}
+                        {total} {total > 1 ? t('employees').toLowerCase() : t('employee').toLowerCase()} {t('found') || 'trouvé'}
                     </p>
                 </div>
                 <div className="flex items-center gap-4">
@@ -230,6 +314,15 @@ export default function EmployesPage() {
                         <Trash2 className="w-6 h-6" />
                         {t('deleteAllEmployees')}
                     </button>
+                    <label className={`bg-white text-slate-900 border-4 border-slate-900 px-8 py-4 rounded-2xl font-black text-lg uppercase tracking-widest shadow-[6px_6px_0px_0px_rgba(15,23,42,1)] hover:translate-x-1 hover:translate-y-1 hover:shadow-none transition-all flex items-center gap-3 ${importing ? 'opacity-50 pointer-events-none' : 'cursor-pointer'}`}>
+                        {importing ? (
+                            <div className="w-6 h-6 border-4 border-slate-300 border-t-slate-900 rounded-full animate-spin" />
+                        ) : (
+                            <Upload className="w-6 h-6" />
+                        )}
+                        Importer
+                        <input type="file" accept=".csv,.xlsx" className="hidden" onChange={handleImport} disabled={importing} />
+                    </label>
                     <button
                         onClick={() => setShowModal(true)}
                         className="bg-blue-600 text-white px-8 py-5 rounded-2xl font-black text-lg uppercase tracking-widest shadow-[6px_6px_0px_0px_rgba(15,23,42,1)] hover:translate-x-1 hover:translate-y-1 hover:shadow-none transition-all flex items-center gap-3"
@@ -253,6 +346,23 @@ export default function EmployesPage() {
                             className="w-full pl-16 pr-8 py-5 bg-slate-50 border-3 border-transparent rounded-2xl text-xl font-bold placeholder:text-slate-300 focus:border-blue-600 outline-none transition-all"
                         />
                     </div>
+                    <select
+                        value={`${tri}:${ordre}`}
+                        onChange={(e) => {
+                            const [cle, sens] = e.target.value.split(':');
+                            setTri(cle);
+                            setOrdre(sens);
+                            setPage(1);
+                        }}
+                        className="py-5 px-4 bg-slate-50 rounded-2xl text-sm font-black uppercase text-slate-700 border-2 border-slate-200 outline-none focus:border-blue-600"
+                    >
+                        <option value="nom:asc">{t('employee')} A → Z</option>
+                        <option value="nom:desc">{t('employee')} Z → A</option>
+                        <option value="poste:asc">{t('position')}</option>
+                        <option value="presence:desc">{t('presence')} ↓</option>
+                        <option value="heuresSupp:desc">{t('overtimeShort')} ↓</option>
+                        <option value="salaireNet:desc">Net à Payer ↓</option>
+                    </select>
                     <div className="flex bg-slate-100 rounded-2xl p-1.5 border-2 border-slate-200">
                         <button
                             onClick={() => setViewMode('grid')}
@@ -275,63 +385,57 @@ export default function EmployesPage() {
             {/* ===== GRID VIEW ===== */}
             {viewMode === 'grid' && (
                 <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-8">
-                    {filteredEmployes.length === 0 ? (
+                    {employes.length === 0 ? (
                         <div className="col-span-full text-center py-24 bg-white rounded-[40px] border-4 border-slate-900 border-dashed">
                             <Users className="w-16 h-16 text-slate-300 mx-auto mb-4" />
                             <p className="text-slate-400 font-black uppercase tracking-[0.2em] text-xs">{t('noEmployeesFound')}</p>
                         </div>
                     ) : (
-                        filteredEmployes.map((employe, idx) => (
-                            <motion.div
+                        employes.map((employe) => (
+                            <div
                                 key={employe.id}
-                                initial={{ opacity: 0, y: 20 }}
-                                animate={{ opacity: 1, y: 0 }}
-                                transition={{ delay: idx * 0.05 }}
+                                onClick={() => openDrawer(employe)}
+                                className="group cursor-pointer bg-white rounded-[40px] p-8 border-4 border-slate-900 shadow-[12px_12px_0px_0px_rgba(15,23,42,1)] hover:translate-x-2 hover:translate-y-2 hover:shadow-none transition-all"
                             >
-                                <div
-                                    onClick={() => openDrawer(employe)}
-                                    className="group cursor-pointer bg-white rounded-[40px] p-8 border-4 border-slate-900 shadow-[12px_12px_0px_0px_rgba(15,23,42,1)] hover:translate-x-2 hover:translate-y-2 hover:shadow-none transition-all"
-                                >
-                                    <div className="flex items-center gap-6 mb-8">
-                                        <div className="w-20 h-20 rounded-3xl bg-slate-900 text-white flex items-center justify-center text-3xl font-black uppercase">
-                                            {employe.nom[0]}{employe.prenom[0]}
-                                        </div>
-                                        <div>
-                                            <h3 className="text-2xl font-black text-slate-900 uppercase leading-none">
-                                                {employe.nom} {employe.prenom}
-                                            </h3>
-                                            <p className="text-[10px] font-black text-blue-600 uppercase tracking-[0.2em] mt-2">
-                                                {employe.poste} • {t('matricule')}: {employe.employeeId || '---'}
-                                            </p>
-                                        </div>
+                                <div className="flex items-center gap-6 mb-8">
+                                    <div className="w-20 h-20 rounded-3xl bg-slate-900 text-white flex items-center justify-center text-3xl font-black uppercase">
+                                        {employe.nom[0]}{employe.prenom[0]}
                                     </div>
+                                    <div>
+                                        <h3 className="text-2xl font-black text-slate-900 uppercase leading-none">
+                                            {employe.nom} {employe.prenom}
+                                        </h3>
+                                        <p className="text-[10px] font-black text-blue-600 uppercase tracking-[0.2em] mt-2">
+                                            {employe.poste} • {t('matricule')}: {employe.employeeId || '---'}
+                                        </p>
+                                    </div>
+                                </div>
 
-                                    <div className="grid grid-cols-2 gap-4 mb-8">
-                                        <div className="p-5 bg-blue-50 rounded-2xl border-2 border-blue-100 items-center justify-center flex flex-col">
-                                            <p className="text-[10px] font-black text-blue-400 uppercase tracking-widest mb-1">Présence</p>
-                                            <p className="text-2xl font-black text-blue-600">
-                                                {employe.statsMensuelles?.presence || 0} <span className="text-xs uppercase">J</span>
-                                            </p>
-                                        </div>
-                                        <div className="p-5 bg-slate-50 rounded-2xl border-2 border-slate-100 items-center justify-center flex flex-col">
-                                            <p className="text-[10px] font-black text-slate-400 uppercase tracking-widest mb-1">{t('overtimeShort')}</p>
-                                            <p className="text-2xl font-black text-slate-900">
-                                                +{employe.statsMensuelles?.heuresSupp || 0} <span className="text-xs uppercase">H</span>
-                                            </p>
-                                        </div>
+                                <div className="grid grid-cols-2 gap-4 mb-8">
+                                    <div className="p-5 bg-blue-50 rounded-2xl border-2 border-blue-100 items-center justify-center flex flex-col">
+                                        <p className="text-[10px] font-black text-blue-400 uppercase tracking-widest mb-1">Présence</p>
+                                        <p className="text-2xl font-black text-blue-600">
+                                            {employe.statsMensuelles?.presence || 0} <span className="text-xs uppercase">J</span>
+                                        </p>
+                                    </div>
+                                    <div className="p-5 bg-slate-50 rounded-2xl border-2 border-slate-100 items-center justify-center flex flex-col">
+                                        <p className="text-[10px] font-black text-slate-400 uppercase tracking-widest mb-1">{t('overtimeShort')}</p>
+                                        <p className="text-2xl font-black text-slate-900">
+                                            +{employe.statsMensuelles?.heuresSupp || 0} <span className="text-xs uppercase">H</span>
+                                        </p>
                                     </div>
+                                </div>
 
-                                    <div className="flex items-center justify-between pt-6 border-t-2 border-slate-50">
-                                        <div className="flex items-center gap-2">
-                                            <div className={`w-3 h-3 rounded-full ${employe.statut === 'ACTIF' ? 'bg-emerald-500' : 'bg-rose-500'}`} />
-                                            <span className="text-[10px] font-black uppercase text-slate-400">{employe.statut === 'ACTIF' ? t('active') : t('inactive')}</span>
-                                        </div>
-                                        <div className="w-10 h-10 rounded-xl bg-slate-100 flex items-center justify-center text-slate-900 group-hover:bg-blue-600 group-hover:text-white transition-all">
-                                            <ChevronRight className="w-6 h-6" />
-                                        </div>
+                                <div className="flex items-center justify-between pt-6 border-t-2 border-slate-50">
+                                    <div className="flex items-center gap-2">
+                                        <div className={`w-3 h-3 rounded-full ${employe.statut === 'ACTIF' ? 'bg-emerald-500' : 'bg-rose-500'}`} />
+                                        <span className="text-[10px] font-black uppercase text-slate-400">{employe.statut === 'ACTIF' ? t('active') : t('inactive')}</span>
+                                    </div>
+                                    <div className="w-10 h-10 rounded-xl bg-slate-100 flex items-center justify-center text-slate-900 group-hover:bg-blue-600 group-hover:text-white transition-all">
+                                        <ChevronRight className="w-6 h-6" />
                                     </div>
                                 </div>
-                            </motion.div>
+                            </div>
                         ))
                     )}
                 </div>
@@ -341,72 +445,61 @@ export default function EmployesPage() {
             {viewMode === 'table' && (
                 <div className="bg-white rounded-[40px] border-4 border-slate-900 shadow-[12px_12px_0px_0px_rgba(15,23,42,1)] overflow-hidden">
                     <div className="overflow-x-auto">
-                        <table className="min-w-full divide-y-4 divide-slate-900">
-                            <thead className="bg-slate-900 text-white">
+                        <TableVirtuelle
+                            lignes={employes}
+                            cle={(emp) => emp.id}
+                            hauteurLigne={89}
+                            colonnes={7}
+                            className="min-w-full divide-y-4 divide-slate-900"
+                            classeEntete="bg-slate-900 text-white"
+                            classeCorps="divide-y divide-slate-100"
+                            entete={
                                 <tr>
-                                    <th className="px-8 py-6 text-left text-[10px] font-black uppercase tracking-[0.2em]">{t('employee')}</th>
-                                    <th className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em]">{t('position')}</th>
-                                    <th className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em]">{t('matricule')}</th>
-                                    <th className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em]">{t('presence')}</th>
-                                    <th className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em]">{t('overtimeShort')}</th>
+                                    <th onClick={() => changerTri('nom')} className="px-8 py-6 text-left text-[10px] font-black uppercase tracking-[0.2em] cursor-pointer select-none">{t('employee')}{indicateurTri('nom')}</th>
+                                    <th onClick={() => changerTri('poste')} className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em] cursor-pointer select-none">{t('position')}{indicateurTri('poste')}</th>
+                                    <th onClick={() => changerTri('matricule')} className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em] cursor-pointer select-none">{t('matricule')}{indicateurTri('matricule')}</th>
+                                    <th onClick={() => changerTri('presence')} className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em] cursor-pointer select-none">{t('presence')}{indicateurTri('presence')}</th>
+                                    <th onClick={() => changerTri('heuresSupp')} className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em] cursor-pointer select-none">{t('overtimeShort')}{indicateurTri('heuresSupp')}</th>
                                     <th className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em]">{t('status')}</th>
                                     <th className="px-6 py-6 text-center text-[10px] font-black uppercase tracking-[0.2em]">{t('actions')}</th>
                                 </tr>
-                            </thead>
-                            <tbody className="divide-y divide-slate-100">
-                                {filteredEmployes.length === 0 ? (
-                                    <tr>
-                                        <td colSpan={7} className="text-center py-16 text-slate-400 font-black uppercase text-xs">
-                                            {t('noEmployeesFound')}
-                                        </td>
-                                    </tr>
-                                ) : (
-                                    filteredEmployes.map((emp) => (
-                                        <tr key={emp.id} className="hover:bg-slate-50 transition-colors group cursor-pointer" onClick={() => openDrawer(emp)}>
-                                            <td className="px-8 py-5">
-                                                <div className="flex items-center gap-4">
-                                                    <div className="w-12 h-12 rounded-2xl bg-slate-900 text-white flex items-center justify-center text-lg font-black uppercase">
-                                                        {emp.nom[0]}{emp.prenom[0]}
-                                                    </div>
-                                                    <div>
-                                                        <p className="text-base font-black text-slate-900 uppercase">{emp.nom} {emp.prenom}</p>
-                                                    </div>
-                                                </div>
-                                            </td>
-                                            <td className="px-6 py-5 text-center">
-                                                <span className="text-xs font-bold text-blue-600 bg-blue-50 px-3 py-1.5 rounded-lg uppercase">{emp.poste}</span>
-                                            </td>
-                                            <td className="px-6 py-5 text-center">
-                                                <span className="text-xs font-black text-slate-500">{emp.employeeId || '---'}</span>
-                                            </td>
-                                            <td className="px-6 py-5 text-center">
-                                                <span className="text-lg font-black text-blue-600">{emp.statsMensuelles?.presence || 0}</span>
-                                                <span className="text-[10px] text-slate-400 font-bold ml-1">J</span>
-                                            </td>
-                                            <td className="px-6 py-5 text-center">
-                                                <span className="text-lg font-black text-slate-900">+{emp.statsMensuelles?.heuresSupp || 0}</span>
-                                                <span className="text-[10px] text-slate-400 font-bold ml-1">H</span>
-                                            </td>
-                                            <td className="px-6 py-5 text-center">
-                                                <div className="flex items-center justify-center gap-2">
-                                                    <div className={`w-2.5 h-2.5 rounded-full ${emp.statut === 'ACTIF' ? 'bg-emerald-500' : 'bg-rose-500'}`} />
-                                                    <span className="text-[10px] font-black uppercase text-slate-400">{emp.statut === 'ACTIF' ? t('active') : t('inactive')}</span>
-                                                </div>
-                                            </td>
-                                            <td className="px-6 py-5 text-center">
-                                                <div className="w-8 h-8 rounded-lg bg-slate-100 flex items-center justify-center mx-auto group-hover:bg-blue-600 group-hover:text-white transition-all text-slate-400">
-                                                    <ChevronRight className="w-4 h-4" />
-                                                </div>
-                                            </td>
-                                        </tr>
-                                    ))
-                                )}
-                            </tbody>
-                        </table>
+                            }
+                            vide={
+                                <tr>
+                                    <td colSpan={7} className="text-center py-16 text-slate-400 font-black uppercase text-xs">
+                                        {t('noEmployeesFound')}
+                                    </td>
+                                </tr>
+                            }
+                            rendreLigne={(emp) => <LigneEmploye emp={emp} t={t} onOpen={openDrawer} />}
+                        />
                     </div>
                 </div>
             )}
 
+            {/* ===== PAGINATION ===== */}
+            {totalPages > 1 && (
+                <div className="flex items-center justify-center gap-6">
+                    <button
+                        onClick={() => setPage(page - 1)}
+                        disabled={page <= 1 || loading}
+                        className="px-6 py-4 rounded-2xl bg-white border-4 border-slate-900 font-black uppercase text-sm tracking-widest disabled:opacity-30 hover:bg-slate-50 transition-all"
+                    >
+                        {t('previous')}
+                    </button>
+                    <span className="text-sm font-black text-slate-500 uppercase tracking-widest">
+                        {page} / {totalPages}
+                    </span>
+                    <button
+                        onClick={() => setPage(page + 1)}
+                        disabled={page >= totalPages || loading}
+                        className="px-6 py-4 rounded-2xl bg-white border-4 border-slate-900 font-black uppercase text-sm tracking-widest disabled:opacity-30 hover:bg-slate-50 transition-all"
+                    >
+                        {t('next')}
+                    </button>
+                </div>
+            )}
+
             {/* ===== EMPLOYEE DRAWER ===== */}
             <AnimatePresence>
                 {selectedEmployee && (
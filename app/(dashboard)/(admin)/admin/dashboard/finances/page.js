@@ -42,6 +42,7 @@ export default function FinancesPage() {
     const [weeklyChart, setWeeklyChart] = useState([]);
     const [loading, setLoading] = useState(true);
     const [actionLoading, setActionLoading] = useState(null);
+    const [selection, setSelection] = useState([]);
     const [toast, setToast] = useState(null);
 
     const showToast = (message, type = 'success') => {
@@ -69,30 +70,33 @@ export default function FinancesPage() {
         fetchFinances();
     }, []);
 
-    const handleAction = async (id, statut) => {
-        const target = avances.find(a => a.id === id);
+    // Une ou plusieurs avances en un appel ; la réponse porte les agrégats à jour
+    const handleAction = async (ids, statut) => {
+        const target = ids.length === 1 ? avances.find(a => a.id === ids[0]) : null;
         try {
-            setActionLoading(id);
-            const res = await fetch(`/api/avances/${id}/approve`, {
+            setActionLoading(ids.length === 1 ? ids[0] : 'lot');
+            const res = await fetch('/api/avances/approve', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ statut })
+                body: JSON.stringify({ ids, statut })
             });
 
             if (!res.ok) throw new Error('Erreur');
+            const data = await res.json();
+            const traitees = new Set(data.traitees);
 
-            // Optimistic UI update — remove from list with animation
-            setAvances(prev => prev.map(a => a.id === id ? { ...a, statut } : a));
+            setAvances(prev => prev.map(a => traitees.has(a.id) ? { ...a, statut } : a));
+            setSelection(prev => prev.filter(id => !ids.includes(id)));
+            setStats(data.stats);
+            setWeeklyChart(data.weeklyChart || []);
 
+            const libelle = statut === 'APPROVED' ? 'approuvée' : 'rejetée';
             showToast(
-                `Avance de ${target.employe.prenom} ${statut === 'APPROVED' ? 'approuvée' : 'rejetée'} avec succès`,
+                target
+                    ? `Avance de ${target.employe.prenom} ${libelle} avec succès`
+                    : `${traitees.size} avance(s) ${libelle}(s) avec succès`,
                 statut === 'APPROVED' ? 'success' : 'error'
             );
-
-            // Refresh stats after a slight delay for animation
-            setTimeout(() => {
-                fetchFinances();
-            }, 600);
         } catch (error) {
             showToast('Erreur lors de la validation', 'error');
         } finally {
@@ -100,7 +104,12 @@ export default function FinancesPage() {
         }
     };
 
+    const toggleSelection = (id) => {
+        setSelection(prev => prev.includes(id) ? prev.filter(x => x !== id) : [...prev, id]);
+    };
+
     const pendingAvances = avances.filter(a => a.statut === 'PENDING');
+    const toutSelectionne = pendingAvances.length > 0 && pendingAvances.every(a => selection.includes(a.id));
     const recentActions = avances
         .filter(a => a.statut === 'APPROVED' || a.statut === 'REJECTED')
         .sort((a, b) => new Date(b.updatedAt || b.date) - new Date(a.updatedAt || a.date))
@@ -268,6 +277,38 @@ export default function FinancesPage() {
                         )}
                     </h3>
 
+                    {pendingAvances.length > 1 && (
+                        <div className="flex items-center gap-3 mb-4">
+                            <label className="flex items-center gap-2 text-[10px] font-black uppercase text-slate-500 cursor-pointer">
+                                <input
+                                    type="checkbox"
+                                    checked={toutSelectionne}
+                                    onChange={() => setSelection(toutSelectionne ? [] : pendingAvances.map(a => a.id))}
+                                    className="w-4 h-4 accent-blue-600"
+                                />
+                                Tout sélectionner
+                            </label>
+                            {selection.length > 0 && (
+                                <div className="ml-auto flex gap-2">
+                                    <button
+                                        onClick={() => handleAction(selection, 'APPROVED')}
+                                        disabled={actionLoading === 'lot'}
+                                        className="bg-emerald-600 text-white px-4 py-2 rounded-xl font-black text-[10px] uppercase hover:bg-emerald-700 transition-all flex items-center gap-1.5 disabled:opacity-50"
+                                    >
+                                        <CheckCircle2 className="w-3.5 h-3.5" /> Approuver ({selection.length})
+                                    </button>
+                                    <button
+                                        onClick={() => handleAction(selection, 'REJECTED')}
+                                        disabled={actionLoading === 'lot'}
+                                        className="bg-rose-600 text-white px-4 py-2 rounded-xl font-black text-[10px] uppercase hover:bg-rose-700 transition-all flex items-center gap-1.5 disabled:opacity-50"
+                                    >
+                                        <XCircle className="w-3.5 h-3.5" /> Rejeter ({selection.length})
+                                    </button>
+                                </div>
+                            )}
+                        </div>
+                    )}
+
                     <div className="space-y-4 max-h-[380px] overflow-y-auto pr-2 flex-1" style={{ scrollbarWidth: 'thin' }}>
                         <AnimatePresence mode="popLayout">
                             {pendingAvances.length === 0 ? (
@@ -291,6 +332,13 @@ export default function FinancesPage() {
                                         className="p-6 bg-slate-50 border-2 border-slate-100 rounded-3xl"
                                     >
                                         <div className="flex items-center justify-between">
+                                            <input
+                                                type="checkbox"
+                                                checked={selection.includes(av.id)}
+                                                onChange={() => toggleSelection(av.id)}
+                                                className="w-4 h-4 mr-4 accent-blue-600"
+                                                aria-label={`Sélectionner ${av.employe.prenom} ${av.employe.nom}`}
+                                            />
                                             <div className="flex-1 min-w-0">
                                                 <p className="font-black text-slate-900 uppercase truncate">
                                                     {av.employe.prenom} {av.employe.nom}
@@ -309,14 +357,14 @@ export default function FinancesPage() {
                                             </div>
                                             <div className="flex flex-col gap-2 ml-4">
                                                 <button
-                                                    onClick={() => handleAction(av.id, 'APPROVED')}
+                                                    onClick={() => handleAction([av.id], 'APPROVED')}
                                                     disabled={actionLoading === av.id}
                                                     className="bg-emerald-600 text-white px-4 py-2 rounded-xl font-black text-[10px] uppercase hover:bg-emerald-700 transition-all flex items-center gap-1.5 disabled:opacity-50 shadow-lg shadow-emerald-600/20"
                                                 >
                                                     <CheckCircle2 className="w-3.5 h-3.5" /> Approuver
                                                 </button>
                                                 <button
-                                                    onClick={() => handleAction(av.id, 'REJECTED')}
+                                                    onClick={() => handleAction([av.id], 'REJECTED')}
                                                     disabled={actionLoading === av.id}
                                                     className="bg-rose-600 text-white px-4 py-2 rounded-xl font-black text-[10px] uppercase hover:bg-rose-700 transition-all flex items-center gap-1.5 disabled:opacity-50"
                                                 >
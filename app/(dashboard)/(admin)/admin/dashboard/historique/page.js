@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useState, useMemo } from 'react';
+import { useState, useMemo } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import {
     Calendar as CalendarIcon,
@@ -15,38 +15,35 @@ import {
     Loader2
 } from 'lucide-react';
 import { generateDailyReportPDF } from '@/lib/services/pdfService';
+import { joursVoisins, moisVoisins, useDemarrage, useRequete } from '@/lib/infrastructure/http/cacheRequetes';
 
 export default function HistoriquePage() {
-    const [pointages, setPointages] = useState([]);
-    const [employes, setEmployes] = useState([]);
-    const [loading, setLoading] = useState(true);
     const [filterDate, setFilterDate] = useState(new Date().toISOString().split('T')[0]);
     const [searchTerm, setSearchTerm] = useState('');
     const [generatingPDF, setGeneratingPDF] = useState(false);
 
-    useEffect(() => {
-        fetchData();
-    }, [filterDate]);
+    const [annee, mois] = filterDate.split('-').map(Number);
 
-    const fetchData = async () => {
-        try {
-            setLoading(true);
-            const [pointagesRes, employesRes] = await Promise.all([
-                fetch(`/api/pointages?dateDebut=${filterDate}&dateFin=${filterDate}`),
-                fetch('/api/employes'),
-            ]);
+    const urlFeuille = `/api/pointages/feuille?date=${filterDate}`;
+    const urlResume = `/api/pointages/jours?mois=${mois}&annee=${annee}`;
+    useDemarrage([urlFeuille, urlResume]);
 
-            const pointagesData = await pointagesRes.json();
-            const employesData = await employesRes.json();
+    // Feuille du jour : effectif, pointages et avances du jour en un appel ;
+    // les jours voisins sont préchargés pour naviguer sans attente
+    const { data: feuille, loading } = useRequete(urlFeuille, {
+        prechargement: joursVoisins(filterDate).map((jour) => `/api/pointages/feuille?date=${jour}`),
+    });
 
-            setPointages(pointagesData);
-            setEmployes(employesData);
-        } catch (error) {
-            console.error('Erreur chargement données:', error);
-        } finally {
-            setLoading(false);
-        }
-    };
+    // Résumé du mois (une ligne par jour pointé), lu dans l'agrégat quotidien
+    const { data: resumeMois } = useRequete(urlResume, {
+        prechargement: moisVoisins(mois, annee).map((m) => `/api/pointages/jours?mois=${m.mois}&annee=${m.annee}`),
+    });
+    const joursMois = resumeMois?.jours || [];
+
+    const employes = feuille?.employes || [];
+    const pointages = useMemo(() => (feuille?.employes || [])
+        .filter(emp => emp.pointage)
+        .map(emp => ({ ...emp.pointage, employeId: emp.id, avanceJour: emp.avance })), [feuille]);
 
     const filteredPointages = useMemo(() => {
         return pointages.filter(p => {
@@ -155,6 +152,34 @@ export default function HistoriquePage() {
                 </div>
             </div>
 
+            {/* Month overview */}
+            {joursMois.length > 0 && (
+                <div className="flex gap-3 overflow-x-auto pb-2">
+                    {joursMois.map((j) => {
+                        const jourIso = j.date.split('T')[0];
+                        const actif = jourIso === filterDate;
+                        return (
+                            <button
+                                key={jourIso}
+                                onClick={() => setFilterDate(jourIso)}
+                                title={`${j.present} présents • ${j.absent} absents • ${j.conge + j.maladie} congés`}
+                                className={`flex-shrink-0 w-20 py-3 rounded-2xl border-3 text-center transition-all ${actif ? 'bg-slate-900 text-white border-slate-900' : 'bg-white border-slate-200 hover:border-blue-600'}`}
+                            >
+                                <p className="text-xl font-black">{Number(jourIso.slice(8))}</p>
+                                <p className={`text-[10px] font-black uppercase ${actif ? 'text-slate-300' : 'text-slate-400'}`}>
+                                    {j.total}/{j.effectifAttendu}
+                                </p>
+                                {j.dateValidationChef ? (
+                                    <CheckCircle2 className="w-4 h-4 text-emerald-500 mx-auto mt-1" />
+                                ) : (
+                                    <Clock className="w-4 h-4 text-slate-300 mx-auto mt-1" />
+                                )}
+                            </button>
+                        );
+                    })}
+                </div>
+            )}
+
             {/* Table */}
             <div className="bg-white rounded-[40px] border-4 border-slate-900 shadow-2xl overflow-hidden">
                 {loading ? (
@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useState, Suspense } from 'react';
+import { useState, Suspense } from 'react';
 import { useRouter } from 'next/navigation';
 import { motion } from 'framer-motion';
 import { Doughnut, Bar, Line } from 'react-chartjs-2';
@@ -33,6 +33,7 @@ import { useDate } from '@/context/DateContext';
 import { useLanguage } from '@/context/LanguageContext';
 import { generateDailyReportPDF } from '@/lib/services/pdfService';
 import SuccessModal from '@/components/ui/SuccessModal';
+import { joursVoisins, useRequete } from '@/lib/infrastructure/http/cacheRequetes';
 import Link from 'next/link';
 
 ChartJS.register(
@@ -60,16 +61,13 @@ function AdminDashboardContent() {
     const { date } = useDate();
     const router = useRouter();
 
-    // We can rely on context, no local date state init needed
-    const [stats, setStats] = useState(null);
-    const [loading, setLoading] = useState(true);
+    // Date du contexte ; les jours voisins sont préchargés en arrière-plan
+    const { data: stats = null, loading } = useRequete(date ? `/api/admin/stats?date=${date}` : null, {
+        prechargement: date ? joursVoisins(date).map((jour) => `/api/admin/stats?date=${jour}`) : [],
+    });
     const [generatingPDF, setGeneratingPDF] = useState(false);
     const [showSuccess, setShowSuccess] = useState(false);
 
-    useEffect(() => {
-        if (date) fetchStats();
-    }, [date]);
-
     // Format display date based on language
     const getLocale = () => {
         switch(language) {
@@ -82,19 +80,6 @@ function AdminDashboardContent() {
         weekday: 'long', day: 'numeric', month: 'long', year: 'numeric'
     }).toUpperCase();
 
-    const fetchStats = async () => {
-        try {
-            setLoading(true);
-            const res = await fetch(`/api/admin/stats?date=${date}`);
-            const data = await res.json();
-            setStats(data);
-        } catch (error) {
-            console.error('Erreur chargement stats:', error);
-        } finally {
-            setLoading(false);
-        }
-    };
-
     const handleGenerateReport = () => {
         setGeneratingPDF(true);
         try {
@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useState, useMemo } from 'react';
+import { memo, useCallback, useEffect, useState, useMemo, useRef } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import {
     ClipboardList,
@@ -20,6 +20,105 @@ import {
     X
 } from 'lucide-react';
 import { getStatutConfig } from '@/lib/domain/value-objects/StatutPointage';
+import { chargerPages } from '@/lib/infrastructure/http/chargerPages';
+import TableVirtuelle, { useValeurDifferee } from '@/components/ui/TableVirtuelle';
+
+const CHAMPS_FEUILLE = 'id,employeId,date,statut,heuresSupp,joursTravailles,notes';
+
+const LIGNE_VIDE = {};
+
+// Boutons de statut, dans l'ordre : PRÉSENT | ABSENT | FÉRIÉ | CONGÉ | MALADIE
+const OPTIONS_STATUT = [
+    { id: 'PRESENT', label: 'PRÉSENT', color: 'emerald', bg: 'bg-emerald-600', border: 'border-emerald-700' },
+    { id: 'ABSENT', label: 'ABSENT', color: 'rose', bg: 'bg-rose-600', border: 'border-rose-700' },
+    { id: 'FERIE', label: 'FÉRIÉ', color: 'blue', bg: 'bg-blue-600', border: 'border-blue-700' },
+    { id: 'CONGE', label: 'CONGÉ', color: 'amber', bg: 'bg-amber-500', border: 'border-amber-600' },
+    { id: 'MALADIE', label: 'MALADIE', color: 'purple', bg: 'bg-purple-600', border: 'border-purple-700' },
+];
+
+// Ligne mémoïsée : une saisie ne redessine que la ligne de l'employé modifié
+const LigneFeuille = memo(function LigneFeuille({ emp, entry, isSunday, onChange }) {
+    return (
+        <tr className={`hover:bg-slate-50/80 transition-colors ${entry.statut === 'ABSENT' ? 'bg-rose-50/30' : ''}`}>
+            <td className="px-10 py-8">
+                <div className="flex items-center gap-6">
+                    <div className={`w-16 h-16 rounded-2xl ${entry.statut === 'PRESENT' ? 'bg-emerald-600' : 'bg-slate-900'} flex items-center justify-center text-white text-xl font-black uppercase shadow-lg`}>
+                        {emp.nom[0]}{emp.prenom[0]}
+                    </div>
+                    <div>
+                        <p className="text-2xl font-black text-slate-900 uppercase leading-none">{emp.nom} {emp.prenom}</p>
+                        <p className="text-xs text-blue-600 font-bold uppercase tracking-widest mt-2 bg-blue-50 w-fit px-2 py-1 rounded-md">{emp.poste}</p>
+                    </div>
+                </div>
+            </td>
+            <td className="px-10 py-8 text-center">
+                <div className="flex justify-center gap-2">
+                    {OPTIONS_STATUT.map((opt) => (
+                        <button
+                            key={opt.id}
+                            onClick={() => onChange(emp.id, 'statut', opt.id)}
+                            data-testid={`status-btn-${emp.id}-${opt.id}`}
+                            className={`px-3 py-2 rounded-xl font-black text-[10px] uppercase transition-all border-2 ${entry.statut === opt.id
+                                ? `${opt.bg} text-white ${opt.border} shadow-lg scale-110 ring-2 ring-white/50`
+                                : `bg-slate-50 text-slate-400 border-slate-200 hover:border-slate-300 hover:bg-white`
+                                }`}
+                        >
+                            {opt.label}
+                        </button>
+                    ))}
+                </div>
+            </td>
+            <td className="px-10 py-8 text-center">
+                {/* MALADIE and CONGE status disable overtime hours and set to 0 */}
+                <div className={`flex items-center justify-center gap-4 ${entry.statut === 'MALADIE' || entry.statut === 'CONGE' ? 'opacity-30 pointer-events-none' : ''}`}>
+                    <button
+                        disabled={entry.statut === 'MALADIE' || entry.statut === 'CONGE'}
+                        onClick={() => onChange(emp.id, 'heuresSupp', Math.max(0, (entry.heuresSupp || 0) - 0.5))}
+                        className="w-10 h-10 bg-blue-50 text-blue-600 rounded-lg font-black border-2 border-blue-200 hover:bg-blue-600 hover:text-white transition-colors disabled:opacity-50"
+                    >
+                        -
+                    </button>
+                    <input
+                        type="number"
+                        value={(entry.statut === 'MALADIE' || entry.statut === 'CONGE') ? 0 : entry.heuresSupp}
+                        disabled={entry.statut === 'MALADIE' || entry.statut === 'CONGE'}
+                        onChange={(e) => onChange(emp.id, 'heuresSupp', parseFloat(e.target.value) || 0)}
+                        data-testid={`hs-input-${emp.id}`}
+                        className="w-24 text-center text-2xl font-black bg-blue-50 border-3 border-blue-200 rounded-xl py-2 focus:border-blue-700 outline-none disabled:bg-slate-100 disabled:text-slate-400"
+                    />
+                    <button
+                        disabled={entry.statut === 'MALADIE' || entry.statut === 'CONGE'}
+                        onClick={() => onChange(emp.id, 'heuresSupp', (entry.heuresSupp || 0) + 0.5)}
+                        className="w-10 h-10 bg-blue-50 text-blue-600 rounded-lg font-black border-2 border-blue-200 hover:bg-blue-600 hover:text-white transition-colors disabled:opacity-50"
+                    >
+                        +
+                    </button>
+                </div>
+            </td>
+            <td className="px-10 py-8 text-center border-l-2 border-slate-100">
+                <div className="flex flex-col items-center">
+                    <span className={`text-2xl font-black ${entry.statut === 'ABSENT' ? 'text-rose-600' : 'text-slate-900'}`}>
+                        {entry.joursTravailles} J
+                    </span>
+                    <span className={`text-[10px] font-black uppercase px-2 py-0.5 rounded-full mt-1 ${isSunday ? 'bg-amber-100 text-amber-700' : 'bg-slate-100 text-slate-500'}`}>
+                        {isSunday ? 'DIMANCHE' : 'NORMAL'}
+                    </span>
+                </div>
+            </td>
+            <td className="px-10 py-8 text-right">
+                {entry.isExisting ? (
+                    <div className="flex items-center justify-end gap-2 text-emerald-600 font-black text-xs uppercase bg-emerald-50 px-4 py-2 rounded-xl border border-emerald-200">
+                        <CheckCircle2 className="w-4 h-4" /> Enregistré
+                    </div>
+                ) : (
+                    <div className="flex items-center justify-end gap-2 text-blue-600 font-black text-xs uppercase bg-blue-50 px-4 py-2 rounded-xl border border-blue-200">
+                        <Clock className="w-4 h-4" /> En attente
+                    </div>
+                )}
+            </td>
+        </tr>
+    );
+});
 
 export default function PointagePage() {
     const [pointages, setPointages] = useState([]);
@@ -30,43 +129,66 @@ export default function PointagePage() {
     const [saveSuccess, setSaveSuccess] = useState(false);
     const [filterDate, setFilterDate] = useState(new Date().toISOString().split('T')[0]);
     const [searchTerm, setSearchTerm] = useState('');
+    const recherche = useValeurDifferee(searchTerm);
 
     // State for the bulk sheet entries
     const [sheetEntries, setSheetEntries] = useState({});
+    const requeteRef = useRef(null);
 
     useEffect(() => {
-        fetchData();
+        fetchEmployes();
     }, []);
 
-    const fetchData = async () => {
-        try {
-            setLoading(true);
-            const [pointagesRes, employesRes] = await Promise.all([
-                fetch('/api/pointages'),
-                fetch('/api/employes'),
-            ]);
+    useEffect(() => {
+        fetchPointages();
+        return () => requeteRef.current?.abort();
+    }, [filterDate]);
 
-            const pointagesData = await pointagesRes.json();
-            const employesData = await employesRes.json();
+    const fetchEmployes = async () => {
+        try {
+            const res = await fetch('/api/employes?fields=id,nom,prenom,poste');
+            setEmployes(await res.json());
+        } catch (error) {
+            console.error('Erreur chargement employés:', error);
+        }
+    };
 
-            setPointages(pointagesData);
-            setEmployes(employesData);
+    // Seuls les pointages du jour affiché sont chargés, page par page :
+    // la feuille se remplit au fil des pages, l'enregistrement attend la fin.
+    const fetchPointages = async () => {
+        requeteRef.current?.abort();
+        const controller = new AbortController();
+        requeteRef.current = controller;
 
-            // Initialize sheet entries for current date
-            initializeSheet(employesData, pointagesData, filterDate);
+        try {
+            setLoading(true);
+            setPointages([]);
+            await chargerPages(
+                `/api/pointages?dateDebut=${filterDate}&dateFin=${filterDate}&limit=200&champs=${CHAMPS_FEUILLE}`,
+                { onPage: setPointages, signal: controller.signal }
+            );
         } catch (error) {
-            console.error('Erreur chargement données:', error);
+            if (error.name !== 'AbortError') {
+                console.error('Erreur chargement données:', error);
+            }
         } finally {
-            setLoading(false);
+            if (requeteRef.current === controller) {
+                setLoading(false);
+            }
         }
     };
 
+    const fetchData = () => Promise.all([fetchEmployes(), fetchPointages()]);
+
     const initializeSheet = (allEmployes, currentPointages, date) => {
         const newEntries = {};
         const isDimanche = new Date(date).getDay() === 0;
+        const parEmploye = new Map(
+            currentPointages.filter(p => p.date.startsWith(date)).map(p => [p.employeId, p])
+        );
 
         allEmployes.forEach(emp => {
-            const existing = currentPointages.find(p => p.employeId === emp.id && p.date.startsWith(date));
+            const existing = parEmploye.get(emp.id);
 
             if (existing) {
                 newEntries[emp.id] = {
@@ -97,28 +219,29 @@ export default function PointagePage() {
         }
     }, [filterDate, employes, pointages]);
 
-    const handleSheetChange = (empId, field, value) => {
-        const isDimanche = new Date(filterDate).getDay() === 0;
+    const isSunday = new Date(filterDate).getDay() === 0;
 
+    // Stable tant que la date ne change pas, pour que les lignes mémoïsées le restent
+    const handleSheetChange = useCallback((empId, field, value) => {
         setSheetEntries(prev => {
             const entry = { ...prev[empId], [field]: value };
 
             // Automatic Business Logic
             if (field === 'statut') {
                 if (value === 'PRESENT') {
-                    entry.joursTravailles = isDimanche ? 0 : 1;
+                    entry.joursTravailles = isSunday ? 0 : 1;
                 } else if (value === 'ABSENT' || value === 'MALADIE') {
                     entry.joursTravailles = 0;
                     entry.heuresSupp = 0;
                 } else if (value === 'CONGE' || value === 'FERIE') {
-                    entry.joursTravailles = isDimanche ? 0 : 1;
+                    entry.joursTravailles = isSunday ? 0 : 1;
                     entry.heuresSupp = 0;
                 }
             }
 
             return { ...prev, [empId]: entry };
         });
-    };
+    }, [isSunday]);
 
     const handleSetAllPresent = () => {
         const isDimanche = new Date(filterDate).getDay() === 0;
@@ -176,10 +299,11 @@ export default function PointagePage() {
     };
 
     const filteredEmployes = useMemo(() => {
+        const terme = recherche.toLowerCase();
         return employes.filter(emp =>
-            `${emp.nom} ${emp.prenom}`.toLowerCase().includes(searchTerm.toLowerCase())
+            `${emp.nom} ${emp.prenom}`.toLowerCase().includes(terme)
         );
-    }, [employes, searchTerm]);
+    }, [employes, recherche]);
 
     const stats = useMemo(() => {
         const data = filteredEmployes.map(emp => sheetEntries[emp.id]).filter(Boolean);
@@ -296,8 +420,15 @@ export default function PointagePage() {
             {/* Attendance Spreadsheet */}
             <div className="bg-white rounded-3xl shadow-xl overflow-hidden">
                 <div className="overflow-x-auto">
-                    <table className="min-w-full divide-y-2 divide-slate-200">
-                        <thead className="bg-slate-800 text-white">
+                    <TableVirtuelle
+                        lignes={filteredEmployes}
+                        cle={(emp) => emp.id}
+                        hauteurLigne={129}
+                        colonnes={5}
+                        className="min-w-full divide-y-2 divide-slate-200"
+                        classeEntete="bg-slate-800 text-white"
+                        classeCorps="divide-y divide-slate-200"
+                        entete={
                             <tr>
                                 <th className="px-10 py-8 text-left text-sm font-black uppercase tracking-[0.2em]">Employé</th>
                                 <th className="px-10 py-8 text-center text-sm font-black uppercase tracking-[0.2em]">Statut</th>
@@ -305,102 +436,16 @@ export default function PointagePage() {
                                 <th className="px-10 py-8 text-center text-sm font-black uppercase tracking-[0.2em]">Jours Travaillés</th>
                                 <th className="px-10 py-8 text-center text-sm font-black uppercase tracking-[0.2em]">État</th>
                             </tr>
-                        </thead>
-                        <tbody className="divide-y divide-slate-200">
-                            {filteredEmployes.map((emp) => {
-                                const entry = sheetEntries[emp.id] || {};
-                                const isSunday = new Date(filterDate).getDay() === 0;
-
-                                return (
-                                    <tr key={emp.id} className={`hover:bg-slate-50/80 transition-colors ${entry.statut === 'ABSENT' ? 'bg-rose-50/30' : ''}`}>
-                                        <td className="px-10 py-8">
-                                            <div className="flex items-center gap-6">
-                                                <div className={`w-16 h-16 rounded-2xl ${entry.statut === 'PRESENT' ? 'bg-emerald-600' : 'bg-slate-900'} flex items-center justify-center text-white text-xl font-black uppercase shadow-lg`}>
-                                                    {emp.nom[0]}{emp.prenom[0]}
-                                                </div>
-                                                <div>
-                                                    <p className="text-2xl font-black text-slate-900 uppercase leading-none">{emp.nom} {emp.prenom}</p>
-                                                    <p className="text-xs text-blue-600 font-bold uppercase tracking-widest mt-2 bg-blue-50 w-fit px-2 py-1 rounded-md">{emp.poste}</p>
-                                                </div>
-                                            </div>
-                                        </td>
-                                        <td className="px-10 py-8 text-center">
-                                            <div className="flex justify-center gap-2">
-                                                {/* Status buttons in order: PRÉSENT | ABSENT | FÉRIÉ | CONGÉ | MALADIE */}
-                                                {[
-                                                    { id: 'PRESENT', label: 'PRÉSENT', color: 'emerald', bg: 'bg-emerald-600', border: 'border-emerald-700' },
-                                                    { id: 'ABSENT', label: 'ABSENT', color: 'rose', bg: 'bg-rose-600', border: 'border-rose-700' },
-                                                    { id: 'FERIE', label: 'FÉRIÉ', color: 'blue', bg: 'bg-blue-600', border: 'border-blue-700' },
-                                                    { id: 'CONGE', label: 'CONGÉ', color: 'amber', bg: 'bg-amber-500', border: 'border-amber-600' },
-                                                    { id: 'MALADIE', label: 'MALADIE', color: 'purple', bg: 'bg-purple-600', border: 'border-purple-700' },
-                                                ].map((opt) => (
-                                                    <button
-                                                        key={opt.id}
-                                                        onClick={() => handleSheetChange(emp.id, 'statut', opt.id)}
-                                                        data-testid={`status-btn-${emp.id}-${opt.id}`}
-                                                        className={`px-3 py-2 rounded-xl font-black text-[10px] uppercase transition-all border-2 ${entry.statut === opt.id
-                                                            ? `${opt.bg} text-white ${opt.border} shadow-lg scale-110 ring-2 ring-white/50`
-                                                            : `bg-slate-50 text-slate-400 border-slate-200 hover:border-slate-300 hover:bg-white`
-                                                            }`}
-                                                    >
-                                                        {opt.label}
-                                                    </button>
-                                                ))}
-                                            </div>
-                                        </td>
-                                        <td className="px-10 py-8 text-center">
-                                            {/* MALADIE and CONGE status disable overtime hours and set to 0 */}
-                                            <div className={`flex items-center justify-center gap-4 ${entry.statut === 'MALADIE' || entry.statut === 'CONGE' ? 'opacity-30 pointer-events-none' : ''}`}>
-                                                <button
-                                                    disabled={entry.statut === 'MALADIE' || entry.statut === 'CONGE'}
-                                                    onClick={() => handleSheetChange(emp.id, 'heuresSupp', Math.max(0, (entry.heuresSupp || 0) - 0.5))}
-                                                    className="w-10 h-10 bg-blue-50 text-blue-600 rounded-lg font-black border-2 border-blue-200 hover:bg-blue-600 hover:text-white transition-colors disabled:opacity-50"
-                                                >
-                                                    -
-                                                </button>
-                                                <input
-                                                    type="number"
-                                                    value={(entry.statut === 'MALADIE' || entry.statut === 'CONGE') ? 0 : entry.heuresSupp}
-                                                    disabled={entry.statut === 'MALADIE' || entry.statut === 'CONGE'}
-                                                    onChange={(e) => handleSheetChange(emp.id, 'heuresSupp', parseFloat(e.target.value) || 0)}
-                                                    data-testid={`hs-input-${emp.id}`}
-                                                    className="w-24 text-center text-2xl font-black bg-blue-50 border-3 border-blue-200 rounded-xl py-2 focus:border-blue-700 outline-none disabled:bg-slate-100 disabled:text-slate-400"
-                                                />
-                                                <button
-                                                    disabled={entry.statut === 'MALADIE' || entry.statut === 'CONGE'}
-                                                    onClick={() => handleSheetChange(emp.id, 'heuresSupp', (entry.heuresSupp || 0) + 0.5)}
-                                                    className="w-10 h-10 bg-blue-50 text-blue-600 rounded-lg font-black border-2 border-blue-200 hover:bg-blue-600 hover:text-white transition-colors disabled:opacity-50"
-                                                >
-                                                    +
-                                                </button>
-                                            </div>
-                                        </td>
-                                        <td className="px-10 py-8 text-center border-l-2 border-slate-100">
-                                            <div className="flex flex-col items-center">
-                                                <span className={`text-2xl font-black ${entry.statut === 'ABSENT' ? 'text-rose-600' : 'text-slate-900'}`}>
-                                                    {entry.joursTravailles} J
-                                                </span>
-                                                <span className={`text-[10px] font-black uppercase px-2 py-0.5 rounded-full mt-1 ${isSunday ? 'bg-amber-100 text-amber-700' : 'bg-slate-100 text-slate-500'}`}>
-                                                    {isSunday ? 'DIMANCHE' : 'NORMAL'}
-                                                </span>
-                                            </div>
-                                        </td>
-                                        <td className="px-10 py-8 text-right">
-                                            {entry.isExisting ? (
-                                                <div className="flex items-center justify-end gap-2 text-emerald-600 font-black text-xs uppercase bg-emerald-50 px-4 py-2 rounded-xl border border-emerald-200">
-                                                    <CheckCircle2 className="w-4 h-4" /> Enregistré
-                                                </div>
-                                            ) : (
-                                                <div className="flex items-center justify-end gap-2 text-blue-600 font-black text-xs uppercase bg-blue-50 px-4 py-2 rounded-xl border border-blue-200">
-                                                    <Clock className="w-4 h-4" /> En attente
-                                                </div>
-                                            )}
-                                        </td>
-                                    </tr>
-                                );
-                            })}
-                        </tbody>
-                    </table>
+                        }
+                        rendreLigne={(emp) => (
+                            <LigneFeuille
+                                emp={emp}
+                                entry={sheetEntries[emp.id] || LIGNE_VIDE}
+                                isSunday={isSunday}
+                                onChange={handleSheetChange}
+                            />
+                        )}
+                    />
                 </div>
 
                 {/* Footer Controls */}
@@ -32,7 +32,7 @@ export default function QuickAttendancePage() {
 
     const fetchEmployees = async () => {
         try {
-            const res = await fetch('/api/employes');
+            const res = await fetch('/api/employes?fields=id,nom,prenom,poste,employeeId,statut,pointages');
             const data = await res.json();
             setEmployees(data.filter(e => e.statut === 'ACTIF'));
             setLoading(false);
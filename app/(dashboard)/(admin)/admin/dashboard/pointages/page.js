@@ -3,48 +3,32 @@
 import { useState, useEffect } from 'react';
 import { motion } from 'framer-motion';
 import { Calendar, Users, Clock, TrendingUp, Download, Save, X, Check, AlertCircle } from 'lucide-react';
+import { moisVoisins, useRequete } from '@/lib/infrastructure/http/cacheRequetes';
+
+const urlPointages = (employeId, mois, annee) =>
+    `/api/pointages?employeId=${employeId}&mois=${mois}&annee=${annee}`;
 
 export default function AttendanceAdminPage() {
-    const [employees, setEmployees] = useState([]);
     const [selectedMonth, setSelectedMonth] = useState(new Date().getMonth() + 1);
     const [selectedYear, setSelectedYear] = useState(new Date().getFullYear());
     const [selectedEmployee, setSelectedEmployee] = useState(null);
-    const [pointages, setPointages] = useState([]);
-    const [loading, setLoading] = useState(true);
     const [editMode, setEditMode] = useState(null);
 
-    useEffect(() => {
-        fetchEmployees();
-    }, []);
-
-    useEffect(() => {
-        if (selectedEmployee) {
-            fetchPointages(selectedEmployee, selectedMonth, selectedYear);
-        }
-    }, [selectedEmployee, selectedMonth, selectedYear]);
+    const { data: employees = [], loading } = useRequete('/api/employes?fields=id,nom,prenom');
 
-    const fetchEmployees = async () => {
-        try {
-            const res = await fetch('/api/employes');
-            const data = await res.json();
-            setEmployees(data);
-            if (data.length > 0) setSelectedEmployee(data[0].id);
-        } catch (error) {
-            console.error(error);
-        } finally {
-            setLoading(false);
+    // Mois voisins préchargés : passer au mois précédent/suivant est instantané
+    const { data: pointages = [], recharger: fetchPointages } = useRequete(
+        selectedEmployee ? urlPointages(selectedEmployee, selectedMonth, selectedYear) : null,
+        {
+            prechargement: selectedEmployee
+                ? moisVoisins(selectedMonth, selectedYear).map((m) => urlPointages(selectedEmployee, m.mois, m.annee))
+                : [],
         }
-    };
+    );
 
-    const fetchPointages = async (employeId, mois, annee) => {
-        try {
-            const res = await fetch(`/api/pointages?employeId=${employeId}&mois=${mois}&annee=${annee}`);
-            const data = await res.json();
-            setPointages(data);
-        } catch (error) {
-            console.error(error);
-        }
-    };
+    useEffect(() => {
+        if (!selectedEmployee && employees.length > 0) setSelectedEmployee(employees[0].id);
+    }, [employees]);
 
     const handleUpdatePointage = async (pointageId, newData) => {
         try {
@@ -53,7 +37,7 @@ export default function AttendanceAdminPage() {
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ id: pointageId, ...newData })
             });
-            fetchPointages(selectedEmployee, selectedMonth, selectedYear);
+            fetchPointages();
             setEditMode(null);
         } catch (error) {
             console.error(error);
@@ -73,7 +57,7 @@ export default function AttendanceAdminPage() {
                     heuresSupp: 0
                 })
             });
-            fetchPointages(selectedEmployee, selectedMonth, selectedYear);
+            fetchPointages();
         } catch (error) {
             console.error(error);
         }
@@ -1,6 +1,6 @@
 'use client';
 
-import { useState, useMemo } from 'react';
+import { useState, useMemo, useEffect, useRef } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import {
     FileBarChart,
@@ -15,7 +15,9 @@ import {
     ChevronRight,
     Search,
     BarChart3,
-    Printer
+    Printer,
+    Lock,
+    Unlock
 } from 'lucide-react';
 import {
     Chart as ChartJS,
@@ -34,6 +36,7 @@ import { Bar, Line } from 'react-chartjs-2';
 import { generateProfessionalPDF } from '@/lib/services/pdfService';
 import { genererPdfGlobal } from '@/lib/services/globalPdfService';
 import SuccessModal from '@/components/ui/SuccessModal';
+import { charger, invalider, lireCache, moisVoisins, precharger } from '@/lib/infrastructure/http/cacheRequetes';
 
 // Register Chart.js components
 ChartJS.register(
@@ -49,19 +52,34 @@ ChartJS.register(
     Filler
 );
 
+const urlRapport = (mois, annee) => `/api/rapports?mois=${mois}&annee=${annee}`;
+
 export default function RapportsPage() {
     const [mois, setMois] = useState(new Date().getMonth() + 1);
     const [annee, setAnnee] = useState(new Date().getFullYear());
     const [rapport, setRapport] = useState(null);
     const [loading, setLoading] = useState(false);
     const [showSuccess, setShowSuccess] = useState(false);
+    const [cloture, setCloture] = useState(null);
+    const [actionCloture, setActionCloture] = useState(false);
+    const demandeRef = useRef(null);
 
     const genererRapport = async () => {
-        setLoading(true);
+        const url = urlRapport(mois, annee);
+        demandeRef.current = url;
+        // Mois déjà en cache (ou préchargé) : affichage immédiat, puis revalidation
+        const enCache = lireCache(url);
+        if (enCache) {
+            setRapport(enCache);
+        } else {
+            setLoading(true);
+        }
         try {
-            const res = await fetch(`/api/rapports?mois=${mois}&annee=${annee}&t=${Date.now()}`);
-            const data = await res.json();
+            const data = await charger(url);
+            // Un changement de mois plus récent a la priorité
+            if (demandeRef.current !== url) return;
             setRapport(data);
+            precharger(moisVoisins(mois, annee).map((m) => urlRapport(m.mois, m.annee)));
         } catch (error) {
             console.error('Erreur génération rapport:', error);
         } finally {
@@ -69,6 +87,59 @@ export default function RapportsPage() {
         }
     };
 
+    // Une fois un rapport affiché, changer de mois le recharge directement
+    useEffect(() => {
+        if (rapport) genererRapport();
+    }, [mois, annee]);
+
+    const chargerCloture = async () => {
+        try {
+            const res = await fetch(`/api/rapports/cloture?mois=${mois}&annee=${annee}`);
+            setCloture(res.ok ? (await res.json()).cloture : null);
+        } catch (error) {
+            console.error('Erreur état clôture:', error);
+        }
+    };
+
+    useEffect(() => {
+        chargerCloture();
+    }, [mois, annee]);
+
+    // Clôture ou réouverture : le rapport du mois change de source
+    const modifierCloture = async (methode, corps) => {
+        setActionCloture(true);
+        try {
+            const res = await fetch('/api/rapports/cloture', {
+                method: methode,
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ mois, annee, ...corps }),
+            });
+            if (!res.ok) {
+                const data = await res.json();
+                alert(data.error || 'Erreur lors de la clôture');
+                return;
+            }
+            invalider('/api/rapports');
+            await chargerCloture();
+            await genererRapport();
+        } catch (error) {
+            console.error('Erreur clôture:', error);
+        } finally {
+            setActionCloture(false);
+        }
+    };
+
+    const cloturerLeMois = () => {
+        if (!confirm('Clôturer ce mois ? Les pointages ne seront plus modifiables et les rapports seront figés.')) return;
+        modifierCloture('POST');
+    };
+
+    const rouvrirLeMois = () => {
+        const motif = prompt('Motif de la réouverture :');
+        if (motif === null) return;
+        modifierCloture('DELETE', { motif });
+    };
+
     const exportToPDF = async (empData) => {
         if (!empData) return;
         setLoading(true);
@@ -176,9 +247,33 @@ export default function RapportsPage() {
                         Rapports &amp; Paie
                     </h1>
                     <p className="text-slate-500 font-medium mt-1">Analyse des performances et consolidation financière mensuelle</p>
+                    {cloture && (
+                        <span className="inline-flex items-center gap-2 mt-3 px-3 py-1 rounded-full bg-amber-100 text-amber-800 text-[10px] font-black uppercase tracking-widest" data-testid="badge-mois-cloture">
+                            <Lock className="w-3 h-3" /> Mois clôturé le {new Date(cloture.clotureLe).toLocaleDateString('fr-FR')}
+                        </span>
+                    )}
                 </div>
                 {rapport && (
                     <div className="flex gap-4 flex-wrap">
+                        {cloture ? (
+                            <button
+                                onClick={rouvrirLeMois}
+                                disabled={actionCloture}
+                                className="btn bg-white hover:bg-amber-50 text-amber-700 border border-amber-200 gap-2 text-[10px] font-black uppercase tracking-widest px-8"
+                                data-testid="btn-rouvrir-mois"
+                            >
+                                <Unlock className="w-4 h-4" /> Rouvrir
+                            </button>
+                        ) : (
+                            <button
+                                onClick={cloturerLeMois}
+                                disabled={actionCloture}
+                                className="btn bg-amber-600 hover:bg-amber-700 text-white gap-2 text-[10px] font-black uppercase tracking-widest px-8 shadow-xl shadow-amber-600/20"
+                                data-testid="btn-cloturer-mois"
+                            >
+                                <Lock className="w-4 h-4" /> Clôturer le mois
+                            </button>
+                        )}
                         <button
                             onClick={exportGlobalPDF}
                             className="btn bg-blue-700 hover:bg-blue-800 text-white gap-2 text-[10px] font-black uppercase tracking-widest px-8 shadow-xl shadow-blue-700/20"
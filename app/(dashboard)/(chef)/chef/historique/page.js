@@ -1,9 +1,108 @@
 'use client';
 
-import { useEffect, useState, useMemo } from 'react';
+import { memo, useCallback, useEffect, useState, useMemo, useRef } from 'react';
 import { useSession } from 'next-auth/react';
 import { Search, Calendar as CalendarIcon, Save, ChevronLeft, ChevronRight, CheckCircle2, AlertCircle, Loader2 } from 'lucide-react';
 import { motion } from 'framer-motion';
+import { chargerPages } from '@/lib/infrastructure/http/chargerPages';
+import TableVirtuelle from '@/components/ui/TableVirtuelle';
+
+const CHAMPS_FEUILLE = 'employeId,date,statut,heuresSupp,joursTravailles,notes';
+
+const STATUTS = ['PRESENT', 'ABSENT', 'FERIE', 'CONGE', 'MALADIE'];
+
+const STYLES_STATUT = {
+    PRESENT: { active: 'bg-emerald-600 text-white border-emerald-700 shadow-lg status-glow-emerald', inactive: 'bg-emerald-50 text-emerald-600 border-emerald-100 hover:bg-emerald-100' },
+    ABSENT: { active: 'bg-rose-600 text-white border-rose-700 shadow-lg status-glow-rose', inactive: 'bg-rose-50 text-rose-600 border-rose-100 hover:bg-rose-100' },
+    FERIE: { active: 'bg-blue-600 text-white border-blue-700 shadow-lg status-glow-blue', inactive: 'bg-blue-50 text-blue-600 border-blue-100 hover:bg-blue-100' },
+    CONGE: { active: 'bg-amber-500 text-white border-amber-600 shadow-lg status-glow-amber', inactive: 'bg-amber-50 text-amber-700 border-amber-100 hover:bg-amber-100' },
+    MALADIE: { active: 'bg-pink-600 text-white border-pink-700 shadow-lg status-glow-rose', inactive: 'bg-pink-50 text-pink-600 border-pink-100 hover:bg-pink-100' },
+};
+
+const getStatusStyles = (s, entryStatut) => {
+    const cfg = STYLES_STATUT[s] || { active: 'bg-slate-600 text-white', inactive: 'bg-slate-50 text-slate-300' };
+    return s === entryStatut ? cfg.active : cfg.inactive;
+};
+
+// Ligne mémoïsée : une saisie ne redessine que la ligne de l'employé modifié
+const LigneHistorique = memo(function LigneHistorique({ emp, entry, isLocked, onChange }) {
+    if (!entry) return (
+        <tr className="bg-slate-50/50 italic opacity-50">
+            <td className="px-10 py-6 font-bold">{emp.nom} {emp.prenom}</td>
+            <td colSpan="5" className="px-10 py-6 text-center text-xs font-black uppercase">Aucun pointage trouvé pour cette date</td>
+        </tr>
+    );
+
+    const isAbsent = entry.statut === 'ABSENT' || entry.statut === 'MALADIE';
+
+    return (
+        <tr className="hover:bg-slate-50/80 transition-colors">
+            <td className="px-10 py-6">
+                <div className="flex items-center gap-4">
+                    <div className="w-12 h-12 rounded-xl bg-slate-900 flex items-center justify-center text-white text-lg font-black uppercase shrink-0">
+                        {emp.nom?.charAt(0)}{emp.prenom?.charAt(0)}
+                    </div>
+                    <div className="min-w-0">
+                        <p className="text-lg font-black text-slate-900 uppercase truncate">{emp.nom} {emp.prenom}</p>
+                        <p className="text-[10px] text-blue-600 font-bold uppercase tracking-widest">{emp.poste}</p>
+                    </div>
+                </div>
+            </td>
+            <td className="px-8 py-6">
+                <div className={`flex justify-center gap-1.5 min-w-[500px] ${isLocked ? 'pointer-events-none' : ''}`}>
+                    {STATUTS.map(s => (
+                        <button
+                            key={s}
+                            onClick={() => onChange(emp.id, s === 'ABSENT' || s === 'MALADIE' ? { statut: s, heuresSupp: 0 } : { statut: s })}
+                            disabled={isLocked}
+                            className={`px-3 py-2.5 rounded-xl text-[9px] font-black border-2 transition-all min-w-[85px] uppercase tracking-tighter ${getStatusStyles(s, entry.statut)} ${isLocked && s !== entry.statut ? 'opacity-30' : ''}`}
+                        >
+                            {s}
+                        </button>
+                    ))}
+                </div>
+            </td>
+            <td className="px-6 py-6 text-center">
+                <div className={`flex items-center justify-center gap-3 ${isAbsent || isLocked ? 'opacity-30 pointer-events-none' : ''}`}>
+                    <input
+                        type="number"
+                        step="0.5"
+                        disabled={isLocked}
+                        value={entry.heuresSupp}
+                        onChange={(e) => onChange(emp.id, { heuresSupp: parseFloat(e.target.value) || 0 })}
+                        className="w-20 text-center font-black bg-white border-2 border-slate-200 rounded-xl py-2 focus:border-blue-600 outline-none shadow-sm"
+                    />
+                </div>
+            </td>
+            <td className="px-6 py-6 text-center">
+                <input
+                    type="number"
+                    step="5"
+                    disabled={isLocked}
+                    value={entry.avance || 0}
+                    onChange={(e) => onChange(emp.id, { avance: parseFloat(e.target.value) || 0 })}
+                    className={`w-24 text-center text-lg font-black bg-white border-2 border-slate-200 rounded-xl py-2 focus:border-emerald-500 focus:bg-emerald-50 outline-none transition-all shadow-sm ${isLocked ? 'opacity-50 pointer-events-none' : ''}`}
+                    placeholder="0"
+                />
+            </td>
+            <td className="px-8 py-6">
+                <input
+                    type="text"
+                    disabled={isLocked}
+                    value={entry.notes || ''}
+                    onChange={(e) => onChange(emp.id, { notes: e.target.value })}
+                    className={`w-full px-4 py-3 bg-white border-2 border-slate-200 rounded-xl text-sm font-bold text-slate-700 focus:border-blue-600 outline-none transition-all shadow-sm ${isLocked ? 'opacity-50 pointer-events-none' : ''}`}
+                    placeholder={isLocked ? "Verrouillé" : "Observation..."}
+                />
+            </td>
+            <td className="px-6 py-6 text-center">
+                <div className="flex items-center justify-center gap-2 text-emerald-600 font-black text-[10px] uppercase bg-emerald-50 px-4 py-2 rounded-xl ring-1 ring-emerald-200">
+                    <CheckCircle2 className="w-3 h-3 text-emerald-500" /> Historique
+                </div>
+            </td>
+        </tr>
+    );
+});
 
 export default function ChefHistoriquePage() {
     const [pointages, setPointages] = useState([]);
@@ -11,6 +110,7 @@ export default function ChefHistoriquePage() {
     const [loading, setLoading] = useState(true);
     const [selectedDate, setSelectedDate] = useState(new Date().toISOString().split('T')[0]);
     const [sheetEntries, setSheetEntries] = useState({});
+    const requeteRef = useRef(null);
     const { data: session } = useSession();
 
     const isLocked = useMemo(() => {
@@ -28,32 +128,54 @@ export default function ChefHistoriquePage() {
     }, [selectedDate, session]);
 
     useEffect(() => {
-        fetchData();
+        fetchEmployes();
     }, []);
 
-    const fetchData = async () => {
+    useEffect(() => {
+        fetchPointages();
+        return () => requeteRef.current?.abort();
+    }, [selectedDate]);
+
+    const fetchEmployes = async () => {
         try {
-            setLoading(true);
-            const [pointagesRes, employesRes] = await Promise.all([
-                fetch('/api/pointages'),
-                fetch('/api/employes'),
-            ]);
-            const p = await pointagesRes.json();
-            const e = await employesRes.json();
-            setPointages(p);
-            setEmployes(e);
-            initializeSheet(e, p, selectedDate);
+            const res = await fetch('/api/employes?fields=id,nom,prenom,poste');
+            setEmployes(await res.json());
         } catch (error) {
             console.error(error);
+        }
+    };
+
+    // Pointages du jour sélectionné uniquement, affichés au fil des pages
+    const fetchPointages = async () => {
+        requeteRef.current?.abort();
+        const controller = new AbortController();
+        requeteRef.current = controller;
+
+        try {
+            setLoading(true);
+            setPointages([]);
+            await chargerPages(
+                `/api/pointages?dateDebut=${selectedDate}&dateFin=${selectedDate}&limit=200&champs=${CHAMPS_FEUILLE}`,
+                { onPage: setPointages, signal: controller.signal }
+            );
+        } catch (error) {
+            if (error.name !== 'AbortError') console.error(error);
         } finally {
-            setLoading(false);
+            if (requeteRef.current === controller) {
+                setLoading(false);
+            }
         }
     };
 
+    const fetchData = () => Promise.all([fetchEmployes(), fetchPointages()]);
+
     const initializeSheet = (allEmployes, currentPointages, date) => {
         const newEntries = {};
+        const parEmploye = new Map(
+            currentPointages.filter(p => p.date.startsWith(date)).map(p => [p.employeId, p])
+        );
         allEmployes.forEach(emp => {
-            const existing = currentPointages.find(p => p.employeId === emp.id && p.date.startsWith(date));
+            const existing = parEmploye.get(emp.id);
             if (existing) {
                 newEntries[emp.id] = {
                     statut: existing.statut,
@@ -74,6 +196,18 @@ export default function ChefHistoriquePage() {
         }
     }, [selectedDate, employes, pointages]);
 
+    const modifierLigne = useCallback((empId, modif) => {
+        setSheetEntries(prev => ({ ...prev, [empId]: { ...prev[empId], ...modif } }));
+    }, []);
+
+    const totaux = useMemo(() => {
+        const lignes = Object.values(sheetEntries);
+        return {
+            heuresSupp: lignes.reduce((sum, e) => sum + (e?.heuresSupp || 0), 0),
+            avances: lignes.reduce((sum, e) => sum + (e?.avance || 0), 0),
+        };
+    }, [sheetEntries]);
+
     const handleUpdate = async () => {
         try {
             setLoading(true);
@@ -165,8 +299,16 @@ export default function ChefHistoriquePage() {
 
             <div className="bg-white rounded-[40px] border-4 border-slate-900 shadow-2xl overflow-hidden">
                 <div className="overflow-x-auto">
-                    <table className="min-w-full divide-y-4 divide-slate-900">
-                        <thead className="bg-slate-900 text-white">
+                    <TableVirtuelle
+                        lignes={employes}
+                        cle={(emp) => emp.id}
+                        hauteurLigne={97}
+                        colonnes={6}
+                        className="min-w-full divide-y-4 divide-slate-900"
+                        classeEntete="bg-slate-900 text-white"
+                        classeCorps="divide-y divide-slate-200"
+                        classePied="bg-slate-50 border-t-4 border-slate-900 font-black uppercase text-xs"
+                        entete={
                             <tr>
                                 <th className="px-10 py-8 text-left text-sm font-black uppercase">Employé</th>
                                 <th className="px-8 py-8 text-center text-sm font-black uppercase">Statut</th>
@@ -175,124 +317,34 @@ export default function ChefHistoriquePage() {
                                 <th className="px-8 py-8 text-left text-sm font-black uppercase">Note/Observation</th>
                                 <th className="px-6 py-8 text-center text-sm font-black uppercase">État</th>
                             </tr>
-                        </thead>
-                        <tbody className="divide-y divide-slate-200">
-                            {employes.map(emp => {
-                                const entry = sheetEntries[emp.id];
-                                if (!entry) return (
-                                    <tr key={emp.id} className="bg-slate-50/50 italic opacity-50">
-                                        <td className="px-10 py-6 font-bold">{emp.nom} {emp.prenom}</td>
-                                        <td colSpan="5" className="px-10 py-6 text-center text-xs font-black uppercase">Aucun pointage trouvé pour cette date</td>
-                                    </tr>
-                                );
-
-                                const isAbsent = entry.statut === 'ABSENT' || entry.statut === 'MALADIE';
-
-                                const getStatusStyles = (s, entryStatut) => {
-                                    const active = s === entryStatut;
-                                    const colors = {
-                                        PRESENT: { active: 'bg-emerald-600 text-white border-emerald-700 shadow-lg status-glow-emerald', inactive: 'bg-emerald-50 text-emerald-600 border-emerald-100 hover:bg-emerald-100' },
-                                        ABSENT: { active: 'bg-rose-600 text-white border-rose-700 shadow-lg status-glow-rose', inactive: 'bg-rose-50 text-rose-600 border-rose-100 hover:bg-rose-100' },
-                                        FERIE: { active: 'bg-blue-600 text-white border-blue-700 shadow-lg status-glow-blue', inactive: 'bg-blue-50 text-blue-600 border-blue-100 hover:bg-blue-100' },
-                                        CONGE: { active: 'bg-amber-500 text-white border-amber-600 shadow-lg status-glow-amber', inactive: 'bg-amber-50 text-amber-700 border-amber-100 hover:bg-amber-100' },
-                                        MALADIE: { active: 'bg-pink-600 text-white border-pink-700 shadow-lg status-glow-rose', inactive: 'bg-pink-50 text-pink-600 border-pink-100 hover:bg-pink-100' },
-                                    };
-                                    const cfg = colors[s] || { active: 'bg-slate-600 text-white', inactive: 'bg-slate-50 text-slate-300' };
-                                    return active ? cfg.active : cfg.inactive;
-                                };
-
-                                return (
-                                    <tr key={emp.id} className="hover:bg-slate-50/80 transition-colors">
-                                        <td className="px-10 py-6">
-                                            <div className="flex items-center gap-4">
-                                                <div className="w-12 h-12 rounded-xl bg-slate-900 flex items-center justify-center text-white text-lg font-black uppercase shrink-0">
-                                                    {emp.nom?.charAt(0)}{emp.prenom?.charAt(0)}
-                                                </div>
-                                                <div className="min-w-0">
-                                                    <p className="text-lg font-black text-slate-900 uppercase truncate">{emp.nom} {emp.prenom}</p>
-                                                    <p className="text-[10px] text-blue-600 font-bold uppercase tracking-widest">{emp.poste}</p>
-                                                </div>
-                                            </div>
-                                        </td>
-                                        <td className="px-8 py-6">
-                                            <div className={`flex justify-center gap-1.5 min-w-[500px] ${isLocked ? 'pointer-events-none' : ''}`}>
-                                                {['PRESENT', 'ABSENT', 'FERIE', 'CONGE', 'MALADIE'].map(s => (
-                                                    <button
-                                                        key={s}
-                                                        onClick={() => setSheetEntries(prev => {
-                                                            const e = { ...prev[emp.id], statut: s };
-                                                            if (s === 'ABSENT' || s === 'MALADIE') e.heuresSupp = 0;
-                                                            return { ...prev, [emp.id]: e };
-                                                        })}
-                                                        disabled={isLocked}
-                                                        className={`px-3 py-2.5 rounded-xl text-[9px] font-black border-2 transition-all min-w-[85px] uppercase tracking-tighter ${getStatusStyles(s, entry.statut)} ${isLocked && s !== entry.statut ? 'opacity-30' : ''}`}
-                                                    >
-                                                        {s}
-                                                    </button>
-                                                ))}
-                                            </div>
-                                        </td>
-                                        <td className="px-6 py-6 text-center">
-                                            <div className={`flex items-center justify-center gap-3 ${isAbsent || isLocked ? 'opacity-30 pointer-events-none' : ''}`}>
-                                                <input
-                                                    type="number"
-                                                    step="0.5"
-                                                    disabled={isLocked}
-                                                    value={entry.heuresSupp}
-                                                    onChange={(e) => setSheetEntries(prev => ({ ...prev, [emp.id]: { ...prev[emp.id], heuresSupp: parseFloat(e.target.value) || 0 } }))}
-                                                    className="w-20 text-center font-black bg-white border-2 border-slate-200 rounded-xl py-2 focus:border-blue-600 outline-none shadow-sm"
-                                                />
-                                            </div>
-                                        </td>
-                                        <td className="px-6 py-6 text-center">
-                                            <input
-                                                type="number"
-                                                step="5"
-                                                disabled={isLocked}
-                                                value={entry.avance || 0}
-                                                onChange={(e) => setSheetEntries(prev => ({ ...prev, [emp.id]: { ...prev[emp.id], avance: parseFloat(e.target.value) || 0 } }))}
-                                                className={`w-24 text-center text-lg font-black bg-white border-2 border-slate-200 rounded-xl py-2 focus:border-emerald-500 focus:bg-emerald-50 outline-none transition-all shadow-sm ${isLocked ? 'opacity-50 pointer-events-none' : ''}`}
-                                                placeholder="0"
-                                            />
-                                        </td>
-                                        <td className="px-8 py-6">
-                                            <input
-                                                type="text"
-                                                disabled={isLocked}
-                                                value={entry.notes || ''}
-                                                onChange={(e) => setSheetEntries(prev => ({ ...prev, [emp.id]: { ...prev[emp.id], notes: e.target.value } }))}
-                                                className={`w-full px-4 py-3 bg-white border-2 border-slate-200 rounded-xl text-sm font-bold text-slate-700 focus:border-blue-600 outline-none transition-all shadow-sm ${isLocked ? 'opacity-50 pointer-events-none' : ''}`}
-                                                placeholder={isLocked ? "Verrouillé" : "Observation..."}
-                                            />
-                                        </td>
-                                        <td className="px-6 py-6 text-center">
-                                            <div className="flex items-center justify-center gap-2 text-emerald-600 font-black text-[10px] uppercase bg-emerald-50 px-4 py-2 rounded-xl ring-1 ring-emerald-200">
-                                                <CheckCircle2 className="w-3 h-3 text-emerald-500" /> Historique
-                                            </div>
-                                        </td>
-                                    </tr>
-                                );
-                            })}
-                        </tbody>
-                        <tfoot className="bg-slate-50 border-t-4 border-slate-900 font-black uppercase text-xs">
+                        }
+                        rendreLigne={(emp) => (
+                            <LigneHistorique
+                                emp={emp}
+                                entry={sheetEntries[emp.id]}
+                                isLocked={isLocked}
+                                onChange={modifierLigne}
+                            />
+                        )}
+                        pied={
                             <tr>
                                 <td colSpan="2" className="px-10 py-6 text-right text-slate-500 tracking-widest">Totaux corrigés</td>
                                 <td className="px-6 py-6 text-center text-slate-900 border-x-2 border-slate-200 bg-blue-50/50">
                                     <div className="flex flex-col">
                                         <span className="text-[10px] text-blue-600 opacity-50">Total HS</span>
-                                        <span className="text-2xl">{Object.values(sheetEntries).reduce((sum, e) => sum + (e?.heuresSupp || 0), 0)}h</span>
+                                        <span className="text-2xl">{totaux.heuresSupp}h</span>
                                     </div>
                                 </td>
                                 <td className="px-6 py-6 text-center text-slate-900 border-r-2 border-slate-200 bg-emerald-50/50">
                                     <div className="flex flex-col">
                                         <span className="text-[10px] text-emerald-600 opacity-50">Total Avances</span>
-                                        <span className="text-2xl">{Object.values(sheetEntries).reduce((sum, e) => sum + (e?.avance || 0), 0).toFixed(3)} DT</span>
+                                        <span className="text-2xl">{totaux.avances.toFixed(3)} DT</span>
                                     </div>
                                 </td>
                                 <td colSpan="2" className="px-10 py-6"></td>
                             </tr>
-                        </tfoot>
-                    </table>
+                        }
+                    />
                 </div>
             </div>
         </div>
@@ -24,15 +24,19 @@ import {
     FileText
 } from 'lucide-react';
 import { generateChefAuditPDF } from '@/lib/services/chefAuditPdfService';
+import { charger, invalider } from '@/lib/infrastructure/http/cacheRequetes';
+import { ecarterSaisie, enfilerSaisie, nouvelleCle, saisiesEnAttente, saisiesRejetees, useSynchronisation } from '@/lib/infrastructure/horsLigne/saisiesHorsLigne';
 
 export default function ChefPointagePage() {
-    const [pointages, setPointages] = useState([]);
     const [employes, setEmployes] = useState([]);
     const [loading, setLoading] = useState(true);
     const [filterDate, setFilterDate] = useState(new Date().toISOString().split('T')[0]);
     const [searchTerm, setSearchTerm] = useState('');
     const [sheetEntries, setSheetEntries] = useState({});
+    const [initialEntries, setInitialEntries] = useState({});
     const [saveSuccess, setSaveSuccess] = useState(false);
+    const [enAttente, setEnAttente] = useState(0);
+    const [rejetees, setRejetees] = useState([]);
     const [pdfGenerating, setPdfGenerating] = useState(false);
     const [validationErrors, setValidationErrors] = useState([]);
     const { data: session } = useSession();
@@ -55,21 +59,21 @@ export default function ChefPointagePage() {
         fetchData();
     }, [filterDate]);
 
+    useEffect(() => {
+        saisiesRejetees().then(setRejetees).catch(() => {});
+    }, []);
+
     const fetchData = async () => {
         try {
             setLoading(true);
-            const [pointagesRes, employesRes] = await Promise.all([
-                fetch(`/api/pointages?dateDebut=${filterDate}&dateFin=${filterDate}`),
-                fetch('/api/employes'),
-            ]);
-
-            const pointagesData = await pointagesRes.json();
-            const employesData = await employesRes.json();
-
-            setPointages(pointagesData);
-            setEmployes(employesData);
-
-            initializeSheet(employesData, pointagesData, filterDate);
+            // Effectif + pointages du jour en un seul appel (304 si la feuille n'a pas changé).
+            // Toujours revalidée : la saisie part de l'état réel de la journée
+            // Hors ligne, le service worker sert la dernière feuille chargée
+            const feuille = await charger(`/api/pointages/feuille?date=${filterDate}`, { force: true });
+            const enFile = await saisiesEnAttente(filterDate).catch(() => []);
+
+            setEmployes(feuille.employes);
+            initializeSheet(feuille.employes, filterDate, enFile);
         } catch (error) {
             console.error('Erreur chargement données:', error);
         } finally {
@@ -77,12 +81,12 @@ export default function ChefPointagePage() {
         }
     };
 
-    const initializeSheet = (allEmployes, currentPointages, date) => {
+    const initializeSheet = (allEmployes, date, enFile = []) => {
         const newEntries = {};
         const isDimanche = new Date(date).getDay() === 0;
 
         allEmployes.forEach(emp => {
-            const existing = currentPointages.find(p => p.employeId === emp.id && p.date.startsWith(date));
+            const existing = emp.pointage;
 
             if (existing) {
                 newEntries[emp.id] = {
@@ -105,7 +109,16 @@ export default function ChefPointagePage() {
                 };
             }
         });
+
+        // Saisies pas encore synchronisées : la feuille les affiche déjà
+        enFile.forEach(saisie => saisie.pointages.forEach(({ employeId, ...ligne }) => {
+            if (newEntries[employeId]) {
+                newEntries[employeId] = { ...newEntries[employeId], ...ligne, notes: ligne.notes || '', isExisting: true };
+            }
+        }));
+
         setSheetEntries(newEntries);
+        setInitialEntries(newEntries);
     };
 
     // Removed redundant useEffect to avoid double initialization
@@ -130,41 +143,78 @@ export default function ChefPointagePage() {
         });
     };
 
+    // Ligne à enregistrer : pas encore en base, ou modifiée depuis le chargement
+    const estModifiee = (empId) => {
+        const entry = sheetEntries[empId];
+        const initial = initialEntries[empId];
+        return !entry.isExisting || !initial
+            || ['statut', 'heuresSupp', 'joursTravailles', 'notes'].some((champ) => entry[champ] !== initial[champ]);
+    };
+
+    const aDesModifications = () => Object.entries(sheetEntries)
+        .some(([empId, data]) => data.avance > 0 || estModifiee(empId));
+
+    // Fin d'un envoi de la file hors ligne : recharger la feuille si rien n'est en cours de saisie
+    useSynchronisation(({ resultats, enAttente: restantes, rejetees: misesDeCote }) => {
+        setEnAttente(restantes);
+        setRejetees(misesDeCote || []);
+        if (resultats.length) {
+            invalider('/api/pointages');
+            if (!aDesModifications()) fetchData();
+        }
+    });
+
     const handleSaveSheet = async () => {
         try {
             setLoading(true);
-            const entriesToSave = Object.entries(sheetEntries).map(([empId, data]) => ({
-                employeId: empId,
-                ...data
-            }));
+            const entries = Object.entries(sheetEntries);
+
+            // Lignes modifiées et nouvelles avances, avec une clé d'idempotence :
+            // un renvoi après une coupure n'applique rien deux fois
+            const saisie = {
+                cle: nouvelleCle(),
+                date: filterDate,
+                pointages: entries
+                    .filter(([empId]) => estModifiee(empId))
+                    .map(([empId, data]) => ({
+                        employeId: empId,
+                        statut: data.statut,
+                        heuresSupp: data.heuresSupp,
+                        joursTravailles: data.joursTravailles,
+                        notes: data.notes
+                    })),
+                avances: entries
+                    .filter(([, data]) => data.avance > 0)
+                    .map(([empId, data]) => ({
+                        employeId: empId,
+                        montant: data.avance,
+                        note: 'Saisie par le Chef'
+                    }))
+            };
+
+            // Confiée au service worker (file IndexedDB, envoi dès que le réseau le permet)
+            const enFile = await enfilerSaisie(saisie);
+            if (enFile) {
+                const enregistrees = Object.fromEntries(entries.map(([empId, data]) => (
+                    [empId, { ...data, avance: 0, isExisting: true }]
+                )));
+                setSheetEntries(enregistrees);
+                setInitialEntries(enregistrees);
+                setEnAttente(enFile.enAttente);
+                setSaveSuccess(true);
+                setTimeout(() => setSaveSuccess(false), 4000);
+                return;
+            }
 
-            // Save Pointages
-            const resPointage = await fetch('/api/pointages', {
+            // Sans service worker : envoi direct, en une seule transaction
+            const res = await fetch('/api/pointages/feuille', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    bulk: true,
-                    date: filterDate,
-                    pointages: entriesToSave
-                }),
+                body: JSON.stringify(saisie),
             });
 
-            // Save Avances (only those > 0)
-            const avancesToSave = entriesToSave.filter(e => e.avance > 0);
-            for (const av of avancesToSave) {
-                await fetch('/api/avances', {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                        employeId: av.employeId,
-                        montant: av.avance,
-                        date: filterDate,
-                        note: 'Saisie par le Chef'
-                    }),
-                });
-            }
-
-            if (resPointage.ok) {
+            if (res.ok) {
+                invalider('/api/pointages');
                 setSaveSuccess(true);
                 setTimeout(() => setSaveSuccess(false), 4000);
                 fetchData();
@@ -238,8 +288,8 @@ export default function ChefPointagePage() {
         // Prepare pointages data for PDF
         const pointagesForPDF = employes.map(emp => {
             const entry = sheetEntries[emp.id];
-            const existing = pointages.find(p => p.employeId === emp.id && p.date.startsWith(filterDate));
-            
+            const existing = emp.pointage;
+
             return {
                 employeId: emp.id,
                 statut: entry?.statut || null,
@@ -268,10 +318,10 @@ export default function ChefPointagePage() {
                     headers: { 'Content-Type': 'application/json' },
                     body: JSON.stringify({
                         date: filterDate,
-                        chefId: session?.user?.id,
                         validatedAt: new Date().toISOString()
                     })
                 });
+                invalider('/api/pointages/feuille');
             } catch (error) {
                 console.error('Erreur validation:', error);
             }
@@ -305,6 +355,37 @@ export default function ChefPointagePage() {
                 )}
             </AnimatePresence>
 
+            {/* Offline queue */}
+            {enAttente > 0 && (
+                <div className="bg-amber-50 border-4 border-amber-200 p-5 rounded-[32px] flex items-center gap-4 font-black text-amber-800" data-testid="sync-pending">
+                    <Clock className="w-7 h-7" />
+                    <span>{enAttente} enregistrement(s) en attente de synchronisation</span>
+                </div>
+            )}
+
+            {/* Saisies refusées ou en erreur répétée : gardées jusqu'à ce qu'elles soient écartées */}
+            {rejetees.length > 0 && (
+                <div className="bg-rose-50 border-4 border-rose-200 p-5 rounded-[32px] space-y-3 font-black text-rose-800" data-testid="sync-rejetees">
+                    <div className="flex items-center gap-4">
+                        <AlertCircle className="w-7 h-7" />
+                        <span>{rejetees.length} enregistrement(s) non synchronisé(s) : à ressaisir</span>
+                    </div>
+                    {rejetees.map((r) => (
+                        <div key={r.cle} className="flex items-center justify-between gap-4 bg-white/70 rounded-2xl px-4 py-3 text-sm">
+                            <span>
+                                {new Date(r.date).toLocaleDateString('fr-FR')} — {r.pointages.length} pointage(s), {r.avances.length} avance(s) — {r.error || `Erreur ${r.status}`}
+                            </span>
+                            <button
+                                onClick={async () => setRejetees(await ecarterSaisie(r.cle))}
+                                className="btn bg-white border border-rose-200 text-rose-700 hover:bg-rose-100 px-4 py-2 text-xs font-black uppercase"
+                            >
+                                Écarter
+                            </button>
+                        </div>
+                    ))}
+                </div>
+            )}
+
             {/* Validation Errors Banner */}
             <AnimatePresence>
                 {validationErrors.length > 0 && (
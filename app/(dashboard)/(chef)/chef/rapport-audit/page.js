@@ -1,6 +1,6 @@
 'use client';
 
-import { useEffect, useState, useMemo } from 'react';
+import { useState, useMemo } from 'react';
 import { useSession } from 'next-auth/react';
 import { motion, AnimatePresence } from 'framer-motion';
 import {
@@ -18,53 +18,26 @@ import {
 } from 'lucide-react';
 import { generateChefAuditPDF } from '@/lib/services/chefAuditPdfService';
 import { useLanguage } from '@/context/LanguageContext';
+import { invalider, joursVoisins, useRequete } from '@/lib/infrastructure/http/cacheRequetes';
 
 export default function ChefAuditReportPage() {
     const { t } = useLanguage();
     const { data: session } = useSession();
-    const [pointages, setPointages] = useState([]);
-    const [employes, setEmployes] = useState([]);
-    const [loading, setLoading] = useState(true);
     const [filterDate, setFilterDate] = useState(new Date().toISOString().split('T')[0]);
     const [searchTerm, setSearchTerm] = useState('');
     const [pdfGenerating, setPdfGenerating] = useState(false);
     const [validationErrors, setValidationErrors] = useState([]);
-    const [isValidated, setIsValidated] = useState(false);
 
-    useEffect(() => {
-        fetchData();
-        checkValidationStatus();
-    }, [filterDate]);
+    // Feuille du jour : effectif, pointages, avances et validation Chef en un appel
+    const { data: feuille, loading } = useRequete(`/api/pointages/feuille?date=${filterDate}`, {
+        prechargement: joursVoisins(filterDate).map((jour) => `/api/pointages/feuille?date=${jour}`),
+    });
 
-    const fetchData = async () => {
-        try {
-            setLoading(true);
-            const [pointagesRes, employesRes] = await Promise.all([
-                fetch(`/api/pointages?dateDebut=${filterDate}&dateFin=${filterDate}`),
-                fetch('/api/employes'),
-            ]);
-
-            const pointagesData = await pointagesRes.json();
-            const employesData = await employesRes.json();
-
-            setPointages(pointagesData);
-            setEmployes(employesData);
-        } catch (error) {
-            console.error('Erreur chargement données:', error);
-        } finally {
-            setLoading(false);
-        }
-    };
-
-    const checkValidationStatus = async () => {
-        try {
-            const res = await fetch(`/api/pointages/validate-chef?date=${filterDate}`);
-            const data = await res.json();
-            setIsValidated(data.isValidated);
-        } catch (error) {
-            console.error('Erreur vérification validation:', error);
-        }
-    };
+    const employes = feuille?.employes || [];
+    const isValidated = !!feuille?.validation.isValidated;
+    const pointages = useMemo(() => (feuille?.employes || [])
+        .filter(emp => emp.pointage)
+        .map(emp => ({ ...emp.pointage, employeId: emp.id, avance: emp.avance })), [feuille]);
 
     // Validation logic
     const validateEntry = (pointage) => {
@@ -90,7 +63,7 @@ export default function ChefAuditReportPage() {
     // Combine employes with their pointages
     const combinedData = useMemo(() => {
         return employes.map(emp => {
-            const pointage = pointages.find(p => p.employeId === emp.id && p.date.startsWith(filterDate));
+            const pointage = pointages.find(p => p.employeId === emp.id);
             const errors = validateEntry(pointage);
             return {
                 ...emp,
@@ -99,7 +72,7 @@ export default function ChefAuditReportPage() {
                 hasErrors: errors.length > 0
             };
         });
-    }, [employes, pointages, filterDate]);
+    }, [employes, pointages]);
 
     const filteredData = useMemo(() => {
         return combinedData.filter(item =>
@@ -148,11 +121,10 @@ export default function ChefAuditReportPage() {
                     headers: { 'Content-Type': 'application/json' },
                     body: JSON.stringify({
                         date: filterDate,
-                        chefId: session?.user?.id,
                         validatedAt: new Date().toISOString()
                     })
                 });
-                setIsValidated(true);
+                invalider('/api/pointages/feuille');
             } catch (error) {
                 console.error('Erreur validation:', error);
             }
@@ -8,6 +8,7 @@ import { useNotifications } from '@/context/NotificationContext';
 import ChatContactList from '@/components/chat/ChatContactList';
 import ChatMessageBubble from '@/components/chat/ChatMessageBubble';
 import ChatInput from '@/components/chat/ChatInput';
+import { charger } from '@/lib/infrastructure/http/cacheRequetes';
 
 /**
  * MessagesPage - Modern chat interface with RTL support
@@ -64,8 +65,7 @@ export default function MessagesPage() {
 
     const loadContacts = async () => {
         try {
-            const res = await fetch('/api/users/chat-contacts');
-            const data = await res.json();
+            const data = await charger('/api/users/chat-contacts');
 
             if (data && data.length > 0) {
                 setContacts(data);
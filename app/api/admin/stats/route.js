@@ -1,14 +1,14 @@
 import { NextResponse } from 'next/server';
-import { getServerSession } from 'next-auth';
-import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
 import prisma from '@/lib/prisma';
 import { calculerJoursOuvrables, calculerJoursOuvrablesPartiel } from '@/lib/services/calculJoursService';
+import { obtenirJour, totaliserPeriode, repartitionDuJour } from '@/lib/services/pointageJourService';
 
 export const dynamic = 'force-dynamic';
 
 export async function GET(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
         if (!session || session.user.role !== 'ADMIN') {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
         }
@@ -55,21 +55,23 @@ export async function GET(request) {
         // 2. Global Stats (Cumulative from 1st to targetDate)
         const totalEmployes = await prisma.employe.count({ where: { statut: 'ACTIF' } });
 
+        // Totaux cumulés lus dans l'agrégat quotidien (PRESENT + FERIE, heures supp)
+        const cumul = await totaliserPeriode(debutMois, finPeriode);
+
+        // Seules les lignes avec heures supp servent au graphique par employé
         const pointagesCumul = await prisma.pointage.findMany({
-            where: { date: { gte: debutMois, lte: finPeriode } }
+            where: { date: { gte: debutMois, lte: finPeriode }, heuresSupp: { gt: 0 } },
+            select: { employeId: true, date: true, heuresSupp: true }
         });
 
         // Calculate capacity only up to targetDate
         const { ouvrables } = calculerJoursOuvrablesPartiel(targetDate);
         const capaciteTotale = ouvrables * totalEmployes;
 
-        const joursPresentsCumul = pointagesCumul
-            .filter(p => p.statut === 'PRESENT' || p.statut === 'FERIE') // FERIE often counts as paid/present in some stats, but technically 'tauxPresence' usually means physically there? 
-            // Previous logic: filter(p => p.statut === 'PRESENT' || p.statut === 'FERIE')
-            .reduce((sum, p) => sum + (p.joursTravailles || 0), 0);
+        const joursPresentsCumul = cumul.joursPresents;
 
         const tauxPresence = capaciteTotale > 0 ? Math.round((joursPresentsCumul / capaciteTotale) * 100) : 0;
-        const totalHeuresSupp = pointagesCumul.reduce((sum, p) => sum + (p.heuresSupp || 0), 0);
+        const totalHeuresSupp = cumul.heuresSupp;
 
         const resultAvances = await prisma.avance.aggregate({
             where: { date: { gte: debutMois, lte: finPeriode }, statut: 'APPROVED' },
@@ -147,30 +149,33 @@ export async function GET(request) {
         }
 
         // 4. State of the Day (Target Date Only)
-        // pointagesJour: date within [debutJour, finJour]
-        const pointagesJour = await prisma.pointage.findMany({
-            where: { date: { gte: debutJour, lte: finJour } },
-            include: { employe: { select: { nom: true, prenom: true } } }
-        });
+        const jour = await obtenirJour(new Date(Date.UTC(targetDate.getFullYear(), targetDate.getMonth(), targetDate.getDate())));
+
+        // Les compteurs viennent de l'agrégat ; seules les listes affichées lisent des lignes
+        const selectionJour = { statut: true, updatedAt: true, employe: { select: { nom: true, prenom: true } } };
+        const [absentsJour, premiersJour] = await Promise.all([
+            prisma.pointage.findMany({
+                where: { date: { gte: debutJour, lte: finJour }, statut: { in: ['ABSENT', 'MALADIE'] } },
+                select: selectionJour
+            }),
+            prisma.pointage.findMany({
+                where: { date: { gte: debutJour, lte: finJour } },
+                select: selectionJour,
+                take: 10
+            }),
+        ]);
 
         // For "isJournalValide", we check if we have enough pointages or if they are validated?
         // Logic in previous code: pointagesToday.length >= totalEmployes.
         // We stick to this heuristic.
-        const isJournalValide = pointagesJour.length >= totalEmployes && totalEmployes > 0;
-
-        const repartitionAujourdhui = {
-            PRESENT: pointagesJour.filter(p => p.statut === 'PRESENT').length,
-            ABSENT: pointagesJour.filter(p => p.statut === 'ABSENT').length,
-            CONGE: pointagesJour.filter(p => p.statut === 'CONGE').length,
-            MALADIE: pointagesJour.filter(p => p.statut === 'MALADIE').length,
-            FERIE: pointagesJour.filter(p => p.statut === 'FERIE').length,
-        };
-
-        const absencesJour = pointagesJour
-            .filter(p => p.statut === 'ABSENT' || p.statut === 'MALADIE')
+        const isJournalValide = (jour?.total || 0) >= totalEmployes && totalEmployes > 0;
+
+        const repartitionAujourdhui = repartitionDuJour(jour);
+
+        const absencesJour = absentsJour
             .map(p => ({ nom: p.employe.nom, prenom: p.employe.prenom, statut: p.statut }));
 
-        const presencesJour = pointagesJour.slice(0, 10).map(p => ({
+        const presencesJour = premiersJour.map(p => ({
             nom: p.employe.nom,
             prenom: p.employe.prenom,
             statut: p.statut,
@@ -2,6 +2,7 @@ import { NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
 import prisma from '@/lib/prisma';
+import { verifierMoisOuvert } from '@/lib/services/clotureService';
 
 export const dynamic = 'force-dynamic';
 
@@ -32,11 +33,15 @@ export async function POST(request, { params }) {
         try {
             console.log('[Approve API] Running SQL update...');
             // Need to handle the enum cast carefully
-            const result = await prisma.$executeRawUnsafe(
-                `UPDATE "Avance" SET statut = $1::"AvanceStatut", "updatedAt" = NOW() WHERE id = $2`,
-                statut,
-                id
-            );
+            const result = await prisma.$transaction(async (tx) => {
+                const avance = await tx.avance.findUnique({ where: { id }, select: { date: true } });
+                await verifierMoisOuvert(tx, [avance?.date]);
+                return await tx.$executeRawUnsafe(
+                    `UPDATE "Avance" SET statut = $1::"AvanceStatut", "updatedAt" = NOW() WHERE id = $2`,
+                    statut,
+                    id
+                );
+            });
 
             console.log(`[Approve API] SQL results: ${result}`);
 
@@ -46,7 +51,7 @@ export async function POST(request, { params }) {
 
             const updatedRow = await prisma.avance.findUnique({
                 where: { id },
-                include: { employe: true }
+                include: { employe: { select: { nom: true, prenom: true } } }
             });
 
             return NextResponse.json(updatedRow);
@@ -56,6 +61,9 @@ export async function POST(request, { params }) {
             throw sqlError;
         }
     } catch (globalError) {
+        if (globalError.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         console.error('[Approve API] FATAL:', globalError);
         return NextResponse.json({
             error: globalError.message,
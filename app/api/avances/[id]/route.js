@@ -2,6 +2,7 @@ import { NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
 import prisma from '@/lib/prisma';
+import { verifierMoisOuvert } from '@/lib/services/clotureService';
 
 export const dynamic = 'force-dynamic';
 
@@ -14,12 +15,19 @@ export async function DELETE(request, { params }) {
 
         const { id } = await params;
 
-        await prisma.avance.delete({
-            where: { id }
+        await prisma.$transaction(async (tx) => {
+            const avance = await tx.avance.findUnique({ where: { id }, select: { date: true } });
+            await verifierMoisOuvert(tx, [avance?.date]);
+            await tx.avance.delete({
+                where: { id }
+            });
         });
 
         return NextResponse.json({ success: true });
     } catch (error) {
+        if (error.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         return NextResponse.json({ error: error.message }, { status: 500 });
     }
 }
@@ -0,0 +1,45 @@
+import { NextResponse } from 'next/server';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import { obtenirFinances, traiterAvances } from '@/lib/use-cases/avance/traiterAvances';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * POST /api/avances/approve
+ * Approuve ou rejette plusieurs avances en attente : { ids: [...], statut }.
+ * Répond avec les ids traités et les agrégats Finances recalculés
+ * (stats, weeklyChart), sans recharger toute la liste.
+ */
+export async function POST(request) {
+    try {
+        const session = await obtenirSession();
+        if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
+        }
+
+        const { ids, statut } = await request.json();
+
+        let traitees;
+        try {
+            traitees = await traiterAvances(ids, statut);
+        } catch (error) {
+            if (['Statut invalide', 'Liste d\'avances invalide'].includes(error.message)) {
+                return NextResponse.json({ error: error.message }, { status: 400 });
+            }
+            if (error.message === 'Mois clôturé') {
+                return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+            }
+            throw error;
+        }
+
+        const { stats, weeklyChart } = await obtenirFinances({ avecListe: false });
+
+        return NextResponse.json({ traitees, statut, stats, weeklyChart });
+    } catch (error) {
+        console.error('Erreur POST /api/avances/approve:', error);
+        return NextResponse.json(
+            { error: 'Erreur serveur', details: error.message },
+            { status: 500 }
+        );
+    }
+}
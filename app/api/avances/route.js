@@ -2,12 +2,16 @@ import { NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
 import prisma from '@/lib/prisma';
+import { lireChamps, selectDe } from '@/lib/infrastructure/http/champs';
+import { verifierMoisOuvert } from '@/lib/services/clotureService';
 
 export const dynamic = 'force-dynamic';
 
+const CHAMPS_AVANCE = ['id', 'employeId', 'montant', 'date', 'note', 'statut', 'createdAt', 'updatedAt'];
+
 /**
  * GET /api/avances?employeId=XXX
- * List advances for an employee
+ * List advances for an employee (fields=a,b,c for a sparse fieldset)
  */
 export async function GET(request) {
     try {
@@ -23,6 +27,7 @@ export async function GET(request) {
 
         const avances = await prisma.avance.findMany({
             where: { employeId },
+            select: selectDe(lireChamps(searchParams, CHAMPS_AVANCE) || CHAMPS_AVANCE),
             orderBy: { date: 'desc' }
         });
 
@@ -49,17 +54,25 @@ export async function POST(request) {
             return NextResponse.json({ error: 'Données manquantes' }, { status: 400 });
         }
 
-        const avance = await prisma.avance.create({
-            data: {
-                employeId,
-                montant: parseFloat(montant),
-                note,
-                date: date ? new Date(date) : new Date()
-            }
+        const dateAvance = date ? new Date(date) : new Date();
+        const avance = await prisma.$transaction(async (tx) => {
+            // Les avances entrent dans la paie du mois : figée une fois le mois clôturé
+            await verifierMoisOuvert(tx, [dateAvance]);
+            return await tx.avance.create({
+                data: {
+                    employeId,
+                    montant: parseFloat(montant),
+                    note,
+                    date: dateAvance
+                }
+            });
         });
 
         return NextResponse.json(avance);
     } catch (error) {
+        if (error.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         return NextResponse.json({ error: error.message }, { status: 500 });
     }
 }
@@ -0,0 +1,87 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { obtenirSession, avecSession } from '@/lib/infrastructure/auth/session';
+import { GET as statsAdmin } from '@/app/api/admin/stats/route';
+import { GET as dashboard } from '@/app/api/dashboard/route';
+import { GET as finances } from '@/app/api/dashboard/finances/route';
+import { GET as employes } from '@/app/api/employes/route';
+import { GET as messagesNonLus } from '@/app/api/messages/unread/route';
+import { GET as pointages } from '@/app/api/pointages/route';
+import { GET as feuille } from '@/app/api/pointages/feuille/route';
+import { GET as jours } from '@/app/api/pointages/jours/route';
+import { GET as rapports } from '@/app/api/rapports/route';
+import { GET as contacts } from '@/app/api/users/chat-contacts/route';
+
+export const dynamic = 'force-dynamic';
+
+// Routes GET exécutables dans un lot (chemin -> handler). /api/profile n'y
+// figure pas : elle n'a qu'un PATCH (mot de passe, 2FA), les pages de profil
+// lisent l'utilisateur depuis la session
+const ROUTES = {
+    '/api/admin/stats': statsAdmin,
+    '/api/dashboard': dashboard,
+    '/api/dashboard/finances': finances,
+    '/api/employes': employes,
+    '/api/messages/unread': messagesNonLus,
+    '/api/pointages': pointages,
+    '/api/pointages/feuille': feuille,
+    '/api/pointages/jours': jours,
+    '/api/rapports': rapports,
+    '/api/users/chat-contacts': contacts,
+};
+
+const TAILLE_MAX_LOT = 10;
+
+/**
+ * POST /api/batch
+ * Exécute plusieurs GET internes en parallèle sous une seule vérification de
+ * session, pour qu'une page charge ses données de démarrage en un aller-retour.
+ *
+ * Body: { requetes: ['/api/messages/unread', '/api/pointages/feuille?date=...'] }
+ * Réponse: { reponses: { [url]: { status, data } } }
+ */
+export async function POST(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
+        }
+
+        const { requetes } = await request.json();
+
+        if (!Array.isArray(requetes) || requetes.length === 0) {
+            return NextResponse.json({ error: 'requetes doit être une liste d\'URL' }, { status: 400 });
+        }
+        if (requetes.length > TAILLE_MAX_LOT) {
+            return NextResponse.json(
+                { error: `${TAILLE_MAX_LOT} requêtes maximum par lot` },
+                { status: 400 }
+            );
+        }
+
+        const urls = [...new Set(requetes)];
+        const resultats = await avecSession(session, () => Promise.all(urls.map(async (url) => {
+            const cible = typeof url === 'string' && url.startsWith('/api/') ? new URL(url, request.url) : null;
+            const handler = cible && ROUTES[cible.pathname];
+
+            if (!handler) {
+                return [url, { status: 404, data: { error: 'Route non disponible en lot' } }];
+            }
+
+            try {
+                const reponse = await handler(new NextRequest(cible));
+                return [url, { status: reponse.status, data: await reponse.json() }];
+            } catch (error) {
+                return [url, { status: 500, data: { error: 'Erreur serveur', details: error.message } }];
+            }
+        })));
+
+        return NextResponse.json({ reponses: Object.fromEntries(resultats) });
+    } catch (error) {
+        console.error('Erreur POST /api/batch:', error);
+        return NextResponse.json(
+            { error: 'Erreur serveur', details: error.message },
+            { status: 500 }
+        );
+    }
+}
@@ -0,0 +1,57 @@
+import { NextResponse } from 'next/server';
+import prisma from '@/lib/prisma';
+import { cloturerSortiesOubliees } from '@/lib/services/autoClockService';
+import { purgerClesFeuille } from '@/lib/use-cases/pointage/enregistrerFeuille';
+import { drainerJoursARecalculer } from '@/lib/services/pointageJourService';
+
+export const dynamic = 'force-dynamic'; // Ensure it's not cached
+
+/**
+ * Balayage planifié des sorties oubliées (toutes les heures suffit), qui
+ * purge au passage les clés d'idempotence expirées des saisies de feuille et
+ * recalcule les jours PointageJour restés marqués (recalcul d'un pointage
+ * d'entrée/sortie interrompu).
+ * Si CRON_SECRET est défini, l'appel doit porter `Authorization: Bearer <CRON_SECRET>`.
+ */
+export async function GET(request) {
+    const secret = process.env.CRON_SECRET;
+    if (secret && request.headers.get('authorization') !== `Bearer ${secret}`) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+    }
+
+    try {
+        const bilan = await cloturerSortiesOubliees();
+        const clesPurgees = await purgerClesFeuille();
+        const joursRecalcules = (await drainerJoursARecalculer()).length;
+        console.log('Auto clock-out:', JSON.stringify({ ...bilan, clesPurgees, joursRecalcules }));
+
+        if (bilan.clotures === 0) {
+            return NextResponse.json({ message: 'No open pointage past cutoff.', bilan });
+        }
+
+        // Trace du balayage : message système aux administrateurs
+        const admins = await prisma.user.findMany({
+            where: { role: 'ADMIN' },
+            select: { id: true }
+        });
+
+        if (admins.length > 0) {
+            await prisma.message.createMany({
+                data: admins.map(admin => ({
+                    subject: 'Sorties automatiques',
+                    content: `${bilan.clotures} pointage(s) sans sortie clôturé(s) automatiquement `
+                        + `(${bilan.heures}h dont ${bilan.heuresSupp}h supp) pour le(s) jour(s) : ${bilan.jours.join(', ')}.`,
+                    senderId: admins[0].id,
+                    receiverId: admin.id,
+                    isSystemMessage: true
+                }))
+            });
+        }
+
+        return NextResponse.json({ success: true, bilan });
+
+    } catch (error) {
+        console.error('Cron Auto Clock-Out Error:', error);
+        return NextResponse.json({ error: 'Internal Server Error' }, { status: 500 });
+    }
+}
@@ -0,0 +1,28 @@
+import { NextResponse } from 'next/server';
+import { preparerPartitions, archiverPartitions } from '@/lib/services/partitionsService';
+
+export const dynamic = 'force-dynamic'; // Ensure it's not cached
+
+/**
+ * Entretien planifié des partitions mensuelles de Pointage (une fois par
+ * jour suffit) : crée les partitions des prochains mois et archive les mois
+ * sortis de la fenêtre de rétention (POINTAGE_RETENTION_MOIS).
+ * Si CRON_SECRET est défini, l'appel doit porter `Authorization: Bearer <CRON_SECRET>`.
+ */
+export async function GET(request) {
+    const secret = process.env.CRON_SECRET;
+    if (secret && request.headers.get('authorization') !== `Bearer ${secret}`) {
+        return NextResponse.json({ error: 'Unauthorized' }, { status: 401 });
+    }
+
+    try {
+        const creees = await preparerPartitions();
+        const archivees = await archiverPartitions();
+        console.log('Partitions Pointage:', JSON.stringify({ creees, archivees }));
+
+        return NextResponse.json({ success: true, creees, archivees });
+    } catch (error) {
+        console.error('Cron Partitions Error:', error);
+        return NextResponse.json({ error: 'Internal Server Error' }, { status: 500 });
+    }
+}
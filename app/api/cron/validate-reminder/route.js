@@ -1,5 +1,7 @@
 import { NextResponse } from 'next/server';
 import prisma from '@/lib/prisma';
+import { obtenirJour } from '@/lib/services/pointageJourService';
+import { obtenirValidation } from '@/lib/use-cases/pointage/validerJournee';
 
 export const dynamic = 'force-dynamic'; // Ensure it's not cached
 
@@ -10,16 +12,14 @@ export async function GET(request) {
 
     try {
         const today = new Date();
-        const startOfDay = new Date(today.setHours(0, 0, 0, 0));
-        const endOfDay = new Date(today.setHours(23, 59, 59, 999));
 
-        // 1. Check if journal is valid (logic from stats API)
+        // 1. Check if journal is valid (logic from stats API), from the daily rollup
         const totalEmployes = await prisma.employe.count({ where: { statut: 'ACTIF' } });
-        const pointagesJour = await prisma.pointage.count({
-            where: { date: { gte: startOfDay, lte: endOfDay } }
-        });
+        const jourCourant = new Date(Date.UTC(today.getFullYear(), today.getMonth(), today.getDate()));
+        const [jour, validation] = await Promise.all([obtenirJour(jourCourant), obtenirValidation(jourCourant)]);
+        const pointagesJour = jour?.total || 0;
 
-        const isJournalValide = pointagesJour >= totalEmployes && totalEmployes > 0;
+        const isJournalValide = (pointagesJour >= totalEmployes && totalEmployes > 0) || !!validation;
 
         if (isJournalValide) {
             return NextResponse.json({ message: 'Journal already validated. No reminder sent.' });
@@ -1,8 +1,9 @@
 import { NextResponse } from 'next/server';
-import { getServerSession } from 'next-auth';
-import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
 import prisma from '@/lib/prisma';
 import { calculerJoursOuvrables } from '@/lib/services/calculJoursService';
+import { obtenirJour, totaliserPeriode, repartitionDuJour } from '@/lib/services/pointageJourService';
+import { urlPhoto } from '@/lib/infrastructure/stockage/photos';
 
 export const dynamic = 'force-dynamic';
 
@@ -12,7 +13,7 @@ export const dynamic = 'force-dynamic';
  */
 export async function GET(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
 
         if (!session) {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
@@ -34,34 +35,19 @@ export async function GET(request) {
             where: { statut: 'ACTIF' },
         });
 
-        // Validation du jour (réel)
-        const pointagesAujourdhuiBrut = await prisma.pointage.findMany({
-            where: {
-                date: {
-                    gte: aujourdhui,
-                    lt: new Date(aujourdhui.getTime() + 24 * 60 * 60 * 1000)
-                }
-            }
-        });
-
-        const isJournalValide = pointagesAujourdhuiBrut.length >= totalEmployes && totalEmployes > 0;
+        // Validation du jour (réel) : agrégat PointageJour
+        const jourAujourdhui = await obtenirJour(aujourdhui);
+        const isJournalValide = (jourAujourdhui?.total || 0) >= totalEmployes && totalEmployes > 0;
 
         // Taux de présence du mois sélectionné
         const { ouvrables } = calculerJoursOuvrables(month, year);
 
-        const pointagesMois = await prisma.pointage.findMany({
-            where: {
-                date: { gte: debutMois, lte: finMois },
-            },
-        });
-
-        const joursPresentsMois = pointagesMois
-            .filter(p => p.statut === 'PRESENT' || p.statut === 'FERIE')
-            .reduce((sum, p) => sum + p.joursTravailles, 0);
+        const totauxMois = await totaliserPeriode(debutMois, finMois);
+        const joursPresentsMois = totauxMois.joursPresents;
 
         const capaciteTotale = ouvrables * totalEmployes;
         const tauxPresenceMois = capaciteTotale > 0 ? Math.round((joursPresentsMois / capaciteTotale) * 100) : 0;
-        const totalHeuresSupp = pointagesMois.reduce((sum, p) => sum + p.heuresSupp, 0);
+        const totalHeuresSupp = totauxMois.heuresSupp;
 
         // 1. DOUGHNUT DATA (Aujourd'hui - SEULEMENT SI MOIS ACTUEL ET VALIDE)
         let repartitionAujourdhui = {
@@ -69,13 +55,7 @@ export async function GET(request) {
         };
 
         if (estMoisActuel && isJournalValide) {
-            repartitionAujourdhui = {
-                PRESENT: pointagesAujourdhuiBrut.filter(p => p.statut === 'PRESENT').length,
-                ABSENT: pointagesAujourdhuiBrut.filter(p => p.statut === 'ABSENT').length,
-                CONGE: pointagesAujourdhuiBrut.filter(p => p.statut === 'CONGE').length,
-                MALADIE: pointagesAujourdhuiBrut.filter(p => p.statut === 'MALADIE').length,
-                FERIE: pointagesAujourdhuiBrut.filter(p => p.statut === 'FERIE').length,
-            };
+            repartitionAujourdhui = repartitionDuJour(jourAujourdhui);
         }
 
         // 2. BAR CHART DATA (Avances du mois sélectionné - Evolution par semaine)
@@ -157,7 +137,7 @@ export async function GET(request) {
                 id: p.id,
                 nom: p.employe.nom,
                 prenom: p.employe.prenom,
-                photo: p.employe.photo,
+                photo: urlPhoto(p.employe.photo, 'petite'),
                 poste: p.employe.poste,
                 statut: p.statut,
                 heureValidation: p.updatedAt
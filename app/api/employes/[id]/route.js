@@ -76,7 +76,7 @@ export async function PATCH(request, { params }) {
 
 /**
  * DELETE /api/employes/[id]
- * Supprime un employé
+ * Supprime un employé (403 si ses pointages ou avances touchent un mois clôturé)
  */
 export async function DELETE(request, { params }) {
     try {
@@ -91,6 +91,9 @@ export async function DELETE(request, { params }) {
 
         return NextResponse.json({ message: 'Employé supprimé' });
     } catch (error) {
+        if (error.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         console.error('Erreur DELETE /api/employes/[id]:', error);
         return NextResponse.json(
             { error: 'Erreur serveur', details: error.message },
@@ -32,6 +32,7 @@ export async function DELETE(request) {
         // Execute cascade delete in correct order to respect foreign keys
         // 1. Delete all Pointages (attendance records)
         const deletedPointages = await prisma.pointage.deleteMany({});
+        await prisma.pointageJour.deleteMany({});
         
         // 2. Delete all Avances (advances)
         const deletedAvances = await prisma.avance.deleteMany({});
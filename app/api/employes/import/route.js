@@ -0,0 +1,59 @@
+import { NextResponse } from 'next/server';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import { lireTableur } from '@/lib/infrastructure/import/lireTableur';
+import { importerEmployes } from '@/lib/use-cases/employe/importerEmployes';
+
+export const dynamic = 'force-dynamic';
+
+const ERREURS_FICHIER = ['Fichier vide', 'Fichier illisible', 'Fichier trop volumineux', 'Format non supporté (CSV ou XLSX)'];
+
+/**
+ * POST /api/employes/import
+ * Import en masse d'employés (multipart, champ "fichier", CSV ou XLSX).
+ * Colonnes : nom, prenom (requises), poste, email, mot de passe, date
+ * d'embauche, salaire, matricule, departement, telephone, soldeConges,
+ * soldeMaladie, role (EMPLOYE ou CHEF).
+ * Champ "ignorerErreurs"=true pour importer les lignes valides malgré les erreurs.
+ *
+ * Réponse: { importes, erreurs: [{ ligne, erreurs }], dureeMs, parSeconde }
+ * (201 si des employés ont été créés, 422 si des erreurs bloquent l'import)
+ */
+export async function POST(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
+        }
+
+        const formData = await request.formData();
+        const fichier = formData.get('fichier');
+
+        if (!fichier || typeof fichier.arrayBuffer !== 'function') {
+            return NextResponse.json({ error: 'Champ fichier requis' }, { status: 400 });
+        }
+
+        let bilan;
+        try {
+            const lignes = await lireTableur(Buffer.from(await fichier.arrayBuffer()), fichier.name);
+            bilan = await importerEmployes(lignes, {
+                ignorerErreurs: formData.get('ignorerErreurs') === 'true',
+            });
+        } catch (error) {
+            if (ERREURS_FICHIER.includes(error.message) || error.message.startsWith('Import limité')) {
+                return NextResponse.json({ error: error.message }, { status: 400 });
+            }
+            throw error;
+        }
+
+        console.log(`Import employés: ${bilan.importes} créé(s), ${bilan.erreurs.length} erreur(s), ${bilan.dureeMs} ms`);
+        const status = bilan.importes > 0 ? 201 : bilan.erreurs.length ? 422 : 200;
+        return NextResponse.json(bilan, { status });
+    } catch (error) {
+        console.error('Erreur POST /api/employes/import:', error);
+        return NextResponse.json(
+            { error: 'Erreur serveur', details: error.message },
+            { status: 500 }
+        );
+    }
+}
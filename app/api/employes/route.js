@@ -1,18 +1,23 @@
 // Rebuild-Tag: 2026-02-07T13:55:00Z - STABLE_RELATIVE
 import { NextResponse } from 'next/server';
-import { getServerSession } from 'next-auth';
-import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
-import { obtenirEmployes, gererEmploye } from '@/lib/use-cases/employe/gererEmploye';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import { obtenirEmployes, gererEmploye, CHAMPS_EMPLOYE } from '@/lib/use-cases/employe/gererEmploye';
+import { obtenirStatsEmployes } from '@/lib/use-cases/employe/obtenirStatsEmployes';
+import { lireChamps } from '@/lib/infrastructure/http/champs';
 
 export const dynamic = 'force-dynamic';
 
 /**
  * GET /api/employes
- * Récupère la liste des employés
+ * Récupère la liste des employés (sans la photo ; fields=a,b,c pour une
+ * projection explicite, ex. fields=id,nom,prenom,photo ; photo est une clé
+ * à servir par /api/photos/[cle])
+ * Avec includeStats=true : page triée { employes, total, page, pageSize, mois, annee }
+ * (paramètres page, pageSize, tri, ordre, mois, annee)
  */
 export async function GET(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
 
         if (!session) {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
@@ -23,33 +28,26 @@ export async function GET(request) {
         const search = searchParams.get('search');
         const includeStats = searchParams.get('includeStats') === 'true';
 
-        let employes = await obtenirEmployes({ statut, search });
-
         if (includeStats) {
-            const { calculerRecapMensuel } = await import('@/lib/use-cases/pointage/calculerRecapMensuel');
-            const mois = new Date().getMonth() + 1;
-            const annee = new Date().getFullYear();
-
-            employes = await Promise.all(employes.map(async (emp) => {
-                try {
-                    const recap = await calculerRecapMensuel(emp.id, mois, annee);
-                    return {
-                        ...emp,
-                        statsMensuelles: {
-                            presence: recap.pointages.presence,
-                            heuresSupp: recap.pointages.heuresSupp,
-                            salaireNet: recap.salaire.salaireNet
-                        }
-                    };
-                } catch (e) {
-                    return {
-                        ...emp,
-                        statsMensuelles: { presence: 0, heuresSupp: 0, salaireNet: emp.salaireBase }
-                    };
-                }
-            }));
+            // Page d'employés + statistiques du mois en une seule requête
+            const resultat = await obtenirStatsEmployes({
+                statut,
+                search,
+                mois: searchParams.get('mois'),
+                annee: searchParams.get('annee'),
+                page: searchParams.get('page'),
+                pageSize: searchParams.get('pageSize'),
+                tri: searchParams.get('tri'),
+                ordre: searchParams.get('ordre'),
+            });
+            return NextResponse.json(resultat);
         }
 
+        const employes = await obtenirEmployes(
+            { statut, search },
+            { champs: lireChamps(searchParams, CHAMPS_EMPLOYE) }
+        );
+
         return NextResponse.json(employes);
     } catch (error) {
         console.error('Erreur GET /api/employes:', error);
@@ -66,7 +64,7 @@ export async function GET(request) {
  */
 export async function POST(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
 
         if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
@@ -1,13 +1,12 @@
 import { NextResponse } from 'next/server';
-import { getServerSession } from 'next-auth';
-import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
 import prisma from '@/lib/prisma';
 
 export const dynamic = 'force-dynamic';
 
 export async function GET(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
         if (!session) return NextResponse.json({ count: 0 });
 
         // Get count of unread messages
@@ -0,0 +1,44 @@
+import { NextResponse } from 'next/server';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import { lirePhoto } from '@/lib/infrastructure/stockage/photos';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * GET /api/photos/[cle]?taille=petite|moyenne|originale
+ * Le contenu d'une clé ne change jamais (clé = empreinte du fichier) :
+ * la réponse est mise en cache par le navigateur pour un an sans revalidation.
+ */
+export async function GET(request, { params }) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
+        }
+
+        const { cle } = await params;
+        const taille = new URL(request.url).searchParams.get('taille') || 'moyenne';
+        const image = await lirePhoto(cle, taille);
+
+        if (!image) {
+            return NextResponse.json({ error: 'Photo non trouvée' }, { status: 404 });
+        }
+
+        return new NextResponse(image, {
+            headers: {
+                'Content-Type': 'image/webp',
+                'Content-Length': String(image.length),
+                // private : derrière la session, pas dans un cache partagé
+                'Cache-Control': 'private, max-age=31536000, immutable',
+                ETag: `"${cle}-${taille}"`,
+            },
+        });
+    } catch (error) {
+        console.error('Erreur GET /api/photos/[cle]:', error);
+        return NextResponse.json(
+            { error: 'Erreur serveur', details: error.message },
+            { status: 500 }
+        );
+    }
+}
@@ -0,0 +1,52 @@
+import { NextResponse } from 'next/server';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import { stockerPhoto, urlPhoto } from '@/lib/infrastructure/stockage/photos';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * POST /api/photos
+ * Envoie une photo (multipart, champ "photo"). La clé retournée est à
+ * enregistrer dans Employe.photo via PATCH /api/employes/[id].
+ *
+ * Réponse: { cle, urls: { petite, moyenne, originale } }
+ */
+export async function POST(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
+        }
+
+        const formData = await request.formData();
+        const fichier = formData.get('photo');
+
+        if (!fichier || typeof fichier.arrayBuffer !== 'function') {
+            return NextResponse.json({ error: 'Champ photo requis' }, { status: 400 });
+        }
+
+        try {
+            const cle = await stockerPhoto(Buffer.from(await fichier.arrayBuffer()));
+            return NextResponse.json({
+                cle,
+                urls: {
+                    petite: urlPhoto(cle, 'petite'),
+                    moyenne: urlPhoto(cle, 'moyenne'),
+                    originale: urlPhoto(cle, 'originale'),
+                },
+            }, { status: 201 });
+        } catch (error) {
+            if (['Image invalide', 'Image trop volumineuse'].includes(error.message)) {
+                return NextResponse.json({ error: error.message }, { status: 400 });
+            }
+            throw error;
+        }
+    } catch (error) {
+        console.error('Erreur POST /api/photos:', error);
+        return NextResponse.json(
+            { error: 'Erreur serveur', details: error.message },
+            { status: 500 }
+        );
+    }
+}
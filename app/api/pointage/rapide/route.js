@@ -2,6 +2,8 @@ import { NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
 import prisma from '@/lib/prisma';
+import { rafraichirJours } from '@/lib/services/pointageJourService';
+import { verifierMoisOuvert } from '@/lib/services/clotureService';
 
 export const dynamic = 'force-dynamic';
 
@@ -14,31 +16,41 @@ export async function POST(request) {
 
         const { day, pointages } = await request.json(); // day: YYYY-MM-DD, pointages: [{employeId, statut, heuresSupp}]
 
-        const results = await Promise.all(pointages.map(async (p) => {
-            return await prisma.pointage.upsert({
-                where: {
-                    employeId_date: {
+        const results = await prisma.$transaction(async (tx) => {
+            await verifierMoisOuvert(tx, [day]);
+
+            const ecrits = [];
+            for (const p of pointages) {
+                ecrits.push(await tx.pointage.upsert({
+                    where: {
+                        employeId_date: {
+                            employeId: p.employeId,
+                            date: new Date(day)
+                        }
+                    },
+                    update: {
+                        statut: p.statut,
+                        heuresSupp: p.heuresSupp || 0,
+                        joursTravailles: p.statut === 'ABSENT' ? 0 : 1
+                    },
+                    create: {
                         employeId: p.employeId,
-                        date: new Date(day)
+                        date: new Date(day),
+                        statut: p.statut,
+                        heuresSupp: p.heuresSupp || 0,
+                        joursTravailles: p.statut === 'ABSENT' ? 0 : 1
                     }
-                },
-                update: {
-                    statut: p.statut,
-                    heuresSupp: p.heuresSupp || 0,
-                    joursTravailles: p.statut === 'ABSENT' ? 0 : 1
-                },
-                create: {
-                    employeId: p.employeId,
-                    date: new Date(day),
-                    statut: p.statut,
-                    heuresSupp: p.heuresSupp || 0,
-                    joursTravailles: p.statut === 'ABSENT' ? 0 : 1
-                }
-            });
-        }));
+                }));
+            }
+            await rafraichirJours([day], tx);
+            return ecrits;
+        });
 
         return NextResponse.json({ success: true, count: results.length });
     } catch (error) {
+        if (error.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         console.error('Error in bulk pointage:', error);
         return NextResponse.json({ error: error.message }, { status: 500 });
     }
@@ -0,0 +1,142 @@
+import { NextResponse } from 'next/server';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import { obtenirFeuilleDuJour, versionFeuille } from '@/lib/use-cases/pointage/feuilleDuJour';
+import { enregistrerFeuille } from '@/lib/use-cases/pointage/enregistrerFeuille';
+import { entetesVersion, nonModifie } from '@/lib/infrastructure/http/conditionnel';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * GET /api/pointages/feuille?date=YYYY-MM-DD
+ * Feuille de présence du jour : effectif, pointages, avances et validation Chef
+ * en une seule réponse. Versionnée par ETag : 304 si If-None-Match correspond,
+ * sans recharger la feuille.
+ */
+export async function GET(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
+        }
+
+        const { searchParams } = new URL(request.url);
+        const date = searchParams.get('date') || new Date().toISOString().split('T')[0];
+
+        if (isNaN(new Date(date).getTime())) {
+            return NextResponse.json({ error: 'Date invalide' }, { status: 400 });
+        }
+
+        const version = await versionFeuille(date);
+        const inchangee = nonModifie(request, version);
+        if (inchangee) {
+            return inchangee;
+        }
+
+        const feuille = await obtenirFeuilleDuJour(date);
+
+        return NextResponse.json(
+            { ...feuille, version: version.etag },
+            { headers: entetesVersion(version) }
+        );
+    } catch (error) {
+        console.error('Erreur GET /api/pointages/feuille:', error);
+        return NextResponse.json(
+            { error: 'Erreur serveur', details: error.message },
+            { status: 500 }
+        );
+    }
+}
+
+// Taille maximale d'un lot envoyé par la file hors ligne
+const LOTS_MAX = 50;
+
+/**
+ * Applique une saisie de feuille pour la session : { status, body, version }
+ * `horsLigne` : saisie de la file hors ligne, faite avant son envoi. Le mois
+ * courant du serveur n'en dit rien (saisie du 31 envoyée le 1er) : seule la
+ * clôture (verifierMoisOuvert) la refuse.
+ */
+async function appliquerSaisie(data, session, { horsLigne = false } = {}) {
+    if (data.valider && session.user.role !== 'CHEF') {
+        return { status: 403, body: { error: 'Accès refusé - Réservé aux Chefs' } };
+    }
+
+    // --- ENFORCEMENT OF MONTHLY LOCKING ---
+    if (session.user.role !== 'ADMIN' && !horsLigne) {
+        const targetDate = new Date(data.date);
+        const now = new Date();
+        const isLocked = (targetDate.getFullYear() < now.getFullYear())
+            || (targetDate.getFullYear() === now.getFullYear() && targetDate.getMonth() < now.getMonth());
+
+        if (isLocked) {
+            return { status: 403, body: { error: 'Impossible de modifier un mois déjà clôturé.' } };
+        }
+    }
+
+    try {
+        const { version, ...resultat } = await enregistrerFeuille(data, session.user.id);
+        return { status: 200, body: { ...resultat, version: version.etag }, version };
+    } catch (error) {
+        if (['Date invalide', 'Données de feuille invalides'].includes(error.message)) {
+            return { status: 400, body: { error: error.message } };
+        }
+        if (error.message === 'Mois clôturé') {
+            return { status: 403, body: { error: 'Mois clôturé : rouvrir le mois pour le modifier.' } };
+        }
+        throw error;
+    }
+}
+
+/**
+ * POST /api/pointages/feuille
+ * Enregistre les modifications d'une feuille en une transaction :
+ * { date, pointages: [lignes modifiées], avances: [nouvelles avances], valider?, cle? }.
+ * Répond avec les compteurs et la nouvelle version (ETag) de la feuille.
+ * `cle` rend l'envoi idempotent (rejouable sans double application).
+ *
+ * Forme lot, utilisée par la synchronisation hors ligne :
+ * { lots: [saisie, ...] } -> { resultats: [{ cle, status, ...corps }] },
+ * chaque saisie dans sa propre transaction, dans l'ordre reçu ; une erreur
+ * serveur sur une saisie est rendue dans son résultat (status 500). Seule
+ * la clôture y refuse un mois passé (voir appliquerSaisie).
+ */
+export async function POST(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
+        }
+
+        const data = await request.json();
+
+        if (Array.isArray(data.lots)) {
+            if (data.lots.length > LOTS_MAX) {
+                return NextResponse.json({ error: `${LOTS_MAX} saisies maximum par lot` }, { status: 400 });
+            }
+            const resultats = [];
+            for (const saisie of data.lots) {
+                // Une saisie en échec ne doit pas faire échouer le lot : la file
+                // du service worker continue avec les suivantes
+                try {
+                    const { status, body } = await appliquerSaisie(saisie || {}, session, { horsLigne: true });
+                    resultats.push({ cle: saisie?.cle || null, status, ...body });
+                } catch (error) {
+                    console.error('Erreur saisie hors ligne /api/pointages/feuille:', error);
+                    resultats.push({ cle: saisie?.cle || null, status: 500, error: 'Erreur serveur', details: error.message });
+                }
+            }
+            return NextResponse.json({ resultats });
+        }
+
+        const { status, body, version } = await appliquerSaisie(data, session);
+        return NextResponse.json(body, version ? { headers: entetesVersion(version) } : { status });
+    } catch (error) {
+        console.error('Erreur POST /api/pointages/feuille:', error);
+        return NextResponse.json(
+            { error: 'Erreur serveur', details: error.message },
+            { status: 500 }
+        );
+    }
+}
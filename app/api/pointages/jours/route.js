@@ -0,0 +1,56 @@
+import { NextResponse } from 'next/server';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import prisma from '@/lib/prisma';
+import { obtenirJours } from '@/lib/services/pointageJourService';
+import { etagDe } from '@/lib/services/versionService';
+import { entetesVersion, nonModifie } from '@/lib/infrastructure/http/conditionnel';
+
+export const dynamic = 'force-dynamic';
+
+/**
+ * GET /api/pointages/jours?mois=&annee=
+ * Historique jour par jour (compteurs par statut, heures supp, validation Chef)
+ * lu dans l'agrégat PointageJour : une ligne par jour pointé du mois.
+ * Versionné par ETag sur l'agrégat lui-même (304 si aucun jour n'a bougé).
+ */
+export async function GET(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
+        }
+
+        const { searchParams } = new URL(request.url);
+        const maintenant = new Date();
+        const mois = parseInt(searchParams.get('mois')) || (maintenant.getMonth() + 1);
+        const annee = parseInt(searchParams.get('annee')) || maintenant.getFullYear();
+
+        const debut = new Date(Date.UTC(annee, mois - 1, 1));
+        const fin = new Date(Date.UTC(annee, mois, 0));
+
+        const { _count, _max } = await prisma.pointageJour.aggregate({
+            where: { date: { gte: debut, lte: fin } },
+            _count: true,
+            _max: { updatedAt: true },
+        });
+        const version = {
+            etag: etagDe([debut, _count, _max.updatedAt]),
+            lastModified: _max.updatedAt,
+        };
+        const inchange = nonModifie(request, version);
+        if (inchange) {
+            return inchange;
+        }
+
+        const jours = await obtenirJours(debut, fin);
+
+        return NextResponse.json({ mois, annee, jours }, { headers: entetesVersion(version) });
+    } catch (error) {
+        console.error('Erreur GET /api/pointages/jours:', error);
+        return NextResponse.json(
+            { error: 'Erreur serveur', details: error.message },
+            { status: 500 }
+        );
+    }
+}
@@ -1,18 +1,20 @@
 // Rebuild-Tag: 2026-02-07T13:55:00Z - STABLE_RELATIVE
 import { NextResponse } from 'next/server';
-import { getServerSession } from 'next-auth';
-import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
-import { obtenirPointages, creerPointage, supprimerPointage } from '@/lib/use-cases/pointage/creerPointage';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import { obtenirPointages, obtenirPagePointages, creerPointage, supprimerPointage, CHAMPS_POINTAGE } from '@/lib/use-cases/pointage/creerPointage';
+import { lireChamps } from '@/lib/infrastructure/http/champs';
 
 export const dynamic = 'force-dynamic';
 
 /**
  * GET /api/pointages
- * Récupère la liste des pointages avec filtres
+ * Récupère la liste des pointages avec filtres, réduite aux fields=a,b,c si fournis
+ * Avec limit (et cursor) : une page { pointages, nextCursor }, triée par
+ * tri=date|employe et ordre=asc|desc
  */
 export async function GET(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
 
         if (!session) {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
@@ -34,7 +36,27 @@ export async function GET(request) {
         if (mois) filters.mois = parseInt(mois);
         if (annee) filters.annee = parseInt(annee);
 
-        const pointages = await obtenirPointages(filters);
+        const champs = lireChamps(searchParams, CHAMPS_POINTAGE);
+
+        if (searchParams.has('limit') || searchParams.has('cursor')) {
+            try {
+                const page = await obtenirPagePointages(filters, {
+                    limit: searchParams.get('limit'),
+                    cursor: searchParams.get('cursor'),
+                    tri: searchParams.get('tri'),
+                    ordre: searchParams.get('ordre'),
+                    champs,
+                });
+                return NextResponse.json(page);
+            } catch (error) {
+                if (error.message === 'Curseur invalide') {
+                    return NextResponse.json({ error: error.message }, { status: 400 });
+                }
+                throw error;
+            }
+        }
+
+        const pointages = await obtenirPointages(filters, { champs });
 
         return NextResponse.json(pointages);
     } catch (error) {
@@ -52,7 +74,7 @@ export async function GET(request) {
  */
 export async function POST(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
 
         if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
@@ -89,6 +111,9 @@ export async function POST(request) {
         const pointage = await creerPointage(data);
         return NextResponse.json(pointage, { status: 201 });
     } catch (error) {
+        if (error.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         console.error('Erreur POST /api/pointages:', error);
         return NextResponse.json(
             { error: 'Erreur serveur', details: error.message },
@@ -103,7 +128,7 @@ export async function POST(request) {
  */
 export async function PATCH(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
 
         if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
@@ -114,6 +139,12 @@ export async function PATCH(request) {
 
         return NextResponse.json(pointage);
     } catch (error) {
+        if (error.message === 'Pointage non trouvé') {
+            return NextResponse.json({ error: error.message }, { status: 404 });
+        }
+        if (error.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         console.error('Erreur PATCH /api/pointages:', error);
         return NextResponse.json(
             { error: 'Erreur serveur', details: error.message },
@@ -128,7 +159,7 @@ export async function PATCH(request) {
  */
 export async function DELETE(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
 
         if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
@@ -141,6 +172,12 @@ export async function DELETE(request) {
 
         return NextResponse.json({ message: 'Pointage supprimé' });
     } catch (error) {
+        if (error.message === 'Pointage non trouvé') {
+            return NextResponse.json({ error: error.message }, { status: 404 });
+        }
+        if (error.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         console.error('Erreur DELETE /api/pointages:', error);
         return NextResponse.json(
             { error: 'Erreur serveur', details: error.message },
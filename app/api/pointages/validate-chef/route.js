@@ -2,16 +2,18 @@ import { NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
 import prisma from '@/lib/prisma';
+import { obtenirValidation, validerJournee } from '@/lib/use-cases/pointage/validerJournee';
 
 export const dynamic = 'force-dynamic';
 
 /**
  * POST /api/pointages/validate-chef
  * 
- * Marque les pointages d'une journée comme "validés par le Chef"
- * et envoie une notification à l'Admin.
+ * Marque les pointages d'une journée comme "validés par le Chef",
+ * enregistre la validation du jour et envoie une notification à l'Admin.
+ * Le Chef validateur est celui de la session.
  * 
- * Body: { date: string, chefId: string, validatedAt: string }
+ * Body: { date: string, validatedAt?: string }
  */
 export async function POST(request) {
     try {
@@ -26,25 +28,19 @@ export async function POST(request) {
             return NextResponse.json({ error: 'Accès refusé - Réservé aux Chefs' }, { status: 403 });
         }
 
-        const { date, chefId, validatedAt } = await request.json();
+        const { date, validatedAt } = await request.json();
+        const chefId = session.user.id;
 
         if (!date) {
             return NextResponse.json({ error: 'Date requise' }, { status: 400 });
         }
 
-        // Mettre à jour tous les pointages de cette date avec le statut de validation Chef
-        const result = await prisma.pointage.updateMany({
-            where: {
-                date: {
-                    startsWith: date
-                }
-            },
-            data: {
-                valideParChef: true,
-                dateValidationChef: new Date(validatedAt),
-                chefValidateurId: chefId
-            }
-        });
+        if (isNaN(new Date(date).getTime())) {
+            return NextResponse.json({ error: 'Date invalide' }, { status: 400 });
+        }
+
+        // Pointages de la journée (plage de dates) et ligne ValidationJour, ensemble
+        const validation = await validerJournee(date, chefId, validatedAt ? new Date(validatedAt) : new Date());
 
         // Créer une notification pour l'Admin
         const formattedDate = new Date(date).toLocaleDateString('fr-FR', {
@@ -77,17 +73,20 @@ export async function POST(request) {
         console.log('✅ Validation Chef enregistrée:', {
             date,
             chefId,
-            pointagesMisAJour: result.count
+            pointagesMisAJour: validation.lignes
         });
 
         return NextResponse.json({
             success: true,
             message: 'Pointages validés par le Chef',
-            pointagesUpdated: result.count,
+            pointagesUpdated: validation.lignes,
             date: formattedDate
         });
 
     } catch (error) {
+        if (error.message === 'Mois clôturé') {
+            return NextResponse.json({ error: 'Mois clôturé : rouvrir le mois pour le modifier.' }, { status: 403 });
+        }
         console.error('Erreur validation Chef:', error);
         return NextResponse.json({
             error: 'Erreur lors de la validation',
@@ -100,6 +99,7 @@ export async function POST(request) {
  * GET /api/pointages/validate-chef
  * 
  * Vérifie si les pointages d'une date ont été validés par le Chef
+ * (lecture de ValidationJour par clé primaire)
  */
 export async function GET(request) {
     try {
@@ -115,25 +115,17 @@ export async function GET(request) {
             return NextResponse.json({ error: 'Date requise' }, { status: 400 });
         }
 
-        // Vérifier s'il existe des pointages validés par le Chef pour cette date
-        const pointagesValides = await prisma.pointage.findFirst({
-            where: {
-                date: {
-                    startsWith: date
-                },
-                valideParChef: true
-            },
-            select: {
-                valideParChef: true,
-                dateValidationChef: true,
-                chefValidateurId: true
-            }
-        });
+        if (isNaN(new Date(date).getTime())) {
+            return NextResponse.json({ error: 'Date invalide' }, { status: 400 });
+        }
+
+        const validation = await obtenirValidation(date);
 
         return NextResponse.json({
-            isValidated: !!pointagesValides,
-            validatedAt: pointagesValides?.dateValidationChef || null,
-            chefId: pointagesValides?.chefValidateurId || null
+            isValidated: !!validation,
+            validatedAt: validation?.validatedAt || null,
+            chefId: validation?.chefId || null,
+            lignes: validation?.lignes || 0
         });
 
     } catch (error) {
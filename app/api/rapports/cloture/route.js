@@ -0,0 +1,83 @@
+import { NextResponse } from 'next/server';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
+import { cloturerMois, rouvrirMois, etatCloture } from '@/lib/use-cases/pointage/cloturerMois';
+
+export const dynamic = 'force-dynamic';
+
+const ERREURS_REQUETE = ['Mois invalide', 'Mois non terminé', 'Motif requis'];
+const ERREURS_ETAT = ['Mois déjà clôturé', 'Mois non clôturé'];
+
+function reponseErreur(error, route) {
+    if (ERREURS_REQUETE.includes(error.message)) {
+        return NextResponse.json({ error: error.message }, { status: 400 });
+    }
+    if (ERREURS_ETAT.includes(error.message)) {
+        return NextResponse.json({ error: error.message }, { status: 409 });
+    }
+    console.error(`Erreur ${route} /api/rapports/cloture:`, error);
+    return NextResponse.json(
+        { error: 'Erreur serveur', details: error.message },
+        { status: 500 }
+    );
+}
+
+/**
+ * GET /api/rapports/cloture?mois=&annee=
+ * État de clôture du mois : { mois, cloture: { totaux, checksum, clotureLe, ... } | null, reouvertures }
+ */
+export async function GET(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session || !['ADMIN', 'CHEF'].includes(session.user.role)) {
+            return NextResponse.json({ error: 'Non autorisé' }, { status: 403 });
+        }
+
+        const { searchParams } = new URL(request.url);
+        return NextResponse.json(await etatCloture(searchParams.get('mois'), searchParams.get('annee')));
+    } catch (error) {
+        return reponseErreur(error, 'GET');
+    }
+}
+
+/**
+ * POST /api/rapports/cloture
+ * Clôture un mois terminé : { mois, annee }. Les récapitulatifs sont figés
+ * dans un instantané servi ensuite par /api/rapports ; les pointages du mois
+ * ne sont plus modifiables.
+ */
+export async function POST(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session || session.user.role !== 'ADMIN') {
+            return NextResponse.json({ error: 'Accès refusé - Réservé aux administrateurs' }, { status: 403 });
+        }
+
+        const { mois, annee } = await request.json();
+        const cloture = await cloturerMois(mois, annee, session.user.id);
+        return NextResponse.json(cloture, { status: 201 });
+    } catch (error) {
+        return reponseErreur(error, 'POST');
+    }
+}
+
+/**
+ * DELETE /api/rapports/cloture
+ * Rouvre un mois clôturé : { mois, annee, motif }. L'instantané est conservé,
+ * marqué rouvert ; le mois redevient modifiable et calculé à la demande.
+ */
+export async function DELETE(request) {
+    try {
+        const session = await obtenirSession();
+
+        if (!session || session.user.role !== 'ADMIN') {
+            return NextResponse.json({ error: 'Accès refusé - Réservé aux administrateurs' }, { status: 403 });
+        }
+
+        const { mois, annee, motif } = await request.json();
+        return NextResponse.json(await rouvrirMois(mois, annee, session.user.id, motif));
+    } catch (error) {
+        return reponseErreur(error, 'DELETE');
+    }
+}
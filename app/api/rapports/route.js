@@ -1,18 +1,24 @@
 // Rebuild-Tag: 2026-02-07T13:55:00Z - STABLE_RELATIVE
 import { NextResponse } from 'next/server';
-import { getServerSession } from 'next-auth';
-import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
+import { obtenirSession } from '@/lib/infrastructure/auth/session';
 import { calculerRecapMensuel, calculerRecapMensuelTous } from '@/lib/use-cases/pointage/calculerRecapMensuel';
+import { obtenirCloture, lireRecapsCloture } from '@/lib/use-cases/pointage/cloturerMois';
+import { etagDe, versionPeriode } from '@/lib/services/versionService';
+import { entetesVersion, nonModifie } from '@/lib/infrastructure/http/conditionnel';
 
 export const dynamic = 'force-dynamic';
 
+const UN_JOUR = 24 * 60 * 60 * 1000;
+
 /**
  * GET /api/rapports
- * Génère un rapport récapitulatif
+ * Génère un rapport récapitulatif. Versionné par ETag : 304 si les pointages,
+ * avances et employés du mois n'ont pas changé, sans recalculer le récap.
+ * Un mois clôturé est servi depuis son instantané (en-tête X-Mois-Cloture).
  */
 export async function GET(request) {
     try {
-        const session = await getServerSession(authOptions);
+        const session = await obtenirSession();
 
         if (!session) {
             return NextResponse.json({ error: 'Non autorisé' }, { status: 401 });
@@ -23,6 +29,37 @@ export async function GET(request) {
         const mois = parseInt(searchParams.get('mois') || new Date().getMonth() + 1);
         const annee = parseInt(searchParams.get('annee') || new Date().getFullYear());
 
+        // Mois clôturé : récapitulatifs figés, version = instantané
+        const cloture = await obtenirCloture(mois, annee);
+        if (cloture) {
+            const version = { etag: etagDe(['cloture', cloture.id, cloture.checksum, employeId]), lastModified: cloture.clotureLe };
+            const entetes = { ...entetesVersion(version), 'X-Mois-Cloture': cloture.clotureLe.toISOString() };
+            const inchange = nonModifie(request, version);
+            if (inchange) {
+                inchange.headers.set('X-Mois-Cloture', entetes['X-Mois-Cloture']);
+                return inchange;
+            }
+
+            const recaps = await lireRecapsCloture(cloture);
+            const rapport = employeId ? recaps.find((r) => r.employe.id === employeId) : recaps;
+            // Employé absent de l'instantané (inactif à la clôture) : calcul direct
+            if (rapport) {
+                return NextResponse.json(rapport, { headers: entetes });
+            }
+        }
+
+        // Le récap borne le mois en heure locale du serveur : la version couvre
+        // un jour de plus de chaque côté pour ne jamais manquer une écriture
+        const version = await versionPeriode(
+            new Date(Date.UTC(annee, mois - 1, 1) - UN_JOUR),
+            new Date(Date.UTC(annee, mois, 1) + UN_JOUR),
+            { employeId }
+        );
+        const inchange = nonModifie(request, version);
+        if (inchange) {
+            return inchange;
+        }
+
         let rapport;
 
         if (employeId) {
@@ -33,7 +70,7 @@ export async function GET(request) {
             rapport = await calculerRecapMensuelTous(mois, annee);
         }
 
-        return NextResponse.json(rapport);
+        return NextResponse.json(rapport, { headers: entetesVersion(version) });
     } catch (error) {
         console.error('Erreur GET /api/rapports:', error);
         return NextResponse.json(
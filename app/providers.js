@@ -1,9 +1,15 @@
 'use client';
 
+import { useEffect } from 'react';
 import { SessionProvider } from 'next-auth/react';
 import { LanguageProvider } from '@/context/LanguageContext';
+import { enregistrerServiceWorker } from '@/lib/infrastructure/horsLigne/saisiesHorsLigne';
 
 export default function Providers({ children }) {
+    useEffect(() => {
+        enregistrerServiceWorker();
+    }, []);
+
     return (
         <SessionProvider>
             <LanguageProvider>
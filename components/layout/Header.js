@@ -1,6 +1,7 @@
 'use client';
 
 import { useSession, signOut } from 'next-auth/react';
+import { preparerDeconnexion } from '@/lib/infrastructure/horsLigne/saisiesHorsLigne';
 import { usePathname, useRouter, useSearchParams } from 'next/navigation';
 import { Suspense } from 'react';
 import { Calendar, UserCircle, LogOut, ShieldCheck, User as UserIcon, ChevronDown, Bell } from 'lucide-react';
@@ -136,9 +137,12 @@ function HeaderContent() {
                                     <UserCircle className="w-4 h-4 text-blue-500" /> {t('profile')}
                                 </button>
                                 <button
-                                    onClick={() => signOut({
-                                        callbackUrl: role === 'ADMIN' ? '/login-admin' : '/employee-login'
-                                    })}
+                                    onClick={async () => {
+                                        await preparerDeconnexion();
+                                        signOut({
+                                            callbackUrl: role === 'ADMIN' ? '/login-admin' : '/employee-login'
+                                        });
+                                    }}
                                     className="w-full flex items-center gap-3 p-4 text-rose-600 hover:bg-rose-50 rounded-2xl transition-colors text-[10px] font-black uppercase tracking-widest"
                                 >
                                     <LogOut className="w-4 h-4" /> {t('logout')}
@@ -24,7 +24,9 @@ import {
     FileCheck
 } from 'lucide-react';
 import { signOut, useSession } from 'next-auth/react';
+import { preparerDeconnexion } from '@/lib/infrastructure/horsLigne/saisiesHorsLigne';
 import { useLanguage } from '@/context/LanguageContext';
+import { charger } from '@/lib/infrastructure/http/cacheRequetes';
 
 export default function Sidebar() {
     const pathname = usePathname();
@@ -38,8 +40,7 @@ export default function Sidebar() {
     useEffect(() => {
         const fetchUnread = async () => {
             try {
-                const res = await fetch('/api/messages/unread');
-                const data = await res.json();
+                const data = await charger('/api/messages/unread');
                 setUnreadCount(data.count || 0);
             } catch (error) {
                 console.error('Error fetching unread count', error);
@@ -201,7 +202,10 @@ export default function Sidebar() {
                 )}
 
                 <button
-                    onClick={() => signOut({ callbackUrl: role === 'ADMIN' ? '/login-admin' : '/employee-login' })}
+                    onClick={async () => {
+                        await preparerDeconnexion();
+                        signOut({ callbackUrl: role === 'ADMIN' ? '/login-admin' : '/employee-login' });
+                    }}
                     className={`w-full flex items-center gap-4 px-5 py-4 rounded-2xl font-black text-sm uppercase tracking-[0.2em] text-rose-400 hover:bg-rose-500/20 transition-all group ${isCollapsed ? 'justify-center' : ''}`}
                 >
                     <LogOut className={`w-6 h-6 group-hover:-translate-x-1 transition-transform ${isRTL ? 'rotate-180' : ''}`} />
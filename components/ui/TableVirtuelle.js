@@ -0,0 +1,150 @@
+'use client';
+
+import { Fragment, useEffect, useLayoutEffect, useRef, useState } from 'react';
+
+/**
+ * Tableau à rendu fenêtré : seules les lignes visibles (plus une marge)
+ * sont dans le DOM, encadrées par deux lignes d'espacement qui gardent la
+ * hauteur totale et donc la barre de défilement. Les pages y passent un
+ * composant de ligne mémoïsé (React.memo) pour qu'une saisie ne redessine
+ * que la ligne modifiée.
+ *
+ * Le défilement suivi est celui du premier parent défilant (le <main> du
+ * tableau de bord), ou de la fenêtre à défaut.
+ */
+
+const MARGE_LIGNES = 8;
+// Lignes rendues avant la première mesure (et côté serveur)
+const FENETRE_INITIALE = 30;
+
+function parentDefilant(element) {
+    for (let parent = element?.parentElement; parent; parent = parent.parentElement) {
+        const { overflowY } = getComputedStyle(parent);
+        if (overflowY === 'auto' || overflowY === 'scroll') {
+            return parent;
+        }
+    }
+    return window;
+}
+
+/**
+ * Plage de lignes à rendre pour un <tbody> dans son conteneur défilant
+ * @returns {{debut: number, fin: number}}
+ */
+function plageVisible(tbody, conteneur, nbLignes, hauteurLigne) {
+    const hautConteneur = conteneur === window ? 0 : conteneur.getBoundingClientRect().top;
+    const hauteurVue = conteneur === window ? window.innerHeight : conteneur.clientHeight;
+    // Distance entre le haut de la vue et le début des lignes (négative une fois dépassé)
+    const decalage = tbody.getBoundingClientRect().top - hautConteneur;
+
+    const debut = Math.max(0, Math.floor(-decalage / hauteurLigne) - MARGE_LIGNES);
+    const fin = Math.min(nbLignes, Math.ceil((hauteurVue - decalage) / hauteurLigne) + MARGE_LIGNES);
+    return { debut: Math.min(debut, fin), fin };
+}
+
+/**
+ * @param {Object} props
+ * @param {Array} props.lignes
+ * @param {Function} props.cle - ligne => clé React
+ * @param {Function} props.rendreLigne - (ligne, index) => <tr>
+ * @param {number} props.hauteurLigne - Estimation en px, corrigée par la première ligne rendue
+ * @param {number} props.colonnes - Nombre de colonnes (lignes d'espacement)
+ * @param {React.ReactNode} props.entete - Contenu du <thead>
+ * @param {React.ReactNode} [props.pied] - Contenu du <tfoot>
+ * @param {React.ReactNode} [props.vide] - Affiché quand il n'y a aucune ligne
+ * @param {string} [props.className] - Classes du <table>
+ * @param {string} [props.classeEntete] - Classes du <thead>
+ * @param {string} [props.classeCorps] - Classes du <tbody>
+ * @param {string} [props.classePied] - Classes du <tfoot>
+ */
+export default function TableVirtuelle({
+    lignes,
+    cle,
+    rendreLigne,
+    hauteurLigne: estimation,
+    colonnes,
+    entete,
+    pied,
+    vide,
+    className = '',
+    classeEntete = '',
+    classeCorps = '',
+    classePied = '',
+}) {
+    const corpsRef = useRef(null);
+    const [hauteurLigne, setHauteurLigne] = useState(estimation);
+    const [plage, setPlage] = useState({ debut: 0, fin: FENETRE_INITIALE });
+
+    useEffect(() => {
+        const tbody = corpsRef.current;
+        const conteneur = parentDefilant(tbody);
+        let image = null;
+
+        const recalculer = () => {
+            image = null;
+            const suivante = plageVisible(tbody, conteneur, lignes.length, hauteurLigne);
+            setPlage((actuelle) => (
+                actuelle.debut === suivante.debut && actuelle.fin === suivante.fin ? actuelle : suivante
+            ));
+        };
+        // Au plus un calcul par image, quel que soit le nombre d'événements
+        const planifier = () => {
+            if (image === null) image = requestAnimationFrame(recalculer);
+        };
+
+        recalculer();
+        conteneur.addEventListener('scroll', planifier, { passive: true });
+        window.addEventListener('resize', planifier);
+        return () => {
+            conteneur.removeEventListener('scroll', planifier);
+            window.removeEventListener('resize', planifier);
+            if (image !== null) cancelAnimationFrame(image);
+        };
+    }, [lignes.length, hauteurLigne]);
+
+    const fin = Math.min(plage.fin, lignes.length);
+    const debut = Math.min(plage.debut, fin);
+
+    // Corrige l'estimation avec la hauteur réelle d'une ligne rendue
+    // (rows[0] est la ligne d'espacement du haut)
+    useLayoutEffect(() => {
+        const mesure = fin > debut ? corpsRef.current?.rows[1]?.offsetHeight : 0;
+        if (mesure && Math.abs(mesure - hauteurLigne) > 1) {
+            setHauteurLigne(mesure);
+        }
+    }, [debut, fin, hauteurLigne]);
+
+    return (
+        <table className={className}>
+            <thead className={classeEntete}>{entete}</thead>
+            <tbody ref={corpsRef} className={classeCorps}>
+                <tr aria-hidden="true" style={{ height: debut * hauteurLigne }}>
+                    <td colSpan={colonnes} className="p-0" />
+                </tr>
+                {lignes.length === 0 && vide}
+                {lignes.slice(debut, fin).map((ligne, i) => (
+                    <Fragment key={cle(ligne)}>{rendreLigne(ligne, debut + i)}</Fragment>
+                ))}
+                <tr aria-hidden="true" style={{ height: (lignes.length - fin) * hauteurLigne }}>
+                    <td colSpan={colonnes} className="p-0" />
+                </tr>
+            </tbody>
+            {pied && <tfoot className={classePied}>{pied}</tfoot>}
+        </table>
+    );
+}
+
+/**
+ * Valeur recopiée après une pause de `delai` ms sans changement : le champ
+ * de recherche reste fluide, le filtrage ne tourne qu'une fois la frappe finie.
+ * @param {any} valeur
+ * @param {number} delai
+ */
+export function useValeurDifferee(valeur, delai = 200) {
+    const [differee, setDifferee] = useState(valeur);
+    useEffect(() => {
+        const timer = setTimeout(() => setDifferee(valeur), delai);
+        return () => clearTimeout(timer);
+    }, [valeur, delai]);
+    return differee;
+}
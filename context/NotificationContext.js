@@ -3,6 +3,7 @@
 import { createContext, useContext, useState, useEffect, useCallback } from 'react';
 import { useSession } from 'next-auth/react';
 import toast, { Toaster } from 'react-hot-toast';
+import { charger, chargerLot } from '@/lib/infrastructure/http/cacheRequetes';
 
 const NotificationContext = createContext();
 
@@ -26,8 +27,7 @@ export function NotificationProvider({ children }) {
     const loadContacts = useCallback(async () => {
         if (!session?.user) return;
         try {
-            const res = await fetch('/api/users/chat-contacts');
-            const data = await res.json();
+            const data = await charger('/api/users/chat-contacts');
             setContacts(data);
         } catch (error) {
             console.error('Error loading contacts:', error);
@@ -45,8 +45,8 @@ export function NotificationProvider({ children }) {
         if (!session?.user) return;
         
         try {
-            const res = await fetch('/api/messages/unread');
-            const data = await res.json();
+            // Partagé avec la barre latérale : un seul appel si les deux interrogent en même temps
+            const data = await charger('/api/messages/unread', { force: true });
             
             if (typeof data.count === 'number') {
                 // Check if new message arrived
@@ -82,6 +82,8 @@ export function NotificationProvider({ children }) {
     useEffect(() => {
         if (!session?.user) return;
         
+        // Données de démarrage en un seul aller-retour (/api/batch)
+        chargerLot(['/api/users/chat-contacts', '/api/messages/unread']).catch(() => {});
         loadContacts();
         fetchUnreadCount();
         
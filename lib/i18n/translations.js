@@ -173,7 +173,7 @@ export const translations = {
         deleteEmployee: 'حذف موظف',
         employeeList: 'قائمة الموظفين',
         noEmployeesFound: 'لم يتم العثور على موظفين',
-        searchPlaceholder: 'بحث ذكي (يتسامح مع الأخطاء)...',
+        searchPlaceholder: 'بحث (الاسم، المنصب، الرقم)...',
         gridView: 'عرض الشبكة',
         tableView: 'عرض الجدول',
         position: 'المنصب',
@@ -379,7 +379,7 @@ export const translations = {
         deleteEmployee: 'Supprimer un employé',
         employeeList: 'Liste des employés',
         noEmployeesFound: 'Aucun collaborateur trouvé',
-        searchPlaceholder: 'Recherche intelligente (tolérant aux fautes)...',
+        searchPlaceholder: 'Rechercher (nom, poste, matricule)...',
         gridView: 'Vue Grille',
         tableView: 'Vue Tableau',
         position: 'Poste',
@@ -588,7 +588,7 @@ export const translations = {
         deleteEmployee: 'Delete Employee',
         employeeList: 'Employee List',
         noEmployeesFound: 'No employees found',
-        searchPlaceholder: 'Smart search (tolerant to errors)...',
+        searchPlaceholder: 'Search (name, position, ID)...',
         gridView: 'Grid View',
         tableView: 'Table View',
         position: 'Position',
@@ -0,0 +1,29 @@
+import { AsyncLocalStorage } from 'async_hooks';
+import { getServerSession } from 'next-auth';
+import { authOptions } from '@/app/api/auth/[...nextauth]/auth-options';
+
+// Session déjà vérifiée par /api/batch pour les routes qu'il exécute
+const sessionDuLot = new AsyncLocalStorage();
+
+/**
+ * Session de la requête courante. Dans un lot (/api/batch), la session
+ * décodée une seule fois par le lot est réutilisée ; sinon, équivalent de
+ * getServerSession(authOptions).
+ * @returns {Promise<Object|null>}
+ */
+export async function obtenirSession() {
+    const lot = sessionDuLot.getStore();
+    if (lot) {
+        return lot.session;
+    }
+    return await getServerSession(authOptions);
+}
+
+/**
+ * Exécute fn avec une session déjà vérifiée
+ * @param {Object} session
+ * @param {Function} fn
+ */
+export function avecSession(session, fn) {
+    return sessionDuLot.run({ session }, fn);
+}
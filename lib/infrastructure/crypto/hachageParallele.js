@@ -0,0 +1,71 @@
+import os from 'os';
+import { Worker } from 'worker_threads';
+
+/**
+ * Hachage bcrypt en parallèle sur un pool de worker threads.
+ *
+ * bcryptjs est du JavaScript pur : sur le thread principal, 1 000 hachages à
+ * coût 10 bloquent le serveur plus d'une minute. Le pool répartit le travail
+ * sur les cœurs disponibles (un cœur reste au serveur) et ne vit que le
+ * temps d'un import.
+ */
+
+// Code des workers : reçoit { id, motDePasse, cout }, répond { id, hache | erreur }
+const CODE_WORKER = `
+const { parentPort } = require('worker_threads');
+const bcrypt = require('bcryptjs');
+parentPort.on('message', ({ id, motDePasse, cout }) => {
+    try {
+        parentPort.postMessage({ id, hache: bcrypt.hashSync(motDePasse, cout) });
+    } catch (error) {
+        parentPort.postMessage({ id, erreur: error.message });
+    }
+});
+`;
+
+/**
+ * Nombre de workers par défaut : cœurs disponibles moins un
+ * @returns {number}
+ */
+export function taillePoolParDefaut() {
+    const coeurs = typeof os.availableParallelism === 'function' ? os.availableParallelism() : os.cpus().length;
+    return Math.max(1, coeurs - 1);
+}
+
+/**
+ * Hache une liste de mots de passe, dans l'ordre
+ * @param {string[]} motsDePasse
+ * @param {Object} options - { cout = 10, taille }
+ * @returns {Promise<string[]>} Hachés bcrypt, même ordre que motsDePasse
+ */
+export async function hacherEnParallele(motsDePasse, { cout = 10, taille = taillePoolParDefaut() } = {}) {
+    if (motsDePasse.length === 0) return [];
+
+    const workers = Array.from(
+        { length: Math.min(taille, motsDePasse.length) },
+        () => new Worker(CODE_WORKER, { eval: true })
+    );
+    const resultats = new Array(motsDePasse.length);
+    let suivant = 0;
+
+    try {
+        await Promise.all(workers.map((worker) => new Promise((resolve, reject) => {
+            const envoyer = () => {
+                if (suivant >= motsDePasse.length) return resolve();
+                const id = suivant++;
+                worker.postMessage({ id, motDePasse: motsDePasse[id], cout });
+            };
+            worker.on('message', ({ id, hache, erreur }) => {
+                if (erreur) return reject(new Error(erreur));
+                resultats[id] = hache;
+                envoyer();
+            });
+            worker.on('error', reject);
+            envoyer();
+        })));
+    } finally {
+        await Promise.all(workers.map((worker) => worker.terminate()));
+    }
+
+    return resultats;
+}
@@ -0,0 +1,126 @@
+'use client';
+
+import { useEffect, useRef } from 'react';
+
+/**
+ * Côté page de la saisie hors ligne (voir public/sw.js).
+ *
+ * Les enregistrements de feuille sont confiés au service worker, qui les
+ * garde dans une file IndexedDB et les envoie par lots dès que le réseau le
+ * permet. Sans service worker actif (premier chargement, navigateur sans
+ * support), enfilerSaisie() renvoie null et la page envoie elle-même.
+ */
+
+/**
+ * Enregistre le service worker (en production : en développement il
+ * servirait des fichiers /_next/static périmés)
+ */
+export function enregistrerServiceWorker() {
+    if (process.env.NODE_ENV !== 'production' || !('serviceWorker' in navigator)) {
+        return;
+    }
+    navigator.serviceWorker.register('/sw.js').catch((error) => {
+        console.error('Erreur enregistrement service worker:', error);
+    });
+}
+
+function demander(message) {
+    const controleur = typeof navigator !== 'undefined' && navigator.serviceWorker?.controller;
+    if (!controleur) {
+        return Promise.resolve(null);
+    }
+    return new Promise((resolve, reject) => {
+        const canal = new MessageChannel();
+        canal.port1.onmessage = ({ data }) => (data.ok ? resolve(data) : reject(new Error(data.error)));
+        controleur.postMessage(message, [canal.port2]);
+    });
+}
+
+/**
+ * Nouvelle clé d'idempotence pour un enregistrement
+ * @returns {string}
+ */
+export function nouvelleCle() {
+    return crypto.randomUUID();
+}
+
+/**
+ * Confie une saisie au service worker
+ * @param {Object} saisie - { cle, date, pointages, avances }
+ * @returns {Promise<Object|null>} { enAttente } ou null sans service worker
+ */
+export async function enfilerSaisie(saisie) {
+    return await demander({ type: 'ENFILER', saisie });
+}
+
+/**
+ * Saisies encore dans la file pour un jour
+ * @param {string} date - 'YYYY-MM-DD'
+ * @returns {Promise<Array>}
+ */
+export async function saisiesEnAttente(date) {
+    const reponse = await demander({ type: 'EN_ATTENTE', date });
+    return reponse?.saisies || [];
+}
+
+/**
+ * Saisies de l'utilisateur mises de côté par le service worker (refusées,
+ * ou en erreur serveur répétée ; voir public/sw.js), gardées jusqu'à ce
+ * qu'il les écarte
+ * @returns {Promise<Array>} { cle, date, pointages, avances, status, error, rejeteeLe }
+ */
+export async function saisiesRejetees() {
+    const reponse = await demander({ type: 'REJETEES' });
+    return reponse?.rejetees || [];
+}
+
+/**
+ * Écarte une saisie rejetée (l'utilisateur en a pris connaissance)
+ * @param {string} cle
+ * @returns {Promise<Array>} Saisies rejetées restantes
+ */
+export async function ecarterSaisie(cle) {
+    const reponse = await demander({ type: 'ECARTER', cle });
+    return reponse?.rejetees || [];
+}
+
+/**
+ * À appeler avant signOut() : envoie ce qui peut l'être sous la session
+ * encore ouverte, puis vide le cache des feuilles et de la session pour que
+ * l'utilisateur suivant de la tablette ne les voie pas hors ligne. Les
+ * saisies non envoyées restent dans la file, réservées à leur auteur.
+ * @param {number} delaiMs - Attente maximale avant de se déconnecter quand même
+ */
+export async function preparerDeconnexion(delaiMs = 5000) {
+    await Promise.race([
+        demander({ type: 'DECONNEXION' }).catch(() => null),
+        new Promise((resolve) => setTimeout(resolve, delaiMs)),
+    ]);
+}
+
+/**
+ * Hook : relance la synchronisation au retour du réseau et appelle
+ * surSynchronise({ resultats, enAttente, rejetees }) après chaque envoi de la file
+ * @param {Function} surSynchronise
+ */
+export function useSynchronisation(surSynchronise) {
+    const rappel = useRef(surSynchronise);
+    rappel.current = surSynchronise;
+
+    useEffect(() => {
+        if (!('serviceWorker' in navigator)) return undefined;
+
+        const surMessage = ({ data }) => {
+            if (data?.type === 'SYNCHRONISE') rappel.current(data);
+        };
+        const surEnLigne = () => navigator.serviceWorker.controller?.postMessage({ type: 'SYNCHRONISER' });
+
+        navigator.serviceWorker.addEventListener('message', surMessage);
+        window.addEventListener('online', surEnLigne);
+        surEnLigne();
+        return () => {
+            navigator.serviceWorker.removeEventListener('message', surMessage);
+            window.removeEventListener('online', surEnLigne);
+        };
+    }, []);
+}
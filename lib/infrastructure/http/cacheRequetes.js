@@ -0,0 +1,242 @@
+'use client';
+
+import { useCallback, useEffect, useState } from 'react';
+
+/**
+ * Cache client des GET JSON, partagé par les pages du tableau de bord.
+ *
+ * - Clé = URL : deux composants qui demandent la même URL en même temps
+ *   partagent une seule requête (dédoublonnage des requêtes en cours).
+ * - Stale-while-revalidate : une donnée déjà en cache est rendue tout de
+ *   suite, puis revalidée en arrière-plan (un 304 côté serveur si l'ETag
+ *   n'a pas changé).
+ * - precharger() remplit le cache pendant que le navigateur est inactif,
+ *   par exemple pour les mois voisins d'une vue mensuelle.
+ * - chargerLot() / useDemarrage() regroupent les données de démarrage d'une
+ *   page en un seul POST /api/batch.
+ */
+
+// Une réponse plus récente que ça n'est pas revalidée (ex. préchargée à l'instant)
+const FRAICHEUR_MS = 10 * 1000;
+const TAILLE_MAX = 60;
+
+const cache = new Map(); // url -> { data, recuLe }
+const enCours = new Map(); // url -> Promise
+const abonnes = new Map(); // url -> Set(fonction)
+
+function memoriser(url, data) {
+    cache.delete(url);
+    cache.set(url, { data, recuLe: Date.now() });
+    // Map garde l'ordre d'insertion : la première clé est la plus ancienne
+    while (cache.size > TAILLE_MAX) {
+        cache.delete(cache.keys().next().value);
+    }
+    abonnes.get(url)?.forEach((notifier) => notifier(data));
+}
+
+/**
+ * Donnée en cache pour une URL (undefined si absente)
+ * @param {string} url
+ */
+export function lireCache(url) {
+    return cache.get(url)?.data;
+}
+
+/**
+ * GET JSON avec dédoublonnage. Une réponse encore fraîche est servie depuis
+ * le cache sans requête, sauf si force est vrai.
+ * @param {string} url
+ * @param {Object} options - { force }
+ * @returns {Promise<any>}
+ */
+export function charger(url, { force = false } = {}) {
+    const entree = cache.get(url);
+    if (!force && entree && Date.now() - entree.recuLe < FRAICHEUR_MS) {
+        return Promise.resolve(entree.data);
+    }
+    if (enCours.has(url)) {
+        return enCours.get(url);
+    }
+
+    const requete = fetch(url)
+        .then(async (res) => {
+            if (!res.ok) {
+                throw new Error(`Erreur ${res.status} sur ${url}`);
+            }
+            const data = await res.json();
+            memoriser(url, data);
+            return data;
+        })
+        .finally(() => enCours.delete(url));
+
+    enCours.set(url, requete);
+    return requete;
+}
+
+/**
+ * Charge plusieurs URL en un seul aller-retour via /api/batch. Les URL encore
+ * fraîches ou déjà en cours ne sont pas redemandées, et chaque URL du lot est
+ * enregistrée comme requête en cours : un charger() ou useRequete() lancé
+ * pendant ce temps attend le lot au lieu de refaire l'appel.
+ * @param {string[]} urls
+ * @returns {Promise<any[]>} Les données, dans l'ordre des URL
+ */
+export function chargerLot(urls) {
+    const manquantes = urls.filter((url) => {
+        const entree = cache.get(url);
+        return !enCours.has(url) && !(entree && Date.now() - entree.recuLe < FRAICHEUR_MS);
+    });
+
+    if (manquantes.length > 1) {
+        const lot = fetch('/api/batch', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ requetes: manquantes }),
+        }).then(async (res) => {
+            if (!res.ok) {
+                throw new Error(`Erreur ${res.status} sur /api/batch`);
+            }
+            return (await res.json()).reponses;
+        });
+
+        manquantes.forEach((url) => {
+            const requete = lot
+                .then((reponses) => {
+                    const { status, data } = reponses[url] || { status: 404 };
+                    if (status >= 400) {
+                        throw new Error(`Erreur ${status} sur ${url}`);
+                    }
+                    memoriser(url, data);
+                    return data;
+                })
+                .finally(() => enCours.delete(url));
+            enCours.set(url, requete);
+        });
+    }
+
+    return Promise.all(urls.map((url) => charger(url)));
+}
+
+/**
+ * Hook : déclare les données de démarrage d'une page, chargées en un lot.
+ * À appeler avant les useRequete() qui les lisent.
+ * @param {string[]} urls
+ */
+export function useDemarrage(urls) {
+    const cle = urls.filter(Boolean).join('\n');
+    useEffect(() => {
+        if (cle) chargerLot(cle.split('\n')).catch(() => {});
+    }, [cle]);
+}
+
+/**
+ * Oublie les entrées dont l'URL commence par prefixe (après une écriture)
+ * et recharge celles qu'un composant affiche encore.
+ * @param {string} prefixe - ex. '/api/pointages'
+ */
+export function invalider(prefixe) {
+    for (const url of [...cache.keys()]) {
+        if (url.startsWith(prefixe)) {
+            cache.delete(url);
+        }
+    }
+    for (const [url, liste] of abonnes) {
+        if (url.startsWith(prefixe) && liste.size) {
+            charger(url, { force: true }).catch(() => {});
+        }
+    }
+}
+
+/**
+ * Précharge des URL quand le navigateur est inactif
+ * @param {string[]} urls
+ * @returns {Function} Annule le préchargement s'il n'a pas encore démarré
+ */
+export function precharger(urls) {
+    const lancer = () => {
+        urls.filter((url) => !cache.has(url))
+            .forEach((url) => charger(url).catch(() => {}));
+    };
+    if (typeof window.requestIdleCallback === 'function') {
+        const id = window.requestIdleCallback(lancer, { timeout: 3000 });
+        return () => window.cancelIdleCallback(id);
+    }
+    const id = setTimeout(lancer, 500);
+    return () => clearTimeout(id);
+}
+
+/**
+ * Hook : donnée d'une URL via le cache partagé.
+ * @param {string|null} url - null pour ne rien charger
+ * @param {Object} options - { prechargement: URL à précharger une fois la vue chargée }
+ * @returns {Object} { data, loading, error, recharger }
+ */
+export function useRequete(url, { prechargement = [] } = {}) {
+    const [data, setData] = useState(() => (url ? lireCache(url) : undefined));
+    const [loading, setLoading] = useState(!!url && !cache.has(url));
+    const [error, setError] = useState(null);
+
+    useEffect(() => {
+        if (!url) {
+            setLoading(false);
+            return;
+        }
+        let actif = true;
+        const notifier = (valeur) => actif && setData(valeur);
+
+        if (!abonnes.has(url)) abonnes.set(url, new Set());
+        abonnes.get(url).add(notifier);
+
+        setData(lireCache(url));
+        setLoading(!cache.has(url));
+        setError(null);
+        charger(url)
+            .then(notifier)
+            .catch((e) => actif && setError(e))
+            .finally(() => actif && setLoading(false));
+
+        return () => {
+            actif = false;
+            abonnes.get(url)?.delete(notifier);
+        };
+    }, [url]);
+
+    const voisins = prechargement.join('\n');
+    useEffect(() => {
+        if (!url || loading || !voisins) return;
+        return precharger(voisins.split('\n'));
+    }, [url, loading, voisins]);
+
+    const recharger = useCallback(
+        () => (url ? charger(url, { force: true }) : Promise.resolve()),
+        [url]
+    );
+
+    return { data, loading, error, recharger };
+}
+
+/**
+ * Mois précédent et suivant d'un (mois, annee), pour le préchargement
+ * @param {number} mois - 1-12
+ * @param {number} annee
+ * @returns {Array<{mois: number, annee: number}>}
+ */
+export function moisVoisins(mois, annee) {
+    return [-1, 1].map((decalage) => {
+        const d = new Date(annee, mois - 1 + decalage, 1);
+        return { mois: d.getMonth() + 1, annee: d.getFullYear() };
+    });
+}
+
+/**
+ * Jour précédent et suivant d'une date 'YYYY-MM-DD', pour les vues par jour
+ * @param {string} date
+ * @returns {string[]}
+ */
+export function joursVoisins(date) {
+    return [-1, 1].map((decalage) => {
+        const d = new Date(`${date}T00:00:00Z`);
+        d.setUTCDate(d.getUTCDate() + decalage);
+        return d.toISOString().split('T')[0];
+    });
+}
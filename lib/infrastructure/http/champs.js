@@ -0,0 +1,30 @@
+/**
+ * Champs demandés par ?fields=a,b,c (ou ?champs=, ancien nom), limités aux
+ * champs autorisés par l'endpoint.
+ * @param {URLSearchParams} searchParams
+ * @param {string[]} autorises
+ * @returns {string[]|null} null si rien de valide n'est demandé (projection par défaut)
+ */
+export function lireChamps(searchParams, autorises) {
+    const brut = searchParams.get('fields') ?? searchParams.get('champs');
+    if (!brut) {
+        return null;
+    }
+    const champs = brut.split(',').map((c) => c.trim()).filter((c) => autorises.includes(c));
+    return champs.length ? champs : null;
+}
+
+/**
+ * Construit un `select` Prisma : chaque champ vaut true, sauf les relations
+ * qui reprennent leur propre sous-projection. L'id est toujours inclus.
+ * @param {string[]} champs
+ * @param {Object} relations - { nomRelation: { select: {...} } }
+ * @returns {Object}
+ */
+export function selectDe(champs, relations = {}) {
+    const select = { id: true };
+    for (const champ of champs) {
+        select[champ] = relations[champ] || true;
+    }
+    return select;
+}
@@ -0,0 +1,29 @@
+/**
+ * Parcourt une liste paginée par curseur ({ [cle]: [...], nextCursor }) et
+ * appelle onPage avec les lignes cumulées après chaque page, pour que l'écran
+ * s'affiche dès la première page au lieu d'attendre la liste complète.
+ * @param {string} url - URL de la première page (avec limit)
+ * @param {Object} options - { cle, onPage, signal }
+ * @returns {Promise<Array>} Toutes les lignes
+ */
+export async function chargerPages(url, { cle = 'pointages', onPage, signal } = {}) {
+    const lignes = [];
+    let cursor = null;
+
+    do {
+        const pageUrl = new URL(url, window.location.origin);
+        if (cursor) pageUrl.searchParams.set('cursor', cursor);
+
+        const res = await fetch(pageUrl, { signal });
+        if (!res.ok) {
+            throw new Error(`Erreur ${res.status} sur ${pageUrl.pathname}`);
+        }
+        const data = await res.json();
+
+        lignes.push(...data[cle]);
+        if (onPage) onPage([...lignes]);
+        cursor = data.nextCursor;
+    } while (cursor);
+
+    return lignes;
+}
@@ -0,0 +1,32 @@
+import { NextResponse } from 'next/server';
+
+/**
+ * En-têtes de validation d'une réponse versionnée. `no-cache` oblige le
+ * navigateur à revalider à chaque fois (If-None-Match) au lieu de servir
+ * une copie périmée ; `private` car les données dépendent de la session.
+ * @param {Object} version - { etag, lastModified }
+ * @returns {Object} En-têtes HTTP
+ */
+export function entetesVersion({ etag, lastModified }) {
+    const entetes = { ETag: etag, 'Cache-Control': 'private, no-cache' };
+    if (lastModified) {
+        entetes['Last-Modified'] = lastModified.toUTCString();
+    }
+    return entetes;
+}
+
+/**
+ * Réponse 304 si le client possède déjà cette version, sinon null.
+ * Seul If-None-Match est pris en compte : une suppression ne fait pas
+ * avancer Last-Modified, seul l'ETag (qui inclut les compteurs) la voit.
+ * @param {Request} request
+ * @param {Object} version - { etag, lastModified }
+ * @returns {NextResponse|null}
+ */
+export function nonModifie(request, version) {
+    const recus = (request.headers.get('if-none-match') || '').split(',').map((e) => e.trim());
+    if (recus.includes(version.etag) || recus.includes('*')) {
+        return new NextResponse(null, { status: 304, headers: entetesVersion(version) });
+    }
+    return null;
+}
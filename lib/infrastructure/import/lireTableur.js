@@ -0,0 +1,100 @@
+/**
+ * Lecture des fichiers d'import (CSV ou XLSX) en lignes { colonne: valeur }.
+ *
+ * La première ligne donne les en-têtes, normalisés (minuscules, sans
+ * accents, espaces, tirets ni apostrophes) : « Date d'embauche » devient
+ * `datedembauche`. Le CSV accepte la virgule ou le point-virgule (export
+ * Excel français) et les champs entre guillemets.
+ */
+
+import { lireXlsx } from './lireXlsx';
+
+export const TAILLE_MAX_IMPORT = 5 * 1024 * 1024;
+
+/**
+ * @param {string} entete
+ * @returns {string}
+ */
+export function normaliserEntete(entete) {
+    return String(entete ?? '')
+        .normalize('NFD')
+        .replace(/[\u0300-\u036f]/g, '')
+        .toLowerCase()
+        .replace(/[\s_\-'\u2019.]/g, '');
+}
+
+/**
+ * Découpe un texte CSV en cellules (RFC 4180)
+ * @param {string} texte
+ * @returns {string[][]}
+ */
+function decouperCsv(texte) {
+    const premiereLigne = texte.slice(0, texte.indexOf('\n') === -1 ? undefined : texte.indexOf('\n'));
+    const separateur = (premiereLigne.match(/;/g) || []).length > (premiereLigne.match(/,/g) || []).length ? ';' : ',';
+
+    const lignes = [];
+    let ligne = [];
+    let cellule = '';
+    let entreGuillemets = false;
+
+    for (let i = 0; i < texte.length; i++) {
+        const c = texte[i];
+        if (entreGuillemets) {
+            if (c === '"' && texte[i + 1] === '"') {
+                cellule += '"';
+                i++;
+            } else if (c === '"') {
+                entreGuillemets = false;
+            } else {
+                cellule += c;
+            }
+        } else if (c === '"') {
+            entreGuillemets = true;
+        } else if (c === separateur) {
+            ligne.push(cellule);
+            cellule = '';
+        } else if (c === '\n' || c === '\r') {
+            if (c === '\r' && texte[i + 1] === '\n') i++;
+            ligne.push(cellule);
+            lignes.push(ligne);
+            ligne = [];
+            cellule = '';
+        } else {
+            cellule += c;
+        }
+    }
+    if (cellule !== '' || ligne.length) {
+        ligne.push(cellule);
+        lignes.push(ligne);
+    }
+    return lignes;
+}
+
+/**
+ * Lit un fichier d'import
+ * @param {Buffer} buffer
+ * @param {string} nomFichier - Détermine le format (.csv ou .xlsx)
+ * @returns {Promise<Object[]>} Lignes de données, clés = en-têtes normalisés
+ */
+export async function lireTableur(buffer, nomFichier = '') {
+    if (buffer.length > TAILLE_MAX_IMPORT) {
+        throw new Error('Fichier trop volumineux');
+    }
+
+    const extension = nomFichier.toLowerCase().split('.').pop();
+    let cellules;
+    if (extension === 'xlsx') {
+        cellules = lireXlsx(buffer);
+    } else if (extension === 'csv' || extension === 'txt') {
+        cellules = decouperCsv(buffer.toString('utf8').replace(/^\uFEFF/, ''));
+    } else {
+        throw new Error('Format non supporté (CSV ou XLSX)');
+    }
+
+    const [entetes = [], ...donnees] = cellules;
+    const cles = entetes.map(normaliserEntete);
+
+    return donnees
+        .filter((ligne) => ligne.some((v) => String(v).trim() !== ''))
+        .map((ligne) => Object.fromEntries(cles.map((cle, i) => [cle, String(ligne[i] ?? '').trim()])));
+}
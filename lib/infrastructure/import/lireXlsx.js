@@ -0,0 +1,174 @@
+/**
+ * Lecture de la première feuille d'un classeur XLSX, sans dépendance.
+ *
+ * Un XLSX est une archive ZIP de fichiers XML : on lit le répertoire
+ * central de l'archive, on décompresse (zlib) les seules parties utiles
+ * (classeur, relations, chaînes partagées, styles, première feuille) et on
+ * en extrait les valeurs des cellules. Les nombres au format date sont
+ * rendus en 'YYYY-MM-DD', comme les dates saisies dans un CSV.
+ */
+
+import { inflateRawSync } from 'zlib';
+
+// Formats de nombre prédéfinis d'Excel qui affichent une date
+const FORMATS_DATE = new Set([14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47]);
+
+/**
+ * Fichiers d'une archive ZIP
+ * @param {Buffer} buffer
+ * @returns {Map<string, Function>} nom -> () => Buffer décompressé
+ */
+function lireZip(buffer) {
+    // Fin du répertoire central : au plus 64 Ko de commentaire après elle
+    let fin = -1;
+    for (let i = buffer.length - 22; i >= Math.max(0, buffer.length - 22 - 0xffff); i--) {
+        if (buffer.readUInt32LE(i) === 0x06054b50) {
+            fin = i;
+            break;
+        }
+    }
+    if (fin === -1) throw new Error('Archive ZIP invalide');
+
+    const fichiers = new Map();
+    const nombre = buffer.readUInt16LE(fin + 10);
+    let pos = buffer.readUInt32LE(fin + 16);
+    for (let n = 0; n < nombre; n++) {
+        if (buffer.readUInt32LE(pos) !== 0x02014b50) throw new Error('Archive ZIP invalide');
+        const methode = buffer.readUInt16LE(pos + 10);
+        const tailleCompressee = buffer.readUInt32LE(pos + 20);
+        const longueurNom = buffer.readUInt16LE(pos + 28);
+        const longueurExtra = buffer.readUInt16LE(pos + 30);
+        const longueurCommentaire = buffer.readUInt16LE(pos + 32);
+        const entete = buffer.readUInt32LE(pos + 42);
+        const nom = buffer.toString('utf8', pos + 46, pos + 46 + longueurNom);
+
+        fichiers.set(nom, () => {
+            const debut = entete + 30 + buffer.readUInt16LE(entete + 26) + buffer.readUInt16LE(entete + 28);
+            const donnees = buffer.subarray(debut, debut + tailleCompressee);
+            if (methode === 0) return donnees;
+            if (methode === 8) return inflateRawSync(donnees);
+            throw new Error(`Compression ZIP ${methode} non supportée`);
+        });
+        pos += 46 + longueurNom + longueurExtra + longueurCommentaire;
+    }
+    return fichiers;
+}
+
+function decoderXml(texte) {
+    return texte.replace(/&(#x[0-9a-f]+|#\d+|lt|gt|amp|quot|apos);/gi, (_, e) => {
+        if (e[0] === '#') {
+            return String.fromCodePoint(e[1] === 'x' || e[1] === 'X' ? parseInt(e.slice(2), 16) : parseInt(e.slice(1), 10));
+        }
+        return { lt: '<', gt: '>', amp: '&', quot: '"', apos: "'" }[e.toLowerCase()];
+    });
+}
+
+function attribut(balise, nom) {
+    const m = balise.match(new RegExp(`\\s${nom}="([^"]*)"`));
+    return m ? decoderXml(m[1]) : undefined;
+}
+
+// Texte d'une chaîne riche (<si> ou <is>), sans les annotations phonétiques
+function texteRiche(xml) {
+    const sansPhonetique = xml.replace(/<rPh\b[\s\S]*?<\/rPh>/g, '');
+    let texte = '';
+    for (const m of sansPhonetique.matchAll(/<t(?:\s[^>]*)?>([\s\S]*?)<\/t>/g)) {
+        texte += decoderXml(m[1]);
+    }
+    return texte;
+}
+
+// Indices des styles de cellule (attribut s) dont le format est une date
+function stylesDate(xml) {
+    const personnalises = new Map();
+    for (const m of xml.matchAll(/<numFmt\b[^>]*>/g)) {
+        personnalises.set(Number(attribut(m[0], 'numFmtId')), attribut(m[0], 'formatCode') || '');
+    }
+    const estDate = (id) => {
+        if (FORMATS_DATE.has(id)) return true;
+        const code = personnalises.get(id);
+        // Jour, mois ou année hors texte littéral et couleurs ([Rouge], "kg"...)
+        return code !== undefined && /[dy]|m(?!s)/i.test(code.replace(/"[^"]*"|\[[^\]]*\]|\\./g, ''));
+    };
+
+    const xfs = xml.match(/<cellXfs\b[\s\S]*?<\/cellXfs>/);
+    if (!xfs) return new Set();
+    const dates = new Set();
+    [...xfs[0].matchAll(/<xf\b[^>]*>/g)].forEach((m, i) => {
+        if (estDate(Number(attribut(m[0], 'numFmtId')))) dates.add(i);
+    });
+    return dates;
+}
+
+// Numéro de série Excel (calendrier 1900) -> 'YYYY-MM-DD'
+function dateDeSerie(serie) {
+    return new Date(Math.round((serie - 25569) * 86400) * 1000).toISOString().split('T')[0];
+}
+
+function indiceColonne(reference) {
+    const lettres = (reference || '').match(/^[A-Z]+/);
+    if (!lettres) return -1;
+    return [...lettres[0]].reduce((n, c) => n * 26 + c.charCodeAt(0) - 64, 0) - 1;
+}
+
+// Chemin de la première feuille du classeur
+function cheminPremiereFeuille(fichiers, lire) {
+    const classeur = lire('xl/workbook.xml');
+    const relations = lire('xl/_rels/workbook.xml.rels');
+    const feuille = classeur.match(/<sheet\b[^>]*>/);
+    const id = feuille && attribut(feuille[0], 'r:id');
+    for (const m of relations.matchAll(/<Relationship\b[^>]*>/g)) {
+        if (attribut(m[0], 'Id') === id) {
+            const cible = attribut(m[0], 'Target');
+            return cible.startsWith('/') ? cible.slice(1) : `xl/${cible}`;
+        }
+    }
+    return 'xl/worksheets/sheet1.xml';
+}
+
+/**
+ * Cellules de la première feuille d'un classeur XLSX
+ * @param {Buffer} buffer
+ * @returns {string[][]} Lignes non vides, cellules positionnées par colonne
+ * @throws {Error} 'Fichier illisible'
+ */
+export function lireXlsx(buffer) {
+    try {
+        const fichiers = lireZip(buffer);
+        const lire = (nom) => (fichiers.has(nom) ? fichiers.get(nom)().toString('utf8') : '');
+
+        const partagees = [...lire('xl/sharedStrings.xml').matchAll(/<si>([\s\S]*?)<\/si>/g)].map((m) => texteRiche(m[1]));
+        const dates = stylesDate(lire('xl/styles.xml'));
+        const feuille = lire(cheminPremiereFeuille(fichiers, lire));
+        if (!feuille) throw new Error('Feuille introuvable');
+
+        const lignes = [];
+        for (const r of feuille.matchAll(/<row\b[^>]*?(?:\/>|>([\s\S]*?)<\/row>)/g)) {
+            const ligne = [];
+            for (const c of (r[1] || '').matchAll(/<c\b([^>]*?)(?:\/>|>([\s\S]*?)<\/c>)/g)) {
+                const balise = `<c${c[1]}>`;
+                const contenu = c[2] || '';
+                const v = contenu.match(/<v>([\s\S]*?)<\/v>/);
+                const brute = v ? decoderXml(v[1]) : '';
+
+                let valeur;
+                switch (attribut(balise, 't')) {
+                    case 's': valeur = partagees[Number(brute)] ?? ''; break;
+                    case 'inlineStr': valeur = texteRiche(contenu); break;
+                    case 'b': valeur = brute === '1' ? 'VRAI' : 'FAUX'; break;
+                    case 'str':
+                    case 'e': valeur = brute; break;
+                    default:
+                        valeur = brute !== '' && dates.has(Number(attribut(balise, 's'))) ? dateDeSerie(Number(brute)) : brute;
+                }
+
+                const colonne = indiceColonne(attribut(balise, 'r'));
+                ligne[colonne === -1 ? ligne.length : colonne] = valeur;
+            }
+            lignes.push(Array.from(ligne, (v) => v ?? ''));
+        }
+        return lignes;
+    } catch {
+        throw new Error('Fichier illisible');
+    }
+}
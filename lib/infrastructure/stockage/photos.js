@@ -0,0 +1,130 @@
+import { createHash } from 'crypto';
+import { mkdir, readFile, rename, writeFile } from 'fs/promises';
+import path from 'path';
+import sharp from 'sharp';
+
+/**
+ * Photos des employés, stockées hors de la base sous l'empreinte SHA-256
+ * du fichier envoyé. La ligne Employe ne garde que cette clé (64 caractères
+ * hexadécimaux) : une même image n'est écrite qu'une fois, et le contenu
+ * d'une clé ne change jamais, ce qui permet un cache navigateur immuable.
+ *
+ * Chaque photo est déclinée en trois tailles WebP, générées à l'envoi.
+ * Le stockage est un simple objet { lire, ecrire } : le disque local par
+ * défaut (PHOTOS_DIR), remplaçable par un stockage objet via utiliserStockage().
+ */
+
+// Côté le plus long, en pixels (l'originale en dernier, cf. stockerPhoto)
+export const TAILLES_PHOTO = { petite: 64, moyenne: 256, originale: 1024 };
+
+const TAILLE_MAX_OCTETS = 5 * 1024 * 1024;
+const CLE_VALIDE = /^[a-f0-9]{64}$/;
+
+/**
+ * Stockage sur disque : <racine>/<2 premiers caractères>/<clé>-<taille>.webp
+ * @param {string} racine
+ */
+export function stockageDisque(racine) {
+    const chemin = (nom) => path.join(racine, nom.slice(0, 2), nom);
+    return {
+        async lire(nom) {
+            try {
+                return await readFile(chemin(nom));
+            } catch (error) {
+                if (error.code === 'ENOENT') return null;
+                throw error;
+            }
+        },
+        async ecrire(nom, contenu) {
+            const cible = chemin(nom);
+            await mkdir(path.dirname(cible), { recursive: true });
+            // Écriture puis renommage : un lecteur ne voit jamais un fichier à moitié écrit
+            const temporaire = `${cible}.${process.pid}.${Date.now()}.tmp`;
+            await writeFile(temporaire, contenu);
+            await rename(temporaire, cible);
+        },
+    };
+}
+
+let stockage = stockageDisque(process.env.PHOTOS_DIR || path.join(process.cwd(), 'storage', 'photos'));
+
+/**
+ * Remplace le stockage (ex. stockage objet)
+ * @param {Object} nouveau - { lire(nom): Promise<Buffer|null>, ecrire(nom, Buffer): Promise<void> }
+ */
+export function utiliserStockage(nouveau) {
+    stockage = nouveau;
+}
+
+export function estClePhoto(valeur) {
+    return typeof valeur === 'string' && CLE_VALIDE.test(valeur);
+}
+
+/**
+ * Enregistre une image et ses miniatures
+ * @param {Buffer} contenu - Fichier envoyé (JPEG, PNG, WebP...)
+ * @returns {Promise<string>} Clé de la photo
+ */
+export async function stockerPhoto(contenu) {
+    if (contenu.length > TAILLE_MAX_OCTETS) {
+        throw new Error('Image trop volumineuse');
+    }
+    try {
+        await sharp(contenu).metadata();
+    } catch {
+        throw new Error('Image invalide');
+    }
+
+    const cle = createHash('sha256').update(contenu).digest('hex');
+    // Même contenu, même clé : déjà stockée
+    if (await stockage.lire(`${cle}-originale.webp`)) {
+        return cle;
+    }
+
+    // L'originale est écrite en dernier : sa présence signifie que les miniatures existent
+    for (const [taille, cote] of Object.entries(TAILLES_PHOTO)) {
+        const image = await sharp(contenu)
+            .rotate()
+            .resize(cote, cote, { fit: 'inside', withoutEnlargement: true })
+            .webp({ quality: taille === 'petite' ? 70 : 80 })
+            .toBuffer();
+        await stockage.ecrire(`${cle}-${taille}.webp`, image);
+    }
+    return cle;
+}
+
+/**
+ * Une déclinaison d'une photo
+ * @param {string} cle
+ * @param {string} taille - petite | moyenne | originale
+ * @returns {Promise<Buffer|null>}
+ */
+export async function lirePhoto(cle, taille = 'moyenne') {
+    if (!estClePhoto(cle) || !TAILLES_PHOTO[taille]) {
+        return null;
+    }
+    return await stockage.lire(`${cle}-${taille}.webp`);
+}
+
+/**
+ * Valeur à enregistrer dans Employe.photo : une data URL (ancien format,
+ * encore envoyé par certains formulaires) est stockée et remplacée par sa clé.
+ * @param {string|null|undefined} photo
+ * @returns {Promise<string|null|undefined>}
+ */
+export async function normaliserPhoto(photo) {
+    const donnees = typeof photo === 'string' && photo.match(/^data:image\/[\w.+-]+;base64,(.+)$/s);
+    if (!donnees) {
+        return photo;
+    }
+    return await stockerPhoto(Buffer.from(donnees[1], 'base64'));
+}
+
+/**
+ * URL d'une photo (null si l'employé n'en a pas)
+ * @param {string|null} cle
+ * @param {string} taille
+ */
+export function urlPhoto(cle, taille = 'moyenne') {
+    return estClePhoto(cle) ? `/api/photos/${cle}?taille=${taille}` : null;
+}
@@ -4,70 +4,86 @@
  * Handles attendance tracking without GPS/Geofencing as per new requirements.
  */
 
+import { randomUUID } from 'crypto';
+import { Prisma } from '@prisma/client';
 import prisma from '../prisma';
-import { startOfDay } from 'date-fns';
+import { instantUTC, jourUTC, planifierRafraichissement, rafraichirJours } from './pointageJourService';
+import { moisClotures } from './clotureService';
+
+// Journée normale au-delà de laquelle les heures comptent en heures supp
+const HEURES_NORMALES = 8;
+
+// Durée après laquelle un pointage d'entrée sans sortie est considéré comme
+// une sortie oubliée et clôturé par le balayage (AUTO_CLOCK_OUT_HEURES)
+export const DUREE_MAX_HEURES = Number(process.env.AUTO_CLOCK_OUT_HEURES) || 10;
+
+// Jours en arrière examinés par le balayage : un pointage ouvert plus ancien
+// a manqué trop de passages pour être clôturé sans le Chef
+const FENETRE_JOURS = 7;
+const UN_JOUR = 24 * 60 * 60 * 1000;
 
 /**
  * Clock in an employee
+ *
+ * Une seule instruction : crée le pointage du jour (minuit UTC, comme le
+ * reste de l'application) ou, s'il existe déjà sans pointage en cours, le
+ * rouvre en gardant la première entrée et les heures déjà cumulées, puis
+ * ajoute l'événement IN au journal ClockEvent et marque le jour à recalculer
+ * dans PointageJour (recalcul attendu avant la réponse). Deux appuis
+ * simultanés ne peuvent plus heurter la contrainte unique (employeId, date) :
+ * le second ne modifie rien, n'ajoute aucun événement et reçoit
+ * ALREADY_CLOCKED_IN.
  * @param {string} employeId - Employee ID
  * @returns {object} Clock-in result
  */
 export async function autoClockIn(employeId) {
     try {
-
-        // Check if already clocked in today
-        const today = startOfDay(new Date());
-        const existingPointage = await prisma.pointage.findFirst({
-            where: {
-                employeId,
-                date: {
-                    gte: today,
-                    lt: new Date(today.getTime() + 24 * 60 * 60 * 1000)
-                }
-            }
-        });
-
         const now = new Date();
+        const today = jourUTC(now);
 
-        if (existingPointage) {
-            // Update existing pointage if it doesn't have a clock-in time
-            if (existingPointage.clockInTime && !existingPointage.clockOutTime) {
-                return {
-                    success: false,
-                    error: 'ALREADY_CLOCKED_IN',
-                    message: `Vous êtes déjà pointé depuis ${existingPointage.clockInTime.toLocaleTimeString('fr-FR')}.`,
-                    pointage: existingPointage
-                };
-            }
-
-            const updated = await prisma.pointage.update({
-                where: { id: existingPointage.id },
-                data: {
-                    clockInTime: now,
-                    clockOutTime: null,
-                    statut: 'PRESENT',
-                    isAutoClockIn: false
-                }
-            });
+        const [pointage] = await prisma.$queryRaw`
+            WITH pointage AS (
+                INSERT INTO "Pointage" (
+                    "id", "employeId", "date", "statut", "clockInTime",
+                    "isAutoClockIn", "joursTravailles", "createdAt", "updatedAt"
+                )
+                VALUES (
+                    ${randomUUID()}, ${employeId}, ${instantUTC(today)}, 'PRESENT', ${instantUTC(now)},
+                    false, 1, ${instantUTC(now)}, ${instantUTC(now)}
+                )
+                ON CONFLICT ("employeId", "date") DO UPDATE SET
+                    "clockInTime" = COALESCE("Pointage"."clockInTime", EXCLUDED."clockInTime"),
+                    "clockOutTime" = NULL,
+                    "statut" = 'PRESENT',
+                    "isAutoClockIn" = false,
+                    "updatedAt" = EXCLUDED."updatedAt"
+                WHERE "Pointage"."clockInTime" IS NULL OR "Pointage"."clockOutTime" IS NOT NULL
+                RETURNING *
+            ), evenement AS (
+                INSERT INTO "ClockEvent" ("employeId", "ts", "kind")
+                SELECT "employeId", ${instantUTC(now)}, 'IN'::"ClockEventKind" FROM pointage
+            ), a_recalculer AS (
+                INSERT INTO "PointageJourARecalculer" ("date", "createdAt")
+                SELECT "date", ${instantUTC(now)} FROM pointage
+                ON CONFLICT ("date") DO NOTHING
+            )
+            SELECT * FROM pointage
+        `;
 
+        if (!pointage) {
+            // Conflit sans mise à jour : un pointage d'entrée est déjà en cours
+            const existingPointage = await prisma.pointage.findUnique({
+                where: { employeId_date: { employeId, date: today } },
+            });
             return {
-                success: true,
-                message: `Bienvenue ! Pointage entrée enregistré à ${now.toLocaleTimeString('fr-FR')}.`,
-                pointage: updated
+                success: false,
+                error: 'ALREADY_CLOCKED_IN',
+                message: `Vous êtes déjà pointé depuis ${existingPointage?.clockInTime?.toLocaleTimeString('fr-FR')}.`,
+                pointage: existingPointage
             };
         }
 
-        // Create new pointage
-        const pointage = await prisma.pointage.create({
-            data: {
-                employeId,
-                date: today,
-                statut: 'PRESENT',
-                clockInTime: now,
-                isAutoClockIn: false,
-                joursTravailles: 1
-            }
-        });
+        await planifierRafraichissement([pointage.date]);
 
         return {
             success: true,
@@ -88,25 +104,49 @@ export async function autoClockIn(employeId) {
 
 /**
  * Clock out an employee
+ *
+ * Mise à jour conditionnelle du pointage du jour encore ouvert : la durée
+ * depuis le dernier IN est ajoutée au cumul du jour (plusieurs allers-retours
+ * possibles), les heures supp en sont déduites, et l'événement OUT est ajouté
+ * par la même instruction, avec le jour marqué à recalculer. Un second
+ * appui ne trouve plus de ligne ouverte (NOT_CLOCKED_IN).
  * @param {string} employeId - Employee ID
  * @returns {object} Clock-out result
  */
 export async function clockOut(employeId) {
     try {
-        const today = startOfDay(new Date());
-        const pointage = await prisma.pointage.findFirst({
-            where: {
-                employeId,
-                date: {
-                    gte: today,
-                    lt: new Date(today.getTime() + 24 * 60 * 60 * 1000)
-                },
-                clockInTime: { not: null },
-                clockOutTime: null
-            }
-        });
+        const now = new Date();
+        const debut = Prisma.sql`GREATEST("clockInTime", (
+            SELECT MAX(e."ts") FROM "ClockEvent" e
+            WHERE e."employeId" = "Pointage"."employeId" AND e."kind" = 'IN'
+        ))`;
+        const heures = Prisma.sql`(COALESCE("totalHours", 0) + EXTRACT(EPOCH FROM (${instantUTC(now)} - ${debut})) / 3600)`;
 
-        if (!pointage) {
+        const [updated] = await prisma.$queryRaw`
+            WITH ferme AS (
+                UPDATE "Pointage" SET
+                    "clockOutTime" = ${instantUTC(now)},
+                    "totalHours" = ROUND(${heures}::numeric, 2)::float8,
+                    "heuresSupp" = ROUND(GREATEST(${heures} - ${HEURES_NORMALES}, 0)::numeric, 2)::float8,
+                    "isAutoClockOut" = false,
+                    "updatedAt" = ${instantUTC(now)}
+                WHERE "employeId" = ${employeId}
+                  AND "date" = ${instantUTC(jourUTC(now))}
+                  AND "clockInTime" IS NOT NULL
+                  AND "clockOutTime" IS NULL
+                RETURNING *
+            ), evenement AS (
+                INSERT INTO "ClockEvent" ("employeId", "ts", "kind")
+                SELECT "employeId", ${instantUTC(now)}, 'OUT'::"ClockEventKind" FROM ferme
+            ), a_recalculer AS (
+                INSERT INTO "PointageJourARecalculer" ("date", "createdAt")
+                SELECT "date", ${instantUTC(now)} FROM ferme
+                ON CONFLICT ("date") DO NOTHING
+            )
+            SELECT * FROM ferme
+        `;
+
+        if (!updated) {
             return {
                 success: false,
                 error: 'NOT_CLOCKED_IN',
@@ -114,29 +154,14 @@ export async function clockOut(employeId) {
             };
         }
 
-        const now = new Date();
-        const clockInTime = new Date(pointage.clockInTime);
-        const hoursWorked = (now - clockInTime) / (1000 * 60 * 60);
-
-        // Calculate overtime (assuming 8-hour workday)
-        const regularHours = 8;
-        const overtimeHours = Math.max(0, hoursWorked - regularHours);
-
-        const updated = await prisma.pointage.update({
-            where: { id: pointage.id },
-            data: {
-                clockOutTime: now,
-                totalHours: Math.round(hoursWorked * 100) / 100,
-                heuresSupp: Math.round(overtimeHours * 100) / 100,
-                isAutoClockOut: false
-            }
-        });
+        await planifierRafraichissement([updated.date]);
 
+        const hoursWorked = Math.round(updated.totalHours * 10) / 10;
         return {
             success: true,
-            message: `Sortie enregistrée. Total: ${Math.round(hoursWorked * 10) / 10}h travaillées.`,
+            message: `Sortie enregistrée. Total: ${hoursWorked}h travaillées.`,
             pointage: updated,
-            hoursWorked: Math.round(hoursWorked * 10) / 10
+            hoursWorked
         };
 
     } catch (error) {
@@ -152,51 +177,49 @@ export async function clockOut(employeId) {
 
 /**
  * Get current clock-in status for an employee
+ *
+ * Répond depuis le dernier événement ClockEvent (index (employeId, ts)),
+ * joint au pointage de son jour pour le cumul des heures.
  * @param {string} employeId - Employee ID
  * @returns {object} Status information
  */
 export async function getClockInStatus(employeId) {
     try {
-        const today = startOfDay(new Date());
-        const pointage = await prisma.pointage.findFirst({
-            where: {
-                employeId,
-                date: {
-                    gte: today,
-                    lt: new Date(today.getTime() + 24 * 60 * 60 * 1000)
-                }
-            },
-            include: {
-                employe: {
-                    select: {
-                        nom: true,
-                        prenom: true,
-                        poste: true
-                    }
-                }
-            }
-        });
-
-        if (!pointage || !pointage.clockInTime) {
+        const now = new Date();
+        const [dernier] = await prisma.$queryRaw`
+            SELECT e."kind"::text AS "kind", e."ts",
+                p."id", p."date", p."statut"::text AS "statut", p."clockInTime", p."clockOutTime",
+                p."totalHours", p."heuresSupp", p."isAutoClockOut"
+            FROM (
+                SELECT "employeId", "kind", "ts" FROM "ClockEvent"
+                WHERE "employeId" = ${employeId}
+                ORDER BY "ts" DESC
+                LIMIT 1
+            ) e
+            LEFT JOIN "Pointage" p ON p."employeId" = e."employeId" AND p."date" = date_trunc('day', e."ts")
+        `;
+
+        if (!dernier || jourUTC(dernier.ts).getTime() !== jourUTC(now).getTime()) {
             return {
                 isClockedIn: false,
                 message: 'Non pointé aujourd\'hui'
             };
         }
 
-        const now = new Date();
-        const clockInTime = new Date(pointage.clockInTime);
-        const hoursWorked = pointage.clockOutTime
-            ? pointage.totalHours
-            : (now - clockInTime) / (1000 * 60 * 60);
+        const { kind, ts, ...pointage } = dernier;
+        const cumul = pointage.totalHours || 0;
+        // Borné comme le balayage, qui clôturera la ligne à cette durée
+        const hoursWorked = kind === 'IN'
+            ? Math.min(cumul + (now - new Date(ts)) / (1000 * 60 * 60), Math.max(cumul, DUREE_MAX_HEURES))
+            : cumul;
 
         return {
-            isClockedIn: !pointage.clockOutTime,
+            isClockedIn: kind === 'IN',
             clockInTime: pointage.clockInTime,
             clockOutTime: pointage.clockOutTime,
+            lastEventTime: ts,
             hoursWorked: Math.round(hoursWorked * 10) / 10,
-            pointage,
-            employe: pointage.employe
+            pointage
         };
 
     } catch (error) {
@@ -208,3 +231,77 @@ export async function getClockInStatus(employeId) {
     }
 }
 
+/**
+ * Clôture les sorties oubliées
+ *
+ * Une seule instruction ensembliste : chaque pointage encore ouvert reçoit
+ * une sortie automatique dès que son cumul du jour atteindrait
+ * `dureeMaxHeures`, avec totalHours et heuresSupp calculés par la même
+ * instruction et l'événement OUT (source AUTO) ajouté au journal. Les heures
+ * supp d'une sortie oubliée sont donc bornées, et le Chef peut les corriger
+ * lors de la validation. Appelé par /api/cron/auto-clock-out.
+ *
+ * Seuls les FENETRE_JOURS derniers jours sont examinés, par l'index partiel
+ * des pointages ouverts. Les mois de la fenêtre sont verrouillés comme pour
+ * toute écriture et les mois clôturés sont laissés tels quels ; l'agrégat
+ * PointageJour est recalculé dans la même transaction.
+ * @param {object} [options]
+ * @param {number} [options.dureeMaxHeures] - Défaut : AUTO_CLOCK_OUT_HEURES ou 10
+ * @param {Date} [options.maintenant]
+ * @returns {Promise<object>} { clotures, heures, heuresSupp, jours, moisClotures }
+ */
+export async function cloturerSortiesOubliees({ dureeMaxHeures = DUREE_MAX_HEURES, maintenant = new Date() } = {}) {
+    const sortie = Prisma.sql`o."debut" + make_interval(secs => o."reste" * 3600)`;
+    const heures = Prisma.sql`(COALESCE(p."totalHours", 0) + o."reste")`;
+
+    const debut = new Date(jourUTC(maintenant).getTime() - FENETRE_JOURS * UN_JOUR);
+    const fin = instantUTC(maintenant);
+
+    const { clotures, clos } = await prisma.$transaction(async (tx) => {
+        // La fenêtre tient sur deux mois au plus : ceux de ses deux bornes
+        const clos = await moisClotures(tx, [debut, maintenant]);
+        const clotures = await tx.$queryRaw`
+            WITH ouverts AS (
+                SELECT p."id", p."date",
+                    GREATEST(p."clockInTime", (
+                        SELECT MAX(e."ts") FROM "ClockEvent" e
+                        WHERE e."employeId" = p."employeId" AND e."kind" = 'IN'
+                          AND e."ts" < p."date" + INTERVAL '1 day'
+                    )) AS "debut",
+                    GREATEST(${dureeMaxHeures}::float8 - COALESCE(p."totalHours", 0), 0) AS "reste"
+                FROM "Pointage" p
+                WHERE p."clockInTime" IS NOT NULL AND p."clockOutTime" IS NULL
+                  AND p."date" >= ${instantUTC(debut)} AND p."date" <= ${fin}
+                  AND to_char(p."date", 'YYYY-MM') <> ALL(${clos}::text[])
+            ), clotures AS (
+                UPDATE "Pointage" p SET
+                    "clockOutTime" = ${sortie},
+                    "totalHours" = ROUND(${heures}::numeric, 2)::float8,
+                    "heuresSupp" = ROUND(GREATEST(${heures} - ${HEURES_NORMALES}, 0)::numeric, 2)::float8,
+                    "isAutoClockOut" = true,
+                    "updatedAt" = ${fin}
+                FROM ouverts o
+                WHERE p."id" = o."id" AND p."date" = o."date"
+                  AND p."clockOutTime" IS NULL
+                  AND ${sortie} <= ${fin}
+                RETURNING p."employeId", p."date", p."clockOutTime", p."totalHours", p."heuresSupp"
+            ), evenements AS (
+                INSERT INTO "ClockEvent" ("employeId", "ts", "kind", "source")
+                SELECT "employeId", "clockOutTime", 'OUT'::"ClockEventKind", 'AUTO'::"ClockEventSource" FROM clotures
+            )
+            SELECT "date", "totalHours", "heuresSupp" FROM clotures
+        `;
+        await rafraichirJours(clotures.map((p) => p.date), tx);
+        return { clotures, clos };
+    }, { timeout: 60000 });
+
+    const jours = [...new Set(clotures.map((p) => jourUTC(p.date).toISOString().split('T')[0]))].sort();
+
+    return {
+        clotures: clotures.length,
+        heures: Math.round(clotures.reduce((s, p) => s + p.totalHours, 0) * 100) / 100,
+        heuresSupp: Math.round(clotures.reduce((s, p) => s + p.heuresSupp, 0) * 100) / 100,
+        jours,
+        moisClotures: clos,
+    };
+}
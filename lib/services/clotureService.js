@@ -0,0 +1,84 @@
+/**
+ * Clôture Service - Mois clôturés
+ *
+ * Un mois clôturé (ClotureMois active, voir lib/use-cases/pointage/cloturerMois.js)
+ * est servi depuis son instantané : ses pointages et ses avances ne doivent
+ * plus changer, sinon les rapports divergeraient des données. Les écritures
+ * le vérifient ici, pour tous les rôles ; l'admin rouvre le mois pour corriger.
+ *
+ * Verrou consultatif par mois : chaque écriture prend le verrou partagé du
+ * mois dans sa transaction avant de vérifier, la clôture le prend en
+ * exclusif pendant qu'elle calcule et enregistre l'instantané. Une écriture
+ * ne peut donc ni se glisser entre le calcul et l'enregistrement, ni passer
+ * après la clôture sans la voir.
+ */
+
+
+// Espace des verrous consultatifs de clôture (pg_advisory_xact_lock(VERROU_CLOTURE, mois))
+const VERROU_CLOTURE = 4250;
+
+// 'YYYY-MM' -> entier pour le verrou
+const numeroMois = (cle) => Number(cle.slice(0, 4)) * 12 + Number(cle.slice(5, 7)) - 1;
+
+/**
+ * Clé de mois d'une date (UTC, comme Pointage.date)
+ * @param {Date|string} date
+ * @returns {string} 'YYYY-MM'
+ */
+export function cleMois(date) {
+    return new Date(date).toISOString().slice(0, 7);
+}
+
+/**
+ * Clé de mois à partir du mois (1-12) et de l'année
+ * @returns {string} 'YYYY-MM'
+ */
+export function cleDe(mois, annee) {
+    return `${annee}-${String(mois).padStart(2, '0')}`;
+}
+
+/**
+ * Prend le verrou partagé des mois des dates (tenu jusqu'à la fin de la
+ * transaction) et renvoie ceux qui sont clôturés
+ * @param {Object} tx - Client de transaction Prisma
+ * @param {Array<Date|string>} dates
+ * @returns {Promise<string[]>} Clés 'YYYY-MM' des mois clôturés
+ */
+export async function moisClotures(tx, dates) {
+    // Ordre fixe des verrous d'une écriture sur plusieurs mois
+    const cles = [...new Set(dates.filter(Boolean).map(cleMois))].sort();
+    if (!cles.length) return [];
+
+    for (const cle of cles) {
+        await tx.$executeRaw`SELECT pg_advisory_xact_lock_shared(${VERROU_CLOTURE}::int, ${numeroMois(cle)}::int)`;
+    }
+    const clotures = await tx.clotureMois.findMany({
+        where: { mois: { in: cles }, rouvertLe: null },
+        select: { mois: true },
+    });
+    return clotures.map((c) => c.mois);
+}
+
+/**
+ * Refuse une écriture qui touche un mois clôturé. À appeler dans la
+ * transaction de l'écriture, avant d'écrire : le verrou partagé est tenu
+ * jusqu'à sa fin.
+ * @param {Object} tx - Client de transaction Prisma
+ * @param {Array<Date|string>} dates - Dates des pointages ou avances écrits
+ * @throws {Error} 'Mois clôturé'
+ */
+export async function verifierMoisOuvert(tx, dates) {
+    if ((await moisClotures(tx, dates)).length > 0) {
+        throw new Error('Mois clôturé');
+    }
+}
+
+/**
+ * Verrou exclusif d'un mois, pour la clôture : attend les écritures en
+ * cours sur le mois et bloque les suivantes jusqu'à la fin de la transaction
+ * @param {Object} tx - Client de transaction Prisma
+ * @param {string} cle - 'YYYY-MM'
+ */
+export async function verrouillerMois(tx, cle) {
+    await tx.$executeRaw`SELECT pg_advisory_xact_lock(${VERROU_CLOTURE}::int, ${numeroMois(cle)}::int)`;
+}
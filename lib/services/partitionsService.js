@@ -0,0 +1,116 @@
+/**
+ * Partitions mensuelles de la table Pointage.
+ *
+ * Pointage est partitionnée par mois sur `date` (migration
+ * 20261019180000_pointage_partitions) : les requêtes d'un mois ne lisent
+ * qu'une partition, et chaque insertion ne met à jour que les index du mois.
+ * Les partitions vivantes sont dans le schéma `pointage_mois`, les mois
+ * archivés dans le schéma `archive` (hors de Pointage : ils n'apparaissent
+ * plus dans les requêtes, les agrégats PointageJour restent).
+ *
+ * Les opérations passent par les fonctions SQL de la migration, partagées
+ * avec le script de peuplement de testsprite_tests/perf.
+ */
+
+import prisma from '../prisma';
+
+// Mois créés à l'avance (une partition manquante enverrait les lignes dans la partition par défaut)
+export const MOIS_AVANCE = 3;
+
+// Mois gardés dans Pointage avant archivage (POINTAGE_RETENTION_MOIS)
+export const RETENTION_MOIS = Math.max(2, Number(process.env.POINTAGE_RETENTION_MOIS) || 24);
+
+// Premier jour du mois, décalé de `decalage` mois, en UTC
+function debutDeMois(date, decalage = 0) {
+    return new Date(Date.UTC(date.getUTCFullYear(), date.getUTCMonth() + decalage, 1));
+}
+
+// 'YYYY-MM' ; passé à SQL sous la forme 'YYYY-MM-01'::date, sans fuseau
+const libelleMois = (date) => date.toISOString().slice(0, 7);
+
+/**
+ * Crée les partitions du mois courant et des mois suivants (idempotent)
+ * @param {Object} options - { moisAvance, maintenant }
+ * @returns {Promise<string[]>} Mois créés ('YYYY-MM')
+ */
+export async function preparerPartitions({ moisAvance = MOIS_AVANCE, maintenant = new Date() } = {}) {
+    const creees = [];
+    for (let i = 0; i <= moisAvance; i++) {
+        const mois = debutDeMois(maintenant, i);
+        const [{ creee }] = await prisma.$queryRaw`
+            SELECT pointage_creer_partition(${`${libelleMois(mois)}-01`}::date) AS creee
+        `;
+        if (creee) creees.push(libelleMois(mois));
+    }
+    return creees;
+}
+
+/**
+ * Partitions vivantes et archivées
+ * @returns {Promise<Array>} [{ mois: 'YYYY-MM', archive, lignes (estimation), taille, tailleIndex }]
+ */
+export async function listerPartitions() {
+    const partitions = await prisma.$queryRaw`
+        SELECT
+            n.nspname = 'archive' AS archive,
+            replace(substr(c.relname, 10), '_', '-') AS mois,
+            GREATEST(c.reltuples, 0)::bigint AS lignes,
+            pg_table_size(c.oid)::bigint AS taille,
+            pg_indexes_size(c.oid)::bigint AS "tailleIndex"
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname IN ('pointage_mois', 'archive')
+          AND c.relkind = 'r'
+          AND c.relname ~ '^Pointage_[0-9]{4}_[0-9]{2}$'
+        ORDER BY mois
+    `;
+    return partitions.map((p) => ({
+        ...p,
+        lignes: Number(p.lignes),
+        taille: Number(p.taille),
+        tailleIndex: Number(p.tailleIndex),
+    }));
+}
+
+/**
+ * Détache dans le schéma `archive` les mois sortis de la fenêtre de rétention.
+ * Seuls les mois clôturés partent : leurs rapports sont servis par
+ * l'instantané de clôture, sans lire Pointage.
+ * @param {Object} options - { retentionMois, maintenant }
+ * @returns {Promise<string[]>} Mois archivés ('YYYY-MM')
+ */
+export async function archiverPartitions({ retentionMois = RETENTION_MOIS, maintenant = new Date() } = {}) {
+    // Le mois courant et le précédent (encore modifiable par l'admin) ne partent jamais
+    const limite = libelleMois(debutDeMois(maintenant, -Math.max(2, retentionMois) + 1));
+    const clotures = await prisma.clotureMois.findMany({
+        where: { rouvertLe: null },
+        select: { mois: true },
+    });
+    const moisClotures = new Set(clotures.map((c) => c.mois));
+    const aArchiver = (await listerPartitions())
+        .filter((p) => !p.archive && p.mois < limite && moisClotures.has(p.mois));
+
+    const archivees = [];
+    for (const { mois } of aArchiver) {
+        const [{ archivee }] = await prisma.$queryRaw`
+            SELECT pointage_archiver_partition(${`${mois}-01`}::date) AS archivee
+        `;
+        if (archivee) archivees.push(mois);
+    }
+    return archivees;
+}
+
+/**
+ * Rattache à Pointage un mois archivé (consultation ou correction d'un mois ancien)
+ * @param {string} mois - 'YYYY-MM'
+ * @returns {Promise<boolean>} false si le mois n'est pas archivé
+ */
+export async function restaurerPartition(mois) {
+    if (!/^\d{4}-\d{2}$/.test(mois || '')) {
+        throw new Error('Mois invalide');
+    }
+    const [{ restauree }] = await prisma.$queryRaw`
+        SELECT pointage_restaurer_partition(${`${mois}-01`}::date) AS restauree
+    `;
+    return restauree;
+}
@@ -0,0 +1,234 @@
+/**
+ * Pointage Jour Service - Agrégat quotidien des pointages
+ *
+ * La table PointageJour garde, pour chaque jour, les compteurs par statut,
+ * le total des heures supp, l'état de validation Chef et l'effectif attendu.
+ * Elle est recalculée depuis Pointage par chaque écriture, dans sa propre
+ * transaction, ce qui permet aux tableaux de bord de lire une ligne par jour
+ * au lieu de toutes les lignes.
+ */
+
+import { Prisma } from '@prisma/client';
+import prisma from '../prisma';
+
+const UN_JOUR = 24 * 60 * 60 * 1000;
+
+// Espace des verrous consultatifs de l'agrégat (pg_advisory_xact_lock(VERROU_JOUR, jour))
+const VERROU_JOUR = 4201;
+
+/**
+ * Ramène une date (Date ou 'YYYY-MM-DD') à minuit UTC, comme Pointage.date
+ * @param {Date|string} date
+ * @returns {Date}
+ */
+export function jourUTC(date) {
+    const d = new Date(date);
+    return new Date(Date.UTC(d.getUTCFullYear(), d.getUTCMonth(), d.getUTCDate()));
+}
+
+/**
+ * Instant en SQL, en timestamp UTC sans fuseau comme les colonnes Prisma,
+ * quel que soit le fuseau de la session PostgreSQL
+ * @param {Date} date
+ */
+export function instantUTC(date) {
+    return Prisma.sql`(to_timestamp(${date.getTime()}::float8 / 1000) AT TIME ZONE 'UTC')`;
+}
+
+/**
+ * Recalcule l'agrégat d'un jour depuis Pointage, dans la transaction tx.
+ * Le verrou du jour, tenu jusqu'à la fin de la transaction, fait passer les
+ * recalculs d'un même jour l'un après l'autre : chacun lit les pointages
+ * validés par le précédent, aucun n'écrase un agrégat plus récent. Les
+ * écritures des autres jours ne l'attendent pas.
+ * @param {Object} tx - Client de transaction Prisma
+ * @param {Date} debut - Jour, minuit UTC
+ */
+async function rafraichirJour(tx, debut) {
+    const fin = new Date(debut.getTime() + UN_JOUR);
+    await tx.$executeRaw`SELECT pg_advisory_xact_lock(${VERROU_JOUR}::int, ${Math.round(debut.getTime() / UN_JOUR)}::int)`;
+    await tx.$executeRaw`
+        INSERT INTO "PointageJour" (
+            "date", "total", "present", "absent", "conge", "maladie", "ferie",
+            "joursPresents", "heuresSupp", "valides", "dateValidationChef",
+            "chefValidateurId", "effectifAttendu", "updatedAt"
+        )
+        SELECT
+            date_trunc('day', p."date"),
+            COUNT(*)::int,
+            (COUNT(*) FILTER (WHERE p."statut" = 'PRESENT'))::int,
+            (COUNT(*) FILTER (WHERE p."statut" = 'ABSENT'))::int,
+            (COUNT(*) FILTER (WHERE p."statut" = 'CONGE'))::int,
+            (COUNT(*) FILTER (WHERE p."statut" = 'MALADIE'))::int,
+            (COUNT(*) FILTER (WHERE p."statut" = 'FERIE'))::int,
+            COALESCE(SUM(p."joursTravailles") FILTER (WHERE p."statut" IN ('PRESENT', 'FERIE')), 0),
+            COALESCE(SUM(p."heuresSupp"), 0),
+            (COUNT(*) FILTER (WHERE p."valideParChef"))::int,
+            MAX(p."dateValidationChef"),
+            (array_agg(p."chefValidateurId" ORDER BY p."dateValidationChef" DESC NULLS LAST))[1],
+            (SELECT COUNT(*) FROM "Employe" WHERE "statut" = 'ACTIF')::int,
+            CURRENT_TIMESTAMP
+        FROM "Pointage" p
+        WHERE p."date" >= ${debut} AND p."date" < ${fin}
+        GROUP BY 1
+        ON CONFLICT ("date") DO UPDATE SET
+            "total" = EXCLUDED."total",
+            "present" = EXCLUDED."present",
+            "absent" = EXCLUDED."absent",
+            "conge" = EXCLUDED."conge",
+            "maladie" = EXCLUDED."maladie",
+            "ferie" = EXCLUDED."ferie",
+            "joursPresents" = EXCLUDED."joursPresents",
+            "heuresSupp" = EXCLUDED."heuresSupp",
+            "valides" = EXCLUDED."valides",
+            "dateValidationChef" = EXCLUDED."dateValidationChef",
+            "chefValidateurId" = EXCLUDED."chefValidateurId",
+            "effectifAttendu" = EXCLUDED."effectifAttendu",
+            "updatedAt" = EXCLUDED."updatedAt"
+    `;
+    // Jour sans plus aucun pointage
+    await tx.$executeRaw`
+        DELETE FROM "PointageJour" j
+        WHERE j."date" >= ${debut} AND j."date" < ${fin}
+          AND NOT EXISTS (
+              SELECT 1 FROM "Pointage" p
+              WHERE p."date" >= ${debut} AND p."date" < ${fin}
+          )
+    `;
+}
+
+/**
+ * Recalcule l'agrégat des jours touchés par une écriture. À appeler dans la
+ * transaction de l'écriture (tx) : l'agrégat est validé avec elle, ou pas du
+ * tout. Sans tx, les jours sont recalculés dans une transaction à part. Le
+ * rattrapage complet se fait avec scripts/backfill-pointage-jour.mjs.
+ * @param {Array<Date|string>} dates - Dates des pointages modifiés
+ * @param {Object} [tx] - Client de transaction Prisma de l'écriture
+ */
+export async function rafraichirJours(dates, tx = null) {
+    // Ordre fixe des verrous quand une écriture touche plusieurs jours
+    const jours = [...new Set(dates.filter(Boolean).map((d) => jourUTC(d).getTime()))].sort((a, b) => a - b);
+    if (!jours.length) return;
+
+    const rafraichir = async (client) => {
+        for (const jour of jours) {
+            await rafraichirJour(client, new Date(jour));
+        }
+    };
+    await (tx ? rafraichir(tx) : prisma.$transaction(rafraichir));
+}
+
+/**
+ * Recalcule les jours marqués dans PointageJourARecalculer (tous, ou ceux de
+ * dates) et les retire de la table. Le marque est retiré avant le recalcul,
+ * sous le verrou du jour : une écriture validée avant est comptée, une
+ * écriture concurrente remet le marque pour le passage suivant.
+ * @param {Array<Date|string>} [dates] - Par défaut : tous les jours marqués
+ * @returns {Promise<Date[]>} Jours recalculés
+ */
+export async function drainerJoursARecalculer(dates = null) {
+    const marques = await prisma.pointageJourARecalculer.findMany({
+        where: dates ? { date: { in: dates.filter(Boolean).map(jourUTC) } } : {},
+        select: { date: true },
+        orderBy: { date: 'asc' },
+    });
+
+    for (const { date } of marques) {
+        await prisma.$transaction(async (tx) => {
+            await tx.$executeRaw`SELECT pg_advisory_xact_lock(${VERROU_JOUR}::int, ${Math.round(date.getTime() / UN_JOUR)}::int)`;
+            await tx.pointageJourARecalculer.deleteMany({ where: { date } });
+            await rafraichirJour(tx, date);
+        });
+    }
+    return marques.map((m) => m.date);
+}
+
+// Écritures unitaires très fréquentes (pointage d'entrée/sortie) : elles
+// marquent leur jour dans PointageJourARecalculer, et les requêtes arrivées
+// pendant DELAI_REGROUPEMENT_MS attendent un seul recalcul commun, pour
+// qu'un pic d'arrivées ne recalcule pas la journée à chaque appui
+const DELAI_REGROUPEMENT_MS = 200;
+const joursEnAttente = new Set();
+let lotOuvert = null;
+
+/**
+ * Recalcule, en un seul passage pour toutes les écritures arrivées pendant
+ * le regroupement, les jours marqués par l'écriture. À attendre avant de
+ * répondre : un environnement serverless peut geler le processus ensuite.
+ * En cas d'échec (ou d'arrêt du processus) le marque reste en base et le
+ * balayage planifié termine le recalcul.
+ * @param {Array<Date|string>} dates - Dates des pointages modifiés
+ * @returns {Promise<void>}
+ */
+export function planifierRafraichissement(dates) {
+    dates.filter(Boolean).forEach((d) => joursEnAttente.add(jourUTC(d).getTime()));
+    if (!lotOuvert) {
+        lotOuvert = new Promise((resolve) => setTimeout(resolve, DELAI_REGROUPEMENT_MS))
+            .then(() => {
+                // Lot fermé : les écritures suivantes ouvrent le lot suivant
+                lotOuvert = null;
+                const jours = [...joursEnAttente].map((j) => new Date(j));
+                joursEnAttente.clear();
+                return drainerJoursARecalculer(jours);
+            })
+            .then(() => undefined)
+            .catch((error) => console.error('Erreur rafraîchissement PointageJour:', error));
+    }
+    return lotOuvert;
+}
+
+/**
+ * Agrégat d'un jour (null si aucun pointage ce jour-là)
+ * @param {Date|string} date
+ * @returns {Promise<Object|null>}
+ */
+export async function obtenirJour(date) {
+    return await prisma.pointageJour.findUnique({
+        where: { date: jourUTC(date) },
+    });
+}
+
+/**
+ * Agrégats des jours de [debut, fin] triés par date
+ * @param {Date} debut
+ * @param {Date} fin
+ * @returns {Promise<Array>}
+ */
+export async function obtenirJours(debut, fin) {
+    return await prisma.pointageJour.findMany({
+        where: { date: { gte: debut, lte: fin } },
+        orderBy: { date: 'asc' },
+    });
+}
+
+/**
+ * Totaux d'une période (jours de présence payés, heures supp)
+ * @param {Date} debut
+ * @param {Date} fin
+ * @returns {Promise<Object>} { joursPresents, heuresSupp }
+ */
+export async function totaliserPeriode(debut, fin) {
+    const { _sum } = await prisma.pointageJour.aggregate({
+        where: { date: { gte: debut, lte: fin } },
+        _sum: { joursPresents: true, heuresSupp: true },
+    });
+    return {
+        joursPresents: _sum.joursPresents || 0,
+        heuresSupp: _sum.heuresSupp || 0,
+    };
+}
+
+/**
+ * Répartition par statut au format des tableaux de bord
+ * @param {Object|null} jour - Ligne PointageJour
+ * @returns {Object} { PRESENT, ABSENT, CONGE, MALADIE, FERIE }
+ */
+export function repartitionDuJour(jour) {
+    return {
+        PRESENT: jour?.present || 0,
+        ABSENT: jour?.absent || 0,
+        CONGE: jour?.conge || 0,
+        MALADIE: jour?.maladie || 0,
+        FERIE: jour?.ferie || 0,
+    };
+}
@@ -0,0 +1,62 @@
+/**
+ * Version Service - Jetons de version pour les GET conditionnels
+ *
+ * Un jeton résume, pour une période, le nombre de lignes et la dernière
+ * modification des tables qui alimentent un calcul (pointages, avances,
+ * employés). Une création, une modification ou une suppression change au
+ * moins l'un des deux, ce qui permet de répondre 304 sans refaire le calcul.
+ */
+
+import { createHash } from 'crypto';
+import { Prisma } from '@prisma/client';
+import prisma from '../prisma';
+import { instantUTC } from './pointageJourService';
+
+/**
+ * ETag faible à partir des éléments qui identifient une version
+ * @param {Array} parties - Compteurs, dates, identifiants
+ * @returns {string} ex. W/"3f2a..."
+ */
+export function etagDe(parties) {
+    const empreinte = createHash('sha1')
+        .update(parties.map((p) => (p instanceof Date ? p.getTime() : p ?? '')).join('|'))
+        .digest('base64url');
+    return `W/"${empreinte}"`;
+}
+
+/**
+ * Version des données d'une période [debut, fin[
+ * @param {Date} debut - Inclus
+ * @param {Date} fin - Exclu
+ * @param {Object} options - { employeId } pour restreindre à un employé
+ * @returns {Promise<Object>} { etag, lastModified }
+ */
+export async function versionPeriode(debut, fin, { employeId } = {}) {
+    const employe = employeId ? Prisma.sql`AND "employeId" = ${employeId}` : Prisma.empty;
+    const fiche = employeId ? Prisma.sql`WHERE "id" = ${employeId}` : Prisma.empty;
+    // Bornes en UTC, indépendantes du fuseau de la session
+    const de = instantUTC(debut);
+    const a = instantUTC(fin);
+
+    const [v] = await prisma.$queryRaw`
+        SELECT
+            (SELECT COUNT(*) FROM "Employe" ${fiche}) AS "employes",
+            (SELECT MAX("updatedAt") FROM "Employe" ${fiche}) AS "employesMaj",
+            (SELECT COUNT(*) FROM "Pointage" WHERE "date" >= ${de} AND "date" < ${a} ${employe}) AS "pointages",
+            (SELECT MAX("updatedAt") FROM "Pointage" WHERE "date" >= ${de} AND "date" < ${a} ${employe}) AS "pointagesMaj",
+            (SELECT COUNT(*) FROM "Avance" WHERE "date" >= ${de} AND "date" < ${a} ${employe}) AS "avances",
+            (SELECT MAX("updatedAt") FROM "Avance" WHERE "date" >= ${de} AND "date" < ${a} ${employe}) AS "avancesMaj"
+    `;
+
+    const dates = [v.employesMaj, v.pointagesMaj, v.avancesMaj].filter(Boolean);
+
+    return {
+        etag: etagDe([
+            debut, fin, employeId,
+            v.employes, v.employesMaj,
+            v.pointages, v.pointagesMaj,
+            v.avances, v.avancesMaj,
+        ]),
+        lastModified: dates.length ? new Date(Math.max(...dates.map((d) => d.getTime()))) : null,
+    };
+}
@@ -0,0 +1,172 @@
+import { Prisma } from '@prisma/client';
+import prisma from '../../prisma';
+import { verifierMoisOuvert } from '../../services/clotureService';
+
+// Taille maximale d'un traitement groupé
+export const AVANCES_MAX = 500;
+
+const UNE_SEMAINE = 7 * 24 * 60 * 60 * 1000;
+
+/**
+ * Use case: Finances du mois en cours (tableau de bord Finances)
+ *
+ * Totaux des avances (approuvées du mois, en attente), salaire net et dette
+ * du mois, flux hebdomadaire des avances approuvées, et la liste des avances.
+ * Les agrégats sont calculés par la base (SUM ... GROUP BY) : sans la liste,
+ * aucune avance ni aucun pointage n'est chargé.
+ *
+ * @param {Object} options - { avecListe } : false pour les seuls agrégats
+ * @returns {Promise<Object>} { stats, weeklyChart, avances? }
+ */
+export async function obtenirFinances({ avecListe = true } = {}) {
+    const now = new Date();
+    const year = now.getFullYear();
+    const month = now.getMonth(); // 0-indexed
+
+    // Use UTC dates to match PostgreSQL storage
+    const firstDay = new Date(Date.UTC(year, month, 1));
+    const nextMonth = new Date(Date.UTC(year, month + 1, 1));
+    const semaines = [0, 1, 2, 3].map(i => [
+        new Date(firstDay.getTime() + i * UNE_SEMAINE),
+        new Date(firstDay.getTime() + (i + 1) * UNE_SEMAINE),
+    ]);
+
+    const [[avances], liste] = await Promise.all([
+        // Approuvées du mois, en attente (toutes dates), et par semaine du mois
+        prisma.$queryRaw`
+            SELECT
+                COALESCE(SUM("montant") FILTER (WHERE "statut" = 'APPROVED'
+                    AND "date" >= ${firstDay} AND "date" < ${nextMonth}), 0) AS "approuvees",
+                COALESCE(SUM("montant") FILTER (WHERE "statut" = 'PENDING'), 0) AS "enAttente",
+                ARRAY[${Prisma.join(semaines.map(([debut, fin]) => Prisma.sql`
+                    COALESCE(SUM("montant") FILTER (WHERE "statut" = 'APPROVED'
+                        AND "date" >= ${debut} AND "date" < ${fin}), 0)`))}
+                ] AS "semaines"
+            FROM "Avance"
+        `,
+        avecListe
+            ? prisma.avance.findMany({
+                select: {
+                    id: true, montant: true, date: true, note: true, statut: true,
+                    employe: { select: { nom: true, prenom: true } }
+                },
+                orderBy: { date: 'desc' }
+            })
+            : null,
+    ]);
+
+    // Net salary computation (wrapped in try-catch to not break the whole API)
+    // Mêmes règles que calculerSalaire : 26 jours, dimanche travaillé en heures
+    // supp (8 h par défaut), majoration 25 %, avances approuvées de l'employé
+    let totalResteAPayer = 0;
+    let totalDetteMois = 0;
+    try {
+        const [salaires] = await prisma.$queryRaw`
+            WITH p AS (
+                SELECT
+                    "employeId",
+                    SUM(CASE WHEN "statut" IN ('PRESENT', 'CONGE', 'MALADIE', 'FERIE')
+                          AND NOT ("statut" = 'PRESENT' AND EXTRACT(ISODOW FROM "date") = 7)
+                        THEN "joursTravailles" ELSE 0 END) AS "joursPayes",
+                    SUM(CASE
+                        WHEN "statut" <> 'PRESENT' THEN 0
+                        WHEN EXTRACT(ISODOW FROM "date") = 7 THEN CASE WHEN "heuresSupp" > 0 THEN "heuresSupp" ELSE 8 END
+                        ELSE "heuresSupp" END) AS "heuresSupp"
+                FROM "Pointage"
+                WHERE "date" >= ${firstDay} AND "date" < ${nextMonth}
+                GROUP BY "employeId"
+            ),
+            a AS (
+                SELECT "employeId", SUM("montant") AS "totalAvances"
+                FROM "Avance"
+                WHERE "statut" = 'APPROVED'
+                GROUP BY "employeId"
+            ),
+            s AS (
+                SELECT
+                    COALESCE(p."joursPayes", 0) * e."salaireBase" / 26
+                    + COALESCE(p."heuresSupp", 0) * (e."salaireBase" / 26 / 8) * 1.25 AS "netBrut",
+                    COALESCE(a."totalAvances", 0) AS "totalAvances"
+                FROM "Employe" e
+                LEFT JOIN p ON p."employeId" = e."id"
+                LEFT JOIN a ON a."employeId" = e."id"
+                WHERE e."statut" = 'ACTIF'
+            )
+            SELECT
+                COALESCE(SUM(ROUND(GREATEST(0, "netBrut" - "totalAvances")::numeric, 3)), 0)::float8 AS "resteAPayer",
+                COALESCE(SUM(ROUND(GREATEST(0, "totalAvances" - "netBrut")::numeric, 3)), 0)::float8 AS "dette"
+            FROM s
+        `;
+        totalResteAPayer = salaires.resteAPayer;
+        totalDetteMois = salaires.dette;
+    } catch (calcErr) {
+        console.error('[Finance API] Erreur calcul salaire:', calcErr.message);
+    }
+
+    // Weekly chart data — sum of APPROVED advances per week of current month
+    const weeklyChart = avances.semaines.map((total, i) => ({ week: `Sem ${i + 1}`, total }));
+
+    const finances = {
+        stats: {
+            totalAvancesApproved: avances.approuvees,
+            totalAvancesPending: avances.enAttente,
+            resteAPayerMois: totalResteAPayer,
+            totalDetteMois: totalDetteMois
+        },
+        weeklyChart
+    };
+
+    if (avecListe) {
+        finances.avances = liste.map(a => ({
+            id: a.id,
+            montant: a.montant,
+            date: a.date,
+            statut: a.statut,
+            note: a.note || '',
+            employe: {
+                nom: a.employe.nom,
+                prenom: a.employe.prenom
+            }
+        }));
+    }
+
+    return finances;
+}
+
+/**
+ * Use case: Approuver ou rejeter des avances en une instruction
+ *
+ * Seules les avances encore en attente changent : une avance déjà traitée
+ * (par exemple depuis un autre poste) n'est pas basculée. Refusé en bloc si
+ * une des avances tombe dans un mois clôturé.
+ *
+ * @param {string[]} ids
+ * @param {string} statut - 'APPROVED' | 'REJECTED'
+ * @returns {Promise<string[]>} Ids effectivement traités
+ */
+export async function traiterAvances(ids, statut) {
+    if (!['APPROVED', 'REJECTED'].includes(statut)) {
+        throw new Error('Statut invalide');
+    }
+    if (!Array.isArray(ids) || ids.length === 0 || ids.length > AVANCES_MAX || ids.some(id => typeof id !== 'string')) {
+        throw new Error('Liste d\'avances invalide');
+    }
+
+    const uniques = [...new Set(ids)];
+    const traitees = await prisma.$transaction(async (tx) => {
+        const mois = await tx.$queryRaw`
+            SELECT DISTINCT date_trunc('month', "date") AS "debut"
+            FROM "Avance"
+            WHERE "id" = ANY(${uniques}::text[]) AND "statut" = 'PENDING'
+        `;
+        await verifierMoisOuvert(tx, mois.map(m => m.debut));
+
+        return await tx.$queryRaw`
+            UPDATE "Avance"
+            SET "statut" = ${statut}::"AvanceStatut", "updatedAt" = CURRENT_TIMESTAMP
+            WHERE "id" = ANY(${uniques}::text[]) AND "statut" = 'PENDING'
+            RETURNING "id"
+        `;
+    });
+    return traitees.map(a => a.id);
+}
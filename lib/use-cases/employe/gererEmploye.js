@@ -1,5 +1,9 @@
 import prisma from '../../prisma';
 import { hash } from 'bcryptjs';
+import { rafraichirJours } from '../../services/pointageJourService';
+import { verifierMoisOuvert } from '../../services/clotureService';
+import { selectDe } from '../../infrastructure/http/champs';
+import { normaliserPhoto } from '../../infrastructure/stockage/photos';
 
 /**
  * Use case: Créer ou mettre à jour un employé
@@ -13,7 +17,6 @@ export async function gererEmploye(data, id = null) {
         prenom = '',
         email,
         password,
-        photo,
         poste = '',
         dateEmbauche,
         salaireBase,
@@ -24,6 +27,9 @@ export async function gererEmploye(data, id = null) {
         employeeId, // Matricule
     } = data;
 
+    // Employe.photo ne contient que la clé du stockage de photos
+    const photo = await normaliserPhoto(data.photo);
+
     // Helper to safely parse float
     const safeParse = (val, fallback = 0) => {
         const parsed = parseFloat(val);
@@ -69,7 +75,7 @@ export async function gererEmploye(data, id = null) {
         return await prisma.employe.update({
             where: { id },
             data: updateData,
-            include: { user: true },
+            include: { user: RELATIONS_EMPLOYE.user },
         });
     }
 
@@ -105,16 +111,37 @@ export async function gererEmploye(data, id = null) {
                 },
             },
         },
-        include: { user: true },
+        include: { user: RELATIONS_EMPLOYE.user },
     });
 }
 
+// Champs accessibles par ?fields= ; `user` et `pointages` sont des relations
+export const CHAMPS_EMPLOYE = [
+    'id', 'nom', 'prenom', 'poste', 'employeeId', 'statut', 'dateEmbauche', 'salaireBase',
+    'soldeConges', 'soldeMaladie', 'departement', 'telephone', 'userId', 'photo',
+    'createdAt', 'updatedAt', 'user', 'pointages',
+];
+
+// Projection par défaut : sans la photo (une clé, cf. /api/photos) ni les horodatages
+const CHAMPS_EMPLOYE_DEFAUT = CHAMPS_EMPLOYE.filter((c) => !['photo', 'createdAt', 'updatedAt'].includes(c));
+
+const RELATIONS_EMPLOYE = {
+    user: { select: { email: true, role: true } },
+    // Dernier pointage (heure de la dernière saisie sur le pointage rapide)
+    pointages: {
+        select: { id: true, date: true, statut: true, updatedAt: true },
+        take: 1,
+        orderBy: { date: 'desc' },
+    },
+};
+
 /**
  * Use case: Obtenir tous les employés
  * @param {Object} filters - Filtres optionnels
+ * @param {Object} options - { champs } : sous-ensemble de CHAMPS_EMPLOYE
  * @returns {Promise<Array>} Liste des employés
  */
-export async function obtenirEmployes(filters = {}) {
+export async function obtenirEmployes(filters = {}, { champs } = {}) {
     const { statut, search } = filters;
 
     const where = {};
@@ -133,18 +160,7 @@ export async function obtenirEmployes(filters = {}) {
 
     return await prisma.employe.findMany({
         where,
-        include: {
-            user: {
-                select: {
-                    email: true,
-                    role: true,
-                },
-            },
-            pointages: {
-                take: 1,
-                orderBy: { date: 'desc' },
-            },
-        },
+        select: selectDe(champs || CHAMPS_EMPLOYE_DEFAUT, RELATIONS_EMPLOYE),
         orderBy: [
             { nom: 'asc' },
             { prenom: 'asc' },
@@ -177,25 +193,49 @@ export async function obtenirEmploye(id) {
 
 /**
  * Use case: Supprimer un employé
+ *
+ * La suppression emporte ses pointages et ses avances : refusée si l'un
+ * d'eux tombe dans un mois clôturé (rouvrir le mois d'abord).
  * @param {string} id - ID de l'employé
  * @returns {Promise<Object>} Employé supprimé
+ * @throws {Error} 'Mois clôturé'
  */
 export async function supprimerEmploye(id) {
     const employe = await prisma.employe.findUnique({
         where: { id },
     });
 
-    if (employe?.userId) {
-        // Supprimer l'utilisateur d'abord car Employe en dépend (cascade logic)
-        // Ou supprimer les deux dans une transaction
-        return await prisma.$transaction([
-            prisma.pointage.deleteMany({ where: { employeId: id } }),
-            prisma.employe.delete({ where: { id } }),
-            prisma.user.delete({ where: { id: employe.userId } }),
-        ]);
-    }
+    // Agrégats des jours recalculés dans la même transaction que la suppression
+    return await prisma.$transaction(async (tx) => {
+        const mois = await tx.$queryRaw`
+            SELECT date_trunc('month', "date") AS "debut" FROM "Pointage" WHERE "employeId" = ${id}
+            UNION
+            SELECT date_trunc('month', "date") AS "debut" FROM "Avance" WHERE "employeId" = ${id}
+        `;
+        await verifierMoisOuvert(tx, mois.map((m) => m.debut));
+
+        // Jours dont l'agrégat PointageJour change avec la suppression
+        const jours = await tx.pointage.findMany({
+            where: { employeId: id },
+            select: { date: true },
+            distinct: ['date'],
+        });
 
-    return await prisma.employe.delete({
-        where: { id },
-    });
+        let resultat;
+        if (employe?.userId) {
+            // Supprimer l'utilisateur d'abord car Employe en dépend (cascade logic)
+            resultat = [
+                await tx.pointage.deleteMany({ where: { employeId: id } }),
+                await tx.employe.delete({ where: { id } }),
+                await tx.user.delete({ where: { id: employe.userId } }),
+            ];
+        } else {
+            resultat = await tx.employe.delete({
+                where: { id },
+            });
+        }
+
+        await rafraichirJours(jours.map((j) => j.date), tx);
+        return resultat;
+    }, { timeout: 60000 });
 }
@@ -0,0 +1,238 @@
+import { randomUUID } from 'crypto';
+import prisma from '../../prisma';
+import { hacherEnParallele } from '../../infrastructure/crypto/hachageParallele';
+
+// Taille maximale d'un import
+export const IMPORT_MAX = 5000;
+
+const ROLES_IMPORT = ['EMPLOYE', 'CHEF'];
+const EMAIL_VALIDE = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+
+// Colonnes acceptées (en-têtes normalisés par lireTableur) -> champ
+const COLONNES = {
+    nom: 'nom',
+    prenom: 'prenom',
+    poste: 'poste',
+    email: 'email',
+    password: 'password',
+    motdepasse: 'password',
+    dateembauche: 'dateEmbauche',
+    datedembauche: 'dateEmbauche',
+    salaire: 'salaireBase',
+    salairebase: 'salaireBase',
+    matricule: 'employeeId',
+    employeeid: 'employeeId',
+    departement: 'departement',
+    telephone: 'telephone',
+    soldeconges: 'soldeConges',
+    soldemaladie: 'soldeMaladie',
+    role: 'role',
+};
+
+function lireChampsLigne(ligne) {
+    const champs = {};
+    for (const [colonne, valeur] of Object.entries(ligne)) {
+        const champ = COLONNES[colonne];
+        if (champ && valeur !== '' && champs[champ] === undefined) champs[champ] = valeur;
+    }
+    return champs;
+}
+
+// '1 250,5' -> 1250.5 ; undefined si vide, NaN si invalide
+function lireNombre(valeur) {
+    if (valeur === undefined) return undefined;
+    return Number(String(valeur).replace(/\s/g, '').replace(',', '.'));
+}
+
+// 'YYYY-MM-DD' ou 'JJ/MM/AAAA' -> Date UTC minuit ; null si invalide
+function lireDate(valeur) {
+    const fr = /^(\d{1,2})\/(\d{1,2})\/(\d{4})$/.exec(valeur);
+    const iso = fr ? `${fr[3]}-${fr[2].padStart(2, '0')}-${fr[1].padStart(2, '0')}` : valeur;
+    if (!/^\d{4}-\d{2}-\d{2}/.test(iso)) return null;
+    const date = new Date(`${iso.slice(0, 10)}T00:00:00.000Z`);
+    return isNaN(date.getTime()) ? null : date;
+}
+
+const nettoyer = (texte) => texte.toLowerCase().replace(/\s/g, '');
+
+/**
+ * Valide une ligne et la convertit en données Employe/User (sans hachage)
+ * @returns {{ donnees?: Object, erreurs: string[] }}
+ */
+function validerLigne(champs) {
+    const erreurs = [];
+
+    if (!champs.nom) erreurs.push('Nom requis');
+    if (!champs.prenom) erreurs.push('Prénom requis');
+
+    const email = champs.email?.toLowerCase();
+    if (email && !EMAIL_VALIDE.test(email)) erreurs.push('Email invalide');
+
+    const role = (champs.role || 'EMPLOYE').toUpperCase();
+    if (!ROLES_IMPORT.includes(role)) erreurs.push('Rôle invalide (EMPLOYE ou CHEF)');
+
+    let dateEmbauche = new Date();
+    if (champs.dateEmbauche) {
+        dateEmbauche = lireDate(champs.dateEmbauche);
+        if (!dateEmbauche) erreurs.push("Date d'embauche invalide");
+    }
+
+    const nombres = {};
+    for (const [champ, defaut] of [['salaireBase', 0], ['soldeConges', 18], ['soldeMaladie', 10]]) {
+        const valeur = lireNombre(champs[champ]);
+        if (valeur !== undefined && (isNaN(valeur) || valeur < 0)) erreurs.push(`${champ} invalide`);
+        nombres[champ] = valeur ?? defaut;
+    }
+
+    if (champs.password !== undefined && champs.password.length < 6) {
+        erreurs.push('Mot de passe trop court (6 caractères minimum)');
+    }
+
+    if (erreurs.length) return { erreurs };
+
+    return {
+        erreurs,
+        donnees: {
+            email,
+            password: champs.password || 'password123',
+            role,
+            nom: champs.nom.toUpperCase(),
+            prenom: champs.prenom,
+            poste: champs.poste || 'Ouvrier',
+            employeeId: champs.employeeId || null,
+            departement: champs.departement || null,
+            telephone: champs.telephone || null,
+            dateEmbauche,
+            ...nombres,
+        },
+    };
+}
+
+/**
+ * Use case: Import en masse d'employés (lignes lues par lireTableur)
+ *
+ * Toutes les lignes sont validées avant toute écriture (champs, unicité des
+ * emails et matricules dans le fichier et en base). Les mots de passe sont
+ * hachés en parallèle hors du thread principal, puis utilisateurs et
+ * employés sont créés par deux createMany dans une même transaction : un
+ * import réussit ou échoue en entier.
+ *
+ * Les emails absents sont générés comme à la création unitaire
+ * (prenom.nom@klbeton.tn), suffixés d'un numéro en cas de collision.
+ *
+ * @param {Object[]} lignes - Lignes du fichier (ligne 2 = première donnée)
+ * @param {Object} options - { ignorerErreurs } : importer les lignes valides malgré les erreurs
+ * @returns {Promise<Object>} { importes, erreurs: [{ ligne, erreurs }], dureeMs, parSeconde }
+ */
+export async function importerEmployes(lignes, { ignorerErreurs = false } = {}) {
+    const debut = Date.now();
+
+    if (!Array.isArray(lignes) || lignes.length === 0) {
+        throw new Error('Fichier vide');
+    }
+    if (lignes.length > IMPORT_MAX) {
+        throw new Error(`Import limité à ${IMPORT_MAX} lignes`);
+    }
+
+    // 1. Validation des champs, ligne par ligne
+    const erreurs = [];
+    const valides = [];
+    lignes.forEach((ligne, index) => {
+        const numero = index + 2; // ligne 1 = en-têtes
+        const resultat = validerLigne(lireChampsLigne(ligne));
+        if (resultat.erreurs.length) {
+            erreurs.push({ ligne: numero, erreurs: resultat.erreurs });
+        } else {
+            valides.push({ numero, ...resultat.donnees });
+        }
+    });
+
+    // 2. Unicité : emails et matricules fournis, dans le fichier et en base
+    const emailsFournis = valides.filter((v) => v.email).map((v) => v.email);
+    const matricules = valides.filter((v) => v.employeeId).map((v) => v.employeeId);
+    const [usersExistants, matriculesExistants] = await Promise.all([
+        prisma.user.findMany({
+            where: {
+                OR: [
+                    { email: { in: emailsFournis } },
+                    // Candidats aux emails générés, pour les suffixes
+                    { email: { endsWith: '@klbeton.tn' } },
+                ],
+            },
+            select: { email: true },
+        }),
+        matricules.length
+            ? prisma.employe.findMany({ where: { employeeId: { in: matricules } }, select: { employeeId: true } })
+            : [],
+    ]);
+
+    const emailsPris = new Set(usersExistants.map((u) => u.email.toLowerCase()));
+    const matriculesPris = new Set(matriculesExistants.map((e) => e.employeeId));
+    const aImporter = [];
+
+    for (const v of valides) {
+        const erreursLigne = [];
+        if (v.email && emailsPris.has(v.email)) erreursLigne.push(`Email déjà utilisé : ${v.email}`);
+        if (v.employeeId && matriculesPris.has(v.employeeId)) erreursLigne.push(`Matricule déjà utilisé : ${v.employeeId}`);
+
+        if (erreursLigne.length) {
+            erreurs.push({ ligne: v.numero, erreurs: erreursLigne });
+            continue;
+        }
+        if (v.email) emailsPris.add(v.email);
+        if (v.employeeId) matriculesPris.add(v.employeeId);
+        aImporter.push(v);
+    }
+
+    // Emails générés après réservation des emails fournis
+    for (const v of aImporter.filter((a) => !a.email)) {
+        const base = `${nettoyer(v.prenom)}.${nettoyer(v.nom)}`;
+        let email = `${base}@klbeton.tn`;
+        for (let n = 2; emailsPris.has(email); n++) email = `${base}.${n}@klbeton.tn`;
+        emailsPris.add(email);
+        v.email = email;
+    }
+
+    erreurs.sort((a, b) => a.ligne - b.ligne);
+    if (erreurs.length && !ignorerErreurs) {
+        return { importes: 0, erreurs, dureeMs: Date.now() - debut, parSeconde: 0 };
+    }
+
+    // 3. Hachage parallèle puis écriture groupée
+    const haches = await hacherEnParallele(aImporter.map((v) => v.password), { cout: 10 });
+
+    const users = [];
+    const employes = [];
+    aImporter.forEach((v, i) => {
+        const userId = randomUUID();
+        users.push({ id: userId, email: v.email, password: haches[i], role: v.role });
+        employes.push({
+            userId,
+            nom: v.nom,
+            prenom: v.prenom,
+            poste: v.poste,
+            employeeId: v.employeeId,
+            departement: v.departement,
+            telephone: v.telephone,
+            dateEmbauche: v.dateEmbauche,
+            salaireBase: v.salaireBase,
+            soldeConges: v.soldeConges,
+            soldeMaladie: v.soldeMaladie,
+        });
+    });
+
+    if (aImporter.length) {
+        await prisma.$transaction([
+            prisma.user.createMany({ data: users }),
+            prisma.employe.createMany({ data: employes }),
+        ]);
+    }
+
+    const dureeMs = Date.now() - debut;
+    return {
+        importes: aImporter.length,
+        erreurs,
+        dureeMs,
+        parSeconde: dureeMs > 0 ? Math.round((aImporter.length * 1000) / dureeMs) : aImporter.length,
+    };
+}
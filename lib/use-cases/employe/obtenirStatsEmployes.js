@@ -0,0 +1,142 @@
+import { Prisma } from '@prisma/client';
+import prisma from '../../prisma';
+import { APP_CONFIG } from '../../config';
+
+// Colonnes de tri autorisées (clé publique -> colonnes de la sous-requête)
+const TRIS = {
+    nom: ['"nom"', '"prenom"'],
+    poste: ['"poste"'],
+    matricule: ['"employeeId"'],
+    salaireBase: ['"salaireBase"'],
+    dateEmbauche: ['"dateEmbauche"'],
+    presence: ['"presence"'],
+    heuresSupp: ['"heuresSupp"'],
+    salaireNet: ['"salaireNet"'],
+};
+
+export const TRIS_EMPLOYES = Object.keys(TRIS);
+
+function clauseTri(tri, ordre) {
+    const sens = ordre === 'desc' ? 'DESC NULLS LAST' : 'ASC NULLS LAST';
+    return Prisma.raw((TRIS[tri] || TRIS.nom).map((col) => `${col} ${sens}`).join(', '));
+}
+
+/**
+ * Use case: Liste paginée des employés avec leurs statistiques du mois
+ *
+ * Une seule requête agrège les pointages et les avances du mois par employé
+ * et applique les mêmes règles que calculerSalaire (dimanche travaillé payé
+ * en heures supp, 8h par défaut ; avances approuvées déduites ; net >= 0).
+ * Le tri et la pagination se font côté base, y compris sur les statistiques.
+ *
+ * @param {Object} options - { statut, search, mois, annee, page, pageSize, tri, ordre }
+ * @returns {Promise<Object>} { employes, total, page, pageSize, mois, annee }
+ */
+export async function obtenirStatsEmployes(options = {}) {
+    const now = new Date();
+    const mois = parseInt(options.mois) || now.getMonth() + 1;
+    const annee = parseInt(options.annee) || now.getFullYear();
+    const page = Math.max(1, parseInt(options.page) || 1);
+    const pageSize = Math.min(500, Math.max(1, parseInt(options.pageSize) || APP_CONFIG.ITEMS_PER_PAGE));
+
+    const debut = new Date(Date.UTC(annee, mois - 1, 1));
+    const fin = new Date(Date.UTC(annee, mois, 1));
+
+    const conditions = [];
+    if (options.statut) {
+        conditions.push(Prisma.sql`e."statut"::text = ${options.statut}`);
+    }
+    if (options.search) {
+        // Même normalisation que la recherche de la page : espaces ignorés
+        const terme = options.search.replace(/\s+/g, '').replace(/[\\%_]/g, '\\$&');
+        conditions.push(Prisma.sql`regexp_replace(
+            e."nom" || e."prenom" || e."poste" || coalesce(e."employeeId", ''), '\\s', '', 'g'
+        ) ILIKE ${'%' + terme + '%'}`);
+    }
+    const where = conditions.length
+        ? Prisma.sql`WHERE ${Prisma.join(conditions, ' AND ')}`
+        : Prisma.empty;
+
+    const lignes = await prisma.$queryRaw`
+        WITH p AS (
+            SELECT
+                "employeId",
+                SUM(CASE WHEN "statut" = 'PRESENT' AND EXTRACT(ISODOW FROM "date") <> 7
+                    THEN "joursTravailles" ELSE 0 END) AS "joursPresence",
+                SUM(CASE WHEN ("statut" = 'PRESENT' AND EXTRACT(ISODOW FROM "date") <> 7)
+                      OR "statut" IN ('CONGE', 'MALADIE')
+                    THEN "joursTravailles" ELSE 0 END) AS "joursTravailles",
+                SUM(CASE WHEN "statut" = 'FERIE' THEN "joursTravailles" ELSE 0 END) AS "joursFerie",
+                SUM(CASE
+                    WHEN "statut" <> 'PRESENT' THEN 0
+                    WHEN EXTRACT(ISODOW FROM "date") = 7 THEN CASE WHEN "heuresSupp" > 0 THEN "heuresSupp" ELSE 8 END
+                    ELSE "heuresSupp" END) AS "heuresSupp"
+            FROM "Pointage"
+            WHERE "date" >= ${debut} AND "date" < ${fin}
+            GROUP BY "employeId"
+        ),
+        a AS (
+            SELECT "employeId", SUM("montant") AS "totalAvances"
+            FROM "Avance"
+            WHERE "statut" = 'APPROVED' AND "date" >= ${debut} AND "date" < ${fin}
+            GROUP BY "employeId"
+        ),
+        s AS (
+            SELECT
+                e."id", e."nom", e."prenom", e."poste", e."employeeId", e."dateEmbauche",
+                e."salaireBase", e."statut", e."soldeConges", e."soldeMaladie", e."userId",
+                u."email", u."role",
+                COALESCE(p."joursPresence", 0) AS "presence",
+                COALESCE(p."heuresSupp", 0) AS "heuresSupp",
+                COALESCE(p."joursTravailles", 0) + COALESCE(p."joursFerie", 0) AS "totalJoursPayes",
+                COALESCE(a."totalAvances", 0) AS "totalAvances",
+                GREATEST(0,
+                    (COALESCE(p."joursTravailles", 0) + COALESCE(p."joursFerie", 0)) * e."salaireBase" / 26
+                    + COALESCE(p."heuresSupp", 0) * (e."salaireBase" / 26 / 8) * 1.25
+                    - COALESCE(a."totalAvances", 0)
+                ) AS "salaireNet"
+            FROM "Employe" e
+            LEFT JOIN "User" u ON u."id" = e."userId"
+            LEFT JOIN p ON p."employeId" = e."id"
+            LEFT JOIN a ON a."employeId" = e."id"
+            ${where}
+        )
+        SELECT s.*, COUNT(*) OVER () AS "total"
+        FROM s
+        ORDER BY ${clauseTri(options.tri, options.ordre)}, "id" ASC
+        LIMIT ${pageSize} OFFSET ${(page - 1) * pageSize}
+    `;
+
+    let total = lignes.length ? Number(lignes[0].total) : 0;
+    if (!lignes.length && page > 1) {
+        // Page au-delà de la fin : on renvoie quand même le total
+        const [{ count }] = await prisma.$queryRaw`
+            SELECT COUNT(*) AS "count" FROM "Employe" e ${where}
+        `;
+        total = Number(count);
+    }
+
+    const employes = lignes.map((l) => ({
+        id: l.id,
+        nom: l.nom,
+        prenom: l.prenom,
+        poste: l.poste,
+        employeeId: l.employeeId,
+        dateEmbauche: l.dateEmbauche,
+        salaireBase: l.salaireBase,
+        statut: l.statut,
+        soldeConges: l.soldeConges,
+        soldeMaladie: l.soldeMaladie,
+        userId: l.userId,
+        user: l.email ? { email: l.email, role: l.role } : null,
+        statsMensuelles: {
+            presence: l.presence,
+            heuresSupp: l.heuresSupp,
+            totalJoursPayes: l.totalJoursPayes,
+            totalAvances: Math.round(l.totalAvances * 1000) / 1000,
+            salaireNet: Math.round(l.salaireNet * 1000) / 1000,
+        },
+    }));
+
+    return { employes, total, page, pageSize, mois, annee };
+}
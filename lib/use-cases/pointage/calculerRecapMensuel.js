@@ -7,11 +7,12 @@ import { obtenirPointages } from './creerPointage';
  * @param {string} employeId - ID de l'employé
  * @param {number} mois - Mois (1-12)
  * @param {number} annee - Année
+ * @param {Object} [client] - Client Prisma ou de transaction (clôture)
  * @returns {Promise<Object>} Récapitulatif complet
  */
-export async function calculerRecapMensuel(employeId, mois, annee) {
+export async function calculerRecapMensuel(employeId, mois, annee, client = prisma) {
     // Récupérer l'employé
-    const employe = await prisma.employe.findUnique({
+    const employe = await client.employe.findUnique({
         where: { id: employeId },
     });
 
@@ -24,10 +25,10 @@ export async function calculerRecapMensuel(employeId, mois, annee) {
         employeId,
         mois,
         annee,
-    });
+    }, { client });
 
     // Récupérer les avances du mois
-    const avances = await prisma.avance.findMany({
+    const avances = await client.avance.findMany({
         where: {
             employeId,
             date: {
@@ -43,20 +44,48 @@ export async function calculerRecapMensuel(employeId, mois, annee) {
 
 /**
  * Use case: Calculer les récapitulatifs pour tous les employés
+ *
+ * Trois requêtes ensemblistes (employés actifs, pointages et avances du
+ * mois), regroupées par employé en mémoire : la clôture les exécute sur la
+ * seule connexion de sa transaction.
  * @param {number} mois - Mois (1-12)
  * @param {number} annee - Année
+ * @param {Object} [client] - Client Prisma ou de transaction (clôture)
  * @returns {Promise<Array>} Récapitulatifs de tous les employés
  */
-export async function calculerRecapMensuelTous(mois, annee) {
+export async function calculerRecapMensuelTous(mois, annee, client = prisma) {
     // Récupérer tous les employés actifs
-    const employes = await prisma.employe.findMany({
+    const employes = await client.employe.findMany({
         where: { statut: 'ACTIF' },
     });
 
-    // Calculer le récap pour chaque employé
-    const recaps = await Promise.all(
-        employes.map(employe => calculerRecapMensuel(employe.id, mois, annee))
-    );
+    const pointages = await obtenirPointages({ mois, annee }, { client });
+    const avances = await client.avance.findMany({
+        where: {
+            date: {
+                gte: new Date(annee, mois - 1, 1),
+                lte: new Date(annee, mois, 0, 23, 59, 59),
+            },
+        },
+    });
+
+    const parEmploye = (lignes) => {
+        const groupes = new Map();
+        for (const ligne of lignes) {
+            if (!groupes.has(ligne.employeId)) groupes.set(ligne.employeId, []);
+            groupes.get(ligne.employeId).push(ligne);
+        }
+        return groupes;
+    };
+    const pointagesPar = parEmploye(pointages);
+    const avancesPar = parEmploye(avances);
 
-    return recaps;
+    // Calculer le récap pour chaque employé
+    return employes.map(employe => genererRecapMensuel(
+        employe,
+        pointagesPar.get(employe.id) || [],
+        mois,
+        annee,
+        avancesPar.get(employe.id) || []
+    ));
 }
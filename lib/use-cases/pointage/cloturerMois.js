@@ -0,0 +1,216 @@
+import { createHash } from 'crypto';
+import { gunzipSync, gzipSync } from 'zlib';
+import prisma from '../../prisma';
+import { cleDe, verrouillerMois } from '../../services/clotureService';
+import { restaurerPartition } from '../../services/partitionsService';
+import { calculerRecapMensuelTous } from './calculerRecapMensuel';
+
+// Métadonnées d'une clôture, sans l'instantané compressé
+const META_CLOTURE = {
+    id: true, mois: true, totaux: true, checksum: true, employes: true,
+    clotureParId: true, clotureLe: true,
+};
+
+const arrondir = (n) => Math.round(n * 1000) / 1000;
+
+// Le calcul de tous les récapitulatifs tient dans la transaction de clôture
+const DUREE_MAX_CLOTURE_MS = 120000;
+
+function verifierPeriode(mois, annee) {
+    const m = parseInt(mois);
+    const a = parseInt(annee);
+    if (!(m >= 1 && m <= 12) || !(a >= 2000 && a <= 2100)) {
+        throw new Error('Mois invalide');
+    }
+    return { mois: m, annee: a, cle: cleDe(m, a) };
+}
+
+function totaliser(recaps) {
+    const somme = (f) => arrondir(recaps.reduce((s, r) => s + (f(r) || 0), 0));
+    return {
+        employes: recaps.length,
+        salaireBrut: somme((r) => r.salaire.salaireBrut),
+        salaireNet: somme((r) => r.salaire.salaireNet),
+        totalAvances: somme((r) => r.salaire.totalAvances),
+        resteARembourser: somme((r) => r.salaire.resteARembourser),
+        joursPayes: somme((r) => r.salaire.totalJoursPayes),
+        heuresSupp: somme((r) => r.pointages.heuresSupp),
+    };
+}
+
+/**
+ * Use case: Clôturer un mois
+ *
+ * Calcule une seule fois les récapitulatifs de tous les employés actifs et
+ * les fige dans un instantané ClotureMois : JSON compressé (gzip), totaux du
+ * mois et SHA-256 du JSON pour vérifier l'instantané à chaque lecture. La
+ * ligne est immuable en base (trigger) ; les rapports du mois sont ensuite
+ * servis depuis elle, et les pointages du mois refusent toute écriture
+ * jusqu'à une réouverture.
+ *
+ * Calcul et enregistrement se font dans une transaction qui tient le verrou
+ * exclusif du mois (verrouillerMois) : les écritures en cours sur le mois
+ * sont attendues, les suivantes attendent la clôture puis la voient.
+ *
+ * @param {number} mois - Mois (1-12), terminé
+ * @param {number} annee - Année
+ * @param {string} adminId - Utilisateur qui clôture
+ * @returns {Promise<Object>} { mois, totaux, checksum, employes, taille, tailleJson, clotureLe }
+ */
+export async function cloturerMois(mois, annee, adminId) {
+    const periode = verifierPeriode(mois, annee);
+    if (Date.UTC(periode.annee, periode.mois, 1) > Date.now()) {
+        throw new Error('Mois non terminé');
+    }
+    if (await obtenirCloture(periode.mois, periode.annee)) {
+        throw new Error('Mois déjà clôturé');
+    }
+
+    // Un mois archivé doit être rattaché pour être calculé
+    await restaurerPartition(periode.cle);
+
+    let instantane;
+    try {
+        instantane = await prisma.$transaction(async (tx) => {
+            await verrouillerMois(tx, periode.cle);
+            if (await tx.clotureMois.findFirst({ where: { mois: periode.cle, rouvertLe: null }, select: { id: true } })) {
+                throw new Error('Mois déjà clôturé');
+            }
+
+            const recaps = await calculerRecapMensuelTous(periode.mois, periode.annee, tx);
+            const json = JSON.stringify(recaps);
+            const recapsGz = gzipSync(json, { level: 9 });
+            const cloture = await tx.clotureMois.create({
+                data: {
+                    mois: periode.cle,
+                    recaps: recapsGz,
+                    totaux: totaliser(recaps),
+                    checksum: createHash('sha256').update(json).digest('hex'),
+                    employes: recaps.length,
+                    clotureParId: adminId,
+                },
+                select: META_CLOTURE,
+            });
+            return { cloture, taille: recapsGz.length, tailleJson: Buffer.byteLength(json) };
+        }, { maxWait: 10000, timeout: DUREE_MAX_CLOTURE_MS });
+    } catch (error) {
+        // Index unique partiel : une clôture active par mois
+        if (error.code === 'P2002') {
+            throw new Error('Mois déjà clôturé');
+        }
+        throw error;
+    }
+
+    const { cloture, taille, tailleJson } = instantane;
+    return {
+        mois: cloture.mois,
+        totaux: cloture.totaux,
+        checksum: cloture.checksum,
+        employes: cloture.employes,
+        taille,
+        tailleJson,
+        clotureLe: cloture.clotureLe,
+    };
+}
+
+/**
+ * Use case: Rouvrir un mois clôturé
+ *
+ * L'instantané n'est pas supprimé : il est marqué rouvert (qui, quand,
+ * pourquoi) et cesse d'être servi. Le mois redevient modifiable ; une
+ * nouvelle clôture créera un nouvel instantané.
+ *
+ * @param {number} mois - Mois (1-12)
+ * @param {number} annee - Année
+ * @param {string} adminId - Utilisateur qui rouvre
+ * @param {string} motif - Raison de la réouverture (obligatoire)
+ * @returns {Promise<Object>} { mois, rouvertLe }
+ */
+export async function rouvrirMois(mois, annee, adminId, motif) {
+    const periode = verifierPeriode(mois, annee);
+    const raison = typeof motif === 'string' ? motif.trim() : '';
+    if (raison.length < 3) {
+        throw new Error('Motif requis');
+    }
+
+    const active = await prisma.clotureMois.findFirst({
+        where: { mois: periode.cle, rouvertLe: null },
+        select: { id: true },
+    });
+    if (!active) {
+        throw new Error('Mois non clôturé');
+    }
+
+    // Les pointages d'un mois archivé redeviennent consultables et modifiables.
+    // Avant la réouverture : tant que la partition est en archive, le mois
+    // reste clôturé et aucune écriture ne peut tomber dans la partition DEFAULT.
+    // Sans effet si le mois n'est pas archivé (ou déjà restauré).
+    await restaurerPartition(periode.cle);
+
+    const rouvertLe = new Date();
+    const { count } = await prisma.clotureMois.updateMany({
+        where: { mois: periode.cle, rouvertLe: null },
+        data: { rouvertLe, rouvertParId: adminId, motifReouverture: raison },
+    });
+    if (count === 0) {
+        throw new Error('Mois non clôturé');
+    }
+    return { mois: periode.cle, rouvertLe };
+}
+
+/**
+ * Clôture active d'un mois (métadonnées, sans l'instantané)
+ * @param {number} mois - Mois (1-12)
+ * @param {number} annee - Année
+ * @returns {Promise<Object|null>}
+ */
+export async function obtenirCloture(mois, annee) {
+    // Période invalide : aucune clôture ne correspond
+    return await prisma.clotureMois.findFirst({
+        where: { mois: cleDe(parseInt(mois), parseInt(annee)), rouvertLe: null },
+        select: META_CLOTURE,
+    });
+}
+
+/**
+ * État de clôture d'un mois, avec l'historique des réouvertures
+ * @param {number} mois - Mois (1-12)
+ * @param {number} annee - Année
+ * @returns {Promise<Object>} { mois, cloture, reouvertures }
+ */
+export async function etatCloture(mois, annee) {
+    const { cle } = verifierPeriode(mois, annee);
+    const clotures = await prisma.clotureMois.findMany({
+        where: { mois: cle },
+        select: { ...META_CLOTURE, rouvertLe: true, rouvertParId: true, motifReouverture: true },
+        orderBy: { clotureLe: 'desc' },
+    });
+
+    return {
+        mois: cle,
+        cloture: clotures.find((c) => !c.rouvertLe) || null,
+        reouvertures: clotures.filter((c) => c.rouvertLe).map((c) => ({
+            clotureLe: c.clotureLe,
+            rouvertLe: c.rouvertLe,
+            rouvertParId: c.rouvertParId,
+            motif: c.motifReouverture,
+        })),
+    };
+}
+
+/**
+ * Récapitulatifs figés d'une clôture, vérifiés par leur empreinte
+ * @param {Object} cloture - { id, checksum } (obtenirCloture)
+ * @returns {Promise<Array>} Récapitulatifs, comme calculerRecapMensuelTous
+ */
+export async function lireRecapsCloture(cloture) {
+    const { recaps } = await prisma.clotureMois.findUnique({
+        where: { id: cloture.id },
+        select: { recaps: true },
+    });
+    const json = gunzipSync(recaps).toString('utf8');
+    if (createHash('sha256').update(json).digest('hex') !== cloture.checksum) {
+        throw new Error(`Instantané de clôture ${cloture.id} corrompu`);
+    }
+    return JSON.parse(json);
+}
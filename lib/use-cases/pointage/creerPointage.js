@@ -1,6 +1,9 @@
 import prisma from '../../prisma';
 import { estDimanche } from '../../services/dimancheCalculator';
 import { estJourFerie } from '../../../constants/joursFeries';
+import { rafraichirJours } from '../../services/pointageJourService';
+import { verifierMoisOuvert } from '../../services/clotureService';
+import { selectDe } from '../../infrastructure/http/champs';
 
 /**
  * Use case: Créer ou mettre à jour un pointage
@@ -52,20 +55,53 @@ export async function creerPointage(data, id = null) {
         notes,
     };
 
-    // Mise à jour des soldes de congés/maladie (version atomique)
-    if (statut === 'CONGE' || statut === 'MALADIE') {
-        const field = statut === 'CONGE' ? 'soldeConges' : 'soldeMaladie';
-        await prisma.employe.update({
-            where: { id: employeId },
-            data: { [field]: { decrement: finalJoursTravailles } },
-        });
+    // Clé primaire (id, date) : la table est partitionnée par mois sur la date
+    const ancien = id ? await prisma.pointage.findFirst({ where: { id }, select: { date: true } }) : null;
+    if (id && !ancien) {
+        throw new Error('Pointage non trouvé');
     }
 
-    // Mise à jour
-    if (id) {
-        return await prisma.pointage.update({
-            where: { id },
-            data: pointageData,
+    const pointage = await prisma.$transaction(async (tx) => {
+        await verifierMoisOuvert(tx, [pointageDate, ancien?.date]);
+
+        // Mise à jour des soldes de congés/maladie (version atomique)
+        if (statut === 'CONGE' || statut === 'MALADIE') {
+            const field = statut === 'CONGE' ? 'soldeConges' : 'soldeMaladie';
+            await tx.employe.update({
+                where: { id: employeId },
+                data: { [field]: { decrement: finalJoursTravailles } },
+            });
+        }
+
+        // Mise à jour
+        if (id) {
+            const modifie = await tx.pointage.update({
+                where: { id_date: { id, date: ancien.date } },
+                data: pointageData,
+                include: {
+                    employe: {
+                        select: {
+                            nom: true,
+                            prenom: true,
+                            poste: true,
+                        },
+                    },
+                },
+            });
+            await rafraichirJours([ancien.date, pointageDate], tx);
+            return modifie;
+        }
+
+        // Création (avec gestion des doublons)
+        const cree = await tx.pointage.upsert({
+            where: {
+                employeId_date: {
+                    employeId,
+                    date: pointageDate,
+                },
+            },
+            update: pointageData,
+            create: pointageData,
             include: {
                 employe: {
                     select: {
@@ -76,28 +112,11 @@ export async function creerPointage(data, id = null) {
                 },
             },
         });
-    }
-
-    // Création (avec gestion des doublons)
-    return await prisma.pointage.upsert({
-        where: {
-            employeId_date: {
-                employeId,
-                date: pointageDate,
-            },
-        },
-        update: pointageData,
-        create: pointageData,
-        include: {
-            employe: {
-                select: {
-                    nom: true,
-                    prenom: true,
-                    poste: true,
-                },
-            },
-        },
+        await rafraichirJours([pointageDate], tx);
+        return cree;
     });
+
+    return pointage;
 }
 
 /**
@@ -108,9 +127,12 @@ export async function creerPointage(data, id = null) {
 export async function creerPointagesEnMasse(data) {
     const { date, pointages } = data;
 
-    // Utiliser une transaction pour tout créer d'un coup
-    return await prisma.$transaction(
-        pointages.map((p) => {
+    // Une transaction pour tout créer d'un coup, mois ouvert vérifié dedans
+    const resultat = await prisma.$transaction(async (tx) => {
+        await verifierMoisOuvert(tx, [date]);
+
+        const ecritures = [];
+        for (const p of pointages) {
             const normalizedDate = new Date(date);
             normalizedDate.setUTCHours(0, 0, 0, 0);
 
@@ -138,42 +160,38 @@ export async function creerPointagesEnMasse(data) {
             };
 
             // Logic for balance decrement in mass creation
-            const updates = [
-                prisma.pointage.upsert({
-                    where: {
-                        employeId_date: {
-                            employeId: p.employeId,
-                            date: normalizedDate,
-                        },
+            ecritures.push(await tx.pointage.upsert({
+                where: {
+                    employeId_date: {
+                        employeId: p.employeId,
+                        date: normalizedDate,
                     },
-                    update: pointageData,
-                    create: pointageData,
-                })
-            ];
+                },
+                update: pointageData,
+                create: pointageData,
+            }));
 
             if (finalStatut === 'CONGE') {
-                updates.push(prisma.employe.update({
+                ecritures.push(await tx.employe.update({
                     where: { id: p.employeId },
                     data: { soldeConges: { decrement: finalJoursTravailles } }
                 }));
             } else if (finalStatut === 'MALADIE') {
-                updates.push(prisma.employe.update({
+                ecritures.push(await tx.employe.update({
                     where: { id: p.employeId },
                     data: { soldeMaladie: { decrement: finalJoursTravailles } }
                 }));
             }
+        }
+
+        await rafraichirJours([date], tx);
+        return ecritures;
+    });
 
-            return updates;
-        }).flat()
-    );
+    return resultat;
 }
 
-/**
- * Use case: Obtenir les pointages avec filtres
- * @param {Object} filters - Filtres
- * @returns {Promise<Array>} Liste des pointages
- */
-export async function obtenirPointages(filters = {}) {
+function construireFiltre(filters) {
     const { employeId, dateDebut, dateFin, statut, mois, annee } = filters;
 
     const where = {};
@@ -201,18 +219,30 @@ export async function obtenirPointages(filters = {}) {
         };
     }
 
-    return await prisma.pointage.findMany({
-        where,
-        include: {
-            employe: {
-                select: {
-                    id: true,
-                    nom: true,
-                    prenom: true,
-                    poste: true,
-                },
-            },
-        },
+    return where;
+}
+
+// Champs accessibles par ?fields= ; `employe` est la relation (id, nom, prénom, poste)
+export const CHAMPS_POINTAGE = [
+    'id', 'employeId', 'date', 'statut', 'heuresSupp', 'joursTravailles', 'notes',
+    'clockInTime', 'clockOutTime', 'isAutoClockIn', 'isAutoClockOut', 'totalHours',
+    'valideParChef', 'dateValidationChef', 'chefValidateurId', 'createdAt', 'updatedAt', 'employe',
+];
+
+const RELATIONS_POINTAGE = {
+    employe: { select: { id: true, nom: true, prenom: true, poste: true } },
+};
+
+/**
+ * Use case: Obtenir les pointages avec filtres
+ * @param {Object} filters - Filtres
+ * @param {Object} options - { champs, client } : sous-ensemble de CHAMPS_POINTAGE, client de transaction
+ * @returns {Promise<Array>} Liste des pointages
+ */
+export async function obtenirPointages(filters = {}, { champs, client = prisma } = {}) {
+    return await client.pointage.findMany({
+        where: construireFiltre(filters),
+        select: selectDe(champs || CHAMPS_POINTAGE, RELATIONS_POINTAGE),
         orderBy: [
             { date: 'desc' },
             { employe: { nom: 'asc' } },
@@ -220,13 +250,142 @@ export async function obtenirPointages(filters = {}) {
     });
 }
 
+// Clés de tri pour la pagination par curseur ; l'id départage toujours en dernier.
+// Le premier critère suit l'ordre demandé, les suivants sont fixes.
+// Le tri par date pagine sur (date, id) seul, dans le sens de l'index
+// Pointage(date, id) : le nom ne départage les lignes qu'à l'intérieur de la page.
+const TRIS_POINTAGES = {
+    date: [
+        { champ: 'date', sens: 'desc' },
+    ],
+    employe: [
+        { relation: 'employe', champ: 'nom', sens: 'asc' },
+        { relation: 'employe', champ: 'prenom', sens: 'asc' },
+        { champ: 'date', sens: 'desc' },
+    ],
+};
+
+const LIMITE_MAX = 500;
+
+function cleDeTri(tri, ordre) {
+    const parDate = tri !== 'employe';
+    const [premiere, ...suivantes] = TRIS_POINTAGES[parDate ? 'date' : tri];
+    const sens = ordre === 'asc' || ordre === 'desc' ? ordre : premiere.sens;
+    return [
+        { ...premiere, sens },
+        ...suivantes,
+        { champ: 'id', sens: parDate ? sens : 'asc' },
+    ];
+}
+
+// Ordre d'affichage d'une page triée par date : date, puis nom, puis id
+function trierParNom(pointages, sens) {
+    const signe = sens === 'asc' ? 1 : -1;
+    return pointages.sort((a, b) =>
+        signe * (a.date - b.date)
+        || a.employe.nom.localeCompare(b.employe.nom)
+        || (a.id < b.id ? -1 : a.id > b.id ? 1 : 0));
+}
+
+function valeurDe(pointage, cle) {
+    return cle.relation ? pointage[cle.relation][cle.champ] : pointage[cle.champ];
+}
+
+function condition(cle, valeur, operateur) {
+    const filtre = operateur ? { [operateur]: valeur } : valeur;
+    return cle.relation ? { [cle.relation]: { [cle.champ]: filtre } } : { [cle.champ]: filtre };
+}
+
+function encoderCurseur(valeurs) {
+    return Buffer.from(JSON.stringify(valeurs)).toString('base64url');
+}
+
+function decoderCurseur(curseur, cles) {
+    try {
+        const valeurs = JSON.parse(Buffer.from(curseur, 'base64url').toString());
+        if (!Array.isArray(valeurs) || valeurs.length !== cles.length) return null;
+        return valeurs.map((v, i) => (cles[i].champ === 'date' ? new Date(v) : v));
+    } catch {
+        return null;
+    }
+}
+
+/**
+ * Use case: Obtenir une page de pointages (pagination par curseur)
+ *
+ * Le curseur encode les valeurs de tri de la dernière ligne renvoyée ; la page
+ * suivante reprend strictement après elle (keyset), sans OFFSET et sans
+ * doublon si des lignes sont ajoutées entre deux pages. Trié par date, le
+ * curseur porte sur (date, id) et chaque page est lue par un parcours de
+ * l'index Pointage(date, id) ; les lignes d'une même date sont rangées par
+ * nom dans la page, pas d'une page à l'autre. Le tri par employé passe par
+ * la jointure Employe et doit rester borné par un filtre de période.
+ *
+ * @param {Object} filters - Mêmes filtres que obtenirPointages
+ * @param {Object} options - { limit, cursor, tri: 'date'|'employe', ordre: 'asc'|'desc', champs: string[] }
+ * @returns {Promise<Object>} { pointages, nextCursor }
+ */
+export async function obtenirPagePointages(filters = {}, options = {}) {
+    const limit = Math.min(LIMITE_MAX, Math.max(1, parseInt(options.limit) || 100));
+    const cles = cleDeTri(options.tri, options.ordre);
+    const where = construireFiltre(filters);
+
+    if (options.cursor) {
+        const valeurs = decoderCurseur(options.cursor, cles);
+        if (!valeurs) {
+            throw new Error('Curseur invalide');
+        }
+        // (k1 > v1) OU (k1 = v1 ET k2 > v2) OU ...
+        const suite = cles.map((cle, i) => ({
+            AND: [
+                ...cles.slice(0, i).map((c, j) => condition(c, valeurs[j])),
+                condition(cle, valeurs[i], cle.sens === 'asc' ? 'gt' : 'lt'),
+            ],
+        }));
+        where.AND = [{ OR: suite }];
+    }
+
+    // Projection : champs demandés + ceux nécessaires au curseur
+    const champs = (options.champs || []).filter((c) => CHAMPS_POINTAGE.includes(c));
+    const select = selectDe(champs.length ? champs : CHAMPS_POINTAGE, RELATIONS_POINTAGE);
+    const parDate = options.tri !== 'employe';
+    for (const cle of parDate ? [...cles, { relation: 'employe' }] : cles) {
+        select[cle.relation || cle.champ] = cle.relation ? RELATIONS_POINTAGE[cle.relation] : true;
+    }
+
+    const lignes = await prisma.pointage.findMany({
+        where,
+        select,
+        orderBy: cles.map((cle) => condition(cle, cle.sens)),
+        take: limit + 1,
+    });
+
+    const pointages = lignes.slice(0, limit);
+    const derniere = pointages[pointages.length - 1];
+    const nextCursor = lignes.length > limit
+        ? encoderCurseur(cles.map((cle) => valeurDe(derniere, cle)))
+        : null;
+
+    return { pointages: parDate ? trierParNom(pointages, cles[0].sens) : pointages, nextCursor };
+}
+
 /**
  * Use case: Supprimer un pointage
  * @param {string} id - ID du pointage
  * @returns {Promise<Object>} Pointage supprimé
  */
 export async function supprimerPointage(id) {
-    return await prisma.pointage.delete({
-        where: { id },
+    const existant = await prisma.pointage.findFirst({ where: { id }, select: { date: true } });
+    if (!existant) {
+        throw new Error('Pointage non trouvé');
+    }
+    const pointage = await prisma.$transaction(async (tx) => {
+        await verifierMoisOuvert(tx, [existant.date]);
+        const supprime = await tx.pointage.delete({
+            where: { id_date: { id, date: existant.date } },
+        });
+        await rafraichirJours([supprime.date], tx);
+        return supprime;
     });
+    return pointage;
 }
@@ -0,0 +1,184 @@
+import prisma from '../../prisma';
+import { estJourFerie } from '../../../constants/joursFeries';
+import { instantUTC, jourUTC, rafraichirJours } from '../../services/pointageJourService';
+import { verifierMoisOuvert } from '../../services/clotureService';
+import { versionFeuille } from './feuilleDuJour';
+import { validerDansTransaction } from './validerJournee';
+
+const STATUTS = ['PRESENT', 'ABSENT', 'CONGE', 'MALADIE', 'FERIE'];
+
+// Durée de conservation des clés d'idempotence (bien au-delà d'une coupure réseau)
+const CONSERVATION_CLES_JOURS = 30;
+
+/**
+ * Lignes de pointage de la feuille, avec les règles de creerPointage
+ * (férié auto-détecté, absence sans jour ni heures supp), une par employé
+ */
+function normaliserPointages(pointages, debut) {
+    const parEmploye = new Map();
+    for (const p of pointages) {
+        if (!p?.employeId || typeof p.employeId !== 'string' || !STATUTS.includes(p.statut)) {
+            throw new Error('Données de feuille invalides');
+        }
+        const statut = estJourFerie(debut) && p.statut === 'PRESENT' ? 'FERIE' : p.statut;
+        const absent = statut === 'ABSENT';
+        parEmploye.set(p.employeId, {
+            employeId: p.employeId,
+            statut,
+            heuresSupp: absent ? 0 : parseFloat(p.heuresSupp) || 0,
+            joursTravailles: absent ? 0 : parseFloat(p.joursTravailles) || 0,
+            notes: p.notes || null,
+        });
+    }
+    return [...parEmploye.values()];
+}
+
+function normaliserAvances(avances, debut) {
+    return avances.map((a) => {
+        const montant = parseFloat(a?.montant);
+        if (!a?.employeId || typeof a.employeId !== 'string' || !(montant > 0)) {
+            throw new Error('Données de feuille invalides');
+        }
+        return { employeId: a.employeId, montant, note: a.note || 'Saisie par le Chef', date: debut };
+    });
+}
+
+/**
+ * Use case: Enregistrer une feuille de présence en une transaction
+ *
+ * Reçoit uniquement ce qui a changé sur la feuille : les pointages modifiés
+ * (une instruction INSERT ... ON CONFLICT pour toutes les lignes, soldes de
+ * congés/maladie ajustés de la différence avec l'ancien pointage dans la même
+ * instruction), les nouvelles avances (createMany) et, si demandé, la
+ * validation Chef du jour. Tout ou rien : un échec ne laisse pas de feuille
+ * à moitié enregistrée.
+ *
+ * Avec une clé d'idempotence (`cle`, générée par le client pour chaque
+ * enregistrement), la clé est réservée dans la même transaction : un envoi
+ * rejoué par la file hors ligne après une réponse perdue renvoie le résultat
+ * du premier sans recréer les avances.
+ *
+ * @param {Object} data - { date, pointages?, avances?, valider?, cle? }
+ * @param {string|null} chefId - Validateur, requis si valider
+ * @returns {Promise<Object>} { pointages, avances, validation, rejoue, version }
+ */
+export async function enregistrerFeuille(data, chefId = null) {
+    const { date, pointages = [], avances = [], valider = false, cle = null } = data;
+
+    const debut = jourUTC(date);
+    if (isNaN(debut.getTime())) {
+        throw new Error('Date invalide');
+    }
+    if (!Array.isArray(pointages) || !Array.isArray(avances) || (cle !== null && typeof cle !== 'string')) {
+        throw new Error('Données de feuille invalides');
+    }
+
+    const lignes = normaliserPointages(pointages, debut);
+    const nouvellesAvances = normaliserAvances(avances, debut);
+    const jour = instantUTC(debut);
+
+    const resultat = await prisma.$transaction(async (tx) => {
+        await verifierMoisOuvert(tx, [debut]);
+
+        if (cle) {
+            // Un envoi concurrent de la même clé attend ici la fin du premier
+            const reservee = await tx.$executeRaw`
+                INSERT INTO "SaisieFeuille" ("cle", "createdAt") VALUES (${cle}, CURRENT_TIMESTAMP)
+                ON CONFLICT ("cle") DO NOTHING
+            `;
+            if (!reservee) {
+                const deja = await tx.saisieFeuille.findUnique({ where: { cle } });
+                return { ...deja.resultat, rejoue: true };
+            }
+        }
+
+        // Un employé inconnu (supprimé depuis la saisie hors ligne) est une
+        // donnée invalide, pas une erreur serveur à retenter
+        const employes = [...new Set([...lignes, ...nouvellesAvances].map((l) => l.employeId))];
+        if (employes.length) {
+            const connus = await tx.employe.count({ where: { id: { in: employes } } });
+            if (connus !== employes.length) {
+                throw new Error('Données de feuille invalides');
+            }
+        }
+
+        let ecrits = 0;
+        if (lignes.length) {
+            const [{ ecrits: n }] = await tx.$queryRaw`
+                WITH entree AS (
+                    SELECT * FROM jsonb_to_recordset(${JSON.stringify(lignes)}::jsonb) AS x(
+                        "employeId" text, "statut" text, "heuresSupp" float8,
+                        "joursTravailles" float8, "notes" text
+                    )
+                ), ancien AS (
+                    SELECT p."employeId", p."statut"::text AS "statut", p."joursTravailles"
+                    FROM "Pointage" p
+                    JOIN entree e ON e."employeId" = p."employeId"
+                    WHERE p."date" = ${jour}
+                ), ecrit AS (
+                    INSERT INTO "Pointage" (
+                        "id", "employeId", "date", "statut", "heuresSupp", "joursTravailles",
+                        "notes", "createdAt", "updatedAt"
+                    )
+                    SELECT gen_random_uuid()::text, e."employeId", ${jour}, e."statut"::"StatutPointage",
+                        e."heuresSupp", e."joursTravailles", e."notes", CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+                    FROM entree e
+                    ON CONFLICT ("employeId", "date") DO UPDATE SET
+                        "statut" = EXCLUDED."statut",
+                        "heuresSupp" = EXCLUDED."heuresSupp",
+                        "joursTravailles" = EXCLUDED."joursTravailles",
+                        "notes" = EXCLUDED."notes",
+                        "updatedAt" = EXCLUDED."updatedAt"
+                    RETURNING "employeId"
+                ), soldes AS (
+                    UPDATE "Employe" emp SET
+                        "soldeConges" = emp."soldeConges" - d."conges",
+                        "soldeMaladie" = emp."soldeMaladie" - d."maladie"
+                    FROM (
+                        SELECT e."employeId",
+                            (CASE WHEN e."statut" = 'CONGE' THEN e."joursTravailles" ELSE 0 END)
+                                - (CASE WHEN a."statut" = 'CONGE' THEN a."joursTravailles" ELSE 0 END) AS "conges",
+                            (CASE WHEN e."statut" = 'MALADIE' THEN e."joursTravailles" ELSE 0 END)
+                                - (CASE WHEN a."statut" = 'MALADIE' THEN a."joursTravailles" ELSE 0 END) AS "maladie"
+                        FROM entree e
+                        LEFT JOIN ancien a ON a."employeId" = e."employeId"
+                    ) d
+                    WHERE emp."id" = d."employeId" AND (d."conges" <> 0 OR d."maladie" <> 0)
+                )
+                SELECT COUNT(*)::int AS "ecrits" FROM ecrit
+            `;
+            ecrits = n;
+        }
+
+        const { count: avancesCreees } = nouvellesAvances.length
+            ? await tx.avance.createMany({ data: nouvellesAvances })
+            : { count: 0 };
+
+        const validation = valider
+            ? await validerDansTransaction(tx, debut, chefId, new Date())
+            : null;
+
+        const bilan = { pointages: ecrits, avances: avancesCreees, validation };
+        if (cle) {
+            await tx.saisieFeuille.update({ where: { cle }, data: { resultat: bilan } });
+        }
+        if (ecrits || validation) {
+            await rafraichirJours([debut], tx);
+        }
+        return { ...bilan, rejoue: false };
+    });
+
+    return { ...resultat, version: await versionFeuille(debut) };
+}
+
+/**
+ * Oublie les clés d'idempotence plus anciennes que la durée de conservation
+ * @param {Date} [maintenant]
+ * @returns {Promise<number>} Nombre de clés supprimées
+ */
+export async function purgerClesFeuille(maintenant = new Date()) {
+    const { count } = await prisma.saisieFeuille.deleteMany({
+        where: { createdAt: { lt: new Date(maintenant.getTime() - CONSERVATION_CLES_JOURS * 24 * 60 * 60 * 1000) } },
+    });
+    return count;
+}
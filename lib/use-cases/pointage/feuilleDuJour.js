@@ -0,0 +1,116 @@
+import prisma from '../../prisma';
+import { instantUTC, jourUTC } from '../../services/pointageJourService';
+import { etagDe } from '../../services/versionService';
+import { obtenirValidation } from './validerJournee';
+
+const UN_JOUR = 24 * 60 * 60 * 1000;
+
+/**
+ * Use case: Version de la feuille de présence d'un jour
+ *
+ * Une seule requête lit le nombre de lignes et la dernière modification de
+ * tout ce qui compose la feuille (employés, pointages et avances du jour,
+ * validation Chef). Toute écriture change au moins l'un de ces compteurs, ce
+ * qui suffit à répondre 304 sans recharger la feuille.
+ *
+ * @param {Date|string} date - Jour (Date ou 'YYYY-MM-DD')
+ * @returns {Promise<Object>} { etag, lastModified }
+ */
+export async function versionFeuille(date) {
+    const debut = jourUTC(date);
+    const fin = new Date(debut.getTime() + UN_JOUR);
+    // Bornes en UTC, indépendantes du fuseau de la session
+    const de = instantUTC(debut);
+    const a = instantUTC(fin);
+
+    const [v] = await prisma.$queryRaw`
+        SELECT
+            (SELECT COUNT(*) FROM "Employe") AS "employes",
+            (SELECT MAX("updatedAt") FROM "Employe") AS "employesMaj",
+            (SELECT COUNT(*) FROM "Pointage" WHERE "date" >= ${de} AND "date" < ${a}) AS "pointages",
+            (SELECT MAX("updatedAt") FROM "Pointage" WHERE "date" >= ${de} AND "date" < ${a}) AS "pointagesMaj",
+            (SELECT COUNT(*) FROM "Avance" WHERE "date" >= ${de} AND "date" < ${a}) AS "avances",
+            (SELECT MAX("updatedAt") FROM "Avance" WHERE "date" >= ${de} AND "date" < ${a}) AS "avancesMaj",
+            (SELECT "updatedAt" FROM "PointageJour" WHERE "date" = ${de}) AS "jourMaj",
+            (SELECT "updatedAt" FROM "ValidationJour" WHERE "date" = ${de}) AS "validationMaj"
+    `;
+
+    const dates = [v.employesMaj, v.pointagesMaj, v.avancesMaj, v.jourMaj, v.validationMaj].filter(Boolean);
+
+    return {
+        etag: etagDe([
+            debut,
+            v.employes, v.employesMaj,
+            v.pointages, v.pointagesMaj,
+            v.avances, v.avancesMaj,
+            v.jourMaj,
+            v.validationMaj,
+        ]),
+        lastModified: dates.length ? new Date(Math.max(...dates.map((d) => d.getTime()))) : null,
+    };
+}
+
+/**
+ * Use case: Feuille de présence d'un jour en un seul aller-retour
+ *
+ * Effectif actif (plus les employés inactifs déjà pointés ce jour-là), avec
+ * pour chacun son pointage du jour et le total de ses avances du jour, et
+ * l'état de validation Chef lu dans ValidationJour. Remplace le couple
+ * /api/pointages + /api/employes des pages de saisie et de contrôle.
+ *
+ * @param {Date|string} date - Jour (Date ou 'YYYY-MM-DD')
+ * @returns {Promise<Object>} { date, employes, validation }
+ */
+export async function obtenirFeuilleDuJour(date) {
+    const debut = jourUTC(date);
+    const fin = new Date(debut.getTime() + UN_JOUR);
+    const duJour = { gte: debut, lt: fin };
+
+    const [employes, pointages, avances, validation] = await Promise.all([
+        prisma.employe.findMany({
+            where: {
+                OR: [
+                    { statut: 'ACTIF' },
+                    { pointages: { some: { date: duJour } } },
+                ],
+            },
+            select: { id: true, nom: true, prenom: true, poste: true, employeeId: true },
+            orderBy: [{ nom: 'asc' }, { prenom: 'asc' }],
+        }),
+        prisma.pointage.findMany({
+            where: { date: duJour },
+            select: {
+                id: true,
+                employeId: true,
+                statut: true,
+                heuresSupp: true,
+                joursTravailles: true,
+                notes: true,
+                valideParChef: true,
+            },
+        }),
+        prisma.avance.groupBy({
+            by: ['employeId'],
+            where: { date: duJour, statut: { not: 'REJECTED' } },
+            _sum: { montant: true },
+        }),
+        obtenirValidation(debut),
+    ]);
+
+    const pointageDe = new Map(pointages.map(({ employeId, ...p }) => [employeId, p]));
+    const avanceDe = new Map(avances.map((a) => [a.employeId, a._sum.montant || 0]));
+
+    return {
+        date: debut.toISOString().split('T')[0],
+        employes: employes.map((e) => ({
+            ...e,
+            pointage: pointageDe.get(e.id) || null,
+            avance: avanceDe.get(e.id) || 0,
+        })),
+        validation: {
+            isValidated: !!validation,
+            validatedAt: validation?.validatedAt || null,
+            chefId: validation?.chefId || null,
+        },
+    };
+}
@@ -0,0 +1,69 @@
+import prisma from '../../prisma';
+import { jourUTC, rafraichirJours } from '../../services/pointageJourService';
+import { verifierMoisOuvert } from '../../services/clotureService';
+
+const UN_JOUR = 24 * 60 * 60 * 1000;
+
+/**
+ * Use case: Validation Chef d'une journée
+ *
+ * Marque les pointages de [jour, jour + 1[ (plage sur l'index date) et écrit
+ * la ligne ValidationJour du jour dans la même transaction.
+ *
+ * @param {Date|string} date - Jour (Date ou 'YYYY-MM-DD')
+ * @param {string} chefId - Utilisateur Chef
+ * @param {Date} [validatedAt]
+ * @returns {Promise<Object>} Ligne ValidationJour
+ */
+export async function validerJournee(date, chefId, validatedAt = new Date()) {
+    const debut = jourUTC(date);
+    if (isNaN(debut.getTime())) {
+        throw new Error('Date invalide');
+    }
+
+    return await prisma.$transaction(async (tx) => {
+        const validation = await validerDansTransaction(tx, debut, chefId, validatedAt);
+        await rafraichirJours([debut], tx);
+        return validation;
+    });
+}
+
+/**
+ * Validation d'un jour dans une transaction ouverte par l'appelant
+ * (qui recalcule l'agrégat PointageJour du jour dans la même transaction)
+ * @param {Object} tx - Client de transaction Prisma
+ * @param {Date} debut - Jour, minuit UTC
+ * @param {string} chefId
+ * @param {Date} validatedAt
+ * @returns {Promise<Object>} Ligne ValidationJour
+ */
+export async function validerDansTransaction(tx, debut, chefId, validatedAt) {
+    await verifierMoisOuvert(tx, [debut]);
+
+    const fin = new Date(debut.getTime() + UN_JOUR);
+    const { count } = await tx.pointage.updateMany({
+        where: { date: { gte: debut, lt: fin } },
+        data: {
+            valideParChef: true,
+            dateValidationChef: validatedAt,
+            chefValidateurId: chefId,
+        },
+    });
+
+    return await tx.validationJour.upsert({
+        where: { date: debut },
+        create: { date: debut, chefId, validatedAt, lignes: count },
+        update: { chefId, validatedAt, lignes: count },
+    });
+}
+
+/**
+ * Use case: Validation Chef d'un jour (null si le jour n'est pas validé)
+ * @param {Date|string} date - Jour (Date ou 'YYYY-MM-DD')
+ * @returns {Promise<Object|null>}
+ */
+export async function obtenirValidation(date) {
+    return await prisma.validationJour.findUnique({
+        where: { date: jourUTC(date) },
+    });
+}
@@ -0,0 +1,5 @@
+-- DropIndex
+DROP INDEX "Pointage_date_idx";
+
+-- CreateIndex
+CREATE INDEX "Pointage_date_id_idx" ON "Pointage"("date", "id");
@@ -0,0 +1,43 @@
+-- CreateTable
+CREATE TABLE "PointageJour" (
+    "date" TIMESTAMP(3) NOT NULL,
+    "total" INTEGER NOT NULL DEFAULT 0,
+    "present" INTEGER NOT NULL DEFAULT 0,
+    "absent" INTEGER NOT NULL DEFAULT 0,
+    "conge" INTEGER NOT NULL DEFAULT 0,
+    "maladie" INTEGER NOT NULL DEFAULT 0,
+    "ferie" INTEGER NOT NULL DEFAULT 0,
+    "joursPresents" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    "heuresSupp" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    "valides" INTEGER NOT NULL DEFAULT 0,
+    "dateValidationChef" TIMESTAMP(3),
+    "chefValidateurId" TEXT,
+    "effectifAttendu" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "PointageJour_pkey" PRIMARY KEY ("date")
+);
+
+-- Backfill (same aggregation as scripts/backfill-pointage-jour.mjs)
+INSERT INTO "PointageJour" (
+    "date", "total", "present", "absent", "conge", "maladie", "ferie",
+    "joursPresents", "heuresSupp", "valides", "dateValidationChef",
+    "chefValidateurId", "effectifAttendu", "updatedAt"
+)
+SELECT
+    date_trunc('day', p."date"),
+    COUNT(*)::int,
+    (COUNT(*) FILTER (WHERE p."statut" = 'PRESENT'))::int,
+    (COUNT(*) FILTER (WHERE p."statut" = 'ABSENT'))::int,
+    (COUNT(*) FILTER (WHERE p."statut" = 'CONGE'))::int,
+    (COUNT(*) FILTER (WHERE p."statut" = 'MALADIE'))::int,
+    (COUNT(*) FILTER (WHERE p."statut" = 'FERIE'))::int,
+    COALESCE(SUM(p."joursTravailles") FILTER (WHERE p."statut" IN ('PRESENT', 'FERIE')), 0),
+    COALESCE(SUM(p."heuresSupp"), 0),
+    (COUNT(*) FILTER (WHERE p."valideParChef"))::int,
+    MAX(p."dateValidationChef"),
+    (array_agg(p."chefValidateurId" ORDER BY p."dateValidationChef" DESC NULLS LAST))[1],
+    (SELECT COUNT(*) FROM "Employe" WHERE "statut" = 'ACTIF')::int,
+    CURRENT_TIMESTAMP
+FROM "Pointage" p
+GROUP BY 1;
@@ -0,0 +1,34 @@
+-- CreateEnum
+CREATE TYPE "ClockEventKind" AS ENUM ('IN', 'OUT');
+
+-- CreateEnum
+CREATE TYPE "ClockEventSource" AS ENUM ('WEB', 'AUTO', 'IMPORT');
+
+-- CreateTable
+CREATE TABLE "ClockEvent" (
+    "id" SERIAL NOT NULL,
+    "employeId" TEXT NOT NULL,
+    "ts" TIMESTAMP(3) NOT NULL,
+    "kind" "ClockEventKind" NOT NULL,
+    "source" "ClockEventSource" NOT NULL DEFAULT 'WEB',
+
+    CONSTRAINT "ClockEvent_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "ClockEvent_employeId_ts_idx" ON "ClockEvent"("employeId", "ts");
+
+-- AddForeignKey
+ALTER TABLE "ClockEvent" ADD CONSTRAINT "ClockEvent_employeId_fkey" FOREIGN KEY ("employeId") REFERENCES "Employe"("id") ON DELETE CASCADE ON UPDATE CASCADE;
+
+-- Backfill: one IN/OUT pair per existing Pointage
+INSERT INTO "ClockEvent" ("employeId", "ts", "kind", "source")
+SELECT "employeId", "ts", "kind"::"ClockEventKind", "source"::"ClockEventSource"
+FROM (
+    SELECT "employeId", "clockInTime" AS "ts", 'IN' AS "kind", 'IMPORT' AS "source"
+    FROM "Pointage" WHERE "clockInTime" IS NOT NULL
+    UNION ALL
+    SELECT "employeId", "clockOutTime", 'OUT', CASE WHEN "isAutoClockOut" THEN 'AUTO' ELSE 'IMPORT' END
+    FROM "Pointage" WHERE "clockInTime" IS NOT NULL AND "clockOutTime" IS NOT NULL
+) e
+ORDER BY "ts";
@@ -0,0 +1,22 @@
+-- CreateTable
+CREATE TABLE "ValidationJour" (
+    "date" TIMESTAMP(3) NOT NULL,
+    "chefId" TEXT NOT NULL,
+    "validatedAt" TIMESTAMP(3) NOT NULL,
+    "lignes" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "ValidationJour_pkey" PRIMARY KEY ("date")
+);
+
+-- Backfill from the days already validated row by row
+INSERT INTO "ValidationJour" ("date", "chefId", "validatedAt", "lignes", "updatedAt")
+SELECT
+    date_trunc('day', p."date"),
+    (array_agg(p."chefValidateurId" ORDER BY p."dateValidationChef" DESC NULLS LAST))[1],
+    MAX(p."dateValidationChef"),
+    COUNT(*)::int,
+    CURRENT_TIMESTAMP
+FROM "Pointage" p
+WHERE p."valideParChef" AND p."chefValidateurId" IS NOT NULL AND p."dateValidationChef" IS NOT NULL
+GROUP BY 1;
@@ -0,0 +1,11 @@
+-- CreateTable
+CREATE TABLE "SaisieFeuille" (
+    "cle" TEXT NOT NULL,
+    "resultat" JSONB,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "SaisieFeuille_pkey" PRIMARY KEY ("cle")
+);
+
+-- CreateIndex
+CREATE INDEX "SaisieFeuille_createdAt_idx" ON "SaisieFeuille"("createdAt");
@@ -0,0 +1,108 @@
+-- Monthly range partitioning of "Pointage" on "date".
+--
+-- Live partitions are "pointage_mois"."Pointage_YYYY_MM" (plus a DEFAULT
+-- partition catching months without one); closed months past the retention
+-- window are detached into the "archive" schema. Both schemas stay outside
+-- the Prisma datasource, which only sees the partitioned parent.
+--
+-- The partition key must belong to every unique constraint, hence the
+-- primary key on ("id", "date"). The single-column indexes on "employeId"
+-- (a prefix of the ("employeId", "date") key), "statut" and "valideParChef"
+-- (low selectivity, filters always combined with a date range) are dropped.
+
+-- CreateSchema
+CREATE SCHEMA IF NOT EXISTS "pointage_mois";
+
+-- CreateSchema
+CREATE SCHEMA IF NOT EXISTS "archive";
+
+-- RenameTable
+ALTER TABLE "Pointage" RENAME TO "Pointage_ancien";
+
+-- CreateTable
+CREATE TABLE "Pointage" (LIKE "Pointage_ancien" INCLUDING DEFAULTS) PARTITION BY RANGE ("date");
+
+-- CreateTable
+CREATE TABLE "pointage_mois"."Pointage_defaut" PARTITION OF "Pointage" DEFAULT;
+
+-- CreateFunction: attach the partition of a month, moving its rows out of
+-- the DEFAULT partition first. No-op if the month is live or archived.
+CREATE FUNCTION pointage_creer_partition(mois DATE) RETURNS BOOLEAN
+LANGUAGE plpgsql AS $$
+DECLARE
+    debut DATE := date_trunc('month', mois)::date;
+    fin DATE := (date_trunc('month', mois) + INTERVAL '1 month')::date;
+    nom TEXT := 'Pointage_' || to_char(mois, 'YYYY_MM');
+BEGIN
+    IF to_regclass(format('pointage_mois.%I', nom)) IS NOT NULL
+        OR to_regclass(format('archive.%I', nom)) IS NOT NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    EXECUTE format('CREATE TABLE pointage_mois.%I (LIKE "Pointage" INCLUDING DEFAULTS)', nom);
+    EXECUTE format(
+        'WITH deplaces AS (DELETE FROM pointage_mois."Pointage_defaut" WHERE "date" >= %L AND "date" < %L RETURNING *)
+         INSERT INTO pointage_mois.%I SELECT * FROM deplaces',
+        debut, fin, nom
+    );
+    EXECUTE format('ALTER TABLE "Pointage" ATTACH PARTITION pointage_mois.%I FOR VALUES FROM (%L) TO (%L)', nom, debut, fin);
+    RETURN TRUE;
+END $$;
+
+-- CreateFunction: detach a month into the "archive" schema
+CREATE FUNCTION pointage_archiver_partition(mois DATE) RETURNS BOOLEAN
+LANGUAGE plpgsql AS $$
+DECLARE
+    nom TEXT := 'Pointage_' || to_char(mois, 'YYYY_MM');
+BEGIN
+    IF to_regclass(format('pointage_mois.%I', nom)) IS NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    EXECUTE format('ALTER TABLE "Pointage" DETACH PARTITION pointage_mois.%I', nom);
+    EXECUTE format('ALTER TABLE pointage_mois.%I SET SCHEMA archive', nom);
+    RETURN TRUE;
+END $$;
+
+-- CreateFunction: bring an archived month back into "Pointage"
+CREATE FUNCTION pointage_restaurer_partition(mois DATE) RETURNS BOOLEAN
+LANGUAGE plpgsql AS $$
+DECLARE
+    debut DATE := date_trunc('month', mois)::date;
+    fin DATE := (date_trunc('month', mois) + INTERVAL '1 month')::date;
+    nom TEXT := 'Pointage_' || to_char(mois, 'YYYY_MM');
+BEGIN
+    IF to_regclass(format('archive.%I', nom)) IS NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    EXECUTE format('ALTER TABLE archive.%I SET SCHEMA pointage_mois', nom);
+    EXECUTE format('ALTER TABLE "Pointage" ATTACH PARTITION pointage_mois.%I FOR VALUES FROM (%L) TO (%L)', nom, debut, fin);
+    RETURN TRUE;
+END $$;
+
+-- Partitions from the first month with data to three months ahead
+SELECT pointage_creer_partition(mois::date)
+FROM generate_series(
+    COALESCE((SELECT date_trunc('month', MIN("date")) FROM "Pointage_ancien"), date_trunc('month', CURRENT_DATE)),
+    date_trunc('month', CURRENT_DATE) + INTERVAL '3 months',
+    INTERVAL '1 month'
+) AS mois;
+
+-- CopyData (indexes are built once the rows are in place)
+INSERT INTO "Pointage" SELECT * FROM "Pointage_ancien";
+
+-- DropTable
+DROP TABLE "Pointage_ancien";
+
+-- AddPrimaryKey
+ALTER TABLE "Pointage" ADD CONSTRAINT "Pointage_pkey" PRIMARY KEY ("id", "date");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "Pointage_employeId_date_key" ON "Pointage"("employeId", "date");
+
+-- CreateIndex
+CREATE INDEX "Pointage_date_id_idx" ON "Pointage"("date", "id");
+
+-- AddForeignKey
+ALTER TABLE "Pointage" ADD CONSTRAINT "Pointage_employeId_fkey" FOREIGN KEY ("employeId") REFERENCES "Employe"("id") ON DELETE CASCADE ON UPDATE CASCADE;
@@ -0,0 +1,47 @@
+-- CreateTable
+CREATE TABLE "ClotureMois" (
+    "id" SERIAL NOT NULL,
+    "mois" TEXT NOT NULL,
+    "recaps" BYTEA NOT NULL,
+    "totaux" JSONB NOT NULL,
+    "checksum" TEXT NOT NULL,
+    "employes" INTEGER NOT NULL,
+    "clotureParId" TEXT NOT NULL,
+    "clotureLe" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "rouvertParId" TEXT,
+    "rouvertLe" TIMESTAMP(3),
+    "motifReouverture" TEXT,
+
+    CONSTRAINT "ClotureMois_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "ClotureMois_mois_idx" ON "ClotureMois"("mois");
+
+-- At most one active (not reopened) closure per month; not expressible in Prisma
+CREATE UNIQUE INDEX "ClotureMois_mois_actif_key" ON "ClotureMois"("mois") WHERE "rouvertLe" IS NULL;
+
+-- Snapshots are immutable: only the reopening columns may be set, once
+CREATE FUNCTION cloture_mois_immuable() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        RAISE EXCEPTION 'ClotureMois % is immutable', OLD."id";
+    END IF;
+    IF OLD."rouvertLe" IS NOT NULL
+        OR NEW."mois" IS DISTINCT FROM OLD."mois"
+        OR NEW."recaps" IS DISTINCT FROM OLD."recaps"
+        OR NEW."totaux" IS DISTINCT FROM OLD."totaux"
+        OR NEW."checksum" IS DISTINCT FROM OLD."checksum"
+        OR NEW."employes" IS DISTINCT FROM OLD."employes"
+        OR NEW."clotureParId" IS DISTINCT FROM OLD."clotureParId"
+        OR NEW."clotureLe" IS DISTINCT FROM OLD."clotureLe" THEN
+        RAISE EXCEPTION 'ClotureMois % is immutable', OLD."id";
+    END IF;
+    RETURN NEW;
+END $$;
+
+-- CreateTrigger
+CREATE TRIGGER "ClotureMois_immuable"
+BEFORE UPDATE OR DELETE ON "ClotureMois"
+FOR EACH ROW EXECUTE FUNCTION cloture_mois_immuable();
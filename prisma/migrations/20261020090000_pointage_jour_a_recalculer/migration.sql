@@ -0,0 +1,7 @@
+-- CreateTable
+CREATE TABLE "PointageJourARecalculer" (
+    "date" TIMESTAMP(3) NOT NULL,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "PointageJourARecalculer_pkey" PRIMARY KEY ("date")
+);
@@ -0,0 +1,8 @@
+-- Partial index of the open pointages (clocked in, not clocked out), read by
+-- the forgotten clock-out sweep (cloturerSortiesOubliees). Only a handful of
+-- rows are open at any time, so the sweep no longer scans "Pointage".
+-- Prisma cannot express a partial index: it lives in migrations only.
+
+-- CreateIndex
+CREATE INDEX "Pointage_ouverts_idx" ON "Pointage"("employeId", "date")
+    WHERE "clockInTime" IS NOT NULL AND "clockOutTime" IS NULL;
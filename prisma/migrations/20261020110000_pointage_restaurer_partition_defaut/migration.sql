@@ -0,0 +1,26 @@
+-- Restoring an archived month must also take the rows written to the DEFAULT
+-- partition meanwhile (a month reopened while its partition was still in
+-- "archive"): ATTACH fails while DEFAULT holds rows of the range. They are
+-- moved into the partition first, like pointage_creer_partition does.
+
+-- CreateFunction
+CREATE OR REPLACE FUNCTION pointage_restaurer_partition(mois DATE) RETURNS BOOLEAN
+LANGUAGE plpgsql AS $$
+DECLARE
+    debut DATE := date_trunc('month', mois)::date;
+    fin DATE := (date_trunc('month', mois) + INTERVAL '1 month')::date;
+    nom TEXT := 'Pointage_' || to_char(mois, 'YYYY_MM');
+BEGIN
+    IF to_regclass(format('archive.%I', nom)) IS NULL THEN
+        RETURN FALSE;
+    END IF;
+
+    EXECUTE format('ALTER TABLE archive.%I SET SCHEMA pointage_mois', nom);
+    EXECUTE format(
+        'WITH deplaces AS (DELETE FROM pointage_mois."Pointage_defaut" WHERE "date" >= %L AND "date" < %L RETURNING *)
+         INSERT INTO pointage_mois.%I SELECT * FROM deplaces',
+        debut, fin, nom
+    );
+    EXECUTE format('ALTER TABLE "Pointage" ATTACH PARTITION pointage_mois.%I FOR VALUES FROM (%L) TO (%L)', nom, debut, fin);
+    RETURN TRUE;
+END $$;
@@ -0,0 +1,349 @@
+/**
+ * Service worker KL Beton - Feuille de présence hors ligne
+ *
+ * - Coquille : la page /chef/pointage et les fichiers /_next/static sont mis
+ *   en cache, la feuille s'ouvre sans réseau.
+ * - Données : la dernière feuille chargée de chaque jour (GET
+ *   /api/pointages/feuille) et la session sont servies depuis le cache quand
+ *   le réseau manque (réseau d'abord, cache ensuite).
+ * - File d'écriture : la page confie chaque enregistrement (message ENFILER)
+ *   à une file IndexedDB, envoyée par lots à POST /api/pointages/feuille dès
+ *   que le réseau revient (Background Sync, ou message SYNCHRONISER de la
+ *   page pour les navigateurs qui ne l'ont pas). Chaque saisie porte une clé
+ *   d'idempotence : un lot renvoyé après une réponse perdue n'applique rien
+ *   deux fois.
+ * - Rejetées : une saisie refusée (4xx), ou en erreur serveur après
+ *   ECHECS_MAX synchronisations, quitte la file pour le store `rejetees`,
+ *   affiché par la page jusqu'à ce que l'utilisateur l'écarte. Les autres
+ *   saisies ne sont jamais bloquées par elle.
+ * - Tablette partagée : chaque saisie porte l'utilisateur qui l'a faite et
+ *   n'est envoyée, affichée ou écartée que sous sa session. La déconnexion
+ *   (message DECONNEXION) vide le cache des données.
+ */
+
+const VERSION = 'klb-v1';
+const CACHE_COQUILLE = `${VERSION}-coquille`;
+const CACHE_DONNEES = `${VERSION}-donnees`;
+const PAGES_HORS_LIGNE = ['/chef/pointage'];
+const DONNEES_HORS_LIGNE = ['/api/pointages/feuille', '/api/auth/session'];
+const TAG_SYNC = 'feuilles';
+const LOT_MAX = 20;
+const ECHECS_MAX = 5;
+
+const BASE = 'klbeton-hors-ligne';
+const STORE = 'saisies';
+const STORE_REJETEES = 'rejetees';
+
+// --- Cycle de vie -----------------------------------------------------------
+
+self.addEventListener('install', (event) => {
+    event.waitUntil((async () => {
+        const cache = await caches.open(CACHE_COQUILLE);
+        await Promise.all(PAGES_HORS_LIGNE.map(async (page) => {
+            try {
+                const res = await fetch(page, { credentials: 'same-origin' });
+                // Pas de mise en cache de la page de connexion après redirection
+                if (res.ok && !res.redirected) await cache.put(page, res);
+            } catch {
+                // Hors ligne à l'installation : la page sera mise en cache à la première visite
+            }
+        }));
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', (event) => {
+    event.waitUntil((async () => {
+        const noms = await caches.keys();
+        await Promise.all(noms.filter((nom) => !nom.startsWith(VERSION)).map((nom) => caches.delete(nom)));
+        await self.clients.claim();
+    })());
+});
+
+// --- Cache ------------------------------------------------------------------
+
+async function cacheDAbord(request) {
+    const cache = await caches.open(CACHE_COQUILLE);
+    const enCache = await cache.match(request);
+    if (enCache) return enCache;
+    const res = await fetch(request);
+    if (res.ok) cache.put(request, res.clone());
+    return res;
+}
+
+async function reseauDAbord(request, nomCache, cle = request) {
+    const cache = await caches.open(nomCache);
+    try {
+        const res = await fetch(request);
+        if (res.ok && !res.redirected) cache.put(cle, res.clone());
+        return res;
+    } catch (error) {
+        const enCache = await cache.match(cle);
+        if (enCache) return enCache;
+        throw error;
+    }
+}
+
+self.addEventListener('fetch', (event) => {
+    const { request } = event;
+    const url = new URL(request.url);
+    if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+
+    if (url.pathname.startsWith('/_next/static/')) {
+        event.respondWith(cacheDAbord(request));
+    } else if (request.mode === 'navigate' && PAGES_HORS_LIGNE.includes(url.pathname)) {
+        event.respondWith(reseauDAbord(request, CACHE_COQUILLE, url.pathname));
+    } else if (DONNEES_HORS_LIGNE.includes(url.pathname)) {
+        event.respondWith(reseauDAbord(request, CACHE_DONNEES, url.pathname + url.search));
+    }
+});
+
+// Utilisateur de la session (réseau d'abord, sinon la dernière session en cache)
+async function utilisateurCourant() {
+    try {
+        const res = await reseauDAbord(
+            new Request('/api/auth/session', { credentials: 'same-origin' }),
+            CACHE_DONNEES,
+            '/api/auth/session'
+        );
+        const session = res.ok ? await res.json() : null;
+        return session?.user?.id || null;
+    } catch {
+        return null;
+    }
+}
+
+// Saisies d'un utilisateur (celles d'avant le marquage par utilisateur vont à tous)
+const deLUtilisateur = (utilisateurId) => (s) => !s.utilisateurId || s.utilisateurId === utilisateurId;
+
+// --- File IndexedDB ---------------------------------------------------------
+
+function ouvrirBase() {
+    return new Promise((resolve, reject) => {
+        const ouverture = indexedDB.open(BASE, 2);
+        ouverture.onupgradeneeded = () => {
+            const db = ouverture.result;
+            [STORE, STORE_REJETEES]
+                .filter((nom) => !db.objectStoreNames.contains(nom))
+                .forEach((nom) => db.createObjectStore(nom, { keyPath: 'cle' }));
+        };
+        ouverture.onsuccess = () => resolve(ouverture.result);
+        ouverture.onerror = () => reject(ouverture.error);
+    });
+}
+
+async function transaction(mode, action, stores = STORE) {
+    const db = await ouvrirBase();
+    return new Promise((resolve, reject) => {
+        const tx = db.transaction(stores, mode);
+        const resultat = action(Array.isArray(stores) ? stores.map((nom) => tx.objectStore(nom)) : tx.objectStore(stores));
+        tx.oncomplete = () => resolve(resultat?.result);
+        tx.onerror = () => reject(tx.error);
+    });
+}
+
+async function lireFile() {
+    const saisies = await transaction('readonly', (store) => store.getAll());
+    return saisies.sort((a, b) => a.creeLe - b.creeLe);
+}
+
+const enregistrer = (saisie) => transaction('readwrite', (store) => store.put(saisie));
+const supprimer = (cle) => transaction('readwrite', (store) => store.delete(cle));
+
+async function lireRejetees() {
+    const saisies = await transaction('readonly', (store) => store.getAll(), STORE_REJETEES);
+    return saisies.sort((a, b) => a.creeLe - b.creeLe);
+}
+
+// Sort une saisie de la file, en une transaction, avec la réponse qui l'a refusée
+function rejeter(saisie, resultat) {
+    return transaction('readwrite', ([file, rejetees]) => {
+        file.delete(saisie.cle);
+        rejetees.put({ ...saisie, status: resultat.status, error: resultat.error, rejeteeLe: Date.now() });
+    }, [STORE, STORE_REJETEES]);
+}
+
+const ecarter = (cle) => transaction('readwrite', (store) => store.delete(cle), STORE_REJETEES);
+
+// Clés en cours d'envoi : elles ne reçoivent plus de modifications
+const enEnvoi = new Set();
+
+let synchronisation = null;
+
+/**
+ * Ajoute une saisie à la file. Une saisie du même jour jamais envoyée est
+ * complétée plutôt que dupliquée (dernière valeur par employé, avances
+ * ajoutées), ce qui garde la file compacte pendant une longue coupure.
+ * Lecture, fusion et écriture se font dans une seule transaction ; pendant
+ * une synchronisation, qui a pu lire la saisie ouverte, rien n'est fusionné :
+ * la saisie est ajoutée à part.
+ */
+async function enfiler(saisie) {
+    const utilisateurId = await utilisateurCourant();
+    await transaction('readwrite', (store) => {
+        const lecture = store.getAll();
+        lecture.onsuccess = () => {
+            const ouverte = synchronisation ? null : lecture.result
+                .filter(deLUtilisateur(utilisateurId))
+                .sort((a, b) => b.creeLe - a.creeLe)
+                .find((s) => s.date === saisie.date && s.tentatives === 0 && !enEnvoi.has(s.cle));
+
+            if (ouverte) {
+                const lignes = new Map(ouverte.pointages.map((p) => [p.employeId, p]));
+                saisie.pointages.forEach((p) => lignes.set(p.employeId, p));
+                store.put({
+                    ...ouverte,
+                    pointages: [...lignes.values()],
+                    avances: [...ouverte.avances, ...saisie.avances],
+                });
+            } else {
+                store.put({ ...saisie, utilisateurId, creeLe: Date.now(), tentatives: 0 });
+            }
+        };
+    });
+    return (await lireFile()).filter(deLUtilisateur(utilisateurId)).length;
+}
+
+async function notifier(message) {
+    const clients = await self.clients.matchAll({ type: 'window' });
+    clients.forEach((client) => client.postMessage(message));
+}
+
+/**
+ * Envoie les saisies de l'utilisateur connecté par lots, dans l'ordre de
+ * saisie, chacune au plus une fois par passage. Rejette si des saisies
+ * restent en attente (réseau, session ou erreur serveur), pour que
+ * Background Sync réessaie plus tard.
+ */
+function synchroniser() {
+    if (!synchronisation) {
+        synchronisation = (async () => {
+            const resultats = [];
+            const envoyees = new Set();
+            const utilisateurId = await utilisateurCourant();
+            const siennes = async () => (await lireFile()).filter(deLUtilisateur(utilisateurId));
+            const aEnvoyer = async () => (await siennes()).filter((s) => !envoyees.has(s.cle));
+            try {
+                if (!utilisateurId) {
+                    throw new Error('Aucune session pour synchroniser');
+                }
+                let file = await aEnvoyer();
+                while (file.length) {
+                    const lot = file.slice(0, LOT_MAX);
+                    lot.forEach((saisie) => {
+                        envoyees.add(saisie.cle);
+                        enEnvoi.add(saisie.cle);
+                    });
+                    // Compter la tentative avant l'envoi : une saisie peut-être
+                    // appliquée ne doit plus être complétée par enfiler()
+                    await transaction('readwrite', (store) => {
+                        lot.forEach((saisie) => store.put({ ...saisie, tentatives: saisie.tentatives + 1 }));
+                    });
+
+                    const res = await fetch('/api/pointages/feuille', {
+                        method: 'POST',
+                        credentials: 'same-origin',
+                        headers: { 'Content-Type': 'application/json' },
+                        body: JSON.stringify({
+                            lots: lot.map(({ cle, date, pointages, avances }) => ({ cle, date, pointages, avances })),
+                        }),
+                    });
+                    if (!res.ok) {
+                        throw new Error(`Erreur ${res.status} sur /api/pointages/feuille`);
+                    }
+
+                    const parCle = new Map(lot.map((saisie) => [saisie.cle, saisie]));
+                    for (const resultat of (await res.json()).resultats) {
+                        const saisie = parCle.get(resultat.cle);
+                        if (resultat.status >= 500 && saisie) {
+                            // Erreur serveur : retentée au prochain passage, puis mise de côté
+                            const echecs = (saisie.echecs || 0) + 1;
+                            if (echecs >= ECHECS_MAX) {
+                                await rejeter(saisie, resultat);
+                            } else {
+                                await enregistrer({ ...saisie, tentatives: saisie.tentatives + 1, echecs });
+                            }
+                        } else if (resultat.status >= 400 && saisie) {
+                            // Ne passera jamais : gardée pour la page jusqu'à ce qu'elle soit écartée
+                            await rejeter(saisie, resultat);
+                        } else {
+                            // 200 : appliquée (ou déjà appliquée)
+                            await supprimer(resultat.cle);
+                        }
+                        resultats.push(resultat);
+                    }
+                    lot.forEach((saisie) => enEnvoi.delete(saisie.cle));
+                    file = await aEnvoyer();
+                }
+                if ((await siennes()).length) {
+                    throw new Error('Saisies en attente après une erreur serveur');
+                }
+            } finally {
+                enEnvoi.clear();
+                const enAttente = (await siennes()).length;
+                const rejetees = (await lireRejetees()).filter(deLUtilisateur(utilisateurId));
+                await notifier({ type: 'SYNCHRONISE', resultats, enAttente, rejetees });
+            }
+        })().finally(() => {
+            synchronisation = null;
+        });
+    }
+    return synchronisation;
+}
+
+self.addEventListener('sync', (event) => {
+    if (event.tag === TAG_SYNC) {
+        event.waitUntil(synchroniser());
+    }
+});
+
+// --- Messages de la page ----------------------------------------------------
+
+self.addEventListener('message', (event) => {
+    const { type } = event.data || {};
+    const repondre = (reponse) => event.ports[0]?.postMessage(reponse);
+
+    if (type === 'ENFILER') {
+        event.waitUntil((async () => {
+            try {
+                const enAttente = await enfiler(event.data.saisie);
+                repondre({ ok: true, enAttente });
+            } catch (error) {
+                repondre({ ok: false, error: error.message });
+                return;
+            }
+            // Envoi immédiat si le réseau est là, sinon au retour du réseau
+            if (self.registration.sync) {
+                await self.registration.sync.register(TAG_SYNC).catch(() => synchroniser().catch(() => {}));
+            } else {
+                await synchroniser().catch(() => {});
+            }
+        })());
+    } else if (type === 'SYNCHRONISER') {
+        event.waitUntil(synchroniser().catch(() => {}));
+    } else if (type === 'REJETEES' || type === 'ECARTER') {
+        event.waitUntil((async () => {
+            const utilisateurId = await utilisateurCourant();
+            if (type === 'ECARTER') {
+                const rejetee = (await lireRejetees()).find((s) => s.cle === event.data.cle);
+                if (rejetee && deLUtilisateur(utilisateurId)(rejetee)) await ecarter(rejetee.cle);
+            }
+            const rejetees = (await lireRejetees()).filter(deLUtilisateur(utilisateurId));
+            repondre({ ok: true, rejetees });
+        })());
+    } else if (type === 'EN_ATTENTE') {
+        event.waitUntil((async () => {
+            const utilisateurId = await utilisateurCourant();
+            const file = (await lireFile()).filter(deLUtilisateur(utilisateurId));
+            repondre({ ok: true, saisies: file.filter((s) => !event.data.date || s.date === event.data.date) });
+        })());
+    } else if (type === 'DECONNEXION') {
+        // Dernier envoi sous la session qui se ferme, puis plus aucune donnée
+        // (feuilles, session) servie hors ligne au prochain utilisateur
+        event.waitUntil((async () => {
+            await synchroniser().catch(() => {});
+            await caches.delete(CACHE_DONNEES);
+            repondre({ ok: true });
+        })());
+    }
+});
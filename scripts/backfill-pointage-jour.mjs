@@ -0,0 +1,50 @@
+// Reconstruit entièrement la table PointageJour à partir de Pointage.
+// À lancer après une reprise de données ou une correction SQL manuelle :
+//   node scripts/backfill-pointage-jour.mjs
+// Le calcul est le même que rafraichirJours (lib/services/pointageJourService.js).
+import { PrismaClient } from '@prisma/client';
+
+const prisma = new PrismaClient();
+
+async function backfill() {
+    try {
+        const debut = Date.now();
+        // Le verrou de table fait attendre les recalculs par jour jusqu'à la fin
+        const [, , inseres] = await prisma.$transaction([
+            prisma.$executeRaw`LOCK TABLE "PointageJour" IN EXCLUSIVE MODE`,
+            prisma.$executeRaw`DELETE FROM "PointageJour"`,
+            prisma.$executeRaw`
+                INSERT INTO "PointageJour" (
+                    "date", "total", "present", "absent", "conge", "maladie", "ferie",
+                    "joursPresents", "heuresSupp", "valides", "dateValidationChef",
+                    "chefValidateurId", "effectifAttendu", "updatedAt"
+                )
+                SELECT
+                    date_trunc('day', p."date"),
+                    COUNT(*)::int,
+                    (COUNT(*) FILTER (WHERE p."statut" = 'PRESENT'))::int,
+                    (COUNT(*) FILTER (WHERE p."statut" = 'ABSENT'))::int,
+                    (COUNT(*) FILTER (WHERE p."statut" = 'CONGE'))::int,
+                    (COUNT(*) FILTER (WHERE p."statut" = 'MALADIE'))::int,
+                    (COUNT(*) FILTER (WHERE p."statut" = 'FERIE'))::int,
+                    COALESCE(SUM(p."joursTravailles") FILTER (WHERE p."statut" IN ('PRESENT', 'FERIE')), 0),
+                    COALESCE(SUM(p."heuresSupp"), 0),
+                    (COUNT(*) FILTER (WHERE p."valideParChef"))::int,
+                    MAX(p."dateValidationChef"),
+                    (array_agg(p."chefValidateurId" ORDER BY p."dateValidationChef" DESC NULLS LAST))[1],
+                    (SELECT COUNT(*) FROM "Employe" WHERE "statut" = 'ACTIF')::int,
+                    CURRENT_TIMESTAMP
+                FROM "Pointage" p
+                GROUP BY 1
+            `,
+        ], { timeout: 10 * 60 * 1000 });
+        console.log(`✅ PointageJour reconstruit : ${inseres} jours en ${((Date.now() - debut) / 1000).toFixed(1)}s`);
+    } catch (error) {
+        console.error('❌ Échec du rattrapage PointageJour:', error);
+        process.exitCode = 1;
+    } finally {
+        await prisma.$disconnect();
+    }
+}
+
+backfill();
@@ -0,0 +1,48 @@
+// Sort les photos encore stockées en data URL dans Employe.photo vers le
+// stockage de photos (lib/infrastructure/stockage/photos.js) et ne garde
+// que leur clé dans la table. Sans effet sur les lignes déjà migrées :
+//   PHOTOS_DIR=/chemin/photos node scripts/migrer-photos.mjs
+import { PrismaClient } from '@prisma/client';
+import { normaliserPhoto } from '../lib/infrastructure/stockage/photos.js';
+
+const prisma = new PrismaClient();
+const LOT = 20;
+
+async function migrer() {
+    let migrees = 0;
+    const echecs = [];
+    try {
+        // Une ligne migrée ne correspond plus au filtre : on relit le premier lot restant
+        for (;;) {
+            const employes = await prisma.employe.findMany({
+                where: { photo: { startsWith: 'data:' }, id: { notIn: echecs } },
+                select: { id: true, photo: true },
+                take: LOT,
+            });
+            if (employes.length === 0) break;
+
+            for (const { id, photo } of employes) {
+                try {
+                    const cle = await normaliserPhoto(photo);
+                    if (cle === photo) throw new Error('data URL non reconnue');
+                    // Condition sur l'ancienne valeur : ne pas écraser une photo modifiée entre-temps
+                    // (0 ligne : la nouvelle photo, si c'est encore une data URL, revient au lot suivant)
+                    const { count } = await prisma.employe.updateMany({ where: { id, photo }, data: { photo: cle } });
+                    migrees += count;
+                } catch (error) {
+                    console.error(`⚠️ Employé ${id} : ${error.message}`);
+                    echecs.push(id);
+                }
+            }
+        }
+        console.log(`✅ ${migrees} photo(s) migrée(s), ${echecs.length} échec(s)`);
+        if (echecs.length) process.exitCode = 1;
+    } catch (error) {
+        console.error('❌ Échec de la migration des photos:', error);
+        process.exitCode = 1;
+    } finally {
+        await prisma.$disconnect();
+    }
+}
+
+migrer();
@@ -1,10 +1,14 @@
 import asyncio
 from playwright import async_api
 
+from perf import BASE_URL
+from perf.page_metrics import PageMetrics
+
 async def run_test():
     pw = None
     browser = None
     context = None
+    metrics = None
 
     try:
         # Start a Playwright session in asynchronous mode
@@ -24,12 +28,13 @@ async def run_test():
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
         context.set_default_timeout(5000)
+        metrics = await PageMetrics.attach(context, "TC002")
 
         # Open a new page in the browser context
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,7 +51,7 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
         
         # -> Fill the email field, fill the password field, and click the 'Connexion Administrateur' button to log in.
         frame = context.pages[-1]
@@ -237,8 +242,11 @@ async def run_test():
         except AssertionError:
             raise AssertionError("Test case failed: The test attempted to verify that after selecting a worker, setting their status to 'Présent' and saving, a success confirmation 'Présence enregistrée avec succès' would be visible, but no such confirmation appeared.")
         await asyncio.sleep(5)
+        metrics.assert_within_budgets()
 
     finally:
+        if metrics:
+            metrics.save()
         if context:
             await context.close()
         if browser:
@@ -1,10 +1,14 @@
 import asyncio
 from playwright import async_api
 
+from perf import BASE_URL
+from perf.page_metrics import PageMetrics
+
 async def run_test():
     pw = None
     browser = None
     context = None
+    metrics = None
 
     try:
         # Start a Playwright session in asynchronous mode
@@ -24,12 +28,13 @@ async def run_test():
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
         context.set_default_timeout(5000)
+        metrics = await PageMetrics.attach(context, "TC004")
 
         # Open a new page in the browser context
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,7 +51,7 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
         
         # -> Fill the admin email and password fields and click 'Connexion Administrateur' to log in.
         frame = context.pages[-1]
@@ -214,8 +219,11 @@ async def run_test():
             raise AssertionError("Test case failed: The test attempted to change the worker's status from 'Absent' to 'Présent' for the selected date and save it, but 'Présent' was not visible on the page — the attendance update did not take effect or was not displayed.")
         ```
         await asyncio.sleep(5)
+        metrics.assert_within_budgets()
 
     finally:
+        if metrics:
+            metrics.save()
         if context:
             await context.close()
         if browser:
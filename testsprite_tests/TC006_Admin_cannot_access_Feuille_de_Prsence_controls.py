@@ -1,10 +1,14 @@
 import asyncio
 from playwright import async_api
 
+from perf import BASE_URL
+from perf.page_metrics import PageMetrics
+
 async def run_test():
     pw = None
     browser = None
     context = None
+    metrics = None
 
     try:
         # Start a Playwright session in asynchronous mode
@@ -24,12 +28,13 @@ async def run_test():
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
         context.set_default_timeout(5000)
+        metrics = await PageMetrics.attach(context, "TC006")
 
         # Open a new page in the browser context
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,7 +51,7 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
         
         # -> Fill the email field with admin@klbeton.tn (input index 6).
         frame = context.pages[-1]
@@ -65,28 +70,28 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
         # -> Navigate to /employee-login so the admin (already attempted authentication) can attempt to open the attendance sheet from the employee login view.
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Open the employee login page (http://localhost:3000/employee-login) in a new tab so the admin credentials can be used from the employee login view.
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Open the employee login page (http://localhost:3000/employee-login) in a new tab so admin credentials can be used from the employee-login view.
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Navigate to http://localhost:3000/employee-login (open the employee login page) so the employee login form can be filled with admin credentials.
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Navigate to http://localhost:3000/employee-login so the employee login form is available to fill with admin credentials.
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Open the employee login page by navigating to http://localhost:3000/employee-login in the current tab so the employee login form can be filled.
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Open the employee login page (/employee-login) in the current tab so the employee login form can be filled with the admin credentials.
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Navigate to /employee-login in the current tab so the employee login form can be used to attempt signing in as admin (or observe access denial).
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Open the navigation for employee/employee-related pages by clicking 'Gestion Employés' in the sidebar to find the 'Feuille de Présence' (attendance sheet) link or control.
         frame = context.pages[-1]
@@ -120,8 +125,11 @@ async def run_test():
         is_save_visible = await save_locator.is_visible()
         assert not is_save_visible, 'Expected "Save" to not be visible, but it was visible.'
         await asyncio.sleep(5)
+        metrics.assert_within_budgets()
 
     finally:
+        if metrics:
+            metrics.save()
         if context:
             await context.close()
         if browser:
@@ -1,10 +1,14 @@
 import asyncio
 from playwright import async_api
 
+from perf import BASE_URL
+from perf.page_metrics import PageMetrics
+
 async def run_test():
     pw = None
     browser = None
     context = None
+    metrics = None
 
     try:
         # Start a Playwright session in asynchronous mode
@@ -24,12 +28,13 @@ async def run_test():
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
         context.set_default_timeout(5000)
+        metrics = await PageMetrics.attach(context, "TC007")
 
         # Open a new page in the browser context
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,7 +51,7 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
         
         # -> Fill the admin login form with provided credentials and submit to sign in (fill email, fill password, click 'Connexion Administrateur').
         frame = context.pages[-1]
@@ -65,7 +70,7 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
         # -> Navigate to /employee-login to continue the test (access the employee/attendance page).
-        await page.goto("http://localhost:3000/employee-login", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/employee-login", wait_until="commit", timeout=10000)
         
         # -> Click the sidebar item 'GESTION EMPLOYÉS' (index 1431) to locate the 'Feuille de Présence' or related attendance page.
         frame = context.pages[-1]
@@ -147,7 +152,7 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
         # -> Reload the employee list page to clear the profile overlay, then (after reload) click a different employee's 'Présence' control to open the Feuille de Présence form.
-        await page.goto("http://localhost:3000/admin/dashboard/employes?date=2026-02-16", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/admin/dashboard/employes?date=2026-02-16", wait_until="commit", timeout=10000)
         
         # -> Click the 'Présence' control for an employee to open the Feuille de Présence form (attempt the remaining 'Présence' click).
         frame = context.pages[-1]
@@ -184,7 +189,7 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
         # -> Reload the employee list page to clear the collaborator overlay, then (after reload) attempt to open an employee 'Présence' to load the Feuille de Présence form.
-        await page.goto("http://localhost:3000/admin/dashboard/employes?date=2026-02-16", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/admin/dashboard/employes?date=2026-02-16", wait_until="commit", timeout=10000)
         
         # -> Click a 'Présence' control for an employee to open the Feuille de Présence (attendance) form, then wait for the form to load.
         frame = context.pages[-1]
@@ -204,7 +209,7 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
         # -> Reload the employee list to clear the collaborator profile overlay, then click an employee 'Présence' control to attempt to open the Feuille de Présence form.
-        await page.goto("http://localhost:3000/admin/dashboard/employes?date=2026-02-16", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/admin/dashboard/employes?date=2026-02-16", wait_until="commit", timeout=10000)
         
         frame = context.pages[-1]
         # Click element
@@ -240,7 +245,7 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
         # -> Reload the employee list page to clear the collaborator profile overlay so the underlying 'Présence' controls are accessible.
-        await page.goto("http://localhost:3000/admin/dashboard/employes?date=2026-02-16", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/admin/dashboard/employes?date=2026-02-16", wait_until="commit", timeout=10000)
         
         # -> Click an employee 'Présence' control to open the Feuille de Présence attendance form, then wait for the form to load so the save validation can be tested.
         frame = context.pages[-1]
@@ -265,8 +270,11 @@ async def run_test():
         await validation.wait_for(state='visible', timeout=5000)
         assert await validation.is_visible()
         await asyncio.sleep(5)
+        metrics.assert_within_budgets()
 
     finally:
+        if metrics:
+            metrics.save()
         if context:
             await context.close()
         if browser:
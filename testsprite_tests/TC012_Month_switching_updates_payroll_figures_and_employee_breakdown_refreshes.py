@@ -1,10 +1,14 @@
 import asyncio
 from playwright import async_api
 
+from perf import BASE_URL
+from perf.page_metrics import PageMetrics
+
 async def run_test():
     pw = None
     browser = None
     context = None
+    metrics = None
 
     try:
         # Start a Playwright session in asynchronous mode
@@ -24,12 +28,13 @@ async def run_test():
         # Create a new browser context (like an incognito window)
         context = await browser.new_context()
         context.set_default_timeout(5000)
+        metrics = await PageMetrics.attach(context, "TC012")
 
         # Open a new page in the browser context
         page = await context.new_page()
 
         # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
 
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,7 +51,7 @@ async def run_test():
 
         # Interact with the page elements to simulate user flow
         # -> Navigate to http://localhost:3000
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}", wait_until="commit", timeout=10000)
         
         # -> Fill the login form: enter email and password, then click 'Connexion Administrateur' to log in.
         frame = context.pages[-1]
@@ -65,10 +70,10 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
         # -> Navigate to /dashboard/admin/rapports (use direct navigation since no relevant navigation elements are present on the current login page).
-        await page.goto("http://localhost:3000/dashboard/admin/rapports", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/dashboard/admin/rapports", wait_until="commit", timeout=10000)
         
         # -> Open the login page and attempt a proper login (fill email and password and submit) so the app can load the dashboard; then proceed to the reports page via the app navigation or direct link if necessary.
-        await page.goto("http://localhost:3000/login-admin", wait_until="commit", timeout=10000)
+        await page.goto(f"{BASE_URL}/login-admin", wait_until="commit", timeout=10000)
         
         # -> Click the 'RAPPORTS & EXPORTS' sidebar link to navigate to the reports page so month switching checks can be performed.
         frame = context.pages[-1]
@@ -95,8 +100,11 @@ async def run_test():
         await page.wait_for_timeout(3000); await elem.click(timeout=5000)
         
         await asyncio.sleep(5)
+        metrics.assert_within_budgets()
 
     finally:
+        if metrics:
+            metrics.save()
         if context:
             await context.close()
         if browser:
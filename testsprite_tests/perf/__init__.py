@@ -0,0 +1,12 @@
+"""Performance and bulk-correctness harness for the KL Beton application.
+
+Unlike the TCxxx Playwright scripts next to this package, the modules here
+exercise the application at scale: large synthetic batches, seeded databases
+and concurrent HTTP traffic. Each module is runnable on its own with
+``python -m testsprite_tests.perf.<module>`` from the repository root.
+"""
+
+import os
+
+# Application under test; ephemeral_db points each worker at its own server
+BASE_URL = os.environ.get("KLBETON_BASE_URL", "http://localhost:3000")
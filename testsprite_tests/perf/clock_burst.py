@@ -0,0 +1,148 @@
+"""Shift-start burst: thousands of clock-ins within one minute.
+
+Every worker logs in first, outside the measured window, so bcrypt on the
+login path does not hide the clock-in itself. The burst then sends
+``POST /api/clock-in`` for ``--clock-ins`` distinct workers with uniformly
+spread arrivals over ``--window`` seconds. A share of them double-tap (a
+second clock-in a few milliseconds later, the race that used to hit the
+``(employeId, date)`` unique constraint), and a share clock out right away.
+
+The run fails on any transport error or 5xx, on a double tap that is not
+answered one ``200`` and one ``400 ALREADY_CLOCKED_IN``, on a worker whose
+``GET /api/clock-out`` does not show the expected state afterwards, and on
+latencies above ``load`` in ``perf/budgets.json``.
+
+Seed with ``--today`` pinned to yesterday so that nobody is clocked in yet
+on the day of the run::
+
+    python -m testsprite_tests.perf.seed_dataset --employees 5000 --months 1 --today 2026-10-18 --truncate
+    python -m testsprite_tests.perf.clock_burst --employees 5000 --clock-ins 2000 --window 60
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from . import BASE_URL
+from .loadtest import Recorder, VirtualUser
+from .page_metrics import load_budgets
+from .seed_dataset import Dataset
+
+
+async def prepare(args, recorder, emails):
+    """Log every worker in, a few at a time, before the burst starts."""
+    gate = asyncio.Semaphore(args.login_concurrency)
+
+    async def one(email):
+        async with gate:
+            user = VirtualUser(args.base_url, recorder, email, args.timeout)
+            if await user.login():
+                return user
+            await user.close()
+            return None
+
+    return [u for u in await asyncio.gather(*(one(e) for e in emails)) if u]
+
+
+async def worker(user, delay, double_tap, clock_out, problems):
+    await asyncio.sleep(delay)
+    if double_tap:
+        # Two taps a few milliseconds apart: exactly one must succeed
+        first = asyncio.create_task(user.request("POST", "/api/clock-in"))
+        await asyncio.sleep(0.005)
+        answers = [await user.request("POST", "/api/clock-in"), await first]
+        statuses = sorted(status for status, _ in answers)
+        rejected = next((body for status, body in answers if status == 400), None)
+        if statuses != [200, 400] or b"ALREADY_CLOCKED_IN" not in (rejected or b""):
+            problems.append(f"{user.email}: double tap answered {statuses}")
+    else:
+        status, _ = await user.request("POST", "/api/clock-in")
+        if status != 200:
+            problems.append(f"{user.email}: clock-in answered {status}")
+
+    if clock_out:
+        status, _ = await user.request("POST", "/api/clock-out")
+        if status != 200:
+            problems.append(f"{user.email}: clock-out answered {status}")
+
+    status, body = await user.request("GET", "/api/clock-out")
+    if status != 200 or json.loads(body).get("isClockedIn") is not (not clock_out):
+        problems.append(f"{user.email}: status after burst is wrong ({status})")
+
+
+def check(summary, limits):
+    problems = []
+    for key, stats in summary["endpoints"].items():
+        if stats["errors"]:
+            problems.append(f"{key}: {stats['errors']} errors")
+        for metric, limit in limits.get(key, {}).items():
+            if stats.get(metric) is not None and stats[metric] > limit:
+                problems.append(f"{key}: {metric} = {stats[metric]} exceeds budget {limit}")
+    return problems
+
+
+async def run(args):
+    dataset = Dataset(args.employees, 1, 0, args.seed)
+    workers = [u[1] for u in dataset.users() if u[3] == "EMPLOYE"]
+    rng = random.Random(args.seed)
+    emails = rng.sample(workers, min(args.clock_ins, len(workers)))
+
+    login_recorder = Recorder()
+    users = await prepare(args, login_recorder, emails)
+    problems = [f"{len(emails) - len(users)} workers could not log in"] if len(users) < len(emails) else []
+
+    recorder = Recorder()
+    for user in users:
+        user.recorder = recorder
+    try:
+        recorder.started = time.perf_counter()
+        await asyncio.gather(*(
+            worker(
+                user,
+                rng.uniform(0, args.window),
+                rng.random() < args.double_tap,
+                rng.random() < args.clock_out,
+                problems,
+            )
+            for user in users
+        ))
+        recorder.finished = time.perf_counter()
+    finally:
+        await asyncio.gather(*(user.close() for user in users))
+
+    summary = recorder.summary()
+    problems.extend(check(summary, load_budgets().get("load", {})))
+    return summary, problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--seed", type=int, default=0, help="seed used by seed_dataset")
+    parser.add_argument("--employees", type=int, default=5000, help="--employees used by seed_dataset")
+    parser.add_argument("--clock-ins", type=int, default=2000)
+    parser.add_argument("--window", type=float, default=60, help="seconds over which the clock-ins arrive")
+    parser.add_argument("--double-tap", type=float, default=0.1, help="share of workers tapping twice")
+    parser.add_argument("--clock-out", type=float, default=0.1, help="share of workers clocking out right away")
+    parser.add_argument("--login-concurrency", type=int, default=32)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args(argv)
+
+    summary, problems = asyncio.run(run(args))
+    for key, stats in summary["endpoints"].items():
+        print(
+            f"{key:<28} n={stats['count']:<6} p50={stats['p50_ms']:>7.0f} p95={stats['p95_ms']:>7.0f}"
+            f" p99={stats['p99_ms']:>7.0f} rps={stats['throughput_rps']:>6} statuses={stats['statuses']}"
+        )
+    for problem in problems[:50]:
+        print(f"FAIL {problem}")
+    if len(problems) > 50:
+        print(f"FAIL ... and {len(problems) - 50} more")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
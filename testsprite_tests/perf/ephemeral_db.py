@@ -0,0 +1,261 @@
+"""Per-worker throwaway databases cloned from a migrated, seeded template.
+
+Migrating and seeding a database takes tens of seconds, while
+``CREATE DATABASE ... TEMPLATE`` copies one at file level in a fraction of a
+second. The template is built once per schema (its fingerprint covers
+``prisma/schema.prisma`` and every migration) and every test worker then gets
+its own clone, so destructive cases such as TC022–TC025 can run in parallel
+and reset between tests without touching a shared database.
+
+The template contains the ``admin@klbeton.tn`` / ``admin123`` account used by
+the TC scripts plus a small ``seed_dataset`` dataset.
+
+Examples::
+
+    # Build (or reuse) the template, then run four workers in parallel
+    python -m testsprite_tests.perf.ephemeral_db run --workers 4 TC022 TC023 TC024 TC025
+
+    # Only rebuild the template
+    python -m testsprite_tests.perf.ephemeral_db prepare --force
+"""
+
+import argparse
+import hashlib
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit
+
+import psycopg
+from psycopg import sql
+
+from .seed_dataset import Dataset, seed
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TESTS_DIR = REPO_ROOT / "testsprite_tests"
+
+TEMPLATE_NAME = "klbeton_template"
+# Account typed by every TC script: admin@klbeton.tn / admin123
+FIXTURE_ADMIN = ("admin@klbeton.tn", "$2b$10$Y5R/PgRc11rJ3s7YlfTjquRBSt2prwgKSAd0SMMHcHcSXYHu5Jk5a")
+
+
+def with_database(url, name):
+    """Return ``url`` pointing at database ``name`` (query string kept)."""
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(path=f"/{name}"))
+
+
+def schema_fingerprint(extra=""):
+    digest = hashlib.sha256(extra.encode())
+    prisma = REPO_ROOT / "prisma"
+    for path in sorted([prisma / "schema.prisma", *prisma.glob("migrations/**/*.sql")]):
+        digest.update(path.relative_to(REPO_ROOT).as_posix().encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+class EphemeralDatabases:
+    """Builds the template database and hands out disposable clones."""
+
+    def __init__(self, database_url, template=TEMPLATE_NAME, employees=50, months=2, seed_value=0):
+        self.database_url = database_url
+        self.admin_url = with_database(database_url, "postgres")
+        self.template = template
+        self.employees = employees
+        self.months = months
+        self.seed_value = seed_value
+
+    def _admin(self):
+        return psycopg.connect(self.admin_url, autocommit=True)
+
+    def url_for(self, name):
+        return with_database(self.database_url, name)
+
+    def _fingerprint(self):
+        return schema_fingerprint(f"{self.employees}:{self.months}:{self.seed_value}")
+
+    def _template_comment(self, conn):
+        row = conn.execute(
+            "SELECT shobj_description(oid, 'pg_database') FROM pg_database WHERE datname = %s",
+            (self.template,),
+        ).fetchone()
+        return None if row is None else (row[0] or "")
+
+    def ensure_template(self, force=False):
+        """Create the template unless an up-to-date one already exists."""
+        fingerprint = self._fingerprint()
+        with self._admin() as conn:
+            comment = self._template_comment(conn)
+            if not force and comment == f"klbeton:{fingerprint}":
+                return False
+            if comment is not None:
+                # A template database must be unmarked before it can be dropped
+                conn.execute(sql.SQL("ALTER DATABASE {} WITH IS_TEMPLATE false").format(sql.Identifier(self.template)))
+            self._drop(conn, self.template)
+            conn.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(self.template)))
+
+        url = self.url_for(self.template)
+        subprocess.run(
+            ["npx", "prisma", "migrate", "deploy"],
+            cwd=REPO_ROOT,
+            env=dict(os.environ, DATABASE_URL=url),
+            check=True,
+        )
+        seed(Dataset(self.employees, self.months, 1.0, self.seed_value), url)
+        with psycopg.connect(url) as conn:
+            conn.execute(
+                'INSERT INTO "User" (id, email, password, role, "updatedAt")'
+                " VALUES (gen_random_uuid(), %s, %s, 'ADMIN', now())",
+                FIXTURE_ADMIN,
+            )
+
+        with self._admin() as conn:
+            ident = sql.Identifier(self.template)
+            conn.execute(sql.SQL("ALTER DATABASE {} WITH IS_TEMPLATE true ALLOW_CONNECTIONS false").format(ident))
+            conn.execute(sql.SQL("COMMENT ON DATABASE {} IS {}").format(ident, sql.Literal(f"klbeton:{fingerprint}")))
+        return True
+
+    @staticmethod
+    def _drop(conn, name):
+        conn.execute(sql.SQL("DROP DATABASE IF EXISTS {} WITH (FORCE)").format(sql.Identifier(name)))
+
+    def clone(self, name):
+        """(Re)create ``name`` as a copy of the template and return its URL.
+
+        The drop terminates every connection to ``name``: stop the app using
+        it first (see ``run_worker``).
+        """
+        with self._admin() as conn:
+            self._drop(conn, name)
+            conn.execute(
+                sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(sql.Identifier(name), sql.Identifier(self.template))
+            )
+        return self.url_for(name)
+
+    reset = clone
+
+    def drop(self, name):
+        with self._admin() as conn:
+            self._drop(conn, name)
+
+
+@contextmanager
+def worker_database(databases, worker_id):
+    """Yield the URL of a private clone for ``worker_id`` and drop it afterwards."""
+    name = f"{databases.template.replace('_template', '')}_w{worker_id}_{os.getpid()}"
+    url = databases.clone(name)
+    try:
+        yield name, url
+    finally:
+        databases.drop(name)
+
+
+def wait_for_app(base_url, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/api/health-check", timeout=2) as resp:
+                if resp.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.5)
+    raise TimeoutError(f"{base_url} did not answer within {timeout}s")
+
+
+def find_tests(ids):
+    scripts = sorted(TESTS_DIR.glob("TC*.py"))
+    if not ids:
+        return scripts
+    return [s for s in scripts if s.name.split("_")[0] in ids]
+
+
+@contextmanager
+def app_server(app_command, port, env):
+    """Run the app on ``port`` until the block exits."""
+    app = subprocess.Popen(app_command.format(port=port), shell=True, cwd=REPO_ROOT, env=env)
+    try:
+        wait_for_app(f"http://localhost:{port}")
+        yield app
+    finally:
+        app.terminate()
+        app.wait()
+
+
+def run_worker(databases, worker_id, tests, app_command, base_port):
+    """Run ``tests`` one after another, each on a fresh clone.
+
+    The reset drops the database under the app, which would leave its Prisma
+    pool holding dead connections: the app is stopped before each reset and
+    started again on the new clone.
+    """
+    port = base_port + worker_id
+    base_url = f"http://localhost:{port}"
+    results = []
+    with worker_database(databases, worker_id) as (name, url):
+        env = dict(os.environ, DATABASE_URL=url, KLBETON_BASE_URL=base_url, PORT=str(port))
+        for i, test in enumerate(tests):
+            reset_ms = 0.0
+            if i:
+                started = time.perf_counter()
+                databases.reset(name)
+                reset_ms = (time.perf_counter() - started) * 1000
+            with app_server(app_command, port, env):
+                proc = subprocess.run([sys.executable, test.name], cwd=TESTS_DIR, env=env)
+            results.append((test.name.split("_")[0], proc.returncode == 0, reset_ms, worker_id))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--template", default=TEMPLATE_NAME)
+    parser.add_argument("--employees", type=int, default=50, help="seed_dataset size inside the template")
+    parser.add_argument("--months", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    prepare = commands.add_parser("prepare", help="build the template database")
+    prepare.add_argument("--force", action="store_true")
+
+    run = commands.add_parser("run", help="run TC scripts on per-worker clones")
+    run.add_argument("tests", nargs="*", help="TC ids, e.g. TC022 (default: all)")
+    run.add_argument("--workers", type=int, default=2)
+    run.add_argument("--base-port", type=int, default=3100)
+    run.add_argument("--app-command", default="npx next start -p {port}")
+
+    args = parser.parse_args(argv)
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+
+    databases = EphemeralDatabases(args.database_url, args.template, args.employees, args.months, args.seed)
+    started = time.perf_counter()
+    rebuilt = databases.ensure_template(force=getattr(args, "force", False))
+    print(f"template {args.template}: {'built' if rebuilt else 'up to date'} in {time.perf_counter() - started:.1f}s")
+    if args.command == "prepare":
+        return 0
+
+    tests = find_tests(args.tests)
+    workers = max(1, min(args.workers, len(tests)))
+    shards = [tests[w::workers] for w in range(workers)]
+    with ThreadPoolExecutor(workers) as pool:
+        futures = [
+            pool.submit(run_worker, databases, w, shard, args.app_command, args.base_port)
+            for w, shard in enumerate(shards)
+        ]
+        results = [r for f in futures for r in f.result()]
+
+    resets = [ms for _, _, ms, _ in results if ms]
+    for test_id, ok, _, worker in sorted(results):
+        print(f"{test_id}  {'PASS' if ok else 'FAIL'}  (worker {worker})")
+    if resets:
+        print(f"database reset: mean {sum(resets) / len(resets):.0f} ms, max {max(resets):.0f} ms")
+    return 0 if all(ok for _, ok, _, _ in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Bulk employee import throughput: one CSV of N employees in one request.
+
+Logs in as the ``seed_dataset`` admin, generates a CSV of ``--rows``
+employees (a few with their own password, the rest on the default one, all
+with a unique email and matricule tagged with the run id so runs never
+collide) and sends it to ``POST /api/employes/import``.
+
+The run fails when the import does not answer ``201``, when a row is
+rejected or missing, or when the wall-clock time exceeds ``import`` in
+``perf/budgets.json`` (``max_seconds`` per ``rows`` employees, scaled
+linearly). The server-side figure (``dureeMs``, ``parSeconde``) is printed
+next to the client-side one.
+
+Example (instance seeded with ``seed_dataset --seed 0``)::
+
+    python -m testsprite_tests.perf.import_throughput --rows 1000
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+import uuid
+
+from . import BASE_URL
+from .page_metrics import load_budgets
+from .payload_budgets import Client
+from .seed_dataset import DEFAULT_PASSWORD, EMAIL_DOMAIN
+
+
+def make_csv(rows, run_id):
+    out = io.StringIO()
+    writer = csv.writer(out, delimiter=";")
+    writer.writerow(["Nom", "Prénom", "Poste", "Email", "Mot de passe", "Date d'embauche", "Salaire", "Matricule"])
+    for i in range(rows):
+        writer.writerow([
+            f"Import{i}",
+            "Perf",
+            "Ouvrier",
+            f"import.{run_id}.{i}@{EMAIL_DOMAIN}",
+            f"secret-{i}" if i % 10 == 0 else "",
+            "01/03/2026",
+            "1250,500",
+            f"IMP-{run_id}-{i}",
+        ])
+    return out.getvalue().encode("utf-8")
+
+
+def post_file(client, path, filename, content):
+    boundary = uuid.uuid4().hex
+    body = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="fichier"; filename="{filename}"\r\n'
+        "Content-Type: text/csv\r\n\r\n"
+    ).encode() + content + f"\r\n--{boundary}--\r\n".encode()
+    request = urllib.request.Request(
+        client.base_url + path,
+        data=body,
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+    try:
+        with client.opener.open(request, timeout=client.timeout) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.read()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=300)
+    args = parser.parse_args(argv)
+
+    budget = load_budgets().get("import", {})
+    limit = budget.get("max_seconds", 30) * args.rows / budget.get("rows", 1000)
+
+    client = Client(args.base_url, args.timeout)
+    client.login(f"admin@{EMAIL_DOMAIN}", DEFAULT_PASSWORD)
+
+    run_id = uuid.uuid4().hex[:8]
+    content = make_csv(args.rows, run_id)
+    started = time.perf_counter()
+    status, body = post_file(client, "/api/employes/import", f"import-{run_id}.csv", content)
+    elapsed = time.perf_counter() - started
+
+    problems = []
+    result = json.loads(body) if body[:1] == b"{" else {}
+    if status != 201:
+        problems.append(f"import answered {status}: {body[:300]!r}")
+    if result.get("erreurs"):
+        problems.append(f"{len(result['erreurs'])} rows rejected, first: {result['erreurs'][0]}")
+    if status == 201 and result.get("importes") != args.rows:
+        problems.append(f"{result.get('importes')} employees imported, expected {args.rows}")
+    if elapsed > limit:
+        problems.append(f"import took {elapsed:.1f}s, budget {limit:.1f}s for {args.rows} rows")
+
+    print(
+        f"rows={args.rows} size={len(content) / 1024:.0f}KB client={elapsed:.1f}s "
+        f"server={result.get('dureeMs', 0) / 1000:.1f}s rate={result.get('parSeconde')}/s budget={limit:.1f}s"
+    )
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
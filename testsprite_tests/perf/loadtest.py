@@ -0,0 +1,328 @@
+"""Asyncio HTTP load generator for the API hot paths.
+
+Runs a production-like mix of virtual users against a running instance that
+was seeded with ``seed_dataset`` (same ``--seed``/``--employees``):
+
+* ``shift_start``: employees log in within a ramp window and hit ``POST /api/clock-in``;
+* ``chef_sheets``: chefs save their crew's sheet with ``POST /api/pointages`` (``bulk: true``);
+* ``admin_reports``: admins browse ``/api/dashboard`` and ``/api/rapports`` month by month;
+* ``idle_tabs``: open tabs poll ``/api/messages/unread`` like NotificationContext and Sidebar.
+
+Latency percentiles (p50/p95/p99), throughput and error rates are reported
+per endpoint in a JSON file; ``--compare`` prints the deltas against a
+previous report so two commits can be compared.
+
+Example::
+
+    python -m testsprite_tests.perf.loadtest --base-url http://localhost:3000 \\
+        --duration 120 --output perf-report.json --compare perf-baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timezone
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from . import BASE_URL
+from .seed_dataset import DEFAULT_PASSWORD, Dataset, make_ids
+
+STATUTS = ["PRESENT"] * 17 + ["ABSENT", "CONGE", "MALADIE"]
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    """Collects one sample per request, keyed by ``METHOD /path``."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.started = time.perf_counter()
+        self.finished = None
+
+    def record(self, key, latency_ms, status):
+        self.samples[key].append(latency_ms)
+        self.statuses[key][status] += 1
+
+    def summary(self):
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        endpoints = {}
+        for key in sorted(self.samples):
+            latencies = sorted(self.samples[key])
+            statuses = self.statuses[key]
+            count = len(latencies)
+            errors = sum(n for status, n in statuses.items() if status == "error" or status >= 500)
+            rejected = sum(n for status, n in statuses.items() if status != "error" and 400 <= status < 500)
+            endpoints[key] = {
+                "count": count,
+                "errors": errors,
+                "rejected": rejected,
+                "error_rate": round(errors / count, 4),
+                "throughput_rps": round(count / elapsed, 2),
+                "mean_ms": round(sum(latencies) / count, 1),
+                "p50_ms": round(percentile(latencies, 50), 1),
+                "p95_ms": round(percentile(latencies, 95), 1),
+                "p99_ms": round(percentile(latencies, 99), 1),
+                "max_ms": round(latencies[-1], 1),
+                "statuses": {str(s): n for s, n in sorted(statuses.items(), key=str)},
+            }
+        return {"elapsed_s": round(elapsed, 2), "endpoints": endpoints}
+
+
+class VirtualUser:
+    """One browser-like client with its own cookie jar and NextAuth session."""
+
+    def __init__(self, base_url, recorder, email, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.recorder = recorder
+        self.email = email
+        jar = aiohttp.CookieJar(unsafe=True)
+        self.http = aiohttp.ClientSession(cookie_jar=jar, timeout=aiohttp.ClientTimeout(total=timeout))
+
+    async def request(self, method, path, **kwargs):
+        key = f"{method} {urlsplit(path).path}"
+        started = time.perf_counter()
+        try:
+            async with self.http.request(method, self.base_url + path, allow_redirects=False, **kwargs) as resp:
+                body = await resp.read()
+                status = resp.status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self.recorder.record(key, (time.perf_counter() - started) * 1000, "error")
+            return None, None
+        self.recorder.record(key, (time.perf_counter() - started) * 1000, status)
+        return status, body
+
+    async def login(self, password=DEFAULT_PASSWORD):
+        status, body = await self.request("GET", "/api/auth/csrf")
+        if status != 200:
+            return False
+        csrf = json.loads(body)["csrfToken"]
+        status, _ = await self.request(
+            "POST",
+            "/api/auth/callback/credentials",
+            data={"csrfToken": csrf, "email": self.email, "password": password, "json": "true"},
+        )
+        return status in (200, 302) and any(c.key.endswith("session-token") for c in self.http.cookie_jar)
+
+    async def close(self):
+        await self.http.close()
+
+
+async def pause(seconds, deadline):
+    await asyncio.sleep(max(0.0, min(seconds, deadline - time.perf_counter())))
+
+
+async def shift_start(ctx, email, delay):
+    """Log in at a random moment of the ramp window, then clock in once."""
+    await asyncio.sleep(delay)
+    user = VirtualUser(ctx.base_url, ctx.recorder, email, ctx.timeout)
+    try:
+        if await user.login():
+            await user.request("POST", "/api/clock-in")
+            await user.request("GET", "/api/clock-out")
+    finally:
+        await user.close()
+
+
+async def chef_sheets(ctx, email, crew, deadline):
+    """Save the whole crew's sheet in one bulk call, then keep re-saving it."""
+    user = VirtualUser(ctx.base_url, ctx.recorder, email, ctx.timeout)
+    rng = random.Random(email)
+    try:
+        if not await user.login():
+            return
+        day = ctx.today.isoformat()
+        while time.perf_counter() < deadline:
+            await user.request("GET", f"/api/pointages?dateDebut={day}&dateFin={day}")
+            await user.request("GET", "/api/employes")
+            payload = {
+                "bulk": True,
+                "date": day,
+                "pointages": [
+                    {
+                        "employeId": employe_id,
+                        "statut": rng.choice(STATUTS),
+                        "joursTravailles": 1,
+                        "heuresSupp": rng.choice([0, 0, 0, 1, 2]),
+                    }
+                    for employe_id in crew
+                ],
+            }
+            await user.request("POST", "/api/pointages", json=payload)
+            await pause(rng.uniform(*ctx.chef_think), deadline)
+    finally:
+        await user.close()
+
+
+async def admin_reports(ctx, email, deadline):
+    """Switch months on the dashboard and the payroll report."""
+    user = VirtualUser(ctx.base_url, ctx.recorder, email, ctx.timeout)
+    rng = random.Random(email)
+    try:
+        if not await user.login():
+            return
+        while time.perf_counter() < deadline:
+            back = rng.randrange(0, 12)
+            month = (ctx.today.month - 1 - back) % 12 + 1
+            year = ctx.today.year - (1 if month > ctx.today.month else 0)
+            await user.request("GET", f"/api/dashboard?month={month}&year={year}")
+            await user.request("GET", f"/api/admin/stats?date={ctx.today.isoformat()}")
+            await user.request("GET", f"/api/rapports?mois={month}&annee={year}")
+            await pause(rng.uniform(*ctx.admin_think), deadline)
+    finally:
+        await user.close()
+
+
+async def idle_tab(ctx, email, deadline):
+    """Poll unread messages like an open dashboard tab (10 s context, 15 s sidebar)."""
+    user = VirtualUser(ctx.base_url, ctx.recorder, email, ctx.timeout)
+    rng = random.Random(email)
+    try:
+        if not await user.login():
+            return
+        await pause(rng.uniform(0, 10), deadline)
+        next_context = next_sidebar = time.perf_counter()
+        while time.perf_counter() < deadline:
+            now = time.perf_counter()
+            if now >= next_context:
+                await user.request("GET", "/api/messages/unread")
+                next_context = now + 10
+            if now >= next_sidebar:
+                await user.request("GET", "/api/messages/unread")
+                next_sidebar = now + 15
+            await pause(min(next_context, next_sidebar) - time.perf_counter(), deadline)
+    finally:
+        await user.close()
+
+
+class Context:
+    def __init__(self, args):
+        self.base_url = args.base_url
+        self.timeout = args.timeout
+        self.today = args.today
+        self.recorder = Recorder()
+        self.chef_think = (args.chef_think * 0.5, args.chef_think * 1.5)
+        self.admin_think = (args.admin_think * 0.5, args.admin_think * 1.5)
+
+
+def build_scenarios(ctx, args):
+    dataset = Dataset(args.employees, 1, 0, args.seed)
+    users = list(dataset.users())
+    employes = make_ids(args.seed, "Employe", 0, args.employees)
+    chefs = [u[1] for u in users if u[3] == "CHEF"]
+    workers = [(u[1], i) for i, u in enumerate(users) if u[3] == "EMPLOYE"]
+    admin = next(u[1] for u in users if u[3] == "ADMIN")
+    rng = random.Random(args.seed)
+    deadline = time.perf_counter() + args.duration
+
+    tasks = []
+    for email, _ in rng.sample(workers, min(args.clock_ins, len(workers))):
+        tasks.append(shift_start(ctx, email, rng.uniform(0, args.ramp)))
+
+    crew_size = math.ceil(len(employes) / max(1, len(chefs)))
+    for c, email in enumerate(chefs[: args.chefs]):
+        crew = employes[c * crew_size:(c + 1) * crew_size]
+        tasks.append(chef_sheets(ctx, email, crew, deadline))
+
+    # The dataset has a single admin account; concurrent admins share it
+    tasks.extend(admin_reports(ctx, admin, deadline) for _ in range(args.admins))
+
+    for email, _ in rng.sample(workers, min(args.idle_tabs, len(workers))):
+        tasks.append(idle_tab(ctx, email, deadline))
+    return tasks
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline_path):
+    with open(baseline_path, encoding="utf-8") as fh:
+        baseline = json.load(fh)["endpoints"]
+    print(f"\n{'endpoint':<42} {'p50':>16} {'p95':>16} {'p99':>16} {'err%':>12}")
+    for key, now in current["endpoints"].items():
+        before = baseline.get(key)
+        if not before:
+            print(f"{key:<42} (new)")
+            continue
+        cells = []
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            delta = (now[metric] - before[metric]) / before[metric] * 100 if before[metric] else 0.0
+            cells.append(f"{now[metric]:>8.0f} {delta:+6.0f}%")
+        err = (now["error_rate"] - before["error_rate"]) * 100
+        print(f"{key:<42} {cells[0]:>16} {cells[1]:>16} {cells[2]:>16} {err:+11.2f}")
+
+
+async def run(args):
+    ctx = Context(args)
+    tasks = build_scenarios(ctx, args)
+    ctx.recorder.started = time.perf_counter()
+    await asyncio.gather(*tasks)
+    ctx.recorder.finished = time.perf_counter()
+    return ctx.recorder.summary()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--duration", type=float, default=60, help="seconds for the looping scenarios")
+    parser.add_argument("--seed", type=int, default=0, help="seed used by seed_dataset")
+    parser.add_argument("--employees", type=int, default=5000, help="--employees used by seed_dataset")
+    parser.add_argument("--today", type=date.fromisoformat, default=datetime.now(timezone.utc).date())
+    parser.add_argument("--clock-ins", type=int, default=500, help="employees in the shift-start burst")
+    parser.add_argument("--ramp", type=float, default=30, help="seconds over which the burst arrives")
+    parser.add_argument("--chefs", type=int, default=20)
+    parser.add_argument("--chef-think", type=float, default=20, help="mean seconds between sheet saves")
+    parser.add_argument("--admins", type=int, default=3)
+    parser.add_argument("--admin-think", type=float, default=5, help="mean seconds between month switches")
+    parser.add_argument("--idle-tabs", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--output", default="perf-report.json")
+    parser.add_argument("--compare", help="previous report to diff against")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run(args))
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "base_url": args.base_url,
+            "config": {k: (v.isoformat() if isinstance(v, date) else v) for k, v in vars(args).items()},
+        },
+        **summary,
+    }
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+
+    for key, stats in report["endpoints"].items():
+        print(
+            f"{key:<42} n={stats['count']:<6} p50={stats['p50_ms']:>7.0f} p95={stats['p95_ms']:>7.0f}"
+            f" p99={stats['p99_ms']:>7.0f} rps={stats['throughput_rps']:>6} err={stats['error_rate']:.2%}"
+        )
+    if args.compare:
+        compare(report, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
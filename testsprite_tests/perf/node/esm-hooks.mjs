@@ -0,0 +1,53 @@
+/**
+ * Hooks de chargement ESM pour exécuter le code de `lib/` hors de Next.js.
+ *
+ * Les modules de l'application utilisent des imports sans extension
+ * (`'../../config'`) et l'alias `@/`, résolus habituellement par le bundler.
+ * Ces hooks reproduisent ce comportement pour Node seul.
+ */
+import { existsSync, statSync } from 'node:fs';
+import { dirname, join, resolve as resolvePath } from 'node:path';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+
+const ROOT = resolvePath(dirname(fileURLToPath(import.meta.url)), '../../..');
+const CANDIDATES = ['', '.js', '.mjs', '.jsx', '/index.js'];
+
+function trouverFichier(base) {
+    for (const suffix of CANDIDATES) {
+        const candidate = base + suffix;
+        if (existsSync(candidate) && statSync(candidate).isFile()) {
+            return candidate;
+        }
+    }
+    return null;
+}
+
+export async function resolve(specifier, context, nextResolve) {
+    let base = null;
+
+    if (specifier.startsWith('@/')) {
+        base = join(ROOT, specifier.slice(2));
+    } else if ((specifier.startsWith('./') || specifier.startsWith('../')) && context.parentURL?.startsWith('file:')) {
+        base = resolvePath(dirname(fileURLToPath(context.parentURL)), specifier);
+    }
+
+    if (base) {
+        const fichier = trouverFichier(base);
+        if (fichier) {
+            return { url: pathToFileURL(fichier).href, shortCircuit: true };
+        }
+    }
+
+    return nextResolve(specifier, context);
+}
+
+export async function load(url, context, nextLoad) {
+    // Les sources de l'application sont en ESM même sans "type": "module"
+    if (url.startsWith('file:') && url.endsWith('.js') && !url.includes('/node_modules/')) {
+        const path = fileURLToPath(url);
+        if (path.startsWith(ROOT)) {
+            return nextLoad(url, { ...context, format: 'module' });
+        }
+    }
+    return nextLoad(url, context);
+}
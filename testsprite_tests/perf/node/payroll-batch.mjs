@@ -0,0 +1,84 @@
+/**
+ * Exécute un moteur de paie JS sur un lot d'employés-mois en un seul appel.
+ *
+ * Usage : node payroll-batch.mjs <dossier>
+ *
+ * Le dossier contient `manifest.json` et des colonnes binaires (little-endian)
+ * écrites par `testsprite_tests/perf/payroll_model.py`. Les résultats sont
+ * écrits dans le même dossier, une colonne Float64 par champ de sortie.
+ */
+import { register } from 'node:module';
+import { readFileSync, writeFileSync } from 'node:fs';
+import { join, resolve as resolvePath } from 'node:path';
+import { pathToFileURL } from 'node:url';
+
+register('./esm-hooks.mjs', import.meta.url);
+
+const STATUTS_POINTAGE = [null, 'PRESENT', 'ABSENT', 'CONGE', 'MALADIE', 'FERIE'];
+const STATUTS_AVANCE = [null, 'PENDING', 'APPROVED', 'REJECTED'];
+
+function lireColonne(dossier, nom, Type) {
+    const buffer = readFileSync(join(dossier, `${nom}.bin`));
+    return new Type(buffer.buffer, buffer.byteOffset, buffer.byteLength / Type.BYTES_PER_ELEMENT);
+}
+
+async function main() {
+    const dossier = resolvePath(process.argv[2]);
+    const manifest = JSON.parse(readFileSync(join(dossier, 'manifest.json'), 'utf8'));
+    const { rows, days, avances: maxAvances, module: modulePath, export: exportName, fields } = manifest;
+
+    const moteur = (await import(pathToFileURL(resolvePath(modulePath)).href))[exportName];
+    if (typeof moteur !== 'function') {
+        throw new Error(`Export "${exportName}" introuvable dans ${modulePath}`);
+    }
+
+    const salaireBase = lireColonne(dossier, 'salaire_base', Float64Array);
+    const mois = lireColonne(dossier, 'mois', Int32Array);
+    const annee = lireColonne(dossier, 'annee', Int32Array);
+    const statut = lireColonne(dossier, 'statut', Uint8Array);
+    const heuresSupp = lireColonne(dossier, 'heures_supp', Float64Array);
+    const joursTravailles = lireColonne(dossier, 'jours_travailles', Float64Array);
+    const avanceMontant = lireColonne(dossier, 'avance_montant', Float64Array);
+    const avanceStatut = lireColonne(dossier, 'avance_statut', Uint8Array);
+
+    const sorties = Object.fromEntries(fields.map(f => [f, new Float64Array(rows)]));
+    const debut = process.hrtime.bigint();
+
+    for (let i = 0; i < rows; i++) {
+        const pointages = [];
+        for (let d = 0; d < days; d++) {
+            const k = i * days + d;
+            if (statut[k] === 0) continue;
+            pointages.push({
+                date: new Date(Date.UTC(annee[i], mois[i] - 1, d + 1)),
+                statut: STATUTS_POINTAGE[statut[k]],
+                heuresSupp: heuresSupp[k],
+                joursTravailles: joursTravailles[k],
+            });
+        }
+
+        const avances = [];
+        for (let a = 0; a < maxAvances; a++) {
+            const k = i * maxAvances + a;
+            if (avanceStatut[k] === 0) continue;
+            avances.push({ montant: avanceMontant[k], statut: STATUTS_AVANCE[avanceStatut[k]] });
+        }
+
+        const resultat = moteur({ salaireBase: salaireBase[i] }, pointages, mois[i], annee[i], avances);
+        for (const f of fields) {
+            sorties[f][i] = resultat[f];
+        }
+    }
+
+    const dureeMs = Number(process.hrtime.bigint() - debut) / 1e6;
+
+    for (const f of fields) {
+        writeFileSync(join(dossier, `out_${f}.bin`), Buffer.from(sorties[f].buffer));
+    }
+    writeFileSync(join(dossier, 'result.json'), JSON.stringify({ rows, dureeMs }));
+}
+
+main().catch((error) => {
+    console.error(error);
+    process.exit(1);
+});
@@ -0,0 +1,252 @@
+"""Per-page frontend performance capture and budgets for the Playwright TCs.
+
+``PageMetrics.attach(context, test_id)`` instruments a browser context so
+that every page a test visits, including client-side route changes, records:
+
+* Navigation Timing (TTFB, DOMContentLoaded, load) on full loads;
+* Largest Contentful Paint;
+* time from route start to the first chart ``<canvas>``;
+* JS bytes downloaded while the page was shown;
+* the ``/api/*`` waterfall: each call's start offset, duration and status.
+
+Visits are appended to ``perf/results/pages/<page>.jsonl`` so a page's history
+can be followed across commits, and ``assert_within_budgets()`` fails the
+test when a page exceeds a limit from ``perf/budgets.json``.
+"""
+
+import fnmatch
+import json
+import subprocess
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+PERF_DIR = Path(__file__).resolve().parent
+BUDGETS_FILE = PERF_DIR / "budgets.json"
+HISTORY_DIR = PERF_DIR / "results" / "pages"
+
+INIT_SCRIPT = """
+(() => {
+    if (window.__klPerfInstalled) return;
+    window.__klPerfInstalled = true;
+
+    const report = (kind, data) => {
+        try {
+            if (window.__klPerfReport) window.__klPerfReport({ kind, path: location.pathname, ...data });
+        } catch (e) { /* page is unloading */ }
+    };
+
+    let routeStart = 0;
+    let chartSeen = false;
+    const onRoute = () => { routeStart = performance.now(); chartSeen = false; report('route', {}); };
+    for (const method of ['pushState', 'replaceState']) {
+        const original = history[method];
+        history[method] = function (...args) {
+            const before = location.pathname;
+            const result = original.apply(this, args);
+            if (location.pathname !== before) onRoute();
+            return result;
+        };
+    }
+    addEventListener('popstate', onRoute);
+
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) report('lcp', { value: entry.startTime });
+    }).observe({ type: 'largest-contentful-paint', buffered: true });
+
+    new PerformanceObserver((list) => {
+        let bytes = 0;
+        for (const entry of list.getEntries()) {
+            if (entry.initiatorType === 'script' || /\\.m?js(\\?|$)/.test(entry.name)) {
+                bytes += entry.encodedBodySize || entry.transferSize || 0;
+            }
+        }
+        if (bytes) report('js', { bytes });
+    }).observe({ type: 'resource', buffered: true });
+
+    addEventListener('load', () => setTimeout(() => {
+        const nav = performance.getEntriesByType('navigation')[0];
+        if (nav) {
+            report('navigation', {
+                ttfb: nav.responseStart,
+                domContentLoaded: nav.domContentLoadedEventEnd,
+                load: nav.loadEventEnd,
+            });
+        }
+    }, 0));
+
+    const lookForChart = () => {
+        if (!chartSeen && document.querySelector('canvas')) {
+            chartSeen = true;
+            report('chart', { value: performance.now() - routeStart });
+        }
+    };
+    new MutationObserver(lookForChart).observe(document, { childList: true, subtree: true });
+})();
+"""
+
+
+def _path(url):
+    path = urlsplit(url).path.rstrip("/")
+    return path or "/"
+
+
+def _slug(path):
+    return path.strip("/").replace("/", "__") or "root"
+
+
+def _revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=PERF_DIR,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_budgets(path=BUDGETS_FILE):
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def budget_for(budgets, path):
+    """Merge the default budget with every page pattern matching ``path``."""
+    merged = dict(budgets.get("default", {}))
+    for pattern, limits in budgets.get("pages", {}).items():
+        if fnmatch.fnmatchcase(path, pattern):
+            merged.update(limits)
+    return merged
+
+
+class Visit:
+    """Metrics of one page shown in one tab, until the route changes."""
+
+    def __init__(self, test_id, path):
+        self.test_id = test_id
+        self.path = path
+        self.started = time.time() * 1000
+        self.navigation = None
+        self.lcp_ms = None
+        self.first_chart_ms = None
+        self.js_bytes = 0
+        self.api = []
+
+    def measures(self):
+        durations = [call["duration_ms"] for call in self.api if call["duration_ms"] is not None]
+        return {
+            "api_calls": len(self.api),
+            "api_total_ms": round(sum(durations), 1),
+            "api_max_ms": round(max(durations), 1) if durations else 0,
+            "api_span_ms": round(
+                max((c["start_ms"] + (c["duration_ms"] or 0) for c in self.api), default=0), 1
+            ),
+            "lcp_ms": self.lcp_ms,
+            "first_chart_ms": self.first_chart_ms,
+            "js_kb": round(self.js_bytes / 1024, 1),
+            "dom_content_loaded_ms": (self.navigation or {}).get("domContentLoaded"),
+            "load_ms": (self.navigation or {}).get("load"),
+            "ttfb_ms": (self.navigation or {}).get("ttfb"),
+        }
+
+    def to_record(self, revision):
+        return {
+            "test": self.test_id,
+            "path": self.path,
+            "revision": revision,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started / 1000)),
+            **self.measures(),
+            "waterfall": self.api,
+        }
+
+
+class PageMetrics:
+    """Collects :class:`Visit` records for every page of a browser context."""
+
+    def __init__(self, test_id, budgets=None):
+        self.test_id = test_id
+        self.budgets = budgets if budgets is not None else load_budgets()
+        self.visits = []
+        self._current = {}
+        self._saved = False
+
+    @classmethod
+    async def attach(cls, context, test_id, budgets=None):
+        metrics = cls(test_id, budgets)
+        await context.expose_binding("__klPerfReport", metrics._on_report)
+        await context.add_init_script(INIT_SCRIPT)
+        context.on("requestfinished", metrics._on_request_done)
+        context.on("requestfailed", metrics._on_request_done)
+        return metrics
+
+    def _visit(self, page, path):
+        visit = self._current.get(page)
+        if visit is None or visit.path != path:
+            visit = Visit(self.test_id, path)
+            self._current[page] = visit
+            self.visits.append(visit)
+        return visit
+
+    def _on_report(self, source, payload):
+        visit = self._visit(source["page"], _path(payload["path"]))
+        kind = payload["kind"]
+        if kind == "navigation":
+            visit.navigation = {k: round(payload[k], 1) for k in ("ttfb", "domContentLoaded", "load")}
+        elif kind == "lcp":
+            visit.lcp_ms = round(payload["value"], 1)
+        elif kind == "chart" and visit.first_chart_ms is None:
+            visit.first_chart_ms = round(payload["value"], 1)
+        elif kind == "js":
+            visit.js_bytes += payload["bytes"]
+
+    async def _on_request_done(self, request):
+        if not urlsplit(request.url).path.startswith("/api/"):
+            return
+        try:
+            frame = request.frame
+        except Exception:
+            return  # service worker and other frameless requests
+        visit = self._visit(frame.page, _path(frame.url))
+        timing = request.timing
+        failed = request.failure is not None
+        response = None if failed else await request.response()
+        end = timing.get("responseEnd", -1)
+        parts = urlsplit(request.url)
+        visit.api.append({
+            "method": request.method,
+            "url": parts.path + (f"?{parts.query}" if parts.query else ""),
+            "status": response.status if response else "failed",
+            "start_ms": round(max(0.0, timing["startTime"] - visit.started), 1),
+            "duration_ms": round(end, 1) if end >= 0 else None,
+        })
+
+    def violations(self):
+        """Return human-readable budget violations for every visit."""
+        problems = []
+        for visit in self.visits:
+            limits = budget_for(self.budgets, visit.path)
+            measures = visit.measures()
+            for metric, limit in limits.items():
+                value = measures.get(metric)
+                if value is not None and value > limit:
+                    problems.append(f"{visit.path}: {metric} = {value} exceeds budget {limit}")
+        return problems
+
+    def save(self):
+        """Append every visit to its page history file (once per test run)."""
+        if self._saved:
+            return
+        self._saved = True
+        HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+        revision = _revision()
+        for visit in self.visits:
+            with open(HISTORY_DIR / f"{_slug(visit.path)}.jsonl", "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(visit.to_record(revision)) + "\n")
+
+    def assert_within_budgets(self):
+        self.save()
+        problems = self.violations()
+        if problems:
+            raise AssertionError(
+                f"Test case {self.test_id} failed: page performance budgets exceeded:\n  " + "\n  ".join(problems)
+            )
@@ -0,0 +1,200 @@
+"""Index size and month-range query plans of the ``Pointage`` table.
+
+Connects straight to the database (``DATABASE_URL``) and reports, for one
+month of a ``seed_dataset`` instance:
+
+* the size of every ``Pointage`` index, summed over the partitions, and the
+  size of the indexes an insert of that month actually touches (the whole
+  table before partitioning, one month after);
+* ``EXPLAIN (ANALYZE, BUFFERS)`` of the month-range queries behind
+  ``obtenirPointages``, the monthly recap and ``/api/dashboard``, plus the
+  upsert of one day's sheet (run in a rolled-back transaction): median
+  execution time, shared buffers touched and ``Pointage`` relations scanned.
+
+Run it once before ``20261019180000_pointage_partitions`` and once after, on
+the same dataset, and diff the two reports with ``--compare``::
+
+    python -m testsprite_tests.perf.partition_report --month 2026-09 --output avant.json
+    npx prisma migrate deploy
+    python -m testsprite_tests.perf.partition_report --month 2026-09 --output apres.json --compare avant.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from datetime import datetime, timedelta, timezone
+
+from .loadtest import git_revision
+
+INDEX_SIZES_SQL = """
+SELECT i.indexrelid::regclass::text AS name,
+       (SELECT COALESCE(SUM(pg_relation_size(t.relid)), 0) FROM pg_partition_tree(i.indexrelid) t)::bigint
+FROM pg_index i
+WHERE i.indrelid = '"Pointage"'::regclass
+ORDER BY 1
+"""
+
+# Leaf tables holding the month: the whole table before partitioning
+MONTH_INDEX_SQL = """
+SELECT COALESCE(SUM(pg_indexes_size(leaf)), 0)::bigint
+FROM (SELECT DISTINCT tableoid AS leaf FROM "Pointage" WHERE "date" >= %(debut)s AND "date" < %(suivant)s) l
+"""
+
+QUERIES = {
+    "obtenirPointages (month)": """
+        SELECT p."id", p."employeId", p."date", p."statut", p."heuresSupp", p."joursTravailles",
+               e."nom", e."prenom", e."poste"
+        FROM "Pointage" p JOIN "Employe" e ON e."id" = p."employeId"
+        WHERE p."date" >= %(debut)s AND p."date" <= %(fin)s
+        ORDER BY p."date" DESC, e."nom" ASC
+    """,
+    "recap (one employee, month)": """
+        SELECT * FROM "Pointage"
+        WHERE "employeId" = %(employe)s AND "date" >= %(debut)s AND "date" <= %(fin)s
+        ORDER BY "date" DESC
+    """,
+    "dashboard (employees with overtime)": """
+        SELECT e."id", e."nom", e."prenom" FROM "Employe" e
+        WHERE EXISTS (
+            SELECT 1 FROM "Pointage" p
+            WHERE p."employeId" = e."id" AND p."date" >= %(debut)s AND p."date" <= %(fin)s AND p."heuresSupp" > 0
+        )
+    """,
+    "dashboard (weekly overtime, one employee)": """
+        SELECT SUM("heuresSupp") FROM "Pointage"
+        WHERE "employeId" = %(employe)s AND "date" >= %(debut)s AND "date" < %(semaine)s
+    """,
+    "upsert (one day's sheet)": """
+        INSERT INTO "Pointage" ("id", "employeId", "date", "statut", "heuresSupp", "joursTravailles", "updatedAt")
+        SELECT "id", "employeId", "date", "statut", "heuresSupp" + 1, "joursTravailles", now()
+        FROM "Pointage" WHERE "date" = %(jour)s
+        ON CONFLICT ("employeId", "date") DO UPDATE SET "heuresSupp" = EXCLUDED."heuresSupp", "updatedAt" = EXCLUDED."updatedAt"
+    """,
+}
+
+
+def relations(plan, found=None):
+    """Names of the ``Pointage`` tables and partitions a plan reads."""
+    found = set() if found is None else found
+    if plan.get("Relation Name", "").startswith("Pointage"):
+        found.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        relations(child, found)
+    return found
+
+
+def explain(conn, query, params, repeat):
+    import psycopg
+
+    runs = []
+    for _ in range(repeat):
+        # Rolled back so the upsert leaves the dataset untouched
+        with conn.transaction(force_rollback=True):
+            cur = psycopg.ClientCursor(conn)
+            cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + query, params)
+            runs.append(cur.fetchone()[0][0])
+    plan = runs[-1]["Plan"]
+    return {
+        "ms": round(statistics.median(r["Execution Time"] for r in runs), 2),
+        "buffers": plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0),
+        "relations": sorted(relations(plan)),
+    }
+
+
+def measure(database_url, month, repeat):
+    import psycopg
+
+    debut = datetime.strptime(month, "%Y-%m")
+    suivant = (debut + timedelta(days=32)).replace(day=1)
+    params = {
+        "debut": debut,
+        "suivant": suivant,
+        "fin": suivant - timedelta(milliseconds=1),
+        "semaine": debut + timedelta(days=7),
+        "jour": debut + timedelta(days=14),
+    }
+
+    with psycopg.connect(database_url, autocommit=True) as conn:
+        row = conn.execute(
+            'SELECT "employeId" FROM "Pointage" WHERE "date" >= %(debut)s AND "date" < %(suivant)s'
+            ' ORDER BY "heuresSupp" DESC LIMIT 1',
+            params,
+        ).fetchone()
+        if row is None:
+            raise SystemExit(f"no Pointage rows in {month}")
+        params["employe"] = row[0]
+
+        indexes = dict(conn.execute(INDEX_SIZES_SQL).fetchall())
+        month_index = conn.execute(MONTH_INDEX_SQL, params).fetchone()[0]
+        partitioned = conn.execute(
+            "SELECT relkind = 'p' FROM pg_class WHERE oid = '\"Pointage\"'::regclass"
+        ).fetchone()[0]
+        queries = {name: explain(conn, sql, params, repeat) for name, sql in QUERIES.items()}
+
+    return {
+        "partitioned": partitioned,
+        "indexes": indexes,
+        "index_bytes": sum(indexes.values()),
+        "month_index_bytes": month_index,
+        "queries": queries,
+    }
+
+
+def compare(current, baseline_path):
+    with open(baseline_path, encoding="utf-8") as fh:
+        baseline = json.load(fh)
+
+    def delta(now, before):
+        return f"{(now - before) / before * 100:+6.0f}%" if before else "   n/a"
+
+    print(f"\n{'':<44} {'before':>12} {'after':>12} {'delta':>8}")
+    for key, label in (("index_bytes", "index size, all months (MB)"), ("month_index_bytes", "index size touched by an insert (MB)")):
+        print(f"{label:<44} {baseline[key] / 2**20:>12.1f} {current[key] / 2**20:>12.1f} {delta(current[key], baseline[key])}")
+    for name, now in current["queries"].items():
+        before = baseline["queries"].get(name)
+        if not before:
+            print(f"{name:<44} (new)")
+            continue
+        print(f"{name + ' (ms)':<44} {before['ms']:>12.2f} {now['ms']:>12.2f} {delta(now['ms'], before['ms'])}")
+        print(f"{name + ' (buffers)':<44} {before['buffers']:>12} {now['buffers']:>12} {delta(now['buffers'], before['buffers'])}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--month", required=True, help="month to measure, YYYY-MM")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per query, the median is kept")
+    parser.add_argument("--output", default="partition-report.json")
+    parser.add_argument("--compare", help="previous report to diff against")
+    args = parser.parse_args(argv)
+
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "month": args.month,
+        },
+        **measure(args.database_url, args.month, args.repeat),
+    }
+    with open(args.output, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+
+    print(f"partitioned={report['partitioned']}")
+    for name, size in report["indexes"].items():
+        print(f"{name:<44} {size / 2**20:>10.1f} MB")
+    print(f"{'total':<44} {report['index_bytes'] / 2**20:>10.1f} MB")
+    print(f"{'touched by an insert into ' + args.month:<44} {report['month_index_bytes'] / 2**20:>10.1f} MB")
+    for name, stats in report["queries"].items():
+        print(f"{name:<44} {stats['ms']:>10.2f} ms  buffers={stats['buffers']:<8} relations={len(stats['relations'])}")
+    if args.compare:
+        compare(report, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
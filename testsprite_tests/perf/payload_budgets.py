@@ -0,0 +1,134 @@
+"""Response-size budgets for the list endpoints.
+
+Logs in as the ``seed_dataset`` admin, fetches every endpoint listed under
+``payloads`` in ``perf/budgets.json`` and fails when a response is larger
+than its budget. Budgets are expressed per row (``bytes_per_row``, rows being
+the top-level array or the ``rows`` key) so they hold for any dataset size,
+or as an absolute ``max_kb`` for paginated endpoints.
+
+Every response is also checked for fields that must never leave the server:
+password hashes, and ``photo`` unless the URL asked for it with ``fields=``.
+
+Example (instance seeded with ``seed_dataset --seed 0``)::
+
+    python -m testsprite_tests.perf.payload_budgets --base-url http://localhost:3000 --seed 0
+"""
+
+import argparse
+import http.cookiejar
+import json
+import re
+import sys
+import urllib.parse
+import urllib.request
+from datetime import datetime, timezone
+
+from . import BASE_URL
+from .page_metrics import load_budgets
+from .seed_dataset import DEFAULT_PASSWORD, EMAIL_DOMAIN, make_ids
+
+BCRYPT = re.compile(rb'"\$2[aby]\$\d\d\$')
+
+
+class Client:
+    """Minimal cookie-keeping client for the NextAuth credentials flow."""
+
+    def __init__(self, base_url, timeout):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def get(self, path):
+        with self.opener.open(self.base_url + path, timeout=self.timeout) as resp:
+            return resp.status, resp.read()
+
+    def login(self, email, password):
+        _, body = self.get("/api/auth/csrf")
+        form = urllib.parse.urlencode({
+            "csrfToken": json.loads(body)["csrfToken"],
+            "email": email,
+            "password": password,
+            "json": "true",
+        }).encode()
+        self.opener.open(self.base_url + "/api/auth/callback/credentials", data=form, timeout=self.timeout).read()
+
+
+def find_keys(value, names, found=None):
+    """Return the subset of ``names`` used as an object key anywhere in ``value``."""
+    found = set() if found is None else found
+    if isinstance(value, dict):
+        found.update(names & value.keys())
+        for child in value.values():
+            find_keys(child, names, found)
+    elif isinstance(value, list):
+        for child in value:
+            find_keys(child, names, found)
+    return found
+
+
+def check(path, body, limits):
+    """Return (measure, problems) for one response body."""
+    data = json.loads(body)
+    rows = data if limits.get("rows") is None else data.get(limits["rows"], [])
+    measure = {"path": path, "bytes": len(body), "rows": len(rows)}
+    problems = []
+
+    if "bytes_per_row" in limits and rows:
+        per_row = len(body) / len(rows)
+        measure["bytes_per_row"] = round(per_row)
+        if per_row > limits["bytes_per_row"]:
+            problems.append(f"{path}: {per_row:.0f} B/row exceeds budget {limits['bytes_per_row']}")
+    if "max_kb" in limits and len(body) > limits["max_kb"] * 1024:
+        problems.append(f"{path}: {len(body) / 1024:.1f} KB exceeds budget {limits['max_kb']} KB")
+
+    forbidden = {"password"}
+    if "photo" not in urllib.parse.parse_qs(urllib.parse.urlsplit(path).query).get("fields", [""])[0].split(","):
+        forbidden.add("photo")
+    leaked = find_keys(data, forbidden)
+    if leaked:
+        problems.append(f"{path}: exposes {', '.join(sorted(leaked))}")
+    if BCRYPT.search(body):
+        problems.append(f"{path}: contains a bcrypt hash")
+    return measure, problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--seed", type=int, default=0, help="seed used by seed_dataset")
+    parser.add_argument("--today", default=datetime.now(timezone.utc).date().isoformat())
+    parser.add_argument("--email", default=f"admin@{EMAIL_DOMAIN}")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--timeout", type=float, default=60)
+    args = parser.parse_args(argv)
+
+    client = Client(args.base_url, args.timeout)
+    client.login(args.email, args.password)
+
+    params = {
+        "today": args.today,
+        "year": int(args.today[:4]),
+        "month": int(args.today[5:7]),
+        "employe": make_ids(args.seed, "Employe", 0, 1)[0],
+    }
+    measures, problems = [], []
+    for template, limits in load_budgets().get("payloads", {}).items():
+        path = template.format(**params)
+        status, body = client.get(path)
+        if status != 200:
+            problems.append(f"{path}: HTTP {status}")
+            continue
+        measure, found = check(path, body, limits)
+        measures.append(measure)
+        problems.extend(found)
+
+    for m in measures:
+        per_row = f"{m['bytes_per_row']:>6} B/row" if "bytes_per_row" in m else " " * 12
+        print(f"{m['bytes'] / 1024:>9.1f} KB {m['rows']:>7} rows {per_row}  {m['path']}")
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
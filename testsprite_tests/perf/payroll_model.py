@@ -0,0 +1,378 @@
+"""Vectorized NumPy reference model of ``calculerSalaire``.
+
+``lib/services/recapGenerator.js`` encodes the payroll rules used by every
+report, PDF and finance aggregate:
+
+* 26-day base month, daily rate ``salaireBase / 26``, hourly rate ``daily / 8``;
+* PRESENT on a Sunday only counts as overtime, 8 h when no hours were entered;
+* CONGE and MALADIE are paid like worked days, FERIE days are paid separately;
+* only APPROVED advances are deducted, the net is clamped at 0 and the
+  remaining debt is reported in ``resteARembourser``.
+
+This module re-implements those rules over whole arrays of employee-months,
+generates large random batches, runs the same batch through the JS engine in
+a single ``node`` call and diffs every output field. Point ``--module`` and
+``--export`` at another implementation to validate an optimized engine.
+
+Example::
+
+    python -m testsprite_tests.perf.payroll_model --rows 300000 --seed 7
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+NODE_DIR = Path(__file__).resolve().parent / "node"
+
+DAYS = 31
+MAX_AVANCES = 6
+
+# Codes shared with node/payroll-batch.mjs
+NONE, PRESENT, ABSENT, CONGE, MALADIE, FERIE = range(6)
+AVANCE_PENDING, AVANCE_APPROVED, AVANCE_REJECTED = 1, 2, 3
+
+FIELDS = (
+    "joursPresence",
+    "joursAbsence",
+    "joursConge",
+    "joursMaladie",
+    "joursFerie",
+    "joursDimancheTravailles",
+    "joursBaseCalcul",
+    "salaireBase",
+    "tauxJournalier",
+    "tauxHoraire",
+    "montantPresence",
+    "montantFeries",
+    "totalHeuresSupp",
+    "montantHeuresSupp",
+    "deductionAbsences",
+    "totalAvances",
+    "nombreAvances",
+    "resteARembourser",
+    "totalJoursPayes",
+    "salaireBrut",
+    "salaireNet",
+)
+
+
+@dataclass
+class PayrollBatch:
+    """Column-oriented batch of employee-months.
+
+    Day-indexed arrays have shape ``(rows, DAYS)``; day ``d`` is the
+    ``d + 1``-th of the month and ``statut == NONE`` means no pointage.
+    """
+
+    salaire_base: np.ndarray  # float64 (rows,)
+    mois: np.ndarray  # int32 (rows,)
+    annee: np.ndarray  # int32 (rows,)
+    statut: np.ndarray  # uint8 (rows, DAYS)
+    heures_supp: np.ndarray  # float64 (rows, DAYS)
+    jours_travailles: np.ndarray  # float64 (rows, DAYS)
+    avance_montant: np.ndarray  # float64 (rows, MAX_AVANCES)
+    avance_statut: np.ndarray  # uint8 (rows, MAX_AVANCES)
+
+    @property
+    def rows(self):
+        return self.salaire_base.shape[0]
+
+
+def month_calendar(mois, annee):
+    """Return ``(in_month, is_sunday)`` boolean masks of shape ``(rows, DAYS)``."""
+    first = (
+        (annee.astype("int64") - 1970) * 12 + (mois.astype("int64") - 1)
+    ).astype("datetime64[M]").astype("datetime64[D]")
+    next_first = (first.astype("datetime64[M]") + 1).astype("datetime64[D]")
+    length = (next_first - first).astype("int64")
+
+    offsets = np.arange(DAYS, dtype="int64")
+    epoch_days = first.astype("int64")[:, None] + offsets[None, :]
+    # 1970-01-01 was a Thursday, so epoch day 3 is a Sunday
+    is_sunday = (epoch_days - 3) % 7 == 0
+    in_month = offsets[None, :] < length[:, None]
+    return in_month, is_sunday
+
+
+def generate_batch(rows, seed=0):
+    """Generate ``rows`` random employee-months with realistic distributions."""
+    rng = np.random.default_rng(seed)
+
+    salaire_base = rng.uniform(600, 3500, rows)
+    salaire_base = np.where(rng.random(rows) < 0.8, np.round(salaire_base), np.round(salaire_base, 3))
+    mois = rng.integers(1, 13, rows, dtype="int32")
+    annee = rng.integers(2024, 2028, rows, dtype="int32")
+    in_month, is_sunday = month_calendar(mois, annee)
+
+    shape = (rows, DAYS)
+    weekday_statut = rng.choice(
+        [PRESENT, ABSENT, CONGE, MALADIE, FERIE],
+        size=shape,
+        p=[0.80, 0.07, 0.06, 0.04, 0.03],
+    ).astype("uint8")
+    sunday_worked = rng.random(shape) < 0.15
+    has_row = (rng.random(shape) < 0.95) & in_month
+
+    statut = np.where(is_sunday, np.where(sunday_worked, PRESENT, NONE), weekday_statut)
+    statut = np.where(has_row, statut, NONE).astype("uint8")
+
+    jours_travailles = np.where(rng.random(shape) < 0.1, 0.5, 1.0)
+    overtime = rng.choice([0.5, 1.0, 1.5, 2.0, 3.0, 4.0], size=shape)
+    heures_supp = np.where(rng.random(shape) < 0.3, overtime, 0.0)
+    # Sunday rows: half of them leave the hours empty to hit the 8 h default
+    sunday_hours = np.where(rng.random(shape) < 0.5, 0.0, rng.choice([4.0, 6.0, 8.0, 10.0], size=shape))
+    heures_supp = np.where(is_sunday, sunday_hours, heures_supp)
+
+    # creerPointage forces 0 days / 0 h on ABSENT, except on a few legacy rows
+    absent = (statut == ABSENT) & (rng.random(shape) < 0.98)
+    jours_travailles = np.where(absent, 0.0, jours_travailles)
+    heures_supp = np.where(absent, 0.0, heures_supp)
+    empty = statut == NONE
+    jours_travailles = np.where(empty, 0.0, jours_travailles)
+    heures_supp = np.where(empty, 0.0, heures_supp)
+
+    nb_avances = rng.integers(0, MAX_AVANCES + 1, rows)
+    slot = np.arange(MAX_AVANCES)[None, :] < nb_avances[:, None]
+    avance_statut = rng.choice(
+        [AVANCE_PENDING, AVANCE_APPROVED, AVANCE_REJECTED],
+        size=(rows, MAX_AVANCES),
+        p=[0.2, 0.7, 0.1],
+    )
+    avance_statut = np.where(slot, avance_statut, NONE).astype("uint8")
+    # Mostly small advances, with a heavy tail that pushes the net below zero
+    avance_montant = np.where(
+        rng.random((rows, MAX_AVANCES)) < 0.9,
+        np.round(rng.uniform(20, 400, (rows, MAX_AVANCES)), 1),
+        np.round(rng.uniform(400, 3000, (rows, MAX_AVANCES)), 3),
+    )
+    avance_montant = np.where(slot, avance_montant, 0.0)
+
+    return PayrollBatch(
+        salaire_base=salaire_base.astype("float64"),
+        mois=mois,
+        annee=annee,
+        statut=statut,
+        heures_supp=heures_supp.astype("float64"),
+        jours_travailles=jours_travailles.astype("float64"),
+        avance_montant=avance_montant.astype("float64"),
+        avance_statut=avance_statut,
+    )
+
+
+def js_round3(values):
+    """``Math.round(x * 1000) / 1000`` with JS tie-breaking (half towards +inf)."""
+    scaled = values * 1000
+    floor = np.floor(scaled)
+    return (floor + (scaled - floor >= 0.5)) / 1000
+
+
+def reference_salaries(batch):
+    """Compute every ``calculerSalaire`` output field for the whole batch.
+
+    Accumulations run day by day (and advance by advance) so that the
+    floating-point summation order matches the JS ``forEach``/``reduce``.
+    """
+    rows = batch.rows
+    _, is_sunday = month_calendar(batch.mois, batch.annee)
+
+    taux_journalier = batch.salaire_base / 26
+    taux_horaire = taux_journalier / 8
+
+    jours_travailles_total = np.zeros(rows)
+    total_heures_supp = np.zeros(rows)
+    jours_ferie = np.zeros(rows)
+    jours_presence = np.zeros(rows)
+    jours_absence = np.zeros(rows)
+    jours_conge = np.zeros(rows)
+    jours_maladie = np.zeros(rows)
+    dimanches_travailles = np.zeros(rows)
+
+    for d in range(DAYS):
+        statut = batch.statut[:, d]
+        sunday = is_sunday[:, d]
+        jt = batch.jours_travailles[:, d]
+        hs = batch.heures_supp[:, d]
+
+        present_sunday = (statut == PRESENT) & sunday
+        present_week = (statut == PRESENT) & ~sunday
+        paid_leave = (statut == CONGE) | (statut == MALADIE)
+
+        heures_dimanche = np.where(hs > 0, hs, 8.0)
+        total_heures_supp = np.where(present_sunday, total_heures_supp + heures_dimanche, total_heures_supp)
+        jours_travailles_total = np.where(present_week, jours_travailles_total + jt, jours_travailles_total)
+        total_heures_supp = np.where(present_week, total_heures_supp + hs, total_heures_supp)
+        jours_travailles_total = np.where(paid_leave, jours_travailles_total + jt, jours_travailles_total)
+        jours_ferie = np.where(statut == FERIE, jours_ferie + jt, jours_ferie)
+
+        jours_presence = np.where(present_week, jours_presence + jt, jours_presence)
+        jours_absence = np.where(statut == ABSENT, jours_absence + jt, jours_absence)
+        jours_conge = np.where(statut == CONGE, jours_conge + jt, jours_conge)
+        jours_maladie = np.where(statut == MALADIE, jours_maladie + jt, jours_maladie)
+        dimanches_travailles += present_sunday
+
+    total_avances = np.zeros(rows)
+    for a in range(MAX_AVANCES):
+        approved = batch.avance_statut[:, a] == AVANCE_APPROVED
+        total_avances = np.where(approved, total_avances + batch.avance_montant[:, a], total_avances)
+    nombre_avances = (batch.avance_statut != NONE).sum(axis=1).astype("float64")
+
+    montant_presence = jours_travailles_total * taux_journalier
+    montant_hs = total_heures_supp * taux_horaire * 1.25
+    montant_feries = jours_ferie * taux_journalier
+
+    net_brut = montant_presence + montant_hs + montant_feries
+    salaire_net = np.maximum(0, net_brut - total_avances)
+    reste = np.maximum(0, total_avances - net_brut)
+    deduction = np.maximum(0, 26 - (jours_travailles_total + jours_ferie)) * taux_journalier
+
+    return {
+        "joursPresence": jours_presence,
+        "joursAbsence": jours_absence,
+        "joursConge": jours_conge,
+        "joursMaladie": jours_maladie,
+        "joursFerie": jours_ferie,
+        "joursDimancheTravailles": dimanches_travailles,
+        "joursBaseCalcul": np.full(rows, 26.0),
+        "salaireBase": batch.salaire_base.copy(),
+        "tauxJournalier": taux_journalier,
+        "tauxHoraire": taux_horaire,
+        "montantPresence": montant_presence,
+        "montantFeries": montant_feries,
+        "totalHeuresSupp": total_heures_supp,
+        "montantHeuresSupp": montant_hs,
+        "deductionAbsences": deduction,
+        "totalAvances": total_avances,
+        "nombreAvances": nombre_avances,
+        "resteARembourser": js_round3(reste),
+        "totalJoursPayes": jours_travailles_total + jours_ferie,
+        "salaireBrut": js_round3(net_brut),
+        "salaireNet": js_round3(salaire_net),
+    }
+
+
+def run_js_engine(batch, module="lib/services/recapGenerator.js", export="calculerSalaire"):
+    """Run ``batch`` through a JS payroll engine in one ``node`` process.
+
+    Returns ``(outputs, duration_ms)`` where ``duration_ms`` only covers the
+    engine loop, not the Node start-up or the column transfer.
+    """
+    with tempfile.TemporaryDirectory(prefix="payroll-batch-") as workdir:
+        work = Path(workdir)
+        columns = {
+            "salaire_base": batch.salaire_base.astype("<f8"),
+            "mois": batch.mois.astype("<i4"),
+            "annee": batch.annee.astype("<i4"),
+            "statut": batch.statut.astype("u1"),
+            "heures_supp": batch.heures_supp.astype("<f8"),
+            "jours_travailles": batch.jours_travailles.astype("<f8"),
+            "avance_montant": batch.avance_montant.astype("<f8"),
+            "avance_statut": batch.avance_statut.astype("u1"),
+        }
+        for name, values in columns.items():
+            np.ascontiguousarray(values).tofile(work / f"{name}.bin")
+
+        manifest = {
+            "rows": batch.rows,
+            "days": DAYS,
+            "avances": MAX_AVANCES,
+            "module": str((REPO_ROOT / module).resolve()),
+            "export": export,
+            "fields": list(FIELDS),
+        }
+        (work / "manifest.json").write_text(json.dumps(manifest))
+
+        # Sundays are detected with Date#getDay(): pin the zone like the server
+        env = dict(os.environ, TZ="UTC")
+        subprocess.run(
+            ["node", str(NODE_DIR / "payroll-batch.mjs"), str(work)],
+            check=True,
+            cwd=REPO_ROOT,
+            env=env,
+        )
+
+        outputs = {f: np.fromfile(work / f"out_{f}.bin", dtype="<f8") for f in FIELDS}
+        result = json.loads((work / "result.json").read_text())
+        return outputs, result["dureeMs"]
+
+
+def diff_outputs(expected, actual, rtol=0.0, atol=0.0):
+    """Return ``{field: indices}`` of the rows where a field disagrees."""
+    mismatches = {}
+    for field in FIELDS:
+        if rtol or atol:
+            bad = ~np.isclose(actual[field], expected[field], rtol=rtol, atol=atol)
+        else:
+            bad = actual[field] != expected[field]
+        if bad.any():
+            mismatches[field] = np.flatnonzero(bad)
+    return mismatches
+
+
+def describe_row(batch, i):
+    days = [
+        f"{d + 1}:{'-PACMF'[s]}/{batch.jours_travailles[i, d]:g}/{batch.heures_supp[i, d]:g}"
+        for d, s in enumerate(batch.statut[i])
+        if s != NONE
+    ]
+    avances = [
+        f"{batch.avance_montant[i, a]:g}:{'-PAR'[s]}"
+        for a, s in enumerate(batch.avance_statut[i])
+        if s != NONE
+    ]
+    return (
+        f"row {i}: {batch.annee[i]}-{batch.mois[i]:02d} base={batch.salaire_base[i]:g}\n"
+        f"  days    {' '.join(days)}\n"
+        f"  avances {' '.join(avances) or '-'}"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--module", default="lib/services/recapGenerator.js")
+    parser.add_argument("--export", default="calculerSalaire")
+    parser.add_argument("--rtol", type=float, default=0.0)
+    parser.add_argument("--atol", type=float, default=0.0)
+    parser.add_argument("--show", type=int, default=3, help="failing rows to print per field")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    batch = generate_batch(args.rows, args.seed)
+    generated = time.perf_counter()
+    expected = reference_salaries(batch)
+    modeled = time.perf_counter()
+    actual, engine_ms = run_js_engine(batch, args.module, args.export)
+    finished = time.perf_counter()
+
+    print(
+        f"{batch.rows} employee-months | generate {generated - started:.2f}s"
+        f" | numpy {modeled - generated:.2f}s | js {finished - modeled:.2f}s"
+        f" (engine {engine_ms / 1000:.2f}s)"
+    )
+
+    mismatches = diff_outputs(expected, actual, args.rtol, args.atol)
+    if not mismatches:
+        print(f"OK: all {len(FIELDS)} fields match on every row")
+        return 0
+
+    for field, rows in mismatches.items():
+        print(f"MISMATCH {field}: {rows.size} rows")
+        for i in rows[: args.show]:
+            print(f"  expected {expected[field][i]!r} got {actual[field][i]!r}")
+            print("  " + describe_row(batch, i).replace("\n", "\n  "))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
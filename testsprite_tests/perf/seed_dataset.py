@@ -0,0 +1,535 @@
+"""Deterministic synthetic dataset seeder for performance testing.
+
+Generates realistic ``User``/``Employe``/``Pointage``/``Avance``/``Message``
+rows and bulk-loads them with ``COPY``:
+
+* Sundays are mostly off, with occasional overtime-only Sunday shifts;
+* fixed Tunisian holidays (``constants/joursFeries.js``) are FERIE;
+* leave comes in multi-day CONGE streaks, MALADIE and ABSENT are sparse;
+* overtime follows a long-tail distribution and clock-in/out times are set,
+  with the matching ``ClockEvent`` IN/OUT pairs;
+* past days are validated by a chef (with their ``ValidationJour`` record),
+  advances are mostly approved.
+
+The same ``--seed`` always produces the same rows, including ids, so
+benchmarks can be compared between commits. Every seeded account uses the
+``@perf.klbeton.tn`` domain and the password ``password123``.
+
+Example (5k employees, 3 years)::
+
+    python -m testsprite_tests.perf.seed_dataset --employees 5000 --months 36 --truncate
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+EMAIL_DOMAIN = "perf.klbeton.tn"
+DEFAULT_PASSWORD = "password123"
+# bcrypt("password123", cost 10) — hashing at seed time would dominate the run
+PASSWORD_HASH = "$2b$10$riBK5vASe7xQq1s61GHIFO3mhZv191VKQmJiFjgvS3fJh9KgeoG4m"
+
+# Fixed dates of JOURS_FERIES_TUNISIE in constants/joursFeries.js
+JOURS_FERIES = {(1, 1), (3, 20), (3, 21), (4, 9), (5, 1), (7, 25), (8, 13), (10, 15), (12, 17)}
+
+PRENOMS = [
+    "Mohamed", "Ahmed", "Ali", "Youssef", "Hamza", "Omar", "Karim", "Sami", "Walid", "Bilel",
+    "Mehdi", "Anis", "Slim", "Nizar", "Fares", "Amine", "Aymen", "Hatem", "Riadh", "Skander",
+    "Fatma", "Amira", "Ines", "Salma", "Meriem", "Sarra", "Rim", "Nour", "Asma", "Olfa",
+]
+NOMS = [
+    "BEN ALI", "TRABELSI", "GHARBI", "JEBALI", "HAMMAMI", "BOUAZIZI", "MEJRI", "SASSI",
+    "BEN SALAH", "KHELIFI", "DRIDI", "AYARI", "CHAABANE", "BEN AMOR", "MZOUGHI", "FERCHICHI",
+    "BOUGHANMI", "ZOUARI", "MATHLOUTHI", "NASRI", "BEN YOUSSEF", "HADDAD", "KSOURI", "TLILI",
+]
+POSTES = [
+    ("Maçon", 0.30), ("Manœuvre", 0.25), ("Ferrailleur", 0.12), ("Coffreur", 0.10),
+    ("Conducteur d'engins", 0.08), ("Électricien", 0.06), ("Plombier", 0.05), ("Chef d'équipe", 0.04),
+]
+DEPARTEMENTS = ["Gros œuvre", "Second œuvre", "Logistique", "Centrale béton"]
+
+# Id layout: <seed>-<table tag>-4000-8000-<sequence>, valid UUID strings that are
+# cheap to format and make seeded rows easy to spot
+TABLE_TAGS = {"User": 1, "Employe": 2, "Pointage": 3, "Avance": 4, "Message": 5}
+
+
+def make_ids(seed, table, start, count):
+    prefix = f"{seed & 0xFFFFFFFF:08x}-{TABLE_TAGS[table]:04x}-4000-8000-"
+    return [f"{prefix}{n:012x}" for n in range(start, start + count)]
+
+
+def month_days(year, month):
+    """Return the ``datetime64[D]`` days of a month."""
+    first = np.datetime64(f"{year:04d}-{month:02d}-01")
+    last = (first.astype("datetime64[M]") + 1).astype("datetime64[D]")
+    return np.arange(first, last)
+
+
+def iter_months(end, months):
+    year, month = end
+    out = []
+    for _ in range(months):
+        out.append((year, month))
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    return list(reversed(out))
+
+
+def iso(values):
+    """Format a ``datetime64`` array as ISO strings, keeping NaT as ``None``."""
+    text = np.datetime_as_string(values, unit="ms")
+    return [None if t == "NaT" else t for t in text.tolist()]
+
+
+class Dataset:
+    """Generates the seeded tables and streams them through ``COPY``."""
+
+    def __init__(self, employees, months, message_rate, seed, end=None, today=None):
+        self.seed = seed
+        self.employees = employees
+        self.message_rate = message_rate
+        self.today = np.datetime64(today or datetime.now(timezone.utc).date().isoformat())
+        end = end or (int(str(self.today)[:4]), int(str(self.today)[5:7]))
+        self.months = iter_months(end, months)
+        # Timestamps derive from "today" so a pinned --today gives identical rows
+        self.now = self.today.astype("datetime64[ms]") + np.timedelta64(18 * 3600 * 1000, "ms")
+        self._build_people()
+
+    def _rng(self, table):
+        # One stream per table so each generator is independent of call order
+        return np.random.default_rng([self.seed, TABLE_TAGS[table]])
+
+    # -- People ---------------------------------------------------------------
+
+    def _build_people(self):
+        rng = self._rng("User")
+        n = self.employees
+        self.chefs = max(1, n // 40)
+
+        self.prenom = rng.choice(PRENOMS, n)
+        self.nom = rng.choice(NOMS, n)
+        postes, weights = zip(*POSTES)
+        self.poste = rng.choice(postes, n, p=np.array(weights) / sum(weights))
+        self.poste[: self.chefs] = "Chef de chantier"
+        self.salaire = np.round(rng.lognormal(np.log(1100), 0.3, n), 0).clip(600, 4500)
+        self.actif = rng.random(n) < 0.96
+
+        first_month = np.datetime64(f"{self.months[0][0]:04d}-{self.months[0][1]:02d}-01")
+        hired_before = rng.integers(30, 3650, n).astype("timedelta64[D]")
+        self.date_embauche = first_month - hired_before
+
+        self.user_ids = make_ids(self.seed, "User", 0, n + 1)
+        self.admin_id = self.user_ids[n]
+        self.employe_ids = make_ids(self.seed, "Employe", 0, n)
+
+    def users(self):
+        created = iso(self.date_embauche.astype("datetime64[ms]"))
+        now = str(self.now)
+        for i in range(self.employees):
+            role = "CHEF" if i < self.chefs else "EMPLOYE"
+            email = f"{self.prenom[i].lower()}.{self.nom[i].lower().replace(' ', '')}.{i}@{EMAIL_DOMAIN}"
+            yield (self.user_ids[i], email, PASSWORD_HASH, role, created[i], now)
+        yield (self.admin_id, f"admin@{EMAIL_DOMAIN}", PASSWORD_HASH, "ADMIN", now, now)
+
+    def employes(self):
+        rng = self._rng("Employe")
+        n = self.employees
+        conges = np.round(rng.uniform(0, 18, n) * 2) / 2
+        maladie = np.round(rng.uniform(0, 10, n) * 2) / 2
+        departement = rng.choice(DEPARTEMENTS, n)
+        telephone = rng.integers(20_000_000, 99_999_999, n)
+        embauche = iso(self.date_embauche.astype("datetime64[ms]"))
+        now = str(self.now)
+        for i in range(n):
+            yield (
+                self.employe_ids[i],
+                self.user_ids[i],
+                self.nom[i],
+                self.prenom[i],
+                self.poste[i],
+                embauche[i],
+                float(self.salaire[i]),
+                "ACTIF" if self.actif[i] else "INACTIF",
+                float(conges[i]),
+                float(maladie[i]),
+                departement[i],
+                f"KLB-{i + 1:06d}",
+                f"+216 {telephone[i]}",
+                embauche[i],
+                now,
+            )
+
+    # -- Attendance -----------------------------------------------------------
+
+    def pointages(self):
+        rng = self._rng("Pointage")
+        n = self.employees
+        chef_of = rng.integers(0, self.chefs, n)
+        sequence = 0
+
+        for year, month in self.months:
+            days = month_days(year, month)
+            days = days[days <= self.today]
+            if days.size == 0:
+                continue
+            shape = (n, days.size)
+            weekday = (days.astype("int64") - 4) % 7  # 0 = Monday
+            sunday = weekday == 6
+            ferie = np.array([(month, int(str(d)[8:10])) in JOURS_FERIES for d in days])
+
+            statut = np.full(shape, "PRESENT", dtype=object)
+            draw = rng.random(shape)
+            statut[draw < 0.05] = "ABSENT"
+            statut[(draw >= 0.05) & (draw < 0.075)] = "MALADIE"
+
+            # One leave streak of 2 to 6 days for ~15% of the crew each month
+            on_leave = rng.random(n) < 0.15
+            start = rng.integers(0, days.size, n)
+            length = rng.integers(2, 7, n)
+            idx = np.arange(days.size)[None, :]
+            streak = on_leave[:, None] & (idx >= start[:, None]) & (idx < (start + length)[:, None])
+            statut[streak] = "CONGE"
+            statut[:, ferie] = "FERIE"
+
+            present = np.ones(shape, dtype=bool)
+            sunday_shift = rng.random(shape) < 0.08
+            present[:, sunday] = sunday_shift[:, sunday]
+            statut[:, sunday] = "PRESENT"
+            # Employees only have rows after hiring and while active
+            hired = self.date_embauche[:, None] <= days[None, :]
+            has_row = present & hired & (self.actif[:, None] | (rng.random(shape) < 0.5))
+
+            jours = np.where(rng.random(shape) < 0.06, 0.5, 1.0)
+            heures = np.where(
+                rng.random(shape) < 0.25,
+                np.minimum(rng.exponential(1.5, shape).round(1) + 0.5, 6.0),
+                0.0,
+            )
+            sunday_hours = np.where(rng.random(shape) < 0.5, 0.0, rng.choice([4.0, 6.0, 8.0, 10.0], shape))
+            heures[:, sunday] = sunday_hours[:, sunday]
+            absent = statut == "ABSENT"
+            jours[absent] = 0.0
+            heures[absent | (statut == "CONGE") | (statut == "MALADIE") | (statut == "FERIE")] = 0.0
+
+            # Clock-in around 07:00, clock-out after 8 h plus overtime
+            clock_in = days[None, :].astype("datetime64[ms]") + (
+                (7 * 60 + rng.normal(0, 12, shape)).astype("int64") * 60_000
+            ).astype("timedelta64[ms]")
+            worked_ms = ((8 + heures) * 3_600_000 * jours).astype("int64")
+            clock_out = clock_in + worked_ms.astype("timedelta64[ms]")
+            clocked = (statut == "PRESENT") & (rng.random(shape) < 0.6)
+            open_today = clocked & (days[None, :] == self.today) & (rng.random(shape) < 0.7)
+            total_hours = np.round(worked_ms / 3_600_000, 2)
+
+            validated = days[None, :] < self.today
+            validated_at = days.astype("datetime64[ms]") + np.timedelta64(17 * 3600 * 1000, "ms")
+
+            rows, cols = np.nonzero(has_row)
+            count = rows.size
+            ids = make_ids(self.seed, "Pointage", sequence, count)
+            sequence += count
+
+            day_text = iso(days.astype("datetime64[ms]"))
+            in_text = iso(clock_in[rows, cols])
+            out_text = iso(clock_out[rows, cols])
+            validated_text = iso(validated_at)
+            statut_rc = statut[rows, cols].tolist()
+            heures_rc = heures[rows, cols].tolist()
+            jours_rc = jours[rows, cols].tolist()
+            clocked_rc = clocked[rows, cols].tolist()
+            open_rc = open_today[rows, cols].tolist()
+            total_rc = total_hours[rows, cols].tolist()
+            validated_rc = np.broadcast_to(validated, shape)[rows, cols].tolist()
+            now = str(self.now)
+
+            for k, (i, d) in enumerate(zip(rows.tolist(), cols.tolist())):
+                is_clocked = clocked_rc[k]
+                is_open = open_rc[k]
+                is_validated = validated_rc[k]
+                yield (
+                    ids[k],
+                    self.employe_ids[i],
+                    day_text[d],
+                    statut_rc[k],
+                    heures_rc[k],
+                    jours_rc[k],
+                    in_text[k] if is_clocked else None,
+                    out_text[k] if is_clocked and not is_open else None,
+                    total_rc[k] if is_clocked and not is_open else None,
+                    is_validated,
+                    validated_text[d] if is_validated else None,
+                    self.user_ids[chef_of[i]] if is_validated else None,
+                    validated_text[d],
+                    now,
+                )
+
+    def avances(self):
+        rng = self._rng("Avance")
+        n = self.employees
+        sequence = 0
+        current = (int(str(self.today)[:4]), int(str(self.today)[5:7]))
+        notes = ["Avance sur salaire", "Urgence familiale", "Transport", None]
+
+        for year, month in self.months:
+            days = month_days(year, month)
+            days = days[days <= self.today]
+            if days.size == 0:
+                continue
+            counts = rng.poisson(0.6, n) * self.actif
+            owner = np.repeat(np.arange(n), counts)
+            total = owner.size
+            ids = make_ids(self.seed, "Avance", sequence, total)
+            sequence += total
+
+            when = rng.choice(days, total)
+            montant = np.round(rng.lognormal(np.log(150), 0.7, total) / 10) * 10
+            montant = montant.clip(20, 3000)
+            if (year, month) == current:
+                statut = rng.choice(["PENDING", "APPROVED", "REJECTED"], total, p=[0.5, 0.45, 0.05])
+            else:
+                statut = rng.choice(["APPROVED", "REJECTED"], total, p=[0.93, 0.07])
+            note = rng.choice(len(notes), total)
+            when_text = iso(when.astype("datetime64[ms]"))
+            now = str(self.now)
+
+            for k in range(total):
+                yield (
+                    ids[k],
+                    self.employe_ids[owner[k]],
+                    float(montant[k]),
+                    when_text[k],
+                    notes[note[k]],
+                    statut[k],
+                    when_text[k],
+                    now,
+                )
+
+    def messages(self):
+        rng = self._rng("Message")
+        users = self.employees + 1
+        sequence = 0
+        contents = [
+            "Bonjour, la feuille de présence du jour est prête.",
+            "Merci de vérifier les heures supplémentaires de l'équipe.",
+            "Demande d'avance transmise pour validation.",
+            "Livraison de béton reportée à demain matin.",
+        ]
+        reminder = "Bonjour Chef, n'oubliez pas de valider la feuille de présence pour aujourd'hui."
+
+        for year, month in self.months:
+            days = month_days(year, month)
+            days = days[days <= self.today]
+            if days.size == 0:
+                continue
+            total = rng.poisson(self.message_rate * users)
+            ids = make_ids(self.seed, "Message", sequence, total)
+            sequence += total
+
+            sender = rng.integers(0, users, total)
+            chef = rng.integers(0, self.chefs, total)
+            system = rng.random(total) < 0.1
+            when = rng.choice(days, total).astype("datetime64[ms]") + (
+                rng.integers(6 * 3600, 20 * 3600, total) * 1000
+            ).astype("timedelta64[ms]")
+            when = np.minimum(when, self.now)
+            recent = when > self.now - np.timedelta64(3 * 24 * 3600 * 1000, "ms")
+            is_read = ~recent | (rng.random(total) < 0.3)
+            content = rng.choice(len(contents), total)
+            when_text = iso(when)
+
+            for k in range(total):
+                if system[k]:
+                    src, dst, text = self.admin_id, self.user_ids[chef[k]], reminder
+                elif sender[k] == self.employees:
+                    src, dst, text = self.admin_id, self.user_ids[chef[k]], contents[content[k]]
+                else:
+                    src, dst, text = self.user_ids[sender[k]], self.admin_id, contents[content[k]]
+                yield (ids[k], text, None, src, dst, bool(is_read[k]), bool(system[k]), when_text[k])
+
+
+TABLES = [
+    ("User", ["id", "email", "password", "role", "createdAt", "updatedAt"], "users"),
+    (
+        "Employe",
+        [
+            "id", "userId", "nom", "prenom", "poste", "dateEmbauche", "salaireBase", "statut",
+            "soldeConges", "soldeMaladie", "departement", "employeeId", "telephone",
+            "createdAt", "updatedAt",
+        ],
+        "employes",
+    ),
+    (
+        "Pointage",
+        [
+            "id", "employeId", "date", "statut", "heuresSupp", "joursTravailles", "clockInTime",
+            "clockOutTime", "totalHours", "valideParChef", "dateValidationChef", "chefValidateurId",
+            "createdAt", "updatedAt",
+        ],
+        "pointages",
+    ),
+    ("Avance", ["id", "employeId", "montant", "date", "note", "statut", "createdAt", "updatedAt"], "avances"),
+    (
+        "Message",
+        ["id", "content", "subject", "senderId", "receiverId", "isRead", "isSystemMessage", "createdAt"],
+        "messages",
+    ),
+]
+
+
+# Same derivation as the ClockEvent migration backfill
+CLOCK_EVENTS_SQL = """
+INSERT INTO "ClockEvent" ("employeId", "ts", "kind", "source")
+SELECT "employeId", "ts", "kind"::"ClockEventKind", 'IMPORT'
+FROM (
+    SELECT "employeId", "clockInTime" AS "ts", 'IN' AS "kind"
+    FROM "Pointage" WHERE "clockInTime" IS NOT NULL
+    UNION ALL
+    SELECT "employeId", "clockOutTime", 'OUT'
+    FROM "Pointage" WHERE "clockInTime" IS NOT NULL AND "clockOutTime" IS NOT NULL
+) e
+ORDER BY "ts"
+"""
+
+
+# Same derivation as the ValidationJour migration backfill
+VALIDATIONS_SQL = """
+INSERT INTO "ValidationJour" ("date", "chefId", "validatedAt", "lignes", "updatedAt")
+SELECT
+    date_trunc('day', "date"),
+    (array_agg("chefValidateurId" ORDER BY "dateValidationChef" DESC))[1],
+    MAX("dateValidationChef"),
+    COUNT(*)::int,
+    CURRENT_TIMESTAMP
+FROM "Pointage"
+WHERE "valideParChef"
+GROUP BY 1
+"""
+
+
+def copy_statement(table, columns):
+    cols = ", ".join(f'"{c}"' for c in columns)
+    return f'COPY "{table}" ({cols}) FROM STDIN'
+
+
+def truncate(conn):
+    conn.execute('TRUNCATE "Message", "Avance", "ClockEvent", "ValidationJour", "Pointage", "Employe", "User" CASCADE')
+    # Archived months are detached from "Pointage", so TRUNCATE misses them
+    archived = conn.execute(
+        "SELECT tablename FROM pg_tables WHERE schemaname = 'archive' AND tablename LIKE 'Pointage\\_%'"
+    ).fetchall()
+    for (name,) in archived:
+        conn.execute(f'DROP TABLE archive."{name}"')
+
+
+def prepare_partitions(conn, months):
+    """Attach one "Pointage" partition per seeded month (COPY would otherwise fill the DEFAULT one)."""
+    for year, month in months:
+        conn.execute("SELECT pointage_creer_partition(%s::date)", (f"{year:04d}-{month:02d}-01",))
+
+
+def seed(dataset, database_url, reset=False, dry_run=False):
+    """Generate and load every table, returning ``{table: (rows, seconds)}``."""
+    stats = {}
+    conn = None
+    if not dry_run:
+        import psycopg
+
+        conn = psycopg.connect(database_url)
+
+    try:
+        if reset and conn:
+            truncate(conn)
+        if conn:
+            prepare_partitions(conn, dataset.months)
+        for table, columns, method in TABLES:
+            started = time.perf_counter()
+            rows = getattr(dataset, method)()
+            count = 0
+            if conn:
+                with conn.cursor() as cur, cur.copy(copy_statement(table, columns)) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+                        count += 1
+            else:
+                count = sum(1 for _ in rows)
+            stats[table] = (count, time.perf_counter() - started)
+            print(f"{table:<9} {count:>10,} rows in {stats[table][1]:6.2f}s")
+
+        if conn:
+            started = time.perf_counter()
+            count = conn.execute(CLOCK_EVENTS_SQL).rowcount
+            print(f"{'ClockEvent':<9} {count:>10,} rows in {time.perf_counter() - started:6.2f}s")
+            started = time.perf_counter()
+            count = conn.execute(VALIDATIONS_SQL).rowcount
+            print(f"{'ValidationJour':<9} {count:>10,} rows in {time.perf_counter() - started:6.2f}s")
+            conn.commit()
+            conn.autocommit = True
+            for table in [t for t, _, _ in TABLES] + ["ClockEvent", "ValidationJour"]:
+                conn.execute(f'ANALYZE "{table}"')
+    finally:
+        if conn:
+            conn.close()
+    if not dry_run:
+        rebuild_rollups(database_url)
+    return stats
+
+
+def rebuild_rollups(database_url):
+    """COPY bypasses the application, so rebuild the per-day PointageJour rollup."""
+    started = time.perf_counter()
+    subprocess.run(
+        ["node", "scripts/backfill-pointage-jour.mjs"],
+        cwd=REPO_ROOT,
+        env=dict(os.environ, DATABASE_URL=database_url),
+        check=True,
+    )
+    print(f"rollups   rebuilt in {time.perf_counter() - started:6.2f}s")
+
+
+def parse_month(value):
+    year, month = value.split("-")
+    return int(year), int(month)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=5000)
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--end-month", type=parse_month, help="last month to seed, YYYY-MM (default: current)")
+    parser.add_argument("--today", type=date.fromisoformat, help="pin 'today' for reproducible partial months")
+    parser.add_argument("--message-rate", type=float, default=2.0, help="messages per user per month")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--truncate", action="store_true", help="empty the seeded tables first")
+    parser.add_argument("--dry-run", action="store_true", help="generate rows without a database")
+    args = parser.parse_args(argv)
+
+    if not args.dry_run and not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required (or use --dry-run)")
+
+    dataset = Dataset(
+        args.employees,
+        args.months,
+        args.message_rate,
+        args.seed,
+        end=args.end_month,
+        today=args.today.isoformat() if args.today else None,
+    )
+    started = time.perf_counter()
+    stats = seed(dataset, args.database_url, reset=args.truncate, dry_run=args.dry_run)
+    total = sum(count for count, _ in stats.values())
+    print(f"total     {total:>10,} rows in {time.perf_counter() - started:6.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
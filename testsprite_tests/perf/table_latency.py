@@ -0,0 +1,194 @@
+"""Interaction latency of the large attendance tables, measured in Chromium.
+
+Opens a table page as the ``seed_dataset`` admin once every row is loaded
+(seed with ``--employees 5000`` for the 5k-row benchmark) and replays what a
+site tablet does all day:
+
+* ``click``: toggling a worker's status on the visible rows;
+* ``type``: typing a name in the search box, one key at a time;
+* ``scroll``: scrolling the sheet from top to bottom.
+
+Clicks and key presses are timed with the Event Timing API (the same
+input-to-next-paint duration Chrome reports as INP); scrolling is timed as
+the gap between animation frames. The number of ``<tr>`` in the DOM is
+reported too, since a windowed table must not grow with the row count.
+Limits come from ``interactions`` in ``perf/budgets.json``.
+
+Example::
+
+    python -m testsprite_tests.perf.seed_dataset --employees 5000 --months 1 --truncate
+    python -m testsprite_tests.perf.table_latency --rows 5000 --cpu-throttle 4
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from playwright import async_api
+
+from . import BASE_URL
+from .page_metrics import load_budgets
+from .seed_dataset import DEFAULT_PASSWORD, EMAIL_DOMAIN
+
+# Event Timing entries, read back after each action
+INIT_SCRIPT = """
+(() => {
+    window.__klInteractions = [];
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) {
+            if (entry.interactionId) {
+                window.__klInteractions.push({ name: entry.name, duration: entry.duration });
+            }
+        }
+    }).observe({ type: 'event', durationThreshold: 16, buffered: true });
+})();
+"""
+
+# Scrolls the dashboard's scroll container to the bottom, one step per frame,
+# and returns the frame-to-frame gaps in ms
+SCROLL_SCRIPT = """
+async (pas) => {
+    const main = document.querySelector('main') || document.scrollingElement;
+    main.scrollTop = 0;
+    const gaps = [];
+    let before = await new Promise(requestAnimationFrame);
+    while (main.scrollTop + main.clientHeight < main.scrollHeight - 1) {
+        main.scrollTop += pas;
+        const now = await new Promise(requestAnimationFrame);
+        gaps.push(now - before);
+        before = now;
+    }
+    return gaps;
+}
+"""
+
+PAGES = {
+    "/admin/dashboard/pointage": {
+        "ready": r"(\d+) Collaborateurs",
+        "search": 'input[placeholder="Rechercher par nom..."]',
+        "click": '[data-testid^="status-btn-"][data-testid$="-ABSENT"]',
+    },
+}
+
+
+def percentile(values, p):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 1)
+
+
+async def login(context, base_url, email, password):
+    csrf = await (await context.request.get(f"{base_url}/api/auth/csrf")).json()
+    await context.request.post(
+        f"{base_url}/api/auth/callback/credentials",
+        form={"csrfToken": csrf["csrfToken"], "email": email, "password": password, "json": "true"},
+    )
+
+
+async def take_interactions(page):
+    return await page.evaluate("() => window.__klInteractions.splice(0)")
+
+
+async def measure(page, base_url, path, rows, clicks, query):
+    spec = PAGES[path]
+    await page.goto(f"{base_url}{path}")
+    # Wait until every row is loaded (the counter reaches --rows)
+    await page.wait_for_function(
+        """([pattern, rows]) => {
+            const m = document.body.innerText.match(new RegExp(pattern));
+            return m && Number(m[1]) >= rows;
+        }""",
+        arg=[spec["ready"], rows],
+        timeout=120_000,
+    )
+    await page.wait_for_timeout(500)
+    await take_interactions(page)
+    dom_rows = await page.locator("tbody tr").count()
+
+    buttons = page.locator(spec["click"])
+    for i in range(min(clicks, await buttons.count())):
+        await buttons.nth(i).click()
+        await page.wait_for_timeout(50)
+    await page.wait_for_timeout(300)
+    click = [e["duration"] for e in await take_interactions(page)]
+
+    search = page.locator(spec["search"])
+    await search.click()
+    await take_interactions(page)
+    await search.press_sequentially(query, delay=120)
+    await page.wait_for_timeout(600)
+    typed = [e["duration"] for e in await take_interactions(page) if e["name"].startswith("key")]
+    await search.fill("")
+    await page.wait_for_timeout(600)
+
+    gaps = await page.evaluate(SCROLL_SCRIPT, 400)
+    dom_rows = max(dom_rows, await page.locator("tbody tr").count())
+
+    return {
+        "path": path,
+        "rows": rows,
+        "dom_rows": dom_rows,
+        "click_p95_ms": percentile(click, 95),
+        "click_max_ms": percentile(click, 100),
+        "type_p95_ms": percentile(typed, 95),
+        "type_max_ms": percentile(typed, 100),
+        "scroll_frame_p95_ms": percentile(gaps, 95),
+        "scroll_frames": len(gaps),
+    }
+
+
+def violations(result, limits):
+    problems = []
+    for key, limit in limits.items():
+        value = result.get(key)
+        if value is not None and value > limit:
+            problems.append(f"{result['path']}: {key} = {value} exceeds budget {limit}")
+    return problems
+
+
+async def run(args):
+    budgets = load_budgets().get("interactions", {})
+    async with async_api.async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True, args=["--window-size=1280,800"])
+        try:
+            context = await browser.new_context(viewport={"width": 1280, "height": 800})
+            context.set_default_timeout(30_000)
+            await context.add_init_script(INIT_SCRIPT)
+            await login(context, args.base_url, args.email, args.password)
+            page = await context.new_page()
+            if args.cpu_throttle > 1:
+                cdp = await context.new_cdp_session(page)
+                await cdp.send("Emulation.setCPUThrottlingRate", {"rate": args.cpu_throttle})
+
+            results, problems = [], []
+            for path in args.page or PAGES:
+                result = await measure(page, args.base_url, path, args.rows, args.clicks, args.query)
+                results.append(result)
+                problems.extend(violations(result, budgets.get(path, {})))
+        finally:
+            await browser.close()
+
+    print(json.dumps(results, indent=2))
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--rows", type=int, default=5000, help="rows expected on the page (seeded employees)")
+    parser.add_argument("--page", action="append", choices=sorted(PAGES), help="page to measure (repeatable)")
+    parser.add_argument("--clicks", type=int, default=20)
+    parser.add_argument("--query", default="ben sa", help="text typed in the search box")
+    parser.add_argument("--cpu-throttle", type=float, default=1, help="CDP CPU slowdown, e.g. 4 for a low-end tablet")
+    parser.add_argument("--email", default=f"admin@{EMAIL_DOMAIN}")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())